@@ -0,0 +1,89 @@
+from fastapi import Depends, HTTPException, Request, status
+from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.security import (
+    PROFILE_SIGNATURE_HEADER,
+    REFRESH_TOKEN_TYPE,
+    decode_token_cached,
+    token_cache,
+    verify_profile_signature,
+)
+from app.db.session import get_read_session, get_write_session
+from app.schemas.user_identity import UserIdentity
+from app.services.auth.revocation import revocation_denylist
+from app.services.auth.user_service import get_user_identity, identity_cache
+
+bearer_scheme = HTTPBearer(auto_error=False)
+
+
+def _unauthorized() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail="Could not validate credentials",
+        headers={"WWW-Authenticate": "Bearer"},
+    )
+
+
+async def get_token_payload(
+    credentials: HTTPAuthorizationCredentials | None = Depends(bearer_scheme),
+    session: AsyncSession = Depends(get_write_session),
+) -> dict:
+    if credentials is None:
+        raise _unauthorized()
+
+    payload = decode_token_cached(credentials.credentials)
+    if (
+        payload is None
+        or not payload.get("sub")
+        or payload.get("type") == REFRESH_TOKEN_TYPE
+    ):
+        raise _unauthorized()
+
+    jti = payload.get("jti")
+    if jti and await revocation_denylist.is_revoked(session, jti):
+        raise _unauthorized()
+    return payload
+
+
+async def get_current_user(
+    payload: dict = Depends(get_token_payload),
+    read_session: AsyncSession = Depends(get_read_session),
+    write_session: AsyncSession = Depends(get_write_session),
+) -> UserIdentity:
+    identity = await get_user_identity(read_session, payload["sub"])
+    if identity is None:
+        # 방금 가입한 사용자는 복제 지연으로 replica에 아직 없을 수 있다.
+        identity = await get_user_identity(write_session, payload["sub"])
+    if identity is None:
+        raise _unauthorized()
+    if not identity.is_active:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Inactive user",
+        )
+    return identity
+
+
+def get_auth_cache_stats() -> dict[str, dict[str, int]]:
+    return {
+        "token": token_cache.stats(),
+        "identity": identity_cache.stats(),
+    }
+
+
+def require_profiling_access(request: Request) -> None:
+    # 프로파일은 내부 구조가 드러나므로 요청마다 서명을 확인하고, 꺼져 있으면 숨긴다.
+    if not settings.PROFILING_ENABLED:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND)
+    signature = request.headers.get(PROFILE_SIGNATURE_HEADER)
+    if signature is None or not verify_profile_signature(
+        signature,
+        request.method,
+        request.url.path,
+    ):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Invalid profiling signature",
+        )
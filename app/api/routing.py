@@ -0,0 +1,49 @@
+import math
+from collections.abc import Callable, Coroutine
+from typing import Any
+
+from fastapi import HTTPException, Request, Response, status
+from fastapi.routing import APIRoute
+
+from app.core.security import decode_token_cached
+from app.services.ratelimit.limiter import rate_limiter
+
+type RouteHandler = Callable[[Request], Coroutine[Any, Any, Response]]
+
+
+class RateLimitedRoute(APIRoute):
+    # 라우트 이름(엔드포인트 함수 이름)에 한도가 설정돼 있으면 핸들러를 감싸서
+    # 의존성 해석 전에 버킷을 확인한다. 의존성으로 두면 의존성 하나를 해석하는
+    # 비용이 요청마다 더 붙는다. 한도가 없는 라우트는 감싸지 않는다.
+    def get_route_handler(self) -> RouteHandler:
+        handler = super().get_route_handler()
+        if not rate_limiter.limits(self.name):
+            return handler
+
+        route = self.name
+        limits_users = rate_limiter.limits_users(route)
+
+        async def limited_handler(request: Request) -> Response:
+            await check_rate_limit(request, route, limits_users)
+            return await handler(request)
+
+        return limited_handler
+
+
+async def check_rate_limit(request: Request, route: str, limits_users: bool) -> None:
+    # 사용자 버킷의 키는 토큰의 sub이다. 캐시된 디코딩만 하고 DB는 보지 않으므로
+    # 인증 실패는 뒤의 get_current_user가 401로 처리한다.
+    # 프록시 뒤라면 uvicorn --proxy-headers로 request.client를 실제 주소로 채운다.
+    user = None
+    if limits_users:
+        scheme, _, token = request.headers.get("authorization", "").partition(" ")
+        payload = decode_token_cached(token) if scheme.lower() == "bearer" else None
+        user = payload.get("sub") if payload else None
+    ip = request.client.host if request.client else None
+    retry_after = await rate_limiter.hit(route, ip, user)
+    if retry_after:
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="Too many requests",
+            headers={"Retry-After": str(math.ceil(retry_after))},
+        )
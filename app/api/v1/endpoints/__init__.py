@@ -1,7 +1,31 @@
 from fastapi import APIRouter
 
-from app.api.v1.endpoints import auth
+from app.api.v1.endpoints import (
+    auth,
+    games,
+    gateway,
+    leaderboard,
+    matchmaking,
+    presence,
+    profiles,
+    room,
+)
 
 api_router = APIRouter()
 
 api_router.include_router(auth.router, prefix="/auth", tags=["auth"])
+api_router.include_router(presence.router, prefix="/presence", tags=["presence"])
+api_router.include_router(room.router, prefix="/rooms", tags=["rooms"])
+api_router.include_router(
+    matchmaking.router,
+    prefix="/matchmaking",
+    tags=["matchmaking"],
+)
+api_router.include_router(games.router, prefix="/games", tags=["games"])
+api_router.include_router(
+    leaderboard.router,
+    prefix="/leaderboard",
+    tags=["leaderboard"],
+)
+api_router.include_router(profiles.router, prefix="/profiles", tags=["profiles"])
+api_router.include_router(gateway.router, tags=["gateway"])
@@ -1,16 +1,23 @@
 from fastapi import APIRouter, Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.db.session import get_session
+from app.api.deps import get_current_user, get_token_payload
+from app.api.routing import RateLimitedRoute
+from app.db.session import get_write_session
 from app.schemas.auth_url_response import AuthUrlResponse
+from app.schemas.base_response import BaseResponse
+from app.schemas.refresh_token import RefreshTokenRequest, RefreshTokenResponse
 from app.schemas.token_response import TokenResponse
-from app.services.auth.google import GoogleOAuthService
+from app.services.auth.token_service import revoke_tokens, rotate_refresh_token
 
-router = APIRouter()
+router = APIRouter(route_class=RateLimitedRoute)
 
 
 @router.get("/login/google", response_model=AuthUrlResponse)
 async def google_login():
+    # Google 클라이언트(httpx, jose)는 로그인에서만 쓰여 처음 부를 때 불러온다.
+    from app.services.auth.google import GoogleOAuthService
+
     auth_url = GoogleOAuthService.get_authorization_url()
     return AuthUrlResponse(auth_url=auth_url)
 
@@ -18,6 +25,30 @@ async def google_login():
 @router.get("/login/google/callback", response_model=TokenResponse)
 async def google_callback(
     code: str,
-    session: AsyncSession = Depends(get_session),
+    session: AsyncSession = Depends(get_write_session),
 ):
+    from app.services.auth.google import GoogleOAuthService
+
     return await GoogleOAuthService.process_google_login(code, session)
+
+
+@router.post("/refresh", response_model=RefreshTokenResponse)
+async def refresh(
+    request: RefreshTokenRequest,
+    session: AsyncSession = Depends(get_write_session),
+):
+    return await rotate_refresh_token(session, request.refresh_token)
+
+
+@router.post(
+    "/logout",
+    response_model=BaseResponse,
+    dependencies=[Depends(get_current_user)],
+)
+async def logout(
+    request: RefreshTokenRequest,
+    payload: dict = Depends(get_token_payload),
+    session: AsyncSession = Depends(get_write_session),
+):
+    await revoke_tokens(session, payload, request.refresh_token)
+    return BaseResponse(message="logged out")
@@ -0,0 +1,26 @@
+from fastapi import APIRouter, Depends, Query
+from fastapi.responses import StreamingResponse
+
+from app.api.deps import get_current_user
+from app.api.routing import RateLimitedRoute
+from app.core.config import settings
+from app.schemas.user_identity import UserIdentity
+from app.services.game.export import export_user_events, parse_cursor
+
+router = APIRouter(route_class=RateLimitedRoute)
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+
+@router.get("/export", response_class=StreamingResponse)
+async def export_games(
+    cursor: str | None = Query(default=None, pattern=r"^\d+:\d+$"),
+    user: UserIdentity = Depends(get_current_user),
+):
+    # 압축은 CompressionMiddleware가 조각마다 flush 하며 맡는다.
+    chunks = export_user_events(
+        user.id,
+        parse_cursor(cursor) if cursor else None,
+        chunk_rows=settings.GAME_EXPORT_CHUNK_ROWS,
+    )
+    return StreamingResponse(chunks, media_type=NDJSON_MEDIA_TYPE)
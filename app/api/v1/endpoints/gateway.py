@@ -0,0 +1,84 @@
+import json
+
+from fastapi import APIRouter, WebSocket, WebSocketDisconnect, status
+
+from app.core.security import REFRESH_TOKEN_TYPE, decode_token_cached
+from app.db.session import async_read_session, async_session
+from app.schemas.user_identity import UserIdentity
+from app.services.auth.revocation import revocation_denylist
+from app.services.auth.user_service import get_user_identity
+from app.services.game.matchmaking import matchmaker
+from app.services.game.room import room_registry
+from app.services.gateway.manager import connection_manager
+
+router = APIRouter()
+
+
+def _extract_token(websocket: WebSocket) -> str | None:
+    # 브라우저 WebSocket은 헤더를 지정할 수 없으므로 쿼리 파라미터도 허용한다.
+    token = websocket.query_params.get("token")
+    if token:
+        return token
+    scheme, _, credentials = websocket.headers.get("authorization", "").partition(" ")
+    if scheme.lower() == "bearer" and credentials:
+        return credentials
+    return None
+
+
+async def authenticate_websocket(websocket: WebSocket) -> UserIdentity | None:
+    token = _extract_token(websocket)
+    if token is None:
+        return None
+
+    payload = decode_token_cached(token)
+    if (
+        payload is None
+        or not payload.get("sub")
+        or payload.get("type") == REFRESH_TOKEN_TYPE
+    ):
+        return None
+
+    jti = payload.get("jti")
+    if jti and revocation_denylist.might_be_revoked(jti):
+        async with async_session() as session:
+            if await revocation_denylist.is_revoked(session, jti):
+                return None
+
+    async with async_read_session() as session:
+        identity = await get_user_identity(session, payload["sub"])
+    if identity is None:
+        async with async_session() as session:
+            identity = await get_user_identity(session, payload["sub"])
+    if identity is None or not identity.is_active:
+        return None
+    return identity
+
+
+@router.websocket("/ws")
+async def gateway(websocket: WebSocket):
+    identity = await authenticate_websocket(websocket)
+    if identity is None:
+        await websocket.close(code=status.WS_1008_POLICY_VIOLATION)
+        return
+
+    connection = await connection_manager.connect(websocket, identity.id)
+    room_registry.attach(identity.id)
+    try:
+        while not connection.closed:
+            text = await websocket.receive_text()
+            connection.touch()
+            try:
+                message = json.loads(text)
+            except json.JSONDecodeError:
+                message = None
+            if not isinstance(message, dict):
+                connection.close(status.WS_1003_UNSUPPORTED_DATA)
+                break
+            await connection_manager.dispatch(connection, message)
+    except WebSocketDisconnect:
+        pass
+    finally:
+        await connection_manager.disconnect(connection)
+        if not connection_manager.user_connections(identity.id):
+            matchmaker.dequeue(identity.id)
+            room_registry.detach(identity.id)
@@ -0,0 +1,42 @@
+from fastapi import APIRouter, Depends, Query
+
+from app.api.deps import get_current_user
+from app.schemas.leaderboard import LeaderboardEntryResponse, LeaderboardResponse
+from app.schemas.user_identity import UserIdentity
+from app.services.ranking.leaderboard import LeaderboardEntry, leaderboard
+
+router = APIRouter()
+
+
+def _response(entries: list[LeaderboardEntry]) -> LeaderboardResponse:
+    return LeaderboardResponse(
+        entries=[
+            LeaderboardEntryResponse(
+                rank=entry.rank,
+                user_id=entry.user_id,
+                rating=entry.rating,
+            )
+            for entry in entries
+        ],
+        total=len(leaderboard),
+    )
+
+
+@router.get(
+    "",
+    response_model=LeaderboardResponse,
+    dependencies=[Depends(get_current_user)],
+)
+async def top_players(
+    limit: int = Query(default=20, ge=1, le=100),
+    offset: int = Query(default=0, ge=0),
+):
+    return _response(leaderboard.top(limit, offset))
+
+
+@router.get("/me", response_model=LeaderboardResponse)
+async def around_me(
+    radius: int = Query(default=5, ge=0, le=50),
+    user: UserIdentity = Depends(get_current_user),
+):
+    return _response(leaderboard.around(user.id, radius))
@@ -0,0 +1,49 @@
+import time
+
+from fastapi import APIRouter, Depends
+
+from app.api.deps import get_current_user
+from app.api.routing import RateLimitedRoute
+from app.schemas.base_response import BaseResponse
+from app.schemas.matchmaking import MatchmakingStatusResponse
+from app.schemas.user_identity import UserIdentity
+from app.services.game.matchmaking import matchmaker
+
+router = APIRouter(route_class=RateLimitedRoute)
+
+
+def _status(user_id: int) -> MatchmakingStatusResponse:
+    if not matchmaker.is_queued(user_id):
+        room = matchmaker.rooms.room_of(user_id)
+        return MatchmakingStatusResponse(
+            queued=False,
+            room_id=room.id if room else None,
+            queue_size=len(matchmaker),
+        )
+
+    entry = matchmaker.get_entry(user_id)
+    now = time.monotonic()
+    return MatchmakingStatusResponse(
+        queued=True,
+        waited_seconds=now - entry.enqueued_at,
+        window=matchmaker.window(entry, now),
+        queue_size=len(matchmaker),
+    )
+
+
+@router.get("/queue", response_model=MatchmakingStatusResponse)
+async def queue_status(user: UserIdentity = Depends(get_current_user)):
+    return _status(user.id)
+
+
+@router.post("/queue", response_model=MatchmakingStatusResponse)
+async def enqueue(user: UserIdentity = Depends(get_current_user)):
+    matchmaker.enqueue(user.id, user.rating)
+    return _status(user.id)
+
+
+@router.delete("/queue", response_model=BaseResponse)
+async def dequeue(user: UserIdentity = Depends(get_current_user)):
+    matchmaker.get_entry(user.id)
+    matchmaker.dequeue(user.id)
+    return BaseResponse(message="left queue")
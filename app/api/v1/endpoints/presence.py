@@ -0,0 +1,23 @@
+from fastapi import APIRouter, Depends
+
+from app.api.deps import get_current_user
+from app.schemas.presence import PresenceStatusResponse, PresenceSummaryResponse
+from app.services.presence.registry import presence_registry
+
+router = APIRouter(dependencies=[Depends(get_current_user)])
+
+
+@router.get("", response_model=PresenceSummaryResponse)
+async def presence_summary():
+    return PresenceSummaryResponse(
+        online=presence_registry.online_count(),
+        counts=presence_registry.counts(),
+    )
+
+
+@router.get("/{user_id}", response_model=PresenceStatusResponse)
+async def presence_status(user_id: int):
+    return PresenceStatusResponse(
+        user_id=user_id,
+        status=presence_registry.get_status(user_id),
+    )
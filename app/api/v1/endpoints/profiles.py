@@ -0,0 +1,51 @@
+from fastapi import APIRouter, Depends
+from fastapi.responses import FileResponse
+
+from app.api.deps import require_profiling_access
+from app.schemas.profile import (
+    LoopStallListResponse,
+    LoopStallResponse,
+    ProfileListResponse,
+    ProfileResponse,
+)
+from app.services.profiling.store import profile_store
+from app.services.profiling.watchdog import loop_lag_monitor
+
+router = APIRouter(dependencies=[Depends(require_profiling_access)])
+
+
+@router.get("", response_model=ProfileListResponse)
+async def list_profiles():
+    return ProfileListResponse(
+        profiles=[
+            ProfileResponse(
+                profile_id=info.profile_id,
+                size=info.size,
+                created_at=info.created_at,
+            )
+            for info in profile_store.entries()
+        ],
+    )
+
+
+@router.get("/stalls", response_model=LoopStallListResponse)
+async def list_loop_stalls():
+    return LoopStallListResponse(
+        stalls=[
+            LoopStallResponse(
+                started_at=stall.started_at,
+                duration=stall.duration,
+                stack=stall.stack,
+            )
+            for stall in reversed(loop_lag_monitor.stalls)
+        ],
+    )
+
+
+@router.get("/{profile_id}", response_class=FileResponse)
+async def download_profile(profile_id: str):
+    return FileResponse(
+        profile_store.path(profile_id),
+        media_type="text/plain",
+        filename=f"{profile_id}.folded",
+    )
@@ -0,0 +1,85 @@
+from fastapi import APIRouter, Depends, Query
+
+from app.api.deps import get_current_user
+from app.api.routing import RateLimitedRoute
+from app.schemas.base_response import BaseResponse
+from app.schemas.room import (
+    RoomCreateRequest,
+    RoomListResponse,
+    RoomReadyRequest,
+    RoomResponse,
+)
+from app.schemas.user_identity import UserIdentity
+from app.services.game.matchmaking import matchmaker
+from app.services.game.room import RoomState, room_registry
+
+router = APIRouter(route_class=RateLimitedRoute)
+
+
+@router.get(
+    "",
+    response_model=RoomListResponse,
+    dependencies=[Depends(get_current_user)],
+)
+async def list_rooms(
+    state: RoomState | None = None,
+    cursor: int | None = None,
+    limit: int = Query(default=20, ge=1, le=100),
+):
+    rooms, next_cursor = room_registry.list_rooms(state, cursor, limit)
+    return RoomListResponse(
+        rooms=[RoomResponse.model_validate(room) for room in rooms],
+        next_cursor=next_cursor,
+    )
+
+
+@router.post("", response_model=RoomResponse)
+async def create_room(
+    request: RoomCreateRequest,
+    user: UserIdentity = Depends(get_current_user),
+):
+    matchmaker.dequeue(user.id)
+    return RoomResponse.model_validate(room_registry.create(user.id, request.name))
+
+
+@router.post("/quick-join", response_model=RoomResponse)
+async def quick_join(user: UserIdentity = Depends(get_current_user)):
+    matchmaker.dequeue(user.id)
+    return RoomResponse.model_validate(room_registry.quick_join(user.id))
+
+
+@router.get(
+    "/{room_id}",
+    response_model=RoomResponse,
+    dependencies=[Depends(get_current_user)],
+)
+async def get_room(room_id: int):
+    return RoomResponse.model_validate(room_registry.get(room_id))
+
+
+@router.post("/{room_id}/join", response_model=RoomResponse)
+async def join_room(room_id: int, user: UserIdentity = Depends(get_current_user)):
+    matchmaker.dequeue(user.id)
+    return RoomResponse.model_validate(room_registry.join(user.id, room_id))
+
+
+@router.post("/{room_id}/leave", response_model=BaseResponse)
+async def leave_room(room_id: int, user: UserIdentity = Depends(get_current_user)):
+    room_registry.leave(user.id, room_id)
+    return BaseResponse(message="left room")
+
+
+@router.post("/{room_id}/ready", response_model=RoomResponse)
+async def ready(
+    room_id: int,
+    request: RoomReadyRequest,
+    user: UserIdentity = Depends(get_current_user),
+):
+    return RoomResponse.model_validate(
+        room_registry.set_ready(user.id, room_id, ready=request.ready),
+    )
+
+
+@router.post("/{room_id}/start", response_model=RoomResponse)
+async def start_game(room_id: int, user: UserIdentity = Depends(get_current_user)):
+    return RoomResponse.model_validate(room_registry.start(user.id, room_id))
@@ -0,0 +1,177 @@
+import zlib
+from typing import Protocol
+
+import brotli
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+# 같은 q 값이면 앞쪽을 고른다.
+SUPPORTED_ENCODINGS = ("br", "gzip")
+# 조각이 올 때마다 바로 내보내야 하는 응답은 압축하지 않는다.
+UNCOMPRESSED_MEDIA_TYPES = frozenset({"text/event-stream"})
+
+
+class Compressor(Protocol):
+    def compress(self, data: bytes) -> bytes: ...
+
+    def flush(self) -> bytes: ...
+
+    def finish(self) -> bytes: ...
+
+
+class GzipCompressor:
+    def __init__(self, level: int) -> None:
+        self._compressor = zlib.compressobj(level, wbits=zlib.MAX_WBITS | 16)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data)
+
+    def flush(self) -> bytes:
+        return self._compressor.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self) -> bytes:
+        return self._compressor.flush()
+
+
+class BrotliCompressor:
+    def __init__(self, quality: int) -> None:
+        self._compressor = brotli.Compressor(quality=quality)
+
+    def compress(self, data: bytes) -> bytes:
+        result: bytes = self._compressor.process(data)
+        return result
+
+    def flush(self) -> bytes:
+        result: bytes = self._compressor.flush()
+        return result
+
+    def finish(self) -> bytes:
+        result: bytes = self._compressor.finish()
+        return result
+
+
+def negotiate_encoding(accept_encoding: str) -> str | None:
+    # Accept-Encoding의 q 값을 보고 지원하는 것 중 가장 선호하는 인코딩을 고른다.
+    weights: dict[str, float] = {}
+    for item in accept_encoding.split(","):
+        name, _, params = item.partition(";")
+        weight = 1.0
+        key, _, value = params.strip().partition("=")
+        if key.strip() == "q":
+            try:
+                weight = float(value)
+            except ValueError:
+                weight = 0.0
+        weights[name.strip().lower()] = weight
+    wildcard = weights.get("*", 0.0)
+    best: str | None = None
+    best_weight = 0.0
+    for encoding in SUPPORTED_ENCODINGS:
+        weight = weights.get(encoding, wildcard)
+        if weight > best_weight:
+            best, best_weight = encoding, weight
+    return best
+
+
+class CompressionMiddleware:
+    # 응답 크기를 알 수 있으면 minimum_size 이상일 때만 압축하고, 스트리밍 응답은
+    # 조각마다 flush 해서 클라이언트가 압축된 채로도 바로 읽을 수 있게 한다.
+    # 이미 Content-Encoding이 붙은 응답은 그대로 보낸다.
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = 1024,
+        gzip_level: int = 6,
+        brotli_quality: int = 4,
+    ) -> None:
+        self.app = app
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        encoding = negotiate_encoding(
+            Headers(scope=scope).get("accept-encoding", ""),
+        )
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+        responder = _CompressionResponder(self, encoding, send)
+        await self.app(scope, receive, responder.send)
+
+    def compressor(self, encoding: str) -> Compressor:
+        if encoding == "br":
+            return BrotliCompressor(self.brotli_quality)
+        return GzipCompressor(self.gzip_level)
+
+
+class _CompressionResponder:
+    # 첫 본문 조각을 볼 때까지 응답 시작 메시지를 잡아 두었다가 압축 여부를 정한다.
+    def __init__(
+        self,
+        middleware: CompressionMiddleware,
+        encoding: str,
+        send: Send,
+    ) -> None:
+        self.middleware = middleware
+        self.encoding = encoding
+        self._send = send
+        self._start: Message | None = None
+        self._compressor: Compressor | None = None
+        self._passthrough = False
+
+    async def send(self, message: Message) -> None:
+        if message["type"] == "http.response.start":
+            self._start = message
+            return
+        if message["type"] != "http.response.body" or self._passthrough:
+            await self._send(message)
+            return
+        if self._start is not None:
+            start, self._start = self._start, None
+            await self._send_first(start, message)
+            return
+        await self._send_chunk(message)
+
+    async def _send_first(self, start: Message, first: Message) -> None:
+        headers = MutableHeaders(raw=start["headers"])
+        body = first.get("body", b"")
+        more_body = first.get("more_body", False)
+        media_type = headers.get("content-type", "").partition(";")[0].strip()
+        if (
+            "content-encoding" in headers
+            or media_type in UNCOMPRESSED_MEDIA_TYPES
+            or (not more_body and len(body) < self.middleware.minimum_size)
+        ):
+            self._passthrough = True
+            await self._send(start)
+            await self._send(first)
+            return
+        compressor = self.middleware.compressor(self.encoding)
+        headers["Content-Encoding"] = self.encoding
+        headers.add_vary_header("Accept-Encoding")
+        if more_body:
+            del headers["Content-Length"]
+            self._compressor = compressor
+            await self._send(start)
+            await self._send_chunk(first)
+            return
+        # 한 번에 끝나는 응답은 미리 압축해 Content-Length를 맞춘다.
+        compressed = compressor.compress(body) + compressor.finish()
+        headers["Content-Length"] = str(len(compressed))
+        await self._send(start)
+        await self._send({"type": "http.response.body", "body": compressed})
+
+    async def _send_chunk(self, message: Message) -> None:
+        if self._compressor is None:
+            await self._send(message)
+            return
+        more_body = message.get("more_body", False)
+        data = self._compressor.compress(message.get("body", b""))
+        data += self._compressor.flush() if more_body else self._compressor.finish()
+        await self._send(
+            {"type": "http.response.body", "body": data, "more_body": more_body},
+        )
@@ -10,6 +10,21 @@ class EnvironmentType(str, Enum):
     PRODUCTION = "production"
 
 
+class SlowConsumerPolicy(str, Enum):
+    DROP_OLDEST = "drop-oldest"
+    DISCONNECT = "disconnect"
+
+
+class EventBusBackend(str, Enum):
+    MEMORY = "memory"
+    POSTGRES = "postgres"
+
+
+class RateLimitBackend(str, Enum):
+    MEMORY = "memory"
+    POSTGRES = "postgres"
+
+
 class Settings(BaseSettings):
     ENVIRONMENT: EnvironmentType = EnvironmentType.DEVELOPMENT
     PROJECT_NAME: str = "Mahjong Game API"
@@ -21,11 +36,109 @@ class Settings(BaseSettings):
     POSTGRES_PASSWORD: str = "admin"
     POSTGRES_PORT: str = "5432"
     POSTGRES_DB: str = "mcr_masters"
+    DATABASE_READ_REPLICA_URI: str | None = None
+
+    DB_ECHO: bool = False
+    DB_POOL_SIZE: int = 10
+    DB_MAX_OVERFLOW: int = 20
+    DB_POOL_TIMEOUT: float = 30.0
+    DB_POOL_RECYCLE: int = 1800
+    DB_POOL_PRE_PING: bool = True
+    DB_STATEMENT_CACHE_SIZE: int = 100
+    DB_PREPARED_STATEMENT_CACHE_SIZE: int = 100
+    DB_READY_TIMEOUT_SECONDS: float = 2.0
+
+    METRICS_ENABLED: bool = True
+    IMPORT_TIME_BUDGET_MS: float = 1000.0
+
+    PROFILING_ENABLED: bool = False
+    PROFILING_SECRET_KEY: str = "secret"
+    PROFILING_SIGNATURE_TTL_SECONDS: float = 300.0
+    PROFILING_SAMPLE_RATE: float = 1.0
+    PROFILING_INTERVAL_SECONDS: float = 0.005
+    PROFILING_DIR: str = "/tmp/mcr-profiles"
+    PROFILING_MAX_FILES: int = 100
+    LOOP_LAG_MONITOR_ENABLED: bool = True
+    LOOP_LAG_CHECK_INTERVAL_SECONDS: float = 0.05
+    LOOP_LAG_THRESHOLD_SECONDS: float = 0.1
+    LOOP_LAG_MAX_STALLS: int = 100
 
     JWT_SECRET_KEY: str = "secret"
     JWT_ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
     REFRESH_TOKEN_EXPIRE_DAYS: int = 3
+    TOKEN_CACHE_SIZE: int = 10000
+    REVOCATION_BLOOM_CAPACITY: int = 1_000_000
+    REVOCATION_BLOOM_ERROR_RATE: float = 0.001
+    REVOCATION_SYNC_INTERVAL_SECONDS: float = 5.0
+    USER_IDENTITY_CACHE_SIZE: int = 10000
+    USER_IDENTITY_CACHE_TTL_SECONDS: float = 30.0
+
+    PRESENCE_FLUSH_INTERVAL_SECONDS: float = 2.0
+
+    WS_SEND_QUEUE_SIZE: int = 256
+    WS_SLOW_CONSUMER_POLICY: SlowConsumerPolicy = SlowConsumerPolicy.DROP_OLDEST
+    WS_HEARTBEAT_INTERVAL_SECONDS: float = 20.0
+    WS_IDLE_TIMEOUT_SECONDS: float = 60.0
+
+    EVENT_BUS_BACKEND: EventBusBackend = EventBusBackend.MEMORY
+    EVENT_BUS_CHANNEL: str = "mcr_events"
+    EVENT_BUS_BATCH_INTERVAL_SECONDS: float = 0.0
+    EVENT_BUS_MAX_PAYLOAD_BYTES: int = 7900
+    EVENT_BUS_COMPRESS_MIN_BYTES: int = 512
+    EVENT_BUS_MAX_PENDING: int = 10_000
+    EVENT_BUS_KEEPALIVE_SECONDS: float = 10.0
+    EVENT_BUS_RECONNECT_MAX_SECONDS: float = 10.0
+    EVENT_BUS_OVERFLOW_RETENTION_SECONDS: float = 300.0
+
+    RATE_LIMIT_ENABLED: bool = True
+    RATE_LIMIT_BACKEND: RateLimitBackend = RateLimitBackend.MEMORY
+    RATE_LIMIT_SHARDS: int = 64
+    RATE_LIMIT_EVICT_INTERVAL_SECONDS: float = 30.0
+    # 엔드포인트 함수 이름 -> "<요청 수>/<second|minute|hour>". 요청 수가 곧 허용
+    # 버스트다. RateLimitedRoute를 쓰는 라우터에만 적용된다.
+    RATE_LIMIT_PER_IP: dict[str, str] = {
+        "google_login": "60/minute",
+        "google_callback": "20/minute",
+        "refresh": "30/minute",
+    }
+    RATE_LIMIT_PER_USER: dict[str, str] = {
+        "logout": "10/minute",
+        "create_room": "20/minute",
+        "quick_join": "30/minute",
+        "join_room": "30/minute",
+        "enqueue": "30/minute",
+        "export_games": "6/minute",
+    }
+
+    MATCHMAKING_BUCKET_WIDTH: float = 25.0
+    MATCHMAKING_BASE_WINDOW: float = 50.0
+    MATCHMAKING_WINDOW_GROWTH_PER_SECOND: float = 10.0
+    MATCHMAKING_MAX_WINDOW: float = 400.0
+    MATCHMAKING_TICK_SECONDS: float = 1.0
+
+    GAME_EVENT_BATCH_SIZE: int = 500
+    GAME_EVENT_FLUSH_INTERVAL_SECONDS: float = 0.25
+    GAME_EVENT_MAX_PENDING: int = 100_000
+    GAME_SNAPSHOT_INTERVAL: int = 64
+    GAME_EXPORT_CHUNK_ROWS: int = 1000
+
+    LEADERBOARD_MIN_RATING: float = 0.0
+    LEADERBOARD_MAX_RATING: float = 4000.0
+    LEADERBOARD_RESOLUTION: float = 0.01
+
+    RATING_K_FACTOR: float = 32.0
+    RATING_SCALE: float = 400.0
+    RATING_RECOMPUTE_CHUNK_GAMES: int = 100_000
+    RATING_UPDATE_CHUNK_SIZE: int = 50_000
+
+    RESPONSE_COMPRESSION_MIN_SIZE: int = 1024
+    RESPONSE_GZIP_LEVEL: int = 6
+    RESPONSE_BROTLI_QUALITY: int = 4
+
+    UID_PERMUTATION_KEY: str = "secret"
+    UID_PERMUTATION_ROUNDS: int = 6
+    UID_PREFETCH_SIZE: int = 100
 
     GOOGLE_CLIENT_ID: str = "secret"
     GOOGLE_CLIENT_SECRET: str = "secret"
@@ -33,6 +146,23 @@ class Settings(BaseSettings):
     GOOGLE_TOKEN_URL: str = "https://oauth2.googleapis.com/token"
     GOOGLE_USER_INFO_URL: str = "https://www.googleapis.com/oauth2/v2/userinfo"
     GOOGLE_REDIRECT_URI: str = "http://localhost:8000/api/v1/auth/login/google/callback"
+    GOOGLE_JWKS_URL: str = "https://www.googleapis.com/oauth2/v3/certs"
+    GOOGLE_ID_TOKEN_ISSUERS: list[str] = [
+        "https://accounts.google.com",
+        "accounts.google.com",
+    ]
+    GOOGLE_VERIFY_ID_TOKEN: bool = True
+    GOOGLE_JWKS_DEFAULT_MAX_AGE: float = 3600.0
+    GOOGLE_JWKS_MIN_REFRESH_INTERVAL: float = 60.0
+
+    HTTP_CLIENT_MAX_CONNECTIONS: int = 100
+    HTTP_CLIENT_MAX_KEEPALIVE_CONNECTIONS: int = 20
+    HTTP_CLIENT_KEEPALIVE_EXPIRY: float = 30.0
+    HTTP_CLIENT_TIMEOUT: float = 10.0
+    HTTP_CLIENT_CONNECT_TIMEOUT: float = 3.0
+    HTTP_CLIENT_HTTP2: bool = False
+    HTTP_CLIENT_MAX_RETRIES: int = 2
+    HTTP_CLIENT_RETRY_BACKOFF: float = 0.2
 
     @property
     def sync_database_uri(self) -> str:
@@ -4,6 +4,22 @@ from typing import Any
 
 class DomainErrorCode(str, Enum):
     INVALID_UID = "INVALID_UID"
+    UID_ALLOCATION_FAILED = "UID_ALLOCATION_FAILED"
+    ROOM_NOT_FOUND = "ROOM_NOT_FOUND"
+    ROOM_FULL = "ROOM_FULL"
+    ROOM_ALREADY_STARTED = "ROOM_ALREADY_STARTED"
+    ROOM_NOT_READY = "ROOM_NOT_READY"
+    NO_AVAILABLE_ROOM = "NO_AVAILABLE_ROOM"
+    ALREADY_IN_ROOM = "ALREADY_IN_ROOM"
+    NOT_IN_ROOM = "NOT_IN_ROOM"
+    NOT_ROOM_HOST = "NOT_ROOM_HOST"
+    ALREADY_QUEUED = "ALREADY_QUEUED"
+    NOT_QUEUED = "NOT_QUEUED"
+    NOT_YOUR_TURN = "NOT_YOUR_TURN"
+    TILE_NOT_IN_HAND = "TILE_NOT_IN_HAND"
+    INVALID_MELD = "INVALID_MELD"
+    NOT_RANKED = "NOT_RANKED"
+    PROFILE_NOT_FOUND = "PROFILE_NOT_FOUND"
 
 
 class MCRDomainError(Exception):
@@ -0,0 +1,104 @@
+import asyncio
+import time
+
+import httpx
+
+from app.core.config import settings
+from app.core.metrics import http_client_request_duration
+
+RETRYABLE_STATUS_CODES = frozenset({429, 502, 503, 504})
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+REQUEST_STARTED_KEY = "request_started"
+
+_client: httpx.AsyncClient | None = None
+
+
+class RetryTransport(httpx.AsyncHTTPTransport):
+    # 연결 단계 실패는 요청이 전송되지 않았으므로 모든 메서드에서 재시도하고,
+    # 응답 상태 코드 기반 재시도는 멱등 메서드에만 적용한다.
+    # (Google 인가 코드는 일회용이라 POST 재전송은 위험하다.)
+    def __init__(
+        self,
+        max_retries: int,
+        backoff: float,
+        **kwargs: object,
+    ) -> None:
+        super().__init__(**kwargs)  # type: ignore[arg-type]
+        self.max_retries = max_retries
+        self.backoff = backoff
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        attempt = 0
+        while True:
+            try:
+                response = await super().handle_async_request(request)
+            except (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout):
+                if attempt >= self.max_retries:
+                    raise
+            else:
+                if (
+                    attempt >= self.max_retries
+                    or request.method not in IDEMPOTENT_METHODS
+                    or response.status_code not in RETRYABLE_STATUS_CODES
+                ):
+                    return response
+                await response.aclose()
+
+            await asyncio.sleep(self.backoff * (2**attempt))
+            attempt += 1
+
+
+async def _mark_request_started(request: httpx.Request) -> None:
+    request.extensions[REQUEST_STARTED_KEY] = time.perf_counter()
+
+
+async def _observe_response(response: httpx.Response) -> None:
+    # 응답 헤더를 받은 시점까지다. 재시도는 전송 계층 안에서 일어나므로 포함된다.
+    request = response.request
+    started = request.extensions.get(REQUEST_STARTED_KEY)
+    if started is None:
+        return
+    http_client_request_duration.observe(
+        time.perf_counter() - started,
+        request.method,
+        request.url.host,
+        str(response.status_code),
+    )
+
+
+def create_http_client() -> httpx.AsyncClient:
+    transport = RetryTransport(
+        max_retries=settings.HTTP_CLIENT_MAX_RETRIES,
+        backoff=settings.HTTP_CLIENT_RETRY_BACKOFF,
+        http2=settings.HTTP_CLIENT_HTTP2,
+        limits=httpx.Limits(
+            max_connections=settings.HTTP_CLIENT_MAX_CONNECTIONS,
+            max_keepalive_connections=settings.HTTP_CLIENT_MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=settings.HTTP_CLIENT_KEEPALIVE_EXPIRY,
+        ),
+    )
+    return httpx.AsyncClient(
+        transport=transport,
+        timeout=httpx.Timeout(
+            settings.HTTP_CLIENT_TIMEOUT,
+            connect=settings.HTTP_CLIENT_CONNECT_TIMEOUT,
+        ),
+        event_hooks={
+            "request": [_mark_request_started],
+            "response": [_observe_response],
+        },
+    )
+
+
+def get_http_client() -> httpx.AsyncClient:
+    global _client  # noqa: PLW0603
+    if _client is None or _client.is_closed:
+        _client = create_http_client()
+    return _client
+
+
+async def close_http_client() -> None:
+    global _client  # noqa: PLW0603
+    if _client is not None:
+        await _client.aclose()
+        _client = None
@@ -0,0 +1,75 @@
+import asyncio
+import logging
+import random
+import threading
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.security import PROFILE_SIGNATURE_HEADER, verify_profile_signature
+from app.services.profiling.sampler import StackSampler
+from app.services.profiling.store import ProfileStore
+
+logger = logging.getLogger(__name__)
+
+PROFILE_ID_HEADER = "X-Profile-Id"
+
+
+class ProfilingMiddleware:
+    # 서명된 헤더가 붙은 요청 중 sample_rate 비율만 샘플링 프로파일러로 잰다.
+    # 샘플은 이벤트 루프 스레드 전체를 보므로 한 번에 한 요청만 잰다.
+    def __init__(
+        self,
+        app: ASGIApp,
+        store: ProfileStore,
+        sample_rate: float,
+        interval: float,
+    ) -> None:
+        self.app = app
+        self.store = store
+        self.sample_rate = sample_rate
+        self.interval = interval
+        self._active = False
+
+    def _should_profile(self, scope: Scope) -> bool:
+        if scope["type"] != "http" or self._active:
+            return False
+        signature = Headers(scope=scope).get(PROFILE_SIGNATURE_HEADER)
+        return (
+            signature is not None
+            and verify_profile_signature(signature, scope["method"], scope["path"])
+            and random.random() < self.sample_rate
+        )
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if not self._should_profile(scope):
+            await self.app(scope, receive, send)
+            return
+
+        profile_id = self.store.new_id()
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                MutableHeaders(scope=message)[PROFILE_ID_HEADER] = profile_id
+            await send(message)
+
+        self._active = True
+        sampler = StackSampler(threading.get_ident(), self.interval)
+        sampler.start()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            sampler.stop()
+            self._active = False
+            try:
+                await asyncio.to_thread(self.store.save, profile_id, sampler.folded())
+            except OSError:
+                logger.warning("Failed to store profile %s", profile_id, exc_info=True)
+            else:
+                logger.info(
+                    "Stored profile %s for %s %s (%.3fs)",
+                    profile_id,
+                    scope["method"],
+                    scope["path"],
+                    sampler.duration,
+                )
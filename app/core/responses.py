@@ -0,0 +1,27 @@
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS
+
+
+def _to_jsonable(value: Any) -> Any:
+    # orjson이 모르는 타입 중 응답에 섞여 나올 수 있는 것은 pydantic 모델뿐이다.
+    if isinstance(value, BaseModel):
+        return value.model_dump(mode="json")
+    raise TypeError
+
+
+def dumps(content: Any) -> bytes:
+    # pydantic 모델은 클래스마다 한 번 만들어 둔 Rust 직렬화기로 바로 JSON을 만든다.
+    # 그 밖의 값(response_model이 만든 dict 등)은 orjson으로 쓴다.
+    if isinstance(content, BaseModel):
+        return content.__pydantic_serializer__.to_json(content)
+    return orjson.dumps(content, default=_to_jsonable, option=ORJSON_OPTIONS)
+
+
+class FastJSONResponse(JSONResponse):
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
@@ -1,12 +1,27 @@
+import hashlib
+import hmac
+import time
+import uuid
 from datetime import UTC, datetime, timedelta
 
-from jose import jwt
-from jose.exceptions import JWTError
-
 from app.core.config import settings
+from app.util.cache import ExpiringLRUCache
+
+ACCESS_TOKEN_TYPE = "access"
+REFRESH_TOKEN_TYPE = "refresh"
+PROFILE_SIGNATURE_HEADER = "x-profile-signature"
 
+# 검증이 끝난 토큰의 payload를 토큰 digest 기준으로 exp 시각까지 보관한다.
+token_cache: ExpiringLRUCache[bytes, dict] = ExpiringLRUCache(
+    maxsize=settings.TOKEN_CACHE_SIZE,
+)
 
-def create_access_token(data: dict, expires_delta: timedelta | None = None) -> str:
+
+def create_access_token(
+    data: dict,
+    expires_delta: timedelta | None = None,
+    token_type: str = ACCESS_TOKEN_TYPE,
+) -> str:
     to_encode = data.copy()
 
     if expires_delta:
@@ -16,7 +31,10 @@ def create_access_token(data: dict, expires_delta: timedelta | None = None) -> s
             minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES,
         )
 
-    to_encode.update({"exp": expire})
+    to_encode.update({"exp": expire, "jti": uuid.uuid4().hex, "type": token_type})
+
+    # jose는 cryptography까지 끌고 와 무겁다. 첫 토큰을 다룰 때 한 번만 불러온다.
+    from jose import jwt
 
     encoded_token = jwt.encode(
         to_encode,
@@ -30,10 +48,14 @@ def create_refresh_token(data: dict) -> str:
     return create_access_token(
         data,
         expires_delta=timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS),
+        token_type=REFRESH_TOKEN_TYPE,
     )
 
 
 def decode_token(token: str) -> dict | None:
+    from jose import jwt
+    from jose.exceptions import JWTError
+
     try:
         payload = jwt.decode(
             token,
@@ -45,6 +67,40 @@ def decode_token(token: str) -> dict | None:
         return None
 
 
+def decode_token_cached(token: str) -> dict | None:
+    key = hashlib.sha256(token.encode()).digest()
+    payload = token_cache.get(key)
+    if payload is not None:
+        return payload
+
+    payload = decode_token(token)
+    if payload is not None and "exp" in payload:
+        token_cache.set(key, payload, float(payload["exp"]))
+    return payload
+
+
 def get_username_from_token(token: str) -> str | None:
     payload = decode_token(token)
     return payload.get("sub") if payload else None
+
+
+def sign_profile_request(method: str, path: str, timestamp: int | None = None) -> str:
+    # 프로파일링 헤더 값. "<unix 초>:<HMAC-SHA256(시각:메서드:경로)>"
+    timestamp = int(time.time()) if timestamp is None else timestamp
+    message = f"{timestamp}:{method.upper()}:{path}".encode()
+    digest = hmac.new(
+        settings.PROFILING_SECRET_KEY.encode(),
+        message,
+        hashlib.sha256,
+    ).hexdigest()
+    return f"{timestamp}:{digest}"
+
+
+def verify_profile_signature(signature: str, method: str, path: str) -> bool:
+    timestamp, _, _ = signature.partition(":")
+    if not timestamp.isdigit():
+        return False
+    if abs(time.time() - int(timestamp)) > settings.PROFILING_SIGNATURE_TTL_SECONDS:
+        return False
+    expected = sign_profile_request(method, path, int(timestamp))
+    return hmac.compare_digest(signature, expected)
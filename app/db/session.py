@@ -1,29 +1,234 @@
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+import asyncio
+import time
+from collections.abc import AsyncGenerator, Callable
+from typing import Any
+
+from sqlalchemy import event, text
+from sqlalchemy.engine import Connection, ExceptionContext
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+from sqlalchemy.pool import AsyncAdaptedQueuePool, ConnectionPoolEntry
 from sqlmodel import SQLModel
 
 from app.core.config import settings
+from app.core.metrics import (
+    db_pool_checkout_duration,
+    db_pool_connections,
+    db_query_duration,
+    db_query_errors,
+    registry,
+)
+
+QUERY_STARTED_KEY = "query_started"
+
+
+class InstrumentedQueuePool(AsyncAdaptedQueuePool):
+    # 커넥션을 얻기까지 기다린 시간을 누적해 풀 크기 조정에 참고한다.
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.checkouts = 0
+        self.checkout_wait_total = 0.0
+        self.checkout_wait_max = 0.0
+
+    def _do_get(self) -> ConnectionPoolEntry:
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            waited = time.perf_counter() - started
+            self.checkouts += 1
+            self.checkout_wait_total += waited
+            self.checkout_wait_max = max(self.checkout_wait_max, waited)
+            db_pool_checkout_duration.observe(waited)
+
+    def stats(self) -> dict[str, float]:
+        capacity = self.size() + self._max_overflow
+        checked_out = self.checkedout()
+        return {
+            "size": self.size(),
+            "max_overflow": self._max_overflow,
+            "checked_out": checked_out,
+            "checked_in": self.checkedin(),
+            "overflow": max(self.overflow(), 0),
+            "utilisation": checked_out / capacity if capacity > 0 else 0.0,
+            "checkouts": self.checkouts,
+            "checkout_wait_total": self.checkout_wait_total,
+            "checkout_wait_avg": (
+                self.checkout_wait_total / self.checkouts if self.checkouts else 0.0
+            ),
+            "checkout_wait_max": self.checkout_wait_max,
+        }
+
+
+def statement_kind(statement: str) -> str:
+    # SELECT/INSERT 같은 첫 단어만 라벨로 쓴다.
+    head = statement.lstrip()[:16].split(None, 1)
+    return head[0].upper() if head else "UNKNOWN"
+
+
+def instrument_engine(target: AsyncEngine, name: str) -> None:
+    # 커서 실행 전후 이벤트로 문장 실행 시간을 잰다. 한 커넥션에서 문장이 중첩될
+    # 수 있으므로 시작 시각은 커넥션별 스택에 쌓는다.
+    sync_engine = target.sync_engine
+
+    @event.listens_for(sync_engine, "before_cursor_execute")
+    def _before_cursor_execute(conn: Connection, *_args: Any) -> None:
+        conn.info.setdefault(QUERY_STARTED_KEY, []).append(time.perf_counter())
+
+    @event.listens_for(sync_engine, "after_cursor_execute")
+    def _after_cursor_execute(
+        conn: Connection,
+        _cursor: Any,
+        statement: str,
+        *_args: Any,
+    ) -> None:
+        started = conn.info[QUERY_STARTED_KEY].pop()
+        db_query_duration.observe(
+            time.perf_counter() - started,
+            name,
+            statement_kind(statement),
+        )
+
+    @event.listens_for(sync_engine, "handle_error")
+    def _handle_error(context: ExceptionContext) -> None:
+        conn = context.connection
+        if conn is not None and conn.info.get(QUERY_STARTED_KEY):
+            conn.info[QUERY_STARTED_KEY].pop()
+        db_query_errors.inc(name, statement_kind(context.statement or ""))
+
+
+def create_db_engine(uri: str, name: str = "primary") -> AsyncEngine:
+    db_engine = create_async_engine(
+        uri,
+        echo=settings.DB_ECHO,
+        poolclass=InstrumentedQueuePool,
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_timeout=settings.DB_POOL_TIMEOUT,
+        pool_recycle=settings.DB_POOL_RECYCLE,
+        pool_pre_ping=settings.DB_POOL_PRE_PING,
+        connect_args={
+            "statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE,
+            "prepared_statement_cache_size": settings.DB_PREPARED_STATEMENT_CACHE_SIZE,
+        },
+    )
+    instrument_engine(db_engine, name)
+    return db_engine
+
+
+class LazyAsyncSessionMaker(async_sessionmaker[AsyncSession]):
+    # 엔진을 import 시점이 아니라 첫 세션을 열 때(보통 lifespan의 init_engines)
+    # 만든다. 테스트·마이그레이션처럼 DB를 안 쓰는 짧은 프로세스는 비용을 내지 않는다.
+    def __init__(self, get_bind: Callable[[], AsyncEngine], **kw: Any) -> None:
+        super().__init__(**kw)
+        self._get_bind = get_bind
+
+    def __call__(self, **local_kw: Any) -> AsyncSession:
+        if self.kw.get("bind") is None:
+            self.configure(bind=self._get_bind())
+        return super().__call__(**local_kw)
+
+
+_engines: dict[str, AsyncEngine] = {}
+
+
+def get_engine() -> AsyncEngine:
+    engine = _engines.get("primary")
+    if engine is None:
+        engine = _engines["primary"] = create_db_engine(settings.database_uri)
+    return engine
+
 
-engine = create_async_engine(
-    settings.database_uri,
-    echo=True,
-    pool_pre_ping=True,
+def get_read_engine() -> AsyncEngine:
+    # 복제본이 설정되지 않으면 읽기도 primary로 보낸다.
+    if not settings.DATABASE_READ_REPLICA_URI:
+        return get_engine()
+    engine = _engines.get("replica")
+    if engine is None:
+        engine = _engines["replica"] = create_db_engine(
+            settings.DATABASE_READ_REPLICA_URI,
+            "replica",
+        )
+    return engine
+
+
+def init_engines() -> None:
+    get_engine()
+    get_read_engine()
+
+
+async def dispose_engines() -> None:
+    for engine in _engines.values():
+        await engine.dispose()
+
+
+async_session = LazyAsyncSessionMaker(
+    get_engine,
+    class_=AsyncSession,
+    expire_on_commit=False,
 )
 
-async_session = async_sessionmaker(
-    engine,
+async_read_session = LazyAsyncSessionMaker(
+    get_read_engine,
     class_=AsyncSession,
     expire_on_commit=False,
 )
 
 
+def get_pool_stats() -> dict[str, dict[str, float]]:
+    # 아직 만들지 않은 엔진은 건드리지 않는다.
+    return {name: _pool_stats(engine) for name, engine in _engines.items()}
+
+
+def _pool_stats(target: AsyncEngine) -> dict[str, float]:
+    pool = target.pool
+    return pool.stats() if isinstance(pool, InstrumentedQueuePool) else {}
+
+
+def collect_pool_metrics() -> None:
+    for name, stats in get_pool_stats().items():
+        for state in ("checked_out", "checked_in", "overflow"):
+            db_pool_connections.set(name, state, value=stats.get(state, 0))
+
+
+registry.add_collector(collect_pool_metrics)
+
+
+async def ping_database() -> bool:
+    # 준비 상태 확인용. 풀에서 커넥션을 얻어 SELECT 1이 제한 시간 안에 끝나는지 본다.
+    try:
+        async with asyncio.timeout(settings.DB_READY_TIMEOUT_SECONDS):
+            async with get_engine().connect() as conn:
+                await conn.execute(text("SELECT 1"))
+    except (SQLAlchemyError, OSError, TimeoutError):
+        return False
+    return True
+
+
 async def init_db() -> None:
-    async with engine.begin() as conn:
+    async with get_engine().begin() as conn:
         await conn.run_sync(SQLModel.metadata.create_all)
 
 
-async def get_session() -> AsyncSession:
+async def get_write_session() -> AsyncGenerator[AsyncSession, None]:
     async with async_session() as session:
         try:
             yield session
         finally:
             await session.close()
+
+
+async def get_read_session() -> AsyncGenerator[AsyncSession, None]:
+    async with async_read_session() as session:
+        try:
+            yield session
+        finally:
+            await session.close()
+
+
+get_session = get_write_session
@@ -1,16 +1,91 @@
-from fastapi import FastAPI, Request, status
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager, suppress
+
+from fastapi import FastAPI, Request, Response, status
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
 
 from app.api.v1.endpoints import api_router
+from app.core.compression import CompressionMiddleware
 from app.core.config import settings
 from app.core.error import MCRDomainError
+from app.core.metrics import CONTENT_TYPE, MetricsMiddleware, registry
+from app.core.profiling import ProfilingMiddleware
+from app.core.responses import FastJSONResponse
+from app.db.session import dispose_engines, init_engines, ping_database
 from app.schemas.base_response import BaseResponse
+from app.services.auth.revocation import revocation_denylist
+from app.services.eventbus.bus import event_bus
+from app.services.game.event_log import game_event_writer
+from app.services.game.matchmaking import matchmaker
+from app.services.game.shanten import get_tables
+from app.services.gateway.manager import connection_manager
+from app.services.presence.registry import presence_registry
+from app.services.profiling.store import profile_store
+from app.services.profiling.watchdog import loop_lag_monitor
+from app.services.ranking.leaderboard import leaderboard
+from app.services.ratelimit.limiter import rate_limiter
+
+
+@asynccontextmanager
+async def lifespan(_app: FastAPI) -> AsyncIterator[None]:
+    # httpx와 jose는 Google 로그인에서만 쓰므로 import 시점이 아니라 여기서 올린다.
+    from app.core.http_client import close_http_client, get_http_client
+    from app.services.auth.jwks import google_jwks
+
+    init_engines()
+    get_http_client()
+    # 첫 화료/향청 판정이 표를 읽느라 늦어지지 않도록 미리 올려 둔다.
+    await asyncio.to_thread(get_tables)
+    await leaderboard.rebuild_safely()
+    revocation_sync = asyncio.create_task(
+        revocation_denylist.run_sync_loop(settings.REVOCATION_SYNC_INTERVAL_SECONDS),
+    )
+    presence_flush = asyncio.create_task(
+        presence_registry.run_flush_loop(settings.PRESENCE_FLUSH_INTERVAL_SECONDS),
+    )
+    gateway_heartbeat = asyncio.create_task(connection_manager.run_heartbeat_loop())
+    matchmaking_tick = asyncio.create_task(
+        matchmaker.run_tick_loop(settings.MATCHMAKING_TICK_SECONDS),
+    )
+    game_event_flush = asyncio.create_task(
+        game_event_writer.run_flush_loop(settings.GAME_EVENT_FLUSH_INTERVAL_SECONDS),
+    )
+    tasks = [
+        asyncio.create_task(event_bus.run()),
+        revocation_sync,
+        presence_flush,
+        gateway_heartbeat,
+        matchmaking_tick,
+        game_event_flush,
+        asyncio.create_task(
+            rate_limiter.run_evict_loop(settings.RATE_LIMIT_EVICT_INTERVAL_SECONDS),
+        ),
+    ]
+    if settings.LOOP_LAG_MONITOR_ENABLED:
+        tasks.append(
+            asyncio.create_task(
+                loop_lag_monitor.run(settings.LOOP_LAG_CHECK_INTERVAL_SECONDS),
+            ),
+        )
+    yield
+    for task in tasks:
+        task.cancel()
+        with suppress(asyncio.CancelledError):
+            await task
+    await presence_registry.flush_safely()
+    await game_event_writer.flush_safely()
+    await google_jwks.close()
+    await close_http_client()
+    await dispose_engines()
+
 
 app = FastAPI(
     title="MCRMasters-BE",
     description="A FastAPI backend application for MCRMasters",
     version="1.0.0",
+    lifespan=lifespan,
+    default_response_class=FastJSONResponse,
 )
 
 # CORS 설정
@@ -21,6 +96,22 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+app.add_middleware(
+    CompressionMiddleware,
+    minimum_size=settings.RESPONSE_COMPRESSION_MIN_SIZE,
+    gzip_level=settings.RESPONSE_GZIP_LEVEL,
+    brotli_quality=settings.RESPONSE_BROTLI_QUALITY,
+)
+if settings.PROFILING_ENABLED:
+    app.add_middleware(
+        ProfilingMiddleware,
+        store=profile_store,
+        sample_rate=settings.PROFILING_SAMPLE_RATE,
+        interval=settings.PROFILING_INTERVAL_SECONDS,
+    )
+# 가장 바깥에 두어 압축과 CORS까지 포함한 시간을 잰다.
+if settings.METRICS_ENABLED:
+    app.add_middleware(MetricsMiddleware)
 
 app.include_router(api_router, prefix=settings.API_V1_STR)
 
@@ -30,12 +121,25 @@ async def health_check() -> BaseResponse:
     return BaseResponse(message="healthy")
 
 
+@app.get("/health/ready", status_code=status.HTTP_200_OK)
+async def readiness_check(response: Response) -> BaseResponse:
+    if not await ping_database():
+        response.status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+        return BaseResponse(message="database unavailable")
+    return BaseResponse(message="ready")
+
+
+@app.get("/metrics", include_in_schema=False)
+async def metrics() -> Response:
+    return Response(registry.render(), media_type=CONTENT_TYPE)
+
+
 @app.exception_handler(MCRDomainError)
 async def mcr_domain_error_handler(
     _request: Request,
     exc: MCRDomainError,
-) -> JSONResponse:
-    return JSONResponse(
+) -> FastJSONResponse:
+    return FastJSONResponse(
         status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
         content={
             "detail": exc.message,
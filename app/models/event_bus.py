@@ -0,0 +1,9 @@
+from sqlalchemy import Column, LargeBinary
+from sqlmodel import Field
+
+from app.models.base_model import BaseModel
+
+
+class EventBusOverflow(BaseModel, table=True):  # type: ignore[call-arg]
+    # NOTIFY 한도를 넘는 이벤트 본문. 알림에는 이 행의 id만 실린다.
+    payload: bytes = Field(sa_column=Column(LargeBinary, nullable=False))
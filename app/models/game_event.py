@@ -0,0 +1,39 @@
+from datetime import UTC, datetime
+
+from sqlalchemy import BigInteger, DateTime, LargeBinary, SmallInteger
+from sqlmodel import Field, SQLModel
+
+
+# 이벤트 로그는 (game_id, seq)가 곧 키라서 BaseModel의 id 열과 인덱스를 두지 않는다.
+# 한 판에 수백 행씩 쌓이므로 행 폭도 smallint로 줄인다.
+class GameEvent(SQLModel, table=True):  # type: ignore[call-arg]
+    game_id: int = Field(primary_key=True, sa_type=BigInteger)
+    seq: int = Field(primary_key=True)
+    kind: int = Field(sa_type=SmallInteger)
+    seat: int = Field(sa_type=SmallInteger)
+    tile: int = Field(sa_type=SmallInteger)
+    arg: int = Field(default=0, sa_type=SmallInteger)
+    created_at: datetime = Field(
+        default_factory=lambda: datetime.now(UTC),
+        sa_type=DateTime(timezone=True),
+    )
+
+
+class GameSnapshot(SQLModel, table=True):  # type: ignore[call-arg]
+    game_id: int = Field(primary_key=True, sa_type=BigInteger)
+    seq: int = Field(primary_key=True)
+    data: bytes = Field(sa_type=LargeBinary)
+    created_at: datetime = Field(
+        default_factory=lambda: datetime.now(UTC),
+        sa_type=DateTime(timezone=True),
+    )
+
+
+# 사용자별 기록 조회용. 판이 시작될 때 자리마다 한 행씩 남기고,
+# 판이 끝나면 최종 점수와 순위를 채운다. 레이팅 재계산의 입력이다.
+class GamePlayer(SQLModel, table=True):  # type: ignore[call-arg]
+    game_id: int = Field(primary_key=True, sa_type=BigInteger)
+    seat: int = Field(primary_key=True, sa_type=SmallInteger)
+    user_id: int = Field(index=True)
+    score: int | None = None
+    placement: int | None = Field(default=None, sa_type=SmallInteger)
@@ -0,0 +1,18 @@
+from datetime import datetime
+
+from sqlalchemy import Column, DateTime
+from sqlmodel import Field, SQLModel
+
+
+# 여러 워커가 나눠 쓰는 토큰 버킷. 재시작하면 비어도 되는 값이라 UNLOGGED로 만들어
+# WAL을 쓰지 않는다. allowed는 마지막 갱신이 요청을 허용했는지를 RETURNING으로
+# 돌려받기 위한 열이다.
+class RateLimitBucket(SQLModel, table=True):  # type: ignore[call-arg]
+    __table_args__ = {"prefixes": ["UNLOGGED"]}
+
+    key: str = Field(primary_key=True, max_length=200)
+    tokens: float
+    allowed: bool
+    updated_at: datetime = Field(
+        sa_column=Column(DateTime(timezone=True), nullable=False, index=True),
+    )
@@ -0,0 +1,13 @@
+from datetime import datetime
+
+from sqlalchemy import Column, DateTime
+from sqlmodel import Field
+
+from app.models.base_model import BaseModel
+
+
+class RevokedToken(BaseModel, table=True):  # type: ignore[call-arg]
+    jti: str = Field(index=True, unique=True, max_length=32)
+    expires_at: datetime = Field(
+        sa_column=Column(DateTime(timezone=True), nullable=False, index=True),
+    )
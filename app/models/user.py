@@ -2,12 +2,24 @@ from datetime import datetime
 from enum import Enum
 
 from pydantic import field_validator
-from sqlalchemy import Column, DateTime, String
-from sqlmodel import Field
+from sqlalchemy import Column, DateTime, Sequence, String
+from sqlmodel import Field, SQLModel
 
 from app.models.base_model import BaseModel
 from app.util.validators import validate_uid
 
+UID_SEQUENCE_NAME = "user_uid_seq"
+DEFAULT_RATING = 1500.0
+
+# uid 발급용 시퀀스. 값은 app.services.auth.uid_allocator에서 순열을 거쳐 uid가 된다.
+uid_sequence = Sequence(
+    UID_SEQUENCE_NAME,
+    start=0,
+    minvalue=0,
+    maxvalue=899_999_999,
+    metadata=SQLModel.metadata,
+)
+
 
 class UserStatus(str, Enum):
     OFFLINE = "offline"
@@ -21,13 +33,17 @@ class User(BaseModel, table=True):  # type: ignore[call-arg]
     nickname: str = Field(max_length=10)
     is_active: bool = Field(default=True)
     status: UserStatus = Field(default=UserStatus.OFFLINE, sa_column=Column(String(20)))
+    rating: float = Field(
+        default=DEFAULT_RATING,
+        sa_column_kwargs={"server_default": str(int(DEFAULT_RATING))},
+    )
 
     last_login: datetime | None = Field(
         default=None,
         sa_column=Column(DateTime(timezone=True), nullable=True),
     )
 
-    email: str | None = Field(default=None)
+    email: str | None = Field(default=None, index=True, unique=True)
 
     @field_validator("uid")
     @classmethod
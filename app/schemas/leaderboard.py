@@ -0,0 +1,12 @@
+from pydantic import BaseModel
+
+
+class LeaderboardEntryResponse(BaseModel):
+    rank: int
+    user_id: int
+    rating: float
+
+
+class LeaderboardResponse(BaseModel):
+    entries: list[LeaderboardEntryResponse]
+    total: int
@@ -0,0 +1,9 @@
+from pydantic import BaseModel
+
+
+class MatchmakingStatusResponse(BaseModel):
+    queued: bool
+    room_id: int | None = None
+    waited_seconds: float = 0.0
+    window: float = 0.0
+    queue_size: int
@@ -0,0 +1,13 @@
+from pydantic import BaseModel
+
+from app.models.user import UserStatus
+
+
+class PresenceSummaryResponse(BaseModel):
+    online: int
+    counts: dict[UserStatus, int]
+
+
+class PresenceStatusResponse(BaseModel):
+    user_id: int
+    status: UserStatus
@@ -0,0 +1,21 @@
+from pydantic import BaseModel
+
+
+class ProfileResponse(BaseModel):
+    profile_id: str
+    size: int
+    created_at: float
+
+
+class ProfileListResponse(BaseModel):
+    profiles: list[ProfileResponse]
+
+
+class LoopStallResponse(BaseModel):
+    started_at: float
+    duration: float
+    stack: list[str]
+
+
+class LoopStallListResponse(BaseModel):
+    stalls: list[LoopStallResponse]
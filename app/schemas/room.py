@@ -0,0 +1,28 @@
+from pydantic import BaseModel, ConfigDict, Field
+
+from app.services.game.room import RoomState
+
+
+class RoomCreateRequest(BaseModel):
+    name: str = Field(min_length=1, max_length=50)
+
+
+class RoomReadyRequest(BaseModel):
+    ready: bool
+
+
+class RoomResponse(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    name: str
+    host_id: int
+    state: RoomState
+    player_ids: list[int]
+    ready_ids: list[int]
+    seats_free: int
+
+
+class RoomListResponse(BaseModel):
+    rooms: list[RoomResponse]
+    next_cursor: int | None
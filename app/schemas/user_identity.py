@@ -0,0 +1,14 @@
+from pydantic import BaseModel, ConfigDict
+
+from app.models.user import DEFAULT_RATING
+
+
+class UserIdentity(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+    id: int
+    uid: str
+    nickname: str
+    email: str | None = None
+    is_active: bool = True
+    rating: float = DEFAULT_RATING
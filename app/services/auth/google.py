@@ -1,11 +1,13 @@
-from datetime import UTC, datetime
 from urllib.parse import urlencode
 
 import httpx
 from fastapi import HTTPException, status
+from jose import jwt
+from jose.exceptions import JWTError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import settings
+from app.core.http_client import get_http_client
 from app.core.security import create_access_token, create_refresh_token
 from app.schemas.google_oauth import (
     GoogleAuthParams,
@@ -14,6 +16,7 @@ from app.schemas.google_oauth import (
     GoogleUserInfo,
 )
 from app.schemas.token_response import TokenResponse
+from app.services.auth.jwks import google_jwks
 from app.services.auth.user_service import get_or_create_user
 
 
@@ -35,30 +38,69 @@ class GoogleOAuthService:
             redirect_uri=settings.GOOGLE_REDIRECT_URI,
         )
 
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                settings.GOOGLE_TOKEN_URL,
-                data=token_request.to_dict(),
-            )
-            response.raise_for_status()
-            token_data = response.json()
-            validated_token: GoogleTokenResponse = GoogleTokenResponse.model_validate(
-                token_data,
-            )
-            return validated_token
+        client = get_http_client()
+        response = await client.post(
+            settings.GOOGLE_TOKEN_URL,
+            data=token_request.to_dict(),
+        )
+        response.raise_for_status()
+        token_data = response.json()
+        validated_token: GoogleTokenResponse = GoogleTokenResponse.model_validate(
+            token_data,
+        )
+        return validated_token
 
     @staticmethod
     async def get_user_info(access_token: str) -> GoogleUserInfo:
         headers = {"Authorization": f"Bearer {access_token}"}
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                settings.GOOGLE_USER_INFO_URL,
-                headers=headers,
+        client = get_http_client()
+        response = await client.get(
+            settings.GOOGLE_USER_INFO_URL,
+            headers=headers,
+        )
+        response.raise_for_status()
+        user_data = response.json()
+        validated_user: GoogleUserInfo = GoogleUserInfo.model_validate(user_data)
+        return validated_user
+
+    @staticmethod
+    async def verify_id_token(token: GoogleTokenResponse) -> GoogleUserInfo | None:
+        if not settings.GOOGLE_VERIFY_ID_TOKEN or not token.id_token:
+            return None
+
+        try:
+            header = jwt.get_unverified_header(token.id_token)
+        except JWTError:
+            return None
+
+        key = await google_jwks.get_key(header.get("kid"))
+        if key is None:
+            return None
+
+        try:
+            claims = jwt.decode(
+                token.id_token,
+                key,
+                algorithms=[key.get("alg", "RS256")],
+                audience=settings.GOOGLE_CLIENT_ID,
+                issuer=settings.GOOGLE_ID_TOKEN_ISSUERS,
+                access_token=token.access_token,
             )
-            response.raise_for_status()
-            user_data = response.json()
-            validated_user: GoogleUserInfo = GoogleUserInfo.model_validate(user_data)
-            return validated_user
+        except JWTError:
+            return None
+
+        if not claims.get("email"):
+            return None
+
+        return GoogleUserInfo(
+            email=claims["email"],
+            verified_email=claims.get("email_verified"),
+            name=claims.get("name"),
+            given_name=claims.get("given_name"),
+            family_name=claims.get("family_name"),
+            picture=claims.get("picture"),
+            locale=claims.get("locale"),
+        )
 
     @staticmethod
     async def process_google_login(
@@ -67,15 +109,17 @@ class GoogleOAuthService:
     ) -> TokenResponse:
         try:
             token_info = await GoogleOAuthService.get_google_token(code)
-            user_info = await GoogleOAuthService.get_user_info(token_info.access_token)
+            user_info = await GoogleOAuthService.verify_id_token(token_info)
+            if user_info is None:
+                user_info = await GoogleOAuthService.get_user_info(
+                    token_info.access_token,
+                )
             user, is_new_user = await get_or_create_user(
                 session,
                 user_info.model_dump(),
             )
 
-            user.last_login = datetime.now(UTC)
             await session.commit()
-            await session.refresh(user)
 
             access_token = create_access_token(data={"sub": user.email})
             refresh_token = create_refresh_token(data={"sub": user.email})
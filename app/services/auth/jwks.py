@@ -0,0 +1,114 @@
+import asyncio
+import logging
+import re
+import time
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+import httpx
+
+from app.core.config import settings
+from app.core.http_client import get_http_client
+
+logger = logging.getLogger(__name__)
+
+JWK = dict[str, Any]
+JWKSFetcher = Callable[[], Awaitable[tuple[list[JWK], float | None]]]
+
+_MAX_AGE_PATTERN = re.compile(r"max-age=(\d+)")
+
+
+def parse_max_age(cache_control: str | None) -> float | None:
+    if not cache_control:
+        return None
+    match = _MAX_AGE_PATTERN.search(cache_control)
+    return float(match.group(1)) if match else None
+
+
+async def fetch_google_jwks() -> tuple[list[JWK], float | None]:
+    response = await get_http_client().get(settings.GOOGLE_JWKS_URL)
+    response.raise_for_status()
+    keys: list[JWK] = response.json()["keys"]
+    return keys, parse_max_age(response.headers.get("cache-control"))
+
+
+class JWKSCache:
+    # 서명 키를 메모리에 보관하고 Cache-Control max-age 동안 재사용한다.
+    # 만료되었거나 모르는 kid가 들어오면 기존 키로 응답하면서 백그라운드에서 갱신하고,
+    # 키가 하나도 없을 때만 요청 경로에서 직접 가져온다.
+    def __init__(
+        self,
+        fetcher: JWKSFetcher,
+        default_max_age: float,
+        min_refresh_interval: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._fetcher = fetcher
+        self._default_max_age = default_max_age
+        self._min_refresh_interval = min_refresh_interval
+        self._clock = clock
+        self._keys: dict[str, JWK] = {}
+        self._expires_at = 0.0
+        self._last_attempt: float | None = None
+        self._refresh_task: asyncio.Task[None] | None = None
+
+    @property
+    def kids(self) -> frozenset[str]:
+        return frozenset(self._keys)
+
+    async def get_key(self, kid: str | None) -> JWK | None:
+        if not self._keys:
+            if self._can_refresh():
+                await self.refresh()
+        elif self._clock() >= self._expires_at:
+            self.schedule_refresh()
+
+        if kid is None:
+            return None
+        key = self._keys.get(kid)
+        if key is None:
+            self.schedule_refresh()
+        return key
+
+    async def refresh(self) -> None:
+        if self._refresh_task is None or self._refresh_task.done():
+            self._refresh_task = asyncio.create_task(self._refresh())
+        await asyncio.shield(self._refresh_task)
+
+    def schedule_refresh(self) -> None:
+        if self._refresh_task is not None and not self._refresh_task.done():
+            return
+        if not self._can_refresh():
+            return
+        self._refresh_task = asyncio.create_task(self._refresh())
+
+    async def close(self) -> None:
+        if self._refresh_task is not None and not self._refresh_task.done():
+            self._refresh_task.cancel()
+        self._refresh_task = None
+
+    def _can_refresh(self) -> bool:
+        return (
+            self._last_attempt is None
+            or self._clock() - self._last_attempt >= self._min_refresh_interval
+        )
+
+    async def _refresh(self) -> None:
+        self._last_attempt = self._clock()
+        try:
+            keys, max_age = await self._fetcher()
+        except (httpx.HTTPError, KeyError, ValueError):
+            logger.warning("Failed to refresh Google JWKS", exc_info=True)
+            return
+
+        self._keys = {key["kid"]: key for key in keys if "kid" in key}
+        self._expires_at = self._clock() + (
+            max_age if max_age is not None else self._default_max_age
+        )
+
+
+google_jwks = JWKSCache(
+    fetch_google_jwks,
+    default_max_age=settings.GOOGLE_JWKS_DEFAULT_MAX_AGE,
+    min_refresh_interval=settings.GOOGLE_JWKS_MIN_REFRESH_INTERVAL,
+)
@@ -0,0 +1,137 @@
+import asyncio
+import logging
+from datetime import UTC, datetime
+
+from sqlalchemy import delete, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlmodel import col
+
+from app.core.config import settings
+from app.db.session import async_session
+from app.models.revoked_token import RevokedToken
+from app.util.bloom import BloomFilter
+
+logger = logging.getLogger(__name__)
+
+# 커밋 순서가 id 순서와 다를 수 있으므로 watermark 직전 구간을 다시 읽는다.
+SYNC_ID_OVERLAP = 256
+
+
+class RevocationDenylist:
+    # 워커마다 폐기된 jti의 Bloom filter를 들고 있어서 "폐기되지 않음"은 I/O 없이
+    # O(1)로 판정하고, filter가 양성일 때만 DB에서 정확히 확인한다.
+    # 다른 워커가 폐기한 토큰은 id watermark 이후 행만 읽어 점진적으로 반영한다.
+    # 첫 rebuild 전에는 filter가 비어 있으므로 모든 jti를 DB에서 확인한다.
+    def __init__(self, capacity: int, error_rate: float) -> None:
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self._filter = BloomFilter(capacity, error_rate)
+        self._watermark = 0
+        self._pending: list[str] | None = None
+        self.loaded = False
+        self.exact_checks = 0
+
+    @property
+    def filter(self) -> BloomFilter:
+        return self._filter
+
+    def might_be_revoked(self, jti: str) -> bool:
+        return not self.loaded or jti in self._filter
+
+    async def is_revoked(self, session: AsyncSession, jti: str) -> bool:
+        if not self.might_be_revoked(jti):
+            return False
+
+        self.exact_checks += 1
+        result = await session.execute(
+            select(col(RevokedToken.id)).where(col(RevokedToken.jti) == jti),
+        )
+        return result.scalar_one_or_none() is not None
+
+    async def revoke(
+        self,
+        session: AsyncSession,
+        jti: str,
+        expires_at: datetime,
+    ) -> bool:
+        result = await session.execute(
+            insert(RevokedToken)
+            .values(jti=jti, expires_at=expires_at, created_at=datetime.now(UTC))
+            .on_conflict_do_nothing(index_elements=["jti"])
+            .returning(col(RevokedToken.id)),
+        )
+        self.add(jti)
+        return result.scalar_one_or_none() is not None
+
+    def add(self, jti: str) -> None:
+        if jti not in self._filter:
+            self._filter.add(jti)
+        if self._pending is not None:
+            self._pending.append(jti)
+
+    async def sync(self, session: AsyncSession) -> int:
+        added = 0
+        for token_id, jti in await self._load(session, self._watermark):
+            if jti not in self._filter:
+                self._filter.add(jti)
+                added += 1
+            self._watermark = max(self._watermark, token_id)
+        return added
+
+    async def rebuild(self, session: AsyncSession) -> None:
+        await session.execute(
+            delete(RevokedToken).where(
+                col(RevokedToken.expires_at) <= datetime.now(UTC),
+            ),
+        )
+        await session.commit()
+
+        # 재구성하는 동안 이 워커에서 폐기된 jti는 새 filter에도 넣는다.
+        self._pending = []
+        try:
+            rows = await self._load(session, 0)
+            # 살아 있는 폐기 건수가 용량을 넘으면 오탐률을 지키도록 용량을 늘린다.
+            # 그대로 두면 매 주기마다 count > capacity라서 전체 재구성을 반복한다.
+            live = len(rows) + len(self._pending)
+            if live > self.capacity:
+                self.capacity = 2 * live
+            new_filter = BloomFilter(self.capacity, self.error_rate)
+            for _, jti in rows:
+                new_filter.add(jti)
+            for jti in self._pending:
+                if jti not in new_filter:
+                    new_filter.add(jti)
+            self._filter = new_filter
+            self._watermark = max((token_id for token_id, _ in rows), default=0)
+            self.loaded = True
+        finally:
+            self._pending = None
+
+    async def _load(self, session: AsyncSession, watermark: int) -> list:
+        result = await session.execute(
+            select(col(RevokedToken.id), col(RevokedToken.jti)).where(
+                col(RevokedToken.id) > watermark - SYNC_ID_OVERLAP,
+                col(RevokedToken.expires_at) > datetime.now(UTC),
+            ),
+        )
+        return list(result.all())
+
+    async def run_sync_loop(self, interval: float) -> None:
+        while True:
+            try:
+                async with async_session() as session:
+                    if not self.loaded or self._filter.count > self.capacity:
+                        await self.rebuild(session)
+                    else:
+                        await self.sync(session)
+            except (SQLAlchemyError, OSError):
+                logger.warning("Failed to sync token revocations", exc_info=True)
+            await asyncio.sleep(interval)
+
+
+revocation_denylist = RevocationDenylist(
+    capacity=settings.REVOCATION_BLOOM_CAPACITY,
+    error_rate=settings.REVOCATION_BLOOM_ERROR_RATE,
+)
@@ -0,0 +1,81 @@
+from datetime import UTC, datetime
+
+from fastapi import HTTPException, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.security import (
+    REFRESH_TOKEN_TYPE,
+    create_access_token,
+    create_refresh_token,
+    decode_token,
+)
+from app.schemas.refresh_token import RefreshTokenResponse
+from app.services.auth.revocation import revocation_denylist
+from app.services.auth.user_service import get_user_identity
+
+
+def _invalid_refresh_token() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail="Invalid refresh token",
+        headers={"WWW-Authenticate": "Bearer"},
+    )
+
+
+def _decode_refresh_token(refresh_token: str) -> dict:
+    payload = decode_token(refresh_token)
+    if (
+        payload is None
+        or payload.get("type") != REFRESH_TOKEN_TYPE
+        or not payload.get("jti")
+        or not payload.get("sub")
+    ):
+        raise _invalid_refresh_token()
+    return payload
+
+
+async def revoke_token_payload(session: AsyncSession, payload: dict) -> bool:
+    return await revocation_denylist.revoke(
+        session,
+        payload["jti"],
+        datetime.fromtimestamp(payload["exp"], UTC),
+    )
+
+
+async def rotate_refresh_token(
+    session: AsyncSession,
+    refresh_token: str,
+) -> RefreshTokenResponse:
+    payload = _decode_refresh_token(refresh_token)
+
+    # 폐기 행 INSERT가 성공한 요청만 회전할 수 있으므로 같은 토큰의 재사용이나
+    # 동시 요청은 한 번만 통과한다.
+    if not await revoke_token_payload(session, payload):
+        await session.rollback()
+        raise _invalid_refresh_token()
+
+    identity = await get_user_identity(session, payload["sub"])
+    if identity is None or not identity.is_active:
+        await session.rollback()
+        raise _invalid_refresh_token()
+
+    await session.commit()
+    return RefreshTokenResponse(
+        access_token=create_access_token(data={"sub": payload["sub"]}),
+        refresh_token=create_refresh_token(data={"sub": payload["sub"]}),
+    )
+
+
+async def revoke_tokens(
+    session: AsyncSession,
+    access_payload: dict,
+    refresh_token: str,
+) -> None:
+    refresh_payload = _decode_refresh_token(refresh_token)
+    if refresh_payload["sub"] != access_payload.get("sub"):
+        raise _invalid_refresh_token()
+
+    await revoke_token_payload(session, refresh_payload)
+    if access_payload.get("jti"):
+        await revoke_token_payload(session, access_payload)
+    await session.commit()
@@ -0,0 +1,94 @@
+import asyncio
+import hashlib
+from collections import deque
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.models.user import UID_SEQUENCE_NAME
+
+UID_OFFSET = 100_000_000
+# 30000 * 30000 = 900,000,000 = 9자리 uid(100000000~999999999)의 개수
+UID_HALF = 30_000
+UID_SPACE = UID_HALF * UID_HALF
+
+_MASK64 = (1 << 64) - 1
+
+
+class FeistelPermutation:
+    # [0, UID_SPACE) 위의 키 기반 순열. 두 반쪽이 같은 크기(30000)인 Feistel
+    # 네트워크라 cycle walking 없이 정확히 전단사가 된다. 키를 바꾸면 이미 발급한
+    # uid와 충돌할 수 있으므로 운영 중에는 키와 라운드 수를 바꾸면 안 된다.
+    def __init__(self, key: str, rounds: int) -> None:
+        self._round_keys = [
+            int.from_bytes(
+                hashlib.blake2b(
+                    key.encode(),
+                    digest_size=8,
+                    person=b"uid-feistel",
+                    salt=i.to_bytes(16, "little"),
+                ).digest(),
+                "little",
+            )
+            for i in range(rounds)
+        ]
+
+    @staticmethod
+    def _round(value: int, round_key: int) -> int:
+        x = (value * 0x9E3779B97F4A7C15 + round_key) & _MASK64
+        x ^= x >> 29
+        x = (x * 0xBF58476D1CE4E5B9) & _MASK64
+        x ^= x >> 32
+        return x % UID_HALF
+
+    def permute(self, value: int) -> int:
+        left, right = divmod(value, UID_HALF)
+        for round_key in self._round_keys:
+            # _round를 인라인한 것. 발급 경로에서 함수 호출 비용을 줄인다.
+            x = (right * 0x9E3779B97F4A7C15 + round_key) & _MASK64
+            x ^= x >> 29
+            x = (x * 0xBF58476D1CE4E5B9) & _MASK64
+            left, right = right, (left + (x ^ (x >> 32))) % UID_HALF
+        return left * UID_HALF + right
+
+    def invert(self, value: int) -> int:
+        left, right = divmod(value, UID_HALF)
+        for round_key in reversed(self._round_keys):
+            left, right = (right - self._round(left, round_key)) % UID_HALF, left
+        return left * UID_HALF + right
+
+
+class UidAllocator:
+    # 시퀀스 값을 블록 단위로 미리 받아 두고 순열을 거쳐 uid로 바꾼다.
+    # 시퀀스 값이 유일하므로 uid도 유일하며 발급마다 조회할 필요가 없다.
+    def __init__(self, permutation: FeistelPermutation, prefetch_size: int) -> None:
+        self._permutation = permutation
+        self._prefetch_size = prefetch_size
+        self._values: deque[int] = deque()
+        self._lock = asyncio.Lock()
+
+    def to_uid(self, value: int) -> str:
+        return str(UID_OFFSET + self._permutation.permute(value))
+
+    async def allocate(self, db: AsyncSession) -> str:
+        if not self._values:
+            async with self._lock:
+                if not self._values:
+                    await self._prefetch(db)
+        return self.to_uid(self._values.popleft())
+
+    async def _prefetch(self, db: AsyncSession) -> None:
+        result = await db.execute(
+            text(
+                f"SELECT nextval('{UID_SEQUENCE_NAME}') FROM generate_series(1, :n)",
+            ),
+            {"n": self._prefetch_size},
+        )
+        self._values.extend(result.scalars().all())
+
+
+uid_allocator = UidAllocator(
+    FeistelPermutation(settings.UID_PERMUTATION_KEY, settings.UID_PERMUTATION_ROUNDS),
+    prefetch_size=settings.UID_PREFETCH_SIZE,
+)
@@ -1,43 +1,108 @@
-from random import randint
+from datetime import UTC, datetime
 
-from sqlalchemy import select
+from sqlalchemy import select, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlmodel import col
 
-from app.models.user import User
-from app.util.validators import validate_uid
+from app.core.config import settings
+from app.core.error import DomainErrorCode, MCRDomainError
+from app.models.user import User, UserStatus
+from app.schemas.user_identity import UserIdentity
+from app.services.auth.uid_allocator import uid_allocator
+from app.util.cache import ExpiringLRUCache
+
+MAX_UID_ATTEMPTS = 3
+
+identity_cache: ExpiringLRUCache[str, UserIdentity] = ExpiringLRUCache(
+    maxsize=settings.USER_IDENTITY_CACHE_SIZE,
+)
 
 
 async def generate_unique_uid(db: AsyncSession) -> str:
-    while True:
-        uid = str(randint(100000000, 999999999))
+    return await uid_allocator.allocate(db)
 
-        try:
-            validate_uid(uid)
-            result = await db.execute(
-                select(User).where(User.uid == uid),
-            )
-            existing_user = result.scalar_one_or_none()
 
-            if not existing_user:
-                return uid
+async def get_or_create_user(db: AsyncSession, user_info: dict) -> tuple[User, bool]:
+    # 기존 사용자는 UPDATE ... RETURNING 한 번으로 조회와 last_login 갱신을 한다.
+    # uid 시퀀스 값은 트랜잭션과 무관하게 소모되므로 행을 새로 넣을 때만 뽑는다.
+    now = datetime.now(UTC)
+    result = await db.execute(
+        update(User)
+        .where(col(User.email) == user_info["email"])
+        .values(last_login=now)
+        .returning(User)
+        .execution_options(populate_existing=True),
+    )
+    user = result.scalar_one_or_none()
+    if user is not None:
+        return user, user.nickname == ""
 
-        except Exception:
+    # 같은 email로 동시에 처음 로그인해도 ON CONFLICT로 행은 하나만 생긴다.
+    for _ in range(MAX_UID_ATTEMPTS):
+        statement = (
+            insert(User)
+            .values(
+                email=user_info["email"],
+                uid=await generate_unique_uid(db),
+                nickname="",
+                is_active=True,
+                status=UserStatus.OFFLINE.value,
+                last_login=now,
+                created_at=now,
+            )
+            .on_conflict_do_update(
+                index_elements=["email"],
+                set_={"last_login": now},
+            )
+            .returning(User)
+            .execution_options(populate_existing=True)
+        )
+        try:
+            result = await db.execute(statement)
+        except IntegrityError:
+            # 순열 도입 전에 무작위로 발급된 uid와 겹친 경우에만 발생한다.
+            await db.rollback()
             continue
 
+        user = result.scalar_one()
+        return user, user.nickname == ""
 
-async def get_or_create_user(db: AsyncSession, user_info: dict) -> tuple[User, bool]:
-    user = await db.execute(
-        select(User).where(User.email == user_info["email"]),
+    raise MCRDomainError(
+        code=DomainErrorCode.UID_ALLOCATION_FAILED,
+        message="Failed to allocate a unique UID",
+        details={"email": user_info["email"]},
     )
-    user = user.scalar_one_or_none()
-    if not user:
-        new_uid = await generate_unique_uid(db)
-        user = User(
-            email=user_info["email"],
-            uid=new_uid,
-            nickname="",
-        )
-        db.add(user)
-        return user, True
 
-    return user, user.nickname == ""
+
+async def get_user_identity(db: AsyncSession, email: str) -> UserIdentity | None:
+    identity = identity_cache.get(email)
+    if identity is not None:
+        return identity
+
+    result = await db.execute(
+        select(
+            col(User.id),
+            col(User.uid),
+            col(User.nickname),
+            col(User.email),
+            col(User.is_active),
+            col(User.rating),
+        ).where(col(User.email) == email),
+    )
+    row = result.one_or_none()
+    if row is None:
+        return None
+
+    identity = UserIdentity.model_validate(row._asdict())
+    identity_cache.set_with_ttl(
+        email,
+        identity,
+        settings.USER_IDENTITY_CACHE_TTL_SECONDS,
+    )
+    return identity
+
+
+def invalidate_user_identity(email: str) -> None:
+    identity_cache.pop(email)
@@ -0,0 +1,282 @@
+import asyncio
+import logging
+import uuid
+import zlib
+from abc import ABC, abstractmethod
+from collections import deque
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any
+
+from app.core.config import EventBusBackend, settings
+from app.models.event_bus import EventBusOverflow
+from app.services.eventbus.codec import (
+    OVERFLOW_FRAME,
+    Event,
+    decode_body,
+    encode_body,
+    encode_event,
+    overflow_frame,
+    pack,
+    parse_frame,
+    unpack,
+)
+
+if TYPE_CHECKING:
+    from asyncpg import Connection
+
+logger = logging.getLogger(__name__)
+
+type EventHandler = Callable[[dict[str, Any]], None]
+
+OVERFLOW_TABLE = EventBusOverflow.__tablename__
+INSERT_OVERFLOW_SQL = (
+    f"INSERT INTO {OVERFLOW_TABLE} (created_at, payload) VALUES (now(), $1) "
+    "RETURNING id"
+)
+SELECT_OVERFLOW_SQL = f"SELECT payload FROM {OVERFLOW_TABLE} WHERE id = $1"
+DELETE_EXPIRED_OVERFLOW_SQL = f"""
+    DELETE FROM {OVERFLOW_TABLE}
+    WHERE created_at < now() - make_interval(secs => $1)
+"""
+RECONNECT_MIN_SECONDS = 0.1
+
+
+class EventBus(ABC):
+    # 다른 워커가 발행한 이벤트를 채널별 핸들러로 넘긴다. 발행한 워커는 이미
+    # 로컬에서 처리했으므로 자기 이벤트는 되돌려 받지 않는다.
+    def __init__(self) -> None:
+        self.origin = uuid.uuid4().hex[:12]
+        self._handlers: dict[str, list[EventHandler]] = {}
+        self.published = 0
+        self.received = 0
+
+    def subscribe(self, channel: str, handler: EventHandler) -> None:
+        self._handlers.setdefault(channel, []).append(handler)
+
+    @abstractmethod
+    def publish(self, channel: str, payload: dict[str, Any]) -> None: ...
+
+    def dispatch(self, events: list[Event]) -> None:
+        for channel, payload in events:
+            self.received += 1
+            for handler in self._handlers.get(channel, ()):
+                try:
+                    handler(payload)
+                except Exception:
+                    logger.exception("Event handler for %s failed", channel)
+
+    async def run(self) -> None:
+        # 프로세스 밖과 주고받을 것이 없으면 할 일이 없다.
+        return
+
+    def stats(self) -> dict[str, int]:
+        return {"published": self.published, "received": self.received}
+
+
+class InProcessEventBus(EventBus):
+    # 워커가 하나일 때의 기본값. 같은 peers 목록을 나눈 인스턴스끼리는 직렬화된
+    # 사본을 주고받으므로 테스트에서 여러 워커를 한 프로세스로 흉내 낼 수 있다.
+    def __init__(self, peers: list["InProcessEventBus"] | None = None) -> None:
+        super().__init__()
+        self.peers = peers if peers is not None else []
+        self.peers.append(self)
+
+    def publish(self, channel: str, payload: dict[str, Any]) -> None:
+        if len(self.peers) == 1:
+            return
+        self.published += 1
+        body = encode_body([encode_event(channel, payload)])
+        for peer in self.peers:
+            if peer is not self:
+                peer.dispatch(decode_body(body))
+
+
+class PostgresEventBus(EventBus):
+    # 전용 asyncpg 연결 하나로 LISTEN/NOTIFY를 한다. 발행은 메모리 큐에 쌓았다가
+    # batch_interval마다 묶어서 보내고, 한도를 넘는 이벤트만 테이블을 거친다.
+    # 끊기면 지수 백오프로 다시 연결한다. 끊기는 순간 보내던 배치와 끊긴 동안
+    # 다른 워커가 보낸 알림은 잃는다. (최대 한 번 전달)
+    def __init__(  # noqa: PLR0913
+        self,
+        dsn: str,
+        channel: str,
+        batch_interval: float,
+        max_payload: int,
+        compress_min: int,
+        max_pending: int,
+        keepalive: float,
+        reconnect_max: float,
+        overflow_retention: float,
+    ) -> None:
+        super().__init__()
+        self.dsn = dsn
+        self.channel = channel
+        self.batch_interval = batch_interval
+        self.max_payload = max_payload
+        self.compress_min = compress_min
+        self.keepalive = keepalive
+        self.reconnect_max = reconnect_max
+        self.overflow_retention = overflow_retention
+        self._pending: deque[bytes] = deque(maxlen=max_pending)
+        self._wakeup = asyncio.Event()
+        self._inbox: asyncio.Queue[tuple[str, str]] = asyncio.Queue()
+        self._connection: Connection | None = None
+        self._lock = asyncio.Lock()
+        self.frames_sent = 0
+        self.overflowed = 0
+        self.dropped = 0
+        self.reconnects = 0
+
+    @property
+    def connected(self) -> bool:
+        return self._connection is not None and not self._connection.is_closed()
+
+    def publish(self, channel: str, payload: dict[str, Any]) -> None:
+        if len(self._pending) == self._pending.maxlen:
+            self.dropped += 1
+        self._pending.append(encode_event(channel, payload))
+        self.published += 1
+        self._wakeup.set()
+
+    def _on_notify(
+        self,
+        _connection: object,
+        _pid: int,
+        _channel: str,
+        frame: str,
+    ) -> None:
+        kind, origin, body = parse_frame(frame)
+        if origin != self.origin:
+            self._inbox.put_nowait((kind, body))
+
+    def _on_terminate(self, _connection: object) -> None:
+        self._wakeup.set()
+
+    async def run(self) -> None:
+        import asyncpg
+
+        deliver = asyncio.create_task(self._deliver_loop())
+        delay = RECONNECT_MIN_SECONDS
+        try:
+            while True:
+                try:
+                    connection = await asyncpg.connect(self.dsn)
+                    self._connection = connection
+                    connection.add_termination_listener(self._on_terminate)
+                    await connection.add_listener(self.channel, self._on_notify)
+                    delay = RECONNECT_MIN_SECONDS
+                    await self._pump(connection)
+                except (OSError, asyncpg.PostgresError, asyncpg.InterfaceError):
+                    logger.warning("Event bus connection failed", exc_info=True)
+                finally:
+                    await self._close()
+                self.reconnects += 1
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, self.reconnect_max)
+        finally:
+            deliver.cancel()
+            await self._close()
+
+    async def _close(self) -> None:
+        connection, self._connection = self._connection, None
+        if connection is not None and not connection.is_closed():
+            connection.terminate()
+
+    async def _pump(self, connection: "Connection") -> None:
+        while not connection.is_closed():
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), self.keepalive)
+            except TimeoutError:
+                # 조용할 때도 끊김을 알아채도록 정리 쿼리를 겸해 한 번씩 부른다.
+                async with self._lock:
+                    await connection.execute(
+                        DELETE_EXPIRED_OVERFLOW_SQL,
+                        self.overflow_retention,
+                    )
+                continue
+            self._wakeup.clear()
+            # 기다리는 동안의 발행은 한 배치로 나간다. 0이어도 앞 NOTIFY가 왕복하는
+            # 사이에 쌓인 것은 묶이므로 부하가 클수록 배치가 커진다.
+            await asyncio.sleep(self.batch_interval)
+            if connection.is_closed():
+                return
+            await self._send(connection)
+
+    async def _send(self, connection: "Connection") -> None:
+        if not self._pending:
+            return
+        events = list(self._pending)
+        self._pending.clear()
+        for item in pack(self.origin, events, self.max_payload, self.compress_min):
+            async with self._lock:
+                frame = item
+                if isinstance(frame, bytes):
+                    row_id = await connection.fetchval(INSERT_OVERFLOW_SQL, frame)
+                    frame = overflow_frame(self.origin, row_id)
+                    self.overflowed += 1
+                await connection.execute(
+                    "SELECT pg_notify($1, $2)",
+                    self.channel,
+                    frame,
+                )
+            self.frames_sent += 1
+
+    async def _deliver_loop(self) -> None:
+        # 알림은 도착 순서대로 하나의 태스크에서 처리해야 넘침 행을 읽는 동안에도
+        # 발행 순서가 유지된다.
+        while True:
+            kind, body = await self._inbox.get()
+            try:
+                if kind == OVERFLOW_FRAME:
+                    events = decode_body(await self._fetch_overflow(int(body)))
+                else:
+                    events = unpack(kind, body)
+            except (ValueError, zlib.error, OSError, LookupError):
+                logger.warning("Dropped undecodable event frame", exc_info=True)
+                continue
+            self.dispatch(events)
+
+    async def _fetch_overflow(self, row_id: int) -> bytes:
+        import asyncpg
+
+        async with self._lock:
+            connection = self._connection
+            if connection is None:
+                msg = "Event bus is not connected"
+                raise ConnectionError(msg)
+            try:
+                payload = await connection.fetchval(SELECT_OVERFLOW_SQL, row_id)
+            except (asyncpg.PostgresError, asyncpg.InterfaceError) as exc:
+                raise ConnectionError(str(exc)) from exc
+        if payload is None:
+            msg = f"Overflow row {row_id} is gone"
+            raise LookupError(msg)
+        return bytes(payload)
+
+    def stats(self) -> dict[str, int]:
+        return super().stats() | {
+            "pending": len(self._pending),
+            "frames_sent": self.frames_sent,
+            "overflowed": self.overflowed,
+            "dropped": self.dropped,
+            "reconnects": self.reconnects,
+        }
+
+
+def create_event_bus() -> EventBus:
+    if settings.EVENT_BUS_BACKEND is EventBusBackend.MEMORY:
+        return InProcessEventBus()
+    return PostgresEventBus(
+        dsn=settings.database_uri.replace("+asyncpg", "", 1),
+        channel=settings.EVENT_BUS_CHANNEL,
+        batch_interval=settings.EVENT_BUS_BATCH_INTERVAL_SECONDS,
+        max_payload=settings.EVENT_BUS_MAX_PAYLOAD_BYTES,
+        compress_min=settings.EVENT_BUS_COMPRESS_MIN_BYTES,
+        max_pending=settings.EVENT_BUS_MAX_PENDING,
+        keepalive=settings.EVENT_BUS_KEEPALIVE_SECONDS,
+        reconnect_max=settings.EVENT_BUS_RECONNECT_MAX_SECONDS,
+        overflow_retention=settings.EVENT_BUS_OVERFLOW_RETENTION_SECONDS,
+    )
+
+
+event_bus = create_event_bus()
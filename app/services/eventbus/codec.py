@@ -0,0 +1,78 @@
+import base64
+import zlib
+from typing import Any
+
+import orjson
+
+from app.core.responses import dumps
+
+# NOTIFY 페이로드 하나는 "<종류><origin>:<본문>" 문자열이다.
+#   j  본문이 [[채널, 페이로드], ...] JSON 그대로
+#   z  같은 JSON을 zlib으로 압축해 base64로 감싼 것
+#   r  한도를 넘는 이벤트를 넣어 둔 넘침 테이블 행의 id
+JSON_FRAME = "j"
+COMPRESSED_FRAME = "z"
+OVERFLOW_FRAME = "r"
+
+type Event = tuple[str, dict[str, Any]]
+
+
+def encode_event(channel: str, payload: dict[str, Any]) -> bytes:
+    # 발행 시점에 바로 직렬화해 두어야 배치가 나가기 전에 원본이 바뀌어도 안전하다.
+    return dumps([channel, payload])
+
+
+def encode_body(events: list[bytes]) -> bytes:
+    return b"[" + b",".join(events) + b"]"
+
+
+def encode_frame(origin: str, body: bytes, compress_min: int) -> str:
+    if len(body) >= compress_min:
+        packed = base64.b64encode(zlib.compress(body))
+        if len(packed) < len(body):
+            return f"{COMPRESSED_FRAME}{origin}:{packed.decode()}"
+    return f"{JSON_FRAME}{origin}:{body.decode()}"
+
+
+def overflow_frame(origin: str, row_id: int) -> str:
+    return f"{OVERFLOW_FRAME}{origin}:{row_id}"
+
+
+def pack(
+    origin: str,
+    events: list[bytes],
+    max_payload: int,
+    compress_min: int,
+) -> list[str | bytes]:
+    # 한 프레임에 다 들어가지 않으면 반으로 나눠 다시 시도한다. 이벤트 하나로도
+    # 넘치면 본문(bytes)을 그대로 돌려주고 넘침 테이블에 넣는 것은 호출 쪽이 한다.
+    # 결과 순서는 발행 순서와 같다.
+    packed: list[str | bytes] = []
+    stack = [events]
+    while stack:
+        chunk = stack.pop()
+        body = encode_body(chunk)
+        frame = encode_frame(origin, body, compress_min)
+        if len(frame.encode()) <= max_payload:
+            packed.append(frame)
+        elif len(chunk) == 1:
+            packed.append(body)
+        else:
+            middle = len(chunk) // 2
+            stack += (chunk[middle:], chunk[:middle])
+    return packed
+
+
+def parse_frame(frame: str) -> tuple[str, str, str]:
+    origin, _, body = frame[1:].partition(":")
+    return frame[0], origin, body
+
+
+def decode_body(body: bytes | str) -> list[Event]:
+    return [(channel, payload) for channel, payload in orjson.loads(body)]
+
+
+def unpack(kind: str, body: str) -> list[Event]:
+    if kind == COMPRESSED_FRAME:
+        return decode_body(zlib.decompress(base64.b64decode(body)))
+    return decode_body(body)
@@ -0,0 +1,277 @@
+from enum import IntEnum
+from functools import cache, lru_cache
+from itertools import combinations_with_replacement, permutations
+
+from app.services.game.tile import (
+    HONORS,
+    SUIT_SIZE,
+    TERMINALS_AND_HONORS,
+    TILE_KINDS,
+    TileCounts,
+)
+
+STANDARD_TILES = 14
+MAX_COPIES = 4
+SETS_PER_HAND = 4
+
+
+class MeldKind(IntEnum):
+    CHOW = 0
+    PUNG = 1
+    KONG = 2
+
+
+type SuitSet = tuple[MeldKind, int]
+type SuitDecomposition = tuple[tuple[SuitSet, ...], int]
+type Decomposition = tuple[tuple[SuitSet, ...], int]
+
+# 조합룡(组合龙)에 쓰이는 147/258/369 배치 6가지
+KNITTED_PATTERNS: tuple[tuple[int, ...], ...] = tuple(
+    tuple(
+        suit * SUIT_SIZE + rank
+        for suit, offset in zip(order, range(3), strict=True)
+        for rank in range(offset, SUIT_SIZE, 3)
+    )
+    for order in permutations(range(3))
+)
+
+
+@cache
+def suit_table() -> dict[tuple[int, ...], tuple[SuitDecomposition, ...]]:
+    # 한 수패 종류 안에서 가능한 모든 (면자 0-4개 + 머리 0-1개) 조합을 미리 펼쳐 두고
+    # 장수 벡터 -> 분해 목록으로 색인한다. 탐색 없이 dict 조회로 분해가 끝난다.
+    melds: list[SuitSet] = [(MeldKind.CHOW, rank) for rank in range(SUIT_SIZE - 2)]
+    melds += [(MeldKind.PUNG, rank) for rank in range(SUIT_SIZE)]
+
+    table: dict[tuple[int, ...], list[SuitDecomposition]] = {}
+    for size in range(SETS_PER_HAND + 1):
+        for combo in combinations_with_replacement(melds, size):
+            counts = [0] * SUIT_SIZE
+            for kind, rank in combo:
+                if kind is MeldKind.CHOW:
+                    counts[rank] += 1
+                    counts[rank + 1] += 1
+                    counts[rank + 2] += 1
+                else:
+                    counts[rank] += 3
+            if max(counts) > MAX_COPIES:
+                continue
+
+            table.setdefault(tuple(counts), []).append((combo, -1))
+            for pair in range(SUIT_SIZE):
+                if counts[pair] + 2 <= MAX_COPIES:
+                    counts[pair] += 2
+                    table.setdefault(tuple(counts), []).append((combo, pair))
+                    counts[pair] -= 2
+    return {key: tuple(value) for key, value in table.items()}
+
+
+def _suit_keys(counts: TileCounts) -> list[tuple[int, ...]]:
+    return [
+        tuple(counts[suit * SUIT_SIZE : (suit + 1) * SUIT_SIZE]) for suit in range(3)
+    ]
+
+
+def is_standard_complete(counts: TileCounts) -> bool:
+    table = suit_table()
+    pairs = 0
+    for key in _suit_keys(counts):
+        if key not in table:
+            return False
+        pairs += sum(key) % 3 == 2  # noqa: PLR2004
+    for tile in HONORS:
+        count = counts[tile]
+        if count == 2:  # noqa: PLR2004
+            pairs += 1
+        elif count not in (0, 3):
+            return False
+    return pairs == 1
+
+
+def _honor_sets(key: tuple[int, ...]) -> tuple[list[SuitSet], int] | None:
+    # 자패는 커쯔 또는 머리로만 쓸 수 있다.
+    sets: list[SuitSet] = []
+    pair = -1
+    for tile in HONORS:
+        count = key[tile]
+        if count == 3:  # noqa: PLR2004
+            sets.append((MeldKind.PUNG, tile))
+        elif count == 2 and pair < 0:  # noqa: PLR2004
+            pair = tile
+        elif count:
+            return None
+    return sets, pair
+
+
+@lru_cache(maxsize=65536)
+def _decompose(key: tuple[int, ...]) -> tuple[Decomposition, ...]:
+    table = suit_table()
+    suit_options: list[list[tuple[tuple[SuitSet, ...], int]]] = []
+    for suit in range(3):
+        options = table.get(key[suit * SUIT_SIZE : (suit + 1) * SUIT_SIZE])
+        if options is None:
+            return ()
+        base = suit * SUIT_SIZE
+        suit_options.append(
+            [
+                (
+                    tuple((kind, base + rank) for kind, rank in sets),
+                    base + pair if pair >= 0 else -1,
+                )
+                for sets, pair in options
+            ],
+        )
+
+    honors = _honor_sets(key)
+    if honors is None:
+        return ()
+    honor_sets, honor_pair = honors
+
+    results: list[Decomposition] = []
+    for sets_m, pair_m in suit_options[0]:
+        for sets_p, pair_p in suit_options[1]:
+            for sets_s, pair_s in suit_options[2]:
+                pairs = [
+                    pair for pair in (pair_m, pair_p, pair_s, honor_pair) if pair >= 0
+                ]
+                if len(pairs) == 1:
+                    results.append(
+                        ((*sets_m, *sets_p, *sets_s, *honor_sets), pairs[0]),
+                    )
+    return tuple(results)
+
+
+def decompose(counts: TileCounts) -> tuple[Decomposition, ...]:
+    # 손패(부로 제외)를 면자 + 머리 하나로 나누는 모든 방법
+    return _decompose(tuple(counts))
+
+
+def is_seven_pairs(counts: TileCounts) -> bool:
+    return sum(counts) == STANDARD_TILES and all(count in (0, 2, 4) for count in counts)
+
+
+def is_thirteen_orphans(counts: TileCounts) -> bool:
+    return sum(counts) == STANDARD_TILES and all(
+        counts[tile] >= 1 if tile in TERMINALS_AND_HONORS else counts[tile] == 0
+        for tile in range(TILE_KINDS)
+    )
+
+
+def honors_and_knitted_pattern(counts: TileCounts) -> tuple[int, ...] | None:
+    # 전불고(全不靠)/칠성불고(七星不靠)
+    # 서로 다른 14장이 자패와 한 조합룡 배치에서만 온다.
+    if sum(counts) != STANDARD_TILES or max(counts) > 1:
+        return None
+    for pattern in KNITTED_PATTERNS:
+        allowed = set(pattern).union(HONORS)
+        if all(tile in allowed for tile in range(TILE_KINDS) if counts[tile]):
+            return pattern
+    return None
+
+
+def knitted_straight_remainders(
+    counts: TileCounts,
+) -> list[tuple[tuple[int, ...], TileCounts]]:
+    results = []
+    for pattern in KNITTED_PATTERNS:
+        if all(counts[tile] for tile in pattern):
+            remainder = list(counts)
+            for tile in pattern:
+                remainder[tile] -= 1
+            results.append((pattern, remainder))
+    return results
+
+
+def is_complete(counts: TileCounts, meld_count: int = 0) -> bool:
+    if is_standard_complete(counts):
+        return True
+    if meld_count == 0 and (
+        is_seven_pairs(counts)
+        or is_thirteen_orphans(counts)
+        or honors_and_knitted_pattern(counts) is not None
+    ):
+        return True
+    return meld_count <= 1 and any(
+        is_standard_complete(remainder)
+        for _, remainder in knitted_straight_remainders(counts)
+    )
+
+
+def _knitted_straight_complete(counts: TileCounts) -> bool:
+    return any(
+        is_standard_complete(remainder)
+        for _, remainder in knitted_straight_remainders(counts)
+    )
+
+
+def _special_waits(counts: TileCounts, meld_count: int) -> set[int]:
+    # 특수형은 가능성이 있는 모양일 때만 확인한다.
+    candidates: set[int] = set()
+    if meld_count == 0:
+        odd = [tile for tile in range(TILE_KINDS) if counts[tile] % 2]
+        if len(odd) == 1:
+            candidates.add(odd[0])
+        present = [tile for tile in range(TILE_KINDS) if counts[tile]]
+        if all(tile in TERMINALS_AND_HONORS for tile in present):
+            candidates.update(TERMINALS_AND_HONORS)
+        if max(counts) <= 1:
+            candidates.update(tile for tile in range(TILE_KINDS) if not counts[tile])
+    if meld_count <= 1 and any(
+        sum(1 for tile in pattern if counts[tile]) >= len(pattern) - 1
+        for pattern in KNITTED_PATTERNS
+    ):
+        candidates.update(range(TILE_KINDS))
+
+    waits = set()
+    for tile in candidates:
+        counts[tile] += 1
+        if is_complete(counts, meld_count):
+            waits.add(tile)
+        counts[tile] -= 1
+    return waits
+
+
+def _standard_waits(counts: TileCounts) -> set[int]:
+    # 한 장을 더하면 그 타일의 종류만 바뀌므로 나머지 종류의 판정은 한 번만 한다.
+    table = suit_table()
+    keys = _suit_keys(counts)
+    suit_ok = [key in table for key in keys]
+    suit_pairs = [sum(key) % 3 == 2 for key in keys]  # noqa: PLR2004
+    honor_bad = sum(1 for tile in HONORS if counts[tile] not in (0, 2, 3))
+    honor_pairs = sum(1 for tile in HONORS if counts[tile] == 2)  # noqa: PLR2004
+
+    waits = set()
+    for suit in range(3):
+        others = [other for other in range(3) if other != suit]
+        if honor_bad or not all(suit_ok[other] for other in others):
+            continue
+        other_pairs = sum(suit_pairs[other] for other in others) + honor_pairs
+        for rank in range(SUIT_SIZE):
+            key = list(keys[suit])
+            key[rank] += 1
+            if key[rank] > MAX_COPIES:
+                continue
+            pair = sum(key) % 3 == 2  # noqa: PLR2004
+            if other_pairs + pair == 1 and tuple(key) in table:
+                waits.add(suit * SUIT_SIZE + rank)
+
+    if all(suit_ok) and honor_bad <= 1:
+        suit_pair_count = sum(suit_pairs)
+        for tile in HONORS:
+            count = counts[tile]
+            bad = honor_bad - (count not in (0, 2, 3)) + (count + 1 not in (0, 2, 3))
+            pairs = honor_pairs - (count == 2) + (count + 1 == 2)  # noqa: PLR2004
+            if bad == 0 and suit_pair_count + pairs == 1:
+                waits.add(tile)
+    return waits
+
+
+def waiting_tiles(
+    counts: TileCounts,
+    meld_count: int = 0,
+    used: TileCounts | None = None,
+) -> list[int]:
+    # used: 부로까지 포함한 장수. 네 장을 모두 가진 타일은 기다릴 수 없다.
+    used = used or counts
+    waits = _standard_waits(counts) | _special_waits(counts, meld_count)
+    return sorted(tile for tile in waits if used[tile] < MAX_COPIES)
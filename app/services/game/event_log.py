@@ -0,0 +1,354 @@
+import asyncio
+import logging
+from collections.abc import Sequence
+from datetime import UTC, datetime
+from enum import IntEnum
+from typing import TYPE_CHECKING
+
+from sqlalchemy import select
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlmodel import col
+
+from app.core.config import settings
+from app.core.error import MCRDomainError
+from app.db.session import async_session
+from app.models.game_event import GameEvent, GameSnapshot
+from app.services.game.decomposition import MeldKind
+from app.services.game.state import (
+    NO_TILE,
+    GameState,
+    decode_snapshot,
+    encode_snapshot,
+)
+
+if TYPE_CHECKING:
+    import asyncpg
+
+logger = logging.getLogger(__name__)
+
+EVENT_COLUMNS = ("game_id", "seq", "kind", "seat", "tile", "arg", "created_at")
+SNAPSHOT_COLUMNS = ("game_id", "seq", "data", "created_at")
+PLAYER_COLUMNS = ("game_id", "seat", "user_id")
+
+type EventRecord = tuple[int, int, int, int, int, int, datetime]
+type SnapshotRecord = tuple[int, int, bytes, datetime]
+type PlayerRecord = tuple[int, int, int]
+type ResultRecord = tuple[int, int, int, int]
+type Batch = tuple[
+    list[EventRecord],
+    list[SnapshotRecord],
+    list[PlayerRecord],
+    list[ResultRecord],
+]
+
+# 판이 끝나면 begin_game에서 넣은 gameplayer 행에 점수와 순위를 한 문장으로 채운다.
+RESULT_UPDATE_SQL = """
+UPDATE gameplayer SET score = v.score, placement = v.placement
+FROM unnest($1::bigint[], $2::smallint[], $3::integer[], $4::smallint[])
+    AS v(game_id, seat, score, placement)
+WHERE gameplayer.game_id = v.game_id AND gameplayer.seat = v.seat
+"""
+
+
+class GameEventKind(IntEnum):
+    DRAW = 0  # arg: 보충패면 1
+    DISCARD = 1
+    PASS = 2
+    CLAIM = 3  # arg: MeldKind, tile: 면자의 첫 타일
+    FINISH = 4
+
+
+class GameEventWriter:
+    # 이벤트는 GameState에 반영한 직후 기록하고 seq는 반영 후의 state.seq를 쓴다.
+    # 워커마다 하나씩 두고 모아 둔 행을 COPY 한 번으로 넣는다. 플러시는
+    # 배치가 batch_size에 닿을 때, 주기 루프, 게임 종료 때 일어난다.
+    # snapshot_interval마다 스냅샷을 함께 남겨 복원 시 재생 길이를 제한한다.
+    def __init__(
+        self,
+        batch_size: int,
+        snapshot_interval: int,
+        session_factory: async_sessionmaker[AsyncSession] = async_session,
+        max_pending: int = 100_000,
+    ) -> None:
+        self.batch_size = batch_size
+        self.snapshot_interval = snapshot_interval
+        self.max_pending = max_pending
+        self._session_factory = session_factory
+        self._events: list[EventRecord] = []
+        self._snapshots: list[SnapshotRecord] = []
+        self._players: list[PlayerRecord] = []
+        self._results: list[ResultRecord] = []
+        self._lock = asyncio.Lock()
+        self._size_flush: asyncio.Task[None] | None = None
+        self.flushed_events = 0
+        self.flushed_snapshots = 0
+        self.flushes = 0
+        self.dropped_rows = 0
+        self.rejected_rows = 0
+
+    @property
+    def pending(self) -> int:
+        return (
+            len(self._events)
+            + len(self._snapshots)
+            + len(self._players)
+            + len(self._results)
+        )
+
+    def begin_game(self, state: GameState) -> None:
+        # 배패 직후의 패산이 복원의 출발점이므로 seq 0 스냅샷은 반드시 남긴다.
+        self.snapshot(state)
+        self._players += (
+            (state.game_id, seat, player.user_id)
+            for seat, player in enumerate(state.players)
+        )
+
+    def record(
+        self,
+        state: GameState,
+        kind: GameEventKind,
+        seat: int,
+        tile: int = NO_TILE,
+        arg: int = 0,
+    ) -> None:
+        self._events.append(
+            (state.game_id, state.seq, kind, seat, tile, arg, datetime.now(UTC)),
+        )
+        if state.seq % self.snapshot_interval == 0:
+            self.snapshot(state)
+        if len(self._events) >= self.batch_size:
+            self._schedule_flush()
+
+    def snapshot(self, state: GameState) -> None:
+        self._snapshots.append(
+            (state.game_id, state.seq, encode_snapshot(state), datetime.now(UTC)),
+        )
+
+    async def end_game(self, state: GameState) -> None:
+        if state.seq % self.snapshot_interval:
+            self.snapshot(state)
+        scores = [player.score for player in state.players]
+        # 동점이면 같은 순위. 1위가 1.
+        self._results += (
+            (state.game_id, seat, score, 1 + sum(other > score for other in scores))
+            for seat, score in enumerate(scores)
+        )
+        await self.flush_safely()
+
+    def _schedule_flush(self) -> None:
+        if self._size_flush is None or self._size_flush.done():
+            self._size_flush = asyncio.create_task(self.flush_safely())
+
+    async def flush(self, session: AsyncSession) -> int:
+        async with self._lock:
+            if not self.pending:
+                return 0
+
+            batch: Batch = (self._events, self._snapshots, self._players, self._results)
+            self._events, self._snapshots, self._players, self._results = [], [], [], []
+            try:
+                await _write_batch(session, batch)
+            except BaseException as exc:
+                if not _is_data_error(exc):
+                    # 연결 문제 같은 일시적인 실패는 배치 전체를 앞에 되돌려 둔다.
+                    self._requeue(batch)
+                    raise
+                # 중복 키처럼 재시도해도 안 되는 배치를 계속 되돌리면 뒤의 플러시가
+                # 모두 막힌다. 게임별로 나눠 다시 넣고 실패한 게임은 버린다.
+                logger.warning("Game event batch rejected, retrying per game")
+                await self._write_per_game(session, batch)
+            else:
+                self._count(batch)
+            return len(batch[0])
+
+    async def _write_per_game(self, session: AsyncSession, batch: Batch) -> None:
+        remaining = list(_split_by_game(batch).items())
+        while remaining:
+            game_id, game = remaining.pop(0)
+            try:
+                await _write_batch(session, game)
+            except BaseException as exc:
+                if not _is_data_error(exc):
+                    self._requeue(_merge([game, *(rest for _, rest in remaining)]))
+                    raise
+                self.rejected_rows += sum(len(records) for records in game)
+                logger.exception("Rejected game events for game %s", game_id)
+            else:
+                self._count(game)
+
+    def _requeue(self, batch: Batch) -> None:
+        # 한도를 넘으면 실패한 배치를 버려 DB가 오래 죽어 있어도 메모리를 묶어 둔다.
+        size = sum(len(records) for records in batch)
+        if self.pending + size > self.max_pending:
+            self.dropped_rows += size
+            logger.error("Dropped %s game event rows after failed flush", size)
+            return
+        events, snapshots, players, results = batch
+        self._events = events + self._events
+        self._snapshots = snapshots + self._snapshots
+        self._players = players + self._players
+        self._results = results + self._results
+
+    def _count(self, batch: Batch) -> None:
+        self.flushes += 1
+        self.flushed_events += len(batch[0])
+        self.flushed_snapshots += len(batch[1])
+
+    async def run_flush_loop(self, interval: float) -> None:
+        while True:
+            await asyncio.sleep(interval)
+            await self.flush_safely()
+
+    async def flush_safely(self) -> None:
+        # COPY와 결과 UPDATE는 asyncpg 연결로 바로 보내므로 asyncpg 예외도 잡는다.
+        import asyncpg
+
+        try:
+            async with self._session_factory() as session:
+                await self.flush(session)
+        except (
+            SQLAlchemyError,
+            OSError,
+            asyncpg.PostgresError,
+            asyncpg.InterfaceError,
+        ):
+            logger.warning("Failed to flush game events", exc_info=True)
+
+
+def _is_data_error(exc: BaseException) -> bool:
+    # 23xxx(무결성 위반)와 22xxx(데이터 오류)는 같은 행으로 다시 넣어도 실패한다.
+    import asyncpg
+
+    return isinstance(
+        exc,
+        asyncpg.IntegrityConstraintViolationError | asyncpg.DataError,
+    )
+
+
+def _split_by_game(batch: Batch) -> dict[int, Batch]:
+    games: dict[int, Batch] = {}
+
+    def rows(game_id: int) -> Batch:
+        return games.setdefault(game_id, ([], [], [], []))
+
+    events, snapshots, players, results = batch
+    for event in events:
+        rows(event[0])[0].append(event)
+    for snapshot in snapshots:
+        rows(snapshot[0])[1].append(snapshot)
+    for player in players:
+        rows(player[0])[2].append(player)
+    for result in results:
+        rows(result[0])[3].append(result)
+    return games
+
+
+def _merge(batches: list[Batch]) -> Batch:
+    return (
+        [event for batch in batches for event in batch[0]],
+        [snapshot for batch in batches for snapshot in batch[1]],
+        [player for batch in batches for player in batch[2]],
+        [result for batch in batches for result in batch[3]],
+    )
+
+
+async def _write_batch(session: AsyncSession, batch: Batch) -> None:
+    events, snapshots, players, results = batch
+    await _copy_rows(
+        session,
+        [
+            ("gameevent", EVENT_COLUMNS, events),
+            ("gamesnapshot", SNAPSHOT_COLUMNS, snapshots),
+            ("gameplayer", PLAYER_COLUMNS, players),
+        ],
+        results,
+    )
+    await session.commit()
+
+
+async def _copy_rows(
+    session: AsyncSession,
+    batches: list[tuple[str, tuple[str, ...], Sequence[tuple[object, ...]]]],
+    results: list[ResultRecord],
+) -> None:
+    # 다중 행 INSERT보다 COPY가 파싱과 왕복이 적다. 모든 테이블을 한 트랜잭션에 넣는다.
+    connection = await session.connection()
+    raw = await connection.get_raw_connection()
+    driver: asyncpg.Connection = raw.driver_connection
+    async with driver.transaction():
+        for table, columns, records in batches:
+            if records:
+                await driver.copy_records_to_table(
+                    table,
+                    records=records,
+                    columns=columns,
+                )
+        if results:
+            await driver.execute(
+                RESULT_UPDATE_SQL, *map(list, zip(*results, strict=True))
+            )
+
+
+def apply_event(state: GameState, event: GameEvent) -> None:
+    if event.seq != state.seq + 1:
+        msg = f"Expected event {state.seq + 1}, got {event.seq}"
+        raise ValueError(msg)
+
+    kind = GameEventKind(event.kind)
+    try:
+        if kind is GameEventKind.DRAW:
+            drawn = state.draw(event.seat, replacement=bool(event.arg))
+            if drawn != event.tile:
+                msg = f"Event {event.seq} drew {event.tile}, wall gives {drawn}"
+                raise ValueError(msg)
+        elif kind is GameEventKind.DISCARD:
+            state.discard(event.seat, event.tile)
+        elif kind is GameEventKind.PASS:
+            state.pass_turn()
+        elif kind is GameEventKind.CLAIM:
+            state.claim(event.seat, MeldKind(event.arg), event.tile)
+        else:
+            state.finish()
+    except MCRDomainError as exc:
+        msg = f"Event {event.seq} cannot be applied"
+        raise ValueError(msg) from exc
+
+
+async def load_game(
+    session: AsyncSession,
+    game_id: int,
+    until_seq: int | None = None,
+) -> GameState:
+    # until_seq 이하의 가장 최근 스냅샷에서 시작해 그 뒤 이벤트만 재생한다.
+    snapshot_query = (
+        select(col(GameSnapshot.data), col(GameSnapshot.seq))
+        .where(col(GameSnapshot.game_id) == game_id)
+        .order_by(col(GameSnapshot.seq).desc())
+        .limit(1)
+    )
+    if until_seq is not None:
+        snapshot_query = snapshot_query.where(col(GameSnapshot.seq) <= until_seq)
+    snapshot = (await session.execute(snapshot_query)).one_or_none()
+    if snapshot is None:
+        msg = f"No snapshot for game {game_id}"
+        raise LookupError(msg)
+
+    state = decode_snapshot(snapshot.data)
+    event_query = (
+        select(GameEvent)
+        .where(col(GameEvent.game_id) == game_id, col(GameEvent.seq) > snapshot.seq)
+        .order_by(col(GameEvent.seq))
+    )
+    if until_seq is not None:
+        event_query = event_query.where(col(GameEvent.seq) <= until_seq)
+    for event in (await session.execute(event_query)).scalars():
+        apply_event(state, event)
+    return state
+
+
+game_event_writer = GameEventWriter(
+    batch_size=settings.GAME_EVENT_BATCH_SIZE,
+    snapshot_interval=settings.GAME_SNAPSHOT_INTERVAL,
+    max_pending=settings.GAME_EVENT_MAX_PENDING,
+)
@@ -0,0 +1,78 @@
+from collections.abc import AsyncIterator
+
+from sqlalchemy import and_, case, literal, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlmodel import col
+
+from app.db.session import async_read_session
+from app.models.game_event import GameEvent, GamePlayer
+from app.services.game.event_log import GameEventKind
+from app.services.game.state import NO_TILE
+
+EXPORT_COLUMNS = ("game_id", "seq", "kind", "seat", "tile", "arg", "created_at")
+
+type ExportCursor = tuple[int, int]
+
+
+def parse_cursor(cursor: str) -> ExportCursor:
+    game_id, seq = cursor.split(":")
+    return int(game_id), int(seq)
+
+
+async def export_user_events(
+    user_id: int,
+    after: ExportCursor | None = None,
+    *,
+    chunk_rows: int,
+    session_factory: async_sessionmaker[AsyncSession] = async_read_session,
+) -> AsyncIterator[bytes]:
+    # 서버 측 커서로 chunk_rows씩만 받아 NDJSON 조각으로 내보낸다. 결과 크기와
+    # 무관하게 메모리에는 한 조각만 남는다. (game_id, seq) 순서라서 끊기면 마지막
+    # 줄의 game_id:seq를 cursor로 넘겨 이어 받는다.
+    # 응답이 끝날 때까지 살아 있어야 하므로 요청 의존성과 별도로 세션을 연다.
+    # 끝난 판만 내보내고, 다른 자리의 쯔모 타일은 NO_TILE로 가린다.
+    # 진행 중인 판을 내보내면 상대 손패를 그대로 읽을 수 있다.
+    player = (
+        select(col(GamePlayer.game_id), col(GamePlayer.seat))
+        .where(
+            col(GamePlayer.user_id) == user_id,
+            col(GamePlayer.placement).is_not(None),
+        )
+        .subquery()
+    )
+    tile = case(
+        (
+            and_(
+                col(GameEvent.kind) == GameEventKind.DRAW,
+                col(GameEvent.seat) != player.c.seat,
+            ),
+            NO_TILE,
+        ),
+        else_=col(GameEvent.tile),
+    )
+    columns = [
+        tile if name == "tile" else col(getattr(GameEvent, name))
+        for name in EXPORT_COLUMNS
+    ]
+    query = (
+        select(*columns)
+        .join(player, player.c.game_id == col(GameEvent.game_id))
+        .order_by(col(GameEvent.game_id), col(GameEvent.seq))
+        .execution_options(yield_per=chunk_rows)
+    )
+    if after is not None:
+        game_id, seq = after
+        query = query.where(
+            tuple_(col(GameEvent.game_id), col(GameEvent.seq))
+            > tuple_(literal(game_id), literal(seq)),
+        )
+
+    async with session_factory() as session:
+        result = await session.stream(query)
+        async for rows in result.partitions():
+            # 값이 모두 정수와 ISO 시각이라 이스케이프가 필요 없어 직접 포맷한다.
+            yield "".join(
+                f'{{"game_id":{game_id},"seq":{seq},"kind":{kind},"seat":{seat},'
+                f'"tile":{tile},"arg":{arg},"created_at":"{created_at.isoformat()}"}}\n'
+                for game_id, seq, kind, seat, tile, arg, created_at in rows
+            ).encode()
@@ -0,0 +1,187 @@
+import asyncio
+import logging
+import math
+import time
+from bisect import bisect_left, bisect_right, insort
+from collections.abc import Callable
+
+from app.core.config import settings
+from app.core.error import DomainErrorCode, MCRDomainError
+from app.services.game.room import MAX_PLAYERS, Room, RoomRegistry, room_registry
+
+logger = logging.getLogger(__name__)
+
+
+class QueueEntry:
+    __slots__ = ("bucket", "checked_window", "enqueued_at", "rating", "user_id")
+
+    def __init__(self, user_id: int, rating: float, bucket: int, now: float) -> None:
+        self.user_id = user_id
+        self.rating = rating
+        self.bucket = bucket
+        self.enqueued_at = now
+        self.checked_window = 0.0
+
+
+class Matchmaker:
+    # 대기열을 레이팅 버킷(폭 bucket_width)으로 나눠 두고, 비어 있지 않은 버킷 키를
+    # 정렬해 유지한다. 입장 시 O(log n)으로 자기 창 안의 버킷만 훑어 세 명을 찾는다.
+    # 창은 base_window에서 시작해 대기 시간에 비례해 max_window까지 넓어진다.
+    # 후보는 기준 사용자와의 레이팅 차이가 두 사람의 창 모두에 들어올 때만 뽑힌다.
+    def __init__(  # noqa: PLR0913
+        self,
+        rooms: RoomRegistry,
+        bucket_width: float,
+        base_window: float,
+        window_growth: float,
+        max_window: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.rooms = rooms
+        self.bucket_width = bucket_width
+        self.base_window = base_window
+        self.window_growth = window_growth
+        self.max_window = max_window
+        self._clock = clock
+        # dict 삽입 순서가 곧 대기 순서이다.
+        self._entries: dict[int, QueueEntry] = {}
+        self._buckets: dict[int, dict[int, QueueEntry]] = {}
+        self._bucket_keys: list[int] = []
+        self.matched_groups = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def is_queued(self, user_id: int) -> bool:
+        return user_id in self._entries
+
+    def get_entry(self, user_id: int) -> QueueEntry:
+        entry = self._entries.get(user_id)
+        if entry is None:
+            raise MCRDomainError(DomainErrorCode.NOT_QUEUED)
+        return entry
+
+    def window(self, entry: QueueEntry, now: float) -> float:
+        waited = now - entry.enqueued_at
+        return min(self.max_window, self.base_window + waited * self.window_growth)
+
+    def enqueue(self, user_id: int, rating: float) -> Room | None:
+        if user_id in self._entries:
+            raise MCRDomainError(DomainErrorCode.ALREADY_QUEUED)
+        if self.rooms.room_of(user_id) is not None:
+            raise MCRDomainError(DomainErrorCode.ALREADY_IN_ROOM)
+
+        now = self._clock()
+        entry = QueueEntry(user_id, rating, self._bucket_of(rating), now)
+        self._entries[user_id] = entry
+        bucket = self._buckets.get(entry.bucket)
+        if bucket is None:
+            bucket = self._buckets[entry.bucket] = {}
+            insort(self._bucket_keys, entry.bucket)
+        bucket[user_id] = entry
+        return self._try_match(entry, now)
+
+    def dequeue(self, user_id: int) -> bool:
+        entry = self._entries.get(user_id)
+        if entry is None:
+            return False
+        self._remove(entry)
+        return True
+
+    def tick(self) -> list[Room]:
+        # 창이 넓어진 사람만 다시 기준으로 삼는다. 새로 들어온 사람과의 조합은 입장
+        # 시점에 이미 확인했다.
+        now = self._clock()
+        rooms = []
+        for entry in list(self._entries.values()):
+            if entry.user_id not in self._entries:
+                continue
+            room = self._try_match(entry, now)
+            if room is not None:
+                rooms.append(room)
+        return rooms
+
+    def _bucket_of(self, rating: float) -> int:
+        return math.floor(rating / self.bucket_width)
+
+    def _remove(self, entry: QueueEntry) -> None:
+        del self._entries[entry.user_id]
+        bucket = self._buckets[entry.bucket]
+        del bucket[entry.user_id]
+        if not bucket:
+            del self._buckets[entry.bucket]
+            del self._bucket_keys[bisect_left(self._bucket_keys, entry.bucket)]
+
+    def _try_match(self, anchor: QueueEntry, now: float) -> Room | None:
+        window = self.window(anchor, now)
+        if window <= anchor.checked_window:
+            return None
+        anchor.checked_window = window
+
+        group = self._find_group(anchor, window, now)
+        if group is None:
+            return None
+
+        # 오래 기다린 사람이 방장이 된다. 방을 만든 뒤에 큐에서 빼야 실패해도
+        # 네 명이 큐에 남는다. 한 판의 실패가 다른 매칭을 막지 않도록 여기서 잡는다.
+        group.sort(key=lambda entry: entry.enqueued_at)
+        try:
+            room = self.rooms.create_table(
+                [entry.user_id for entry in group],
+                f"Match #{self.matched_groups + 1}",
+            )
+        except MCRDomainError:
+            logger.warning("Failed to form a matched table", exc_info=True)
+            # 그 사이 다른 방에 들어간 사람은 매칭될 수 없으므로 큐에서 뺀다.
+            for entry in group:
+                if self.rooms.room_of(entry.user_id) is not None:
+                    self._remove(entry)
+            return None
+
+        for entry in group:
+            self._remove(entry)
+        self.matched_groups += 1
+        for entry in group:
+            self.rooms.gateway.send_to_user(
+                entry.user_id,
+                {"type": "match", "room_id": room.id},
+            )
+        return room
+
+    def _find_group(
+        self,
+        anchor: QueueEntry,
+        window: float,
+        now: float,
+    ) -> list[QueueEntry] | None:
+        keys = self._bucket_keys
+        low = bisect_left(keys, self._bucket_of(anchor.rating - window))
+        high = bisect_right(keys, self._bucket_of(anchor.rating + window))
+        # 레이팅이 가까운 버킷부터 본다.
+        nearby = sorted(keys[low:high], key=lambda key: abs(key - anchor.bucket))
+
+        group = [anchor]
+        for key in nearby:
+            for entry in self._buckets[key].values():
+                if entry is anchor:
+                    continue
+                distance = abs(entry.rating - anchor.rating)
+                if distance <= window and distance <= self.window(entry, now):
+                    group.append(entry)
+                    if len(group) == MAX_PLAYERS:
+                        return group
+        return None
+
+    async def run_tick_loop(self, interval: float) -> None:
+        while True:
+            await asyncio.sleep(interval)
+            self.tick()
+
+
+matchmaker = Matchmaker(
+    rooms=room_registry,
+    bucket_width=settings.MATCHMAKING_BUCKET_WIDTH,
+    base_window=settings.MATCHMAKING_BASE_WINDOW,
+    window_growth=settings.MATCHMAKING_WINDOW_GROWTH_PER_SECOND,
+    max_window=settings.MATCHMAKING_MAX_WINDOW,
+)
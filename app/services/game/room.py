@@ -0,0 +1,282 @@
+import itertools
+import time
+from bisect import bisect_left, bisect_right, insort
+from enum import Enum
+
+from app.core.error import DomainErrorCode, MCRDomainError
+from app.models.user import UserStatus
+from app.services.gateway.manager import ConnectionManager, connection_manager
+from app.services.presence.registry import PresenceRegistry, presence_registry
+
+MAX_PLAYERS = 4
+
+
+class RoomState(str, Enum):
+    WAITING = "waiting"
+    FULL = "full"
+    PLAYING = "playing"
+
+
+def room_topic(room_id: int) -> str:
+    return f"room:{room_id}"
+
+
+class Room:
+    __slots__ = (
+        "created_at",
+        "host_id",
+        "id",
+        "name",
+        "player_ids",
+        "ready_ids",
+        "state",
+    )
+
+    def __init__(self, room_id: int, name: str, host_id: int) -> None:
+        self.id = room_id
+        self.name = name
+        self.host_id = host_id
+        self.player_ids: list[int] = [host_id]
+        self.ready_ids: set[int] = set()
+        self.state = RoomState.WAITING
+        self.created_at = time.time()
+
+    @property
+    def seats_free(self) -> int:
+        return MAX_PLAYERS - len(self.player_ids)
+
+
+class RoomRegistry:
+    # 방은 워커 메모리에만 있고 세 가지 인덱스를 함께 유지한다.
+    #   상태별 정렬된 id 목록  -> 로비 목록을 bisect로 커서 페이지네이션
+    #   대기 방의 빈 자리 수별 버킷 -> 빠른 입장은 버킷 MAX_PLAYERS개만 확인
+    #   사용자 -> 방
+    # 방 상태가 바뀌면 참가자의 presence(IN_ROOM/PLAYING)도 같이 바꾼다.
+    def __init__(
+        self,
+        presence: PresenceRegistry,
+        gateway: ConnectionManager,
+    ) -> None:
+        self.presence = presence
+        self.gateway = gateway
+        self._ids = itertools.count(1)
+        self._rooms: dict[int, Room] = {}
+        self._sorted_ids: list[int] = []
+        self._by_state: dict[RoomState, list[int]] = {state: [] for state in RoomState}
+        self._waiting_by_seats_free: list[dict[int, Room]] = [
+            {} for _ in range(MAX_PLAYERS + 1)
+        ]
+        self._user_room: dict[int, Room] = {}
+
+    def __len__(self) -> int:
+        return len(self._rooms)
+
+    def get(self, room_id: int) -> Room:
+        room = self._rooms.get(room_id)
+        if room is None:
+            raise MCRDomainError(DomainErrorCode.ROOM_NOT_FOUND)
+        return room
+
+    def room_of(self, user_id: int) -> Room | None:
+        return self._user_room.get(user_id)
+
+    def count(self, state: RoomState) -> int:
+        return len(self._by_state[state])
+
+    def list_rooms(
+        self,
+        state: RoomState | None = None,
+        cursor: int | None = None,
+        limit: int = 20,
+    ) -> tuple[list[Room], int | None]:
+        ids = self._sorted_ids if state is None else self._by_state[state]
+        start = bisect_right(ids, cursor) if cursor is not None else 0
+        page = ids[start : start + limit]
+        next_cursor = page[-1] if page and start + limit < len(ids) else None
+        return [self._rooms[room_id] for room_id in page], next_cursor
+
+    def _index(self, room: Room) -> None:
+        insort(self._by_state[room.state], room.id)
+        if room.state is RoomState.WAITING:
+            self._waiting_by_seats_free[room.seats_free][room.id] = room
+
+    def _unindex(self, room: Room) -> None:
+        ids = self._by_state[room.state]
+        del ids[bisect_left(ids, room.id)]
+        if room.state is RoomState.WAITING:
+            del self._waiting_by_seats_free[room.seats_free][room.id]
+
+    def _update_state(self, room: Room) -> None:
+        if room.state is not RoomState.PLAYING:
+            room.state = RoomState.FULL if room.seats_free == 0 else RoomState.WAITING
+
+    def _ensure_not_in_room(self, user_id: int) -> None:
+        if user_id in self._user_room:
+            raise MCRDomainError(DomainErrorCode.ALREADY_IN_ROOM)
+
+    def _seat(self, room: Room, user_id: int) -> None:
+        self._user_room[user_id] = room
+        self.presence.set_status(user_id, UserStatus.IN_ROOM)
+        self.gateway.subscribe_user(user_id, room_topic(room.id))
+
+    def _publish(self, room: Room, event: str) -> None:
+        self.gateway.publish(
+            room_topic(room.id),
+            {
+                "type": "room",
+                "event": event,
+                "room": {
+                    "id": room.id,
+                    "state": room.state.value,
+                    "host_id": room.host_id,
+                    "player_ids": room.player_ids,
+                    "ready_ids": sorted(room.ready_ids),
+                },
+            },
+        )
+
+    def create(self, user_id: int, name: str) -> Room:
+        self._ensure_not_in_room(user_id)
+        room = Room(next(self._ids), name, user_id)
+        self._rooms[room.id] = room
+        # id가 단조 증가하므로 전체 목록에는 항상 끝에 붙는다.
+        self._sorted_ids.append(room.id)
+        self._index(room)
+        self._seat(room, user_id)
+        return room
+
+    def create_table(self, user_ids: list[int], name: str) -> Room:
+        # 매칭된 네 명을 한 번에 앉힌다.
+        for user_id in user_ids:
+            self._ensure_not_in_room(user_id)
+        room = self.create(user_ids[0], name)
+        for user_id in user_ids[1:]:
+            self._add_player(room, user_id)
+        return room
+
+    def join(self, user_id: int, room_id: int) -> Room:
+        self._ensure_not_in_room(user_id)
+        room = self.get(room_id)
+        if room.state is RoomState.PLAYING:
+            raise MCRDomainError(DomainErrorCode.ROOM_ALREADY_STARTED)
+        if room.state is RoomState.FULL:
+            raise MCRDomainError(DomainErrorCode.ROOM_FULL)
+        return self._add_player(room, user_id)
+
+    def quick_join(self, user_id: int) -> Room:
+        self._ensure_not_in_room(user_id)
+        # 자리가 적게 남은 방부터 채워야 게임이 빨리 시작된다.
+        for seats_free in range(1, MAX_PLAYERS + 1):
+            bucket = self._waiting_by_seats_free[seats_free]
+            if bucket:
+                return self._add_player(next(iter(bucket.values())), user_id)
+        raise MCRDomainError(DomainErrorCode.NO_AVAILABLE_ROOM)
+
+    def _add_player(self, room: Room, user_id: int) -> Room:
+        self._unindex(room)
+        room.player_ids.append(user_id)
+        self._update_state(room)
+        self._index(room)
+        self._seat(room, user_id)
+        self._publish(room, "joined")
+        return room
+
+    def _room_for_player(self, user_id: int, room_id: int) -> Room:
+        room = self._user_room.get(user_id)
+        if room is None or room.id != room_id:
+            raise MCRDomainError(DomainErrorCode.NOT_IN_ROOM)
+        return room
+
+    def leave(self, user_id: int, room_id: int) -> Room:
+        room = self._room_for_player(user_id, room_id)
+        if room.state is RoomState.PLAYING:
+            raise MCRDomainError(DomainErrorCode.ROOM_ALREADY_STARTED)
+        self._remove_player(room, user_id)
+        return room
+
+    def _remove_player(self, room: Room, user_id: int) -> None:
+        self._unindex(room)
+        room.player_ids.remove(user_id)
+        room.ready_ids.discard(user_id)
+        del self._user_room[user_id]
+        self.gateway.unsubscribe_user(user_id, room_topic(room.id))
+        # 연결이 끊겨 OFFLINE이 된 사용자를 다시 ONLINE으로 올리지 않는다.
+        if self.presence.is_online(user_id):
+            self.presence.set_status(user_id, UserStatus.ONLINE)
+
+        if not room.player_ids:
+            del self._rooms[room.id]
+            del self._sorted_ids[bisect_left(self._sorted_ids, room.id)]
+            return
+
+        if room.host_id == user_id:
+            room.host_id = room.player_ids[0]
+            room.ready_ids.discard(room.host_id)
+        self._update_state(room)
+        self._index(room)
+        self._publish(room, "left")
+
+    def set_ready(self, user_id: int, room_id: int, *, ready: bool) -> Room:
+        room = self._room_for_player(user_id, room_id)
+        if room.state is RoomState.PLAYING:
+            raise MCRDomainError(DomainErrorCode.ROOM_ALREADY_STARTED)
+        if ready and user_id != room.host_id:
+            room.ready_ids.add(user_id)
+        else:
+            room.ready_ids.discard(user_id)
+        self._publish(room, "ready")
+        return room
+
+    def start(self, user_id: int, room_id: int) -> Room:
+        room = self._room_for_player(user_id, room_id)
+        if room.host_id != user_id:
+            raise MCRDomainError(DomainErrorCode.NOT_ROOM_HOST)
+        if room.state is RoomState.PLAYING:
+            raise MCRDomainError(DomainErrorCode.ROOM_ALREADY_STARTED)
+        if room.state is not RoomState.FULL or len(room.ready_ids) != MAX_PLAYERS - 1:
+            raise MCRDomainError(DomainErrorCode.ROOM_NOT_READY)
+
+        self._unindex(room)
+        room.state = RoomState.PLAYING
+        self._index(room)
+        for player_id in room.player_ids:
+            self.presence.set_status(player_id, UserStatus.PLAYING)
+        self._publish(room, "started")
+        return room
+
+    def finish(self, room_id: int) -> Room:
+        room = self.get(room_id)
+        if room.state is not RoomState.PLAYING:
+            raise MCRDomainError(DomainErrorCode.ROOM_NOT_READY)
+
+        self._unindex(room)
+        room.state = RoomState.FULL
+        room.ready_ids.clear()
+        self._update_state(room)
+        self._index(room)
+        for player_id in room.player_ids:
+            if self.presence.is_online(player_id):
+                self.presence.set_status(player_id, UserStatus.IN_ROOM)
+        self._publish(room, "finished")
+        return room
+
+    def attach(self, user_id: int) -> None:
+        # 재접속한 사용자의 presence와 방 구독을 복구한다.
+        room = self._user_room.get(user_id)
+        if room is None:
+            return
+        playing = room.state is RoomState.PLAYING
+        self.presence.set_status(
+            user_id,
+            UserStatus.PLAYING if playing else UserStatus.IN_ROOM,
+        )
+        self.gateway.subscribe_user(user_id, room_topic(room.id))
+
+    def detach(self, user_id: int) -> None:
+        # 마지막 연결이 끊기면 대기 중인 방에서는 빼고 진행 중인 게임은 자리를 둔다.
+        room = self._user_room.get(user_id)
+        if room is not None and room.state is not RoomState.PLAYING:
+            self._remove_player(room, user_id)
+
+
+room_registry = RoomRegistry(presence=presence_registry, gateway=connection_manager)
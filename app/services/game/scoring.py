@@ -0,0 +1,1021 @@
+from collections import Counter
+from collections.abc import Callable, Iterable, Sequence
+from enum import IntEnum
+from itertools import combinations
+
+from app.services.game.decomposition import (
+    MAX_COPIES,
+    SETS_PER_HAND,
+    STANDARD_TILES,
+    MeldKind,
+    decompose,
+    honors_and_knitted_pattern,
+    is_seven_pairs,
+    is_thirteen_orphans,
+    knitted_straight_remainders,
+    waiting_tiles,
+)
+from app.services.game.tile import (
+    DRAGONS,
+    EAST,
+    GREEN_TILES,
+    HONOR_START,
+    HONORS,
+    REVERSIBLE_TILES,
+    SUIT_SIZE,
+    TILE_KINDS,
+    WINDS,
+    TileCounts,
+    is_honor,
+    is_terminal,
+    to_counts,
+)
+
+MIN_POINTS = 8
+
+
+class Fan(IntEnum):
+    # 88
+    BIG_FOUR_WINDS = 1
+    BIG_THREE_DRAGONS = 2
+    ALL_GREEN = 3
+    NINE_GATES = 4
+    FOUR_KONGS = 5
+    SEVEN_SHIFTED_PAIRS = 6
+    THIRTEEN_ORPHANS = 7
+    # 64
+    ALL_TERMINALS = 8
+    LITTLE_FOUR_WINDS = 9
+    LITTLE_THREE_DRAGONS = 10
+    ALL_HONORS = 11
+    FOUR_CONCEALED_PUNGS = 12
+    PURE_TERMINAL_CHOWS = 13
+    # 48
+    QUADRUPLE_CHOW = 14
+    FOUR_PURE_SHIFTED_PUNGS = 15
+    # 32
+    FOUR_PURE_SHIFTED_CHOWS = 16
+    THREE_KONGS = 17
+    ALL_TERMINALS_AND_HONORS = 18
+    # 24
+    SEVEN_PAIRS = 19
+    GREATER_HONORS_AND_KNITTED_TILES = 20
+    ALL_EVEN_PUNGS = 21
+    FULL_FLUSH = 22
+    PURE_TRIPLE_CHOW = 23
+    PURE_SHIFTED_PUNGS = 24
+    UPPER_TILES = 25
+    MIDDLE_TILES = 26
+    LOWER_TILES = 27
+    # 16
+    PURE_STRAIGHT = 28
+    THREE_SUITED_TERMINAL_CHOWS = 29
+    PURE_SHIFTED_CHOWS = 30
+    ALL_FIVES = 31
+    TRIPLE_PUNG = 32
+    THREE_CONCEALED_PUNGS = 33
+    # 12
+    LESSER_HONORS_AND_KNITTED_TILES = 34
+    KNITTED_STRAIGHT = 35
+    UPPER_FOUR = 36
+    LOWER_FOUR = 37
+    BIG_THREE_WINDS = 38
+    # 8
+    MIXED_STRAIGHT = 39
+    REVERSIBLE_TILES = 40
+    MIXED_TRIPLE_CHOW = 41
+    MIXED_SHIFTED_PUNGS = 42
+    CHICKEN_HAND = 43
+    LAST_TILE_DRAW = 44
+    LAST_TILE_CLAIM = 45
+    OUT_WITH_REPLACEMENT_TILE = 46
+    ROBBING_THE_KONG = 47
+    TWO_CONCEALED_KONGS = 48
+    # 6
+    ALL_PUNGS = 49
+    HALF_FLUSH = 50
+    MIXED_SHIFTED_CHOWS = 51
+    ALL_TYPES = 52
+    MELDED_HAND = 53
+    TWO_DRAGON_PUNGS = 54
+    # 4
+    OUTSIDE_HAND = 55
+    FULLY_CONCEALED_HAND = 56
+    TWO_MELDED_KONGS = 57
+    LAST_TILE = 58
+    # 2
+    DRAGON_PUNG = 59
+    PREVALENT_WIND = 60
+    SEAT_WIND = 61
+    CONCEALED_HAND = 62
+    ALL_CHOWS = 63
+    TILE_HOG = 64
+    DOUBLE_PUNG = 65
+    TWO_CONCEALED_PUNGS = 66
+    CONCEALED_KONG = 67
+    ALL_SIMPLES = 68
+    # 1
+    PURE_DOUBLE_CHOW = 69
+    MIXED_DOUBLE_CHOW = 70
+    SHORT_STRAIGHT = 71
+    TWO_TERMINAL_CHOWS = 72
+    PUNG_OF_TERMINALS_OR_HONORS = 73
+    MELDED_KONG = 74
+    ONE_VOIDED_SUIT = 75
+    NO_HONORS = 76
+    EDGE_WAIT = 77
+    CLOSED_WAIT = 78
+    SINGLE_WAIT = 79
+    SELF_DRAWN = 80
+    FLOWER_TILES = 81
+
+
+_POINT_GROUPS = (
+    (88, Fan.BIG_FOUR_WINDS, Fan.THIRTEEN_ORPHANS),
+    (64, Fan.ALL_TERMINALS, Fan.PURE_TERMINAL_CHOWS),
+    (48, Fan.QUADRUPLE_CHOW, Fan.FOUR_PURE_SHIFTED_PUNGS),
+    (32, Fan.FOUR_PURE_SHIFTED_CHOWS, Fan.ALL_TERMINALS_AND_HONORS),
+    (24, Fan.SEVEN_PAIRS, Fan.LOWER_TILES),
+    (16, Fan.PURE_STRAIGHT, Fan.THREE_CONCEALED_PUNGS),
+    (12, Fan.LESSER_HONORS_AND_KNITTED_TILES, Fan.BIG_THREE_WINDS),
+    (8, Fan.MIXED_STRAIGHT, Fan.TWO_CONCEALED_KONGS),
+    (6, Fan.ALL_PUNGS, Fan.TWO_DRAGON_PUNGS),
+    (4, Fan.OUTSIDE_HAND, Fan.LAST_TILE),
+    (2, Fan.DRAGON_PUNG, Fan.ALL_SIMPLES),
+    (1, Fan.PURE_DOUBLE_CHOW, Fan.FLOWER_TILES),
+)
+FAN_POINTS: dict[Fan, int] = {
+    fan: points
+    for points, first, last in _POINT_GROUPS
+    for fan in Fan
+    if first <= fan <= last
+}
+
+# 상위 번종이 성립하면 계산하지 않는 번종 (不计). 점수가 높은 번종부터 적용하므로
+# 제외된 번종은 다른 번종을 제외하지 못한다. 면자끼리 조합하는 번종(일반고, 삼색삼동순
+# 등)은 이 표가 아니라 _combination_fans에서 고른다.
+EXCLUDES: dict[Fan, tuple[Fan, ...]] = {
+    Fan.BIG_FOUR_WINDS: (
+        Fan.LITTLE_FOUR_WINDS,
+        Fan.BIG_THREE_WINDS,
+        Fan.ALL_PUNGS,
+        Fan.SEAT_WIND,
+        Fan.PREVALENT_WIND,
+    ),
+    Fan.BIG_THREE_DRAGONS: (
+        Fan.LITTLE_THREE_DRAGONS,
+        Fan.TWO_DRAGON_PUNGS,
+        Fan.DRAGON_PUNG,
+    ),
+    Fan.ALL_GREEN: (Fan.HALF_FLUSH,),
+    Fan.NINE_GATES: (
+        Fan.FULL_FLUSH,
+        Fan.CONCEALED_HAND,
+        Fan.FULLY_CONCEALED_HAND,
+        Fan.PUNG_OF_TERMINALS_OR_HONORS,
+        Fan.NO_HONORS,
+        Fan.ONE_VOIDED_SUIT,
+    ),
+    Fan.FOUR_KONGS: (Fan.ALL_PUNGS, Fan.SINGLE_WAIT),
+    Fan.SEVEN_SHIFTED_PAIRS: (
+        Fan.SEVEN_PAIRS,
+        Fan.FULL_FLUSH,
+        Fan.CONCEALED_HAND,
+        Fan.FULLY_CONCEALED_HAND,
+        Fan.SINGLE_WAIT,
+        Fan.NO_HONORS,
+        Fan.ONE_VOIDED_SUIT,
+    ),
+    Fan.THIRTEEN_ORPHANS: (
+        Fan.ALL_TERMINALS_AND_HONORS,
+        Fan.ALL_TYPES,
+        Fan.CONCEALED_HAND,
+        Fan.FULLY_CONCEALED_HAND,
+        Fan.SINGLE_WAIT,
+    ),
+    Fan.ALL_TERMINALS: (
+        Fan.ALL_TERMINALS_AND_HONORS,
+        Fan.ALL_PUNGS,
+        Fan.OUTSIDE_HAND,
+        Fan.PUNG_OF_TERMINALS_OR_HONORS,
+        Fan.NO_HONORS,
+    ),
+    Fan.LITTLE_FOUR_WINDS: (Fan.BIG_THREE_WINDS,),
+    Fan.LITTLE_THREE_DRAGONS: (Fan.TWO_DRAGON_PUNGS, Fan.DRAGON_PUNG),
+    Fan.ALL_HONORS: (
+        Fan.ALL_TERMINALS_AND_HONORS,
+        Fan.ALL_PUNGS,
+        Fan.OUTSIDE_HAND,
+        Fan.PUNG_OF_TERMINALS_OR_HONORS,
+    ),
+    Fan.FOUR_CONCEALED_PUNGS: (
+        Fan.ALL_PUNGS,
+        Fan.THREE_CONCEALED_PUNGS,
+        Fan.TWO_CONCEALED_PUNGS,
+        Fan.CONCEALED_HAND,
+    ),
+    Fan.PURE_TERMINAL_CHOWS: (
+        Fan.SEVEN_PAIRS,
+        Fan.FULL_FLUSH,
+        Fan.ALL_CHOWS,
+        Fan.NO_HONORS,
+        Fan.ONE_VOIDED_SUIT,
+    ),
+    Fan.QUADRUPLE_CHOW: (Fan.TILE_HOG,),
+    Fan.FOUR_PURE_SHIFTED_PUNGS: (Fan.ALL_PUNGS,),
+    Fan.ALL_TERMINALS_AND_HONORS: (
+        Fan.ALL_PUNGS,
+        Fan.OUTSIDE_HAND,
+        Fan.PUNG_OF_TERMINALS_OR_HONORS,
+    ),
+    Fan.SEVEN_PAIRS: (
+        Fan.CONCEALED_HAND,
+        Fan.FULLY_CONCEALED_HAND,
+        Fan.SINGLE_WAIT,
+    ),
+    Fan.GREATER_HONORS_AND_KNITTED_TILES: (
+        Fan.LESSER_HONORS_AND_KNITTED_TILES,
+        Fan.ALL_TYPES,
+        Fan.CONCEALED_HAND,
+        Fan.FULLY_CONCEALED_HAND,
+    ),
+    Fan.ALL_EVEN_PUNGS: (Fan.ALL_PUNGS, Fan.ALL_SIMPLES, Fan.NO_HONORS),
+    Fan.FULL_FLUSH: (Fan.NO_HONORS, Fan.ONE_VOIDED_SUIT),
+    Fan.UPPER_TILES: (Fan.UPPER_FOUR, Fan.NO_HONORS),
+    Fan.MIDDLE_TILES: (Fan.ALL_SIMPLES, Fan.NO_HONORS),
+    Fan.LOWER_TILES: (Fan.LOWER_FOUR, Fan.NO_HONORS),
+    Fan.THREE_SUITED_TERMINAL_CHOWS: (Fan.ALL_CHOWS, Fan.NO_HONORS),
+    Fan.ALL_FIVES: (Fan.ALL_SIMPLES, Fan.NO_HONORS),
+    Fan.LESSER_HONORS_AND_KNITTED_TILES: (
+        Fan.ALL_TYPES,
+        Fan.CONCEALED_HAND,
+        Fan.FULLY_CONCEALED_HAND,
+    ),
+    Fan.UPPER_FOUR: (Fan.NO_HONORS,),
+    Fan.LOWER_FOUR: (Fan.NO_HONORS,),
+    Fan.REVERSIBLE_TILES: (Fan.ONE_VOIDED_SUIT,),
+    Fan.LAST_TILE_DRAW: (Fan.SELF_DRAWN,),
+    Fan.OUT_WITH_REPLACEMENT_TILE: (Fan.SELF_DRAWN,),
+    Fan.ROBBING_THE_KONG: (Fan.LAST_TILE,),
+    Fan.MELDED_HAND: (Fan.SINGLE_WAIT,),
+    Fan.FULLY_CONCEALED_HAND: (Fan.CONCEALED_HAND, Fan.SELF_DRAWN),
+    Fan.ALL_CHOWS: (Fan.NO_HONORS,),
+    Fan.ALL_SIMPLES: (Fan.NO_HONORS,),
+}
+
+type ScoredSet = tuple[MeldKind, int, bool]
+
+PAIR = -1
+
+
+class Meld:
+    __slots__ = ("concealed", "kind", "tile")
+
+    def __init__(self, kind: MeldKind, tile: int, *, concealed: bool = False) -> None:
+        # tile: 순자는 가장 낮은 타일, 각자/깡자는 그 타일
+        self.kind = kind
+        self.tile = tile
+        self.concealed = concealed
+
+    def tiles(self) -> list[int]:
+        if self.kind is MeldKind.CHOW:
+            return [self.tile, self.tile + 1, self.tile + 2]
+        size = 4 if self.kind is MeldKind.KONG else 3
+        return [self.tile] * size
+
+    def key(self) -> tuple[int, int, bool]:
+        return (self.kind, self.tile, self.concealed)
+
+
+class WinContext:
+    __slots__ = (
+        "flowers",
+        "is_last_of_wall",
+        "is_last_tile",
+        "is_replacement",
+        "is_robbing_kong",
+        "prevalent_wind",
+        "seat_wind",
+        "self_drawn",
+    )
+
+    def __init__(  # noqa: PLR0913
+        self,
+        *,
+        self_drawn: bool = False,
+        seat_wind: int = EAST,
+        prevalent_wind: int = EAST,
+        is_last_tile: bool = False,
+        is_last_of_wall: bool = False,
+        is_replacement: bool = False,
+        is_robbing_kong: bool = False,
+        flowers: int = 0,
+    ) -> None:
+        self.self_drawn = self_drawn
+        self.seat_wind = seat_wind
+        self.prevalent_wind = prevalent_wind
+        # 화절장(和绝张): 화료패가 그 종류의 마지막 한 장
+        self.is_last_tile = is_last_tile
+        # 해저(海底): 패산의 마지막 패로 화료
+        self.is_last_of_wall = is_last_of_wall
+        self.is_replacement = is_replacement
+        self.is_robbing_kong = is_robbing_kong
+        self.flowers = flowers
+
+    def key(self) -> tuple:
+        return tuple(getattr(self, name) for name in self.__slots__)
+
+
+class Hand:
+    __slots__ = ("concealed", "melds", "winning_tile")
+
+    def __init__(
+        self,
+        concealed: Sequence[int],
+        winning_tile: int,
+        melds: Sequence[Meld] = (),
+    ) -> None:
+        # concealed: 화료패를 뺀 손패
+        self.concealed = tuple(concealed)
+        self.winning_tile = winning_tile
+        self.melds = tuple(melds)
+
+    def key(self) -> tuple:
+        return (
+            tuple(sorted(self.concealed)),
+            self.winning_tile,
+            tuple(meld.key() for meld in self.melds),
+        )
+
+
+class ScoreResult:
+    __slots__ = ("fans",)
+
+    def __init__(self, fans: dict[Fan, int]) -> None:
+        self.fans = fans
+
+    @property
+    def total(self) -> int:
+        return sum(FAN_POINTS[fan] * count for fan, count in self.fans.items())
+
+    @property
+    def points_without_flowers(self) -> int:
+        return self.total - self.fans.get(Fan.FLOWER_TILES, 0)
+
+    @property
+    def is_valid(self) -> bool:
+        # 8점 최소 기준에 꽃패는 들어가지 않는다.
+        return self.points_without_flowers >= MIN_POINTS
+
+    def __repr__(self) -> str:
+        fans = ", ".join(
+            f"{fan.name}x{count}" if count > 1 else fan.name
+            for fan, count in sorted(self.fans.items())
+        )
+        return f"ScoreResult({self.total}: {fans})"
+
+
+def _points(fans: dict[Fan, int]) -> int:
+    return sum(FAN_POINTS[fan] * count for fan, count in fans.items())
+
+
+def _fan_points(fans: list[Fan]) -> int:
+    return sum(FAN_POINTS[fan] for fan in fans)
+
+
+def _chow_pair_fan(a: int, b: int) -> Fan | None:
+    suit_a, rank_a = divmod(a, SUIT_SIZE)
+    suit_b, rank_b = divmod(b, SUIT_SIZE)
+    if suit_a != suit_b:
+        return Fan.MIXED_DOUBLE_CHOW if rank_a == rank_b else None
+    if rank_a == rank_b:
+        return Fan.PURE_DOUBLE_CHOW
+    if abs(rank_a - rank_b) == 3:  # noqa: PLR2004
+        return Fan.SHORT_STRAIGHT
+    if {rank_a, rank_b} == {0, 6}:
+        return Fan.TWO_TERMINAL_CHOWS
+    return None
+
+
+def _pure_chow_triple_fan(low: int, mid: int, high: int) -> Fan | None:
+    if low == high:
+        return Fan.PURE_TRIPLE_CHOW
+    if (low, mid, high) == (0, 3, 6):
+        return Fan.PURE_STRAIGHT
+    if mid - low == high - mid and mid - low in (1, 2):
+        return Fan.PURE_SHIFTED_CHOWS
+    return None
+
+
+def _mixed_chow_triple_fan(low: int, mid: int, high: int) -> Fan | None:
+    if low == high:
+        return Fan.MIXED_TRIPLE_CHOW
+    if (low, mid, high) == (0, 3, 6):
+        return Fan.MIXED_STRAIGHT
+    if mid - low == 1 and high - mid == 1:
+        return Fan.MIXED_SHIFTED_CHOWS
+    return None
+
+
+def _chow_triple_fan(a: int, b: int, c: int) -> Fan | None:
+    suits = {a // SUIT_SIZE, b // SUIT_SIZE, c // SUIT_SIZE}
+    low, mid, high = sorted((a % SUIT_SIZE, b % SUIT_SIZE, c % SUIT_SIZE))
+    if len(suits) == 1:
+        return _pure_chow_triple_fan(low, mid, high)
+    if len(suits) == 3:  # noqa: PLR2004
+        return _mixed_chow_triple_fan(low, mid, high)
+    return None
+
+
+def _chow_quad_fan(chows: list[int]) -> Fan | None:
+    if len({chow // SUIT_SIZE for chow in chows}) != 1:
+        return None
+    low, second, third, high = sorted(chows)
+    step = second - low
+    if step == 0 and high == low:
+        return Fan.QUADRUPLE_CHOW
+    if step in (1, 2) and third - second == step and high - third == step:
+        return Fan.FOUR_PURE_SHIFTED_CHOWS
+    return None
+
+
+def _pung_pair_fan(a: int, b: int) -> Fan | None:
+    if a // SUIT_SIZE != b // SUIT_SIZE and a % SUIT_SIZE == b % SUIT_SIZE:
+        return Fan.DOUBLE_PUNG
+    return None
+
+
+def _pung_triple_fan(a: int, b: int, c: int) -> Fan | None:
+    suits = {a // SUIT_SIZE, b // SUIT_SIZE, c // SUIT_SIZE}
+    low, mid, high = sorted((a % SUIT_SIZE, b % SUIT_SIZE, c % SUIT_SIZE))
+    consecutive = mid - low == 1 and high - mid == 1
+    if len(suits) == 3 and low == high:  # noqa: PLR2004
+        return Fan.TRIPLE_PUNG
+    if len(suits) == 1 and consecutive:
+        return Fan.PURE_SHIFTED_PUNGS
+    if len(suits) == 3 and consecutive:  # noqa: PLR2004
+        return Fan.MIXED_SHIFTED_PUNGS
+    return None
+
+
+def _pung_quad_fan(pungs: list[int]) -> Fan | None:
+    low, second, third, high = sorted(pungs)
+    if len({pung // SUIT_SIZE for pung in pungs}) == 1 and (
+        second - low == third - second == high - third == 1
+    ):
+        return Fan.FOUR_PURE_SHIFTED_PUNGS
+    return None
+
+
+def _best_triple_fans(
+    items: list[int],
+    pair_fan: Callable[[int, int], Fan | None],
+    triple_fan: Callable[[int, int, int], Fan | None],
+) -> list[Fan]:
+    # 세 면자 번종이 있으면 남은 면자는 그중 하나와만 조합한다.
+    best: list[Fan] = []
+    for triple in combinations(range(len(items)), 3):
+        fan = triple_fan(*(items[index] for index in triple))
+        if fan is None:
+            continue
+        fans = [fan]
+        for rest in set(range(len(items))).difference(triple):
+            extras = [
+                extra
+                for index in triple
+                if (extra := pair_fan(items[rest], items[index])) is not None
+            ]
+            if extras:
+                fans.append(max(extras, key=FAN_POINTS.__getitem__))
+        if _fan_points(fans) > _fan_points(best):
+            best = fans
+    return best
+
+
+def _pair_forest_fans(
+    items: list[int],
+    pair_fan: Callable[[int, int], Fan | None],
+) -> list[Fan]:
+    # 두 면자 번종을 간선으로 보면 순환이 없는 간선 집합만 셀 수 있으므로
+    # 크루스칼로 최대 가중 숲을 고른다.
+    edges = sorted(
+        (
+            (fan, i, j)
+            for i, j in combinations(range(len(items)), 2)
+            if (fan := pair_fan(items[i], items[j])) is not None
+        ),
+        key=lambda edge: -FAN_POINTS[edge[0]],
+    )
+    parent = list(range(len(items)))
+
+    def find(node: int) -> int:
+        while parent[node] != node:
+            node = parent[node]
+        return node
+
+    forest: list[Fan] = []
+    for fan, i, j in edges:
+        root_i, root_j = find(i), find(j)
+        if root_i != root_j:
+            parent[root_i] = root_j
+            forest.append(fan)
+    return forest
+
+
+def _combination_fans(
+    items: list[int],
+    pair_fan: Callable[[int, int], Fan | None],
+    triple_fan: Callable[[int, int, int], Fan | None],
+    quad_fan: Callable[[list[int]], Fan | None],
+) -> list[Fan]:
+    # 일투원칙(一套原则): 한 면자는 다른 면자와 한 번만 조합해 번을 만들 수 있다.
+    if len(items) == SETS_PER_HAND and (fan := quad_fan(items)) is not None:
+        return [fan]
+    best = _best_triple_fans(items, pair_fan, triple_fan)
+    forest = _pair_forest_fans(items, pair_fan)
+    return forest if _fan_points(forest) > _fan_points(best) else best
+
+
+def _apply_exclusions(fans: Counter[Fan]) -> dict[Fan, int]:
+    for fan in sorted(fans, key=lambda fan: (-FAN_POINTS[fan], fan)):
+        if fan in fans:
+            for excluded in EXCLUDES.get(fan, ()):
+                fans.pop(excluded, None)
+    if not any(fan is not Fan.FLOWER_TILES for fan in fans):
+        fans[Fan.CHICKEN_HAND] = 1
+    return dict(fans)
+
+
+def _contains_terminal_or_honor(kind: MeldKind, tile: int) -> bool:
+    if kind is MeldKind.CHOW:
+        return tile % SUIT_SIZE in (0, SUIT_SIZE - 3)
+    return is_terminal(tile) or is_honor(tile)
+
+
+def _contains_five(kind: MeldKind, tile: int) -> bool:
+    if is_honor(tile):
+        return False
+    rank = tile % SUIT_SIZE
+    return rank in (2, 3, 4) if kind is MeldKind.CHOW else rank == 4  # noqa: PLR2004
+
+
+def _rank_fans(
+    present: list[int],
+    suits: set[int],
+    *,
+    has_honors: bool,
+) -> Counter[Fan]:
+    fans: Counter[Fan] = Counter()
+    if not has_honors:
+        fans[Fan.NO_HONORS] = 1
+        ranks = {tile % SUIT_SIZE for tile in present}
+        for fan, allowed in _RANK_FANS:
+            if ranks <= allowed:
+                fans[fan] = 1
+    if all(is_terminal(tile) or is_honor(tile) for tile in present):
+        fans[Fan.ALL_TERMINALS_AND_HONORS] = 1
+        if not has_honors:
+            fans[Fan.ALL_TERMINALS] = 1
+        elif not suits:
+            fans[Fan.ALL_HONORS] = 1
+    return fans
+
+
+def _wind_dragon_fans(
+    wind_pungs: list[int],
+    dragon_pungs: list[int],
+    pair: int,
+) -> Counter[Fan]:
+    fans: Counter[Fan] = Counter()
+    if len(wind_pungs) == len(WINDS):
+        fans[Fan.BIG_FOUR_WINDS] = 1
+    elif len(wind_pungs) == 3 and pair in WINDS:  # noqa: PLR2004
+        fans[Fan.LITTLE_FOUR_WINDS] = 1
+    elif len(wind_pungs) == 3:  # noqa: PLR2004
+        fans[Fan.BIG_THREE_WINDS] = 1
+    if len(dragon_pungs) == len(DRAGONS):
+        fans[Fan.BIG_THREE_DRAGONS] = 1
+    elif len(dragon_pungs) == 2 and pair in DRAGONS:  # noqa: PLR2004
+        fans[Fan.LITTLE_THREE_DRAGONS] = 1
+    elif len(dragon_pungs) == 2:  # noqa: PLR2004
+        fans[Fan.TWO_DRAGON_PUNGS] = 1
+    elif dragon_pungs:
+        fans[Fan.DRAGON_PUNG] = 1
+    return fans
+
+
+def _pung_count_fans(
+    pungs: list[int],
+    pair: int,
+    concealed_pungs: int,
+) -> Counter[Fan]:
+    fans: Counter[Fan] = Counter()
+    if len(pungs) == SETS_PER_HAND:
+        fans[Fan.ALL_PUNGS] = 1
+        # 2, 4, 6, 8은 번호로 1, 3, 5, 7
+        if all(
+            tile < HONOR_START and tile % SUIT_SIZE % 2 == 1 for tile in (*pungs, pair)
+        ):
+            fans[Fan.ALL_EVEN_PUNGS] = 1
+    if concealed_pungs == SETS_PER_HAND:
+        fans[Fan.FOUR_CONCEALED_PUNGS] = 1
+    elif concealed_pungs == 3:  # noqa: PLR2004
+        fans[Fan.THREE_CONCEALED_PUNGS] = 1
+    elif concealed_pungs == 2:  # noqa: PLR2004
+        fans[Fan.TWO_CONCEALED_PUNGS] = 1
+    return fans
+
+
+class _HandScorer:
+    # 한 손에 대해 분해와 무관한 번종은 한 번만 계산하고, 분해(그리고 화료패를 어느
+    # 면자에 귀속시키는지)마다 나머지 번종을 더해 가장 높은 점수를 고른다.
+    def __init__(
+        self,
+        hand: Hand,
+        context: WinContext,
+        concealed: TileCounts,
+        used: TileCounts,
+    ) -> None:
+        self.hand = hand
+        self.context = context
+        self.concealed = concealed
+        self.used = used
+        self.winning_tile = hand.winning_tile
+        self.meld_sets: list[ScoredSet] = [
+            (meld.kind, meld.tile, meld.concealed) for meld in hand.melds
+        ]
+        self._unique_wait: bool | None = None
+        self.hand_fans = self._hand_fans()
+
+    def has_unique_wait(self) -> bool:
+        if self._unique_wait is None:
+            before = list(self.concealed)
+            before[self.winning_tile] -= 1
+            used = list(self.used)
+            used[self.winning_tile] -= 1
+            waits = waiting_tiles(before, len(self.hand.melds), used)
+            self._unique_wait = waits == [self.winning_tile]
+        return self._unique_wait
+
+    def _hand_fans(self) -> Counter[Fan]:
+        fans: Counter[Fan] = Counter()
+        used = self.used
+        present = [tile for tile in range(TILE_KINDS) if used[tile]]
+        suits = {tile // SUIT_SIZE for tile in present if tile < HONOR_START}
+        has_honors = any(tile >= HONOR_START for tile in present)
+        fans.update(self._tile_fans(present, suits, has_honors=has_honors))
+
+        kong_tiles = {
+            meld.tile for meld in self.hand.melds if meld.kind is MeldKind.KONG
+        }
+        tile_hogs = sum(
+            1 for tile in present if used[tile] == MAX_COPIES and tile not in kong_tiles
+        )
+        if tile_hogs:
+            fans[Fan.TILE_HOG] = tile_hogs
+        fans.update(self._kong_fans())
+
+        melds = self.hand.melds
+        exposed = [meld for meld in melds if not meld.concealed]
+        if not exposed:
+            if self.context.self_drawn:
+                fans[Fan.FULLY_CONCEALED_HAND] = 1
+            else:
+                fans[Fan.CONCEALED_HAND] = 1
+        elif len(exposed) == SETS_PER_HAND and not self.context.self_drawn:
+            fans[Fan.MELDED_HAND] = 1
+        if not melds and len(suits) == 1 and not has_honors and self._is_nine_gates():
+            fans[Fan.NINE_GATES] = 1
+        fans.update(self._context_fans())
+        return fans
+
+    def _tile_fans(
+        self,
+        present: list[int],
+        suits: set[int],
+        *,
+        has_honors: bool,
+    ) -> Counter[Fan]:
+        # 어떤 패를 썼는지만 보는 번종
+        fans: Counter[Fan] = Counter()
+        used = self.used
+        if len(suits) == 1:
+            fans[Fan.HALF_FLUSH if has_honors else Fan.FULL_FLUSH] = 1
+        elif len(suits) == 2:  # noqa: PLR2004
+            fans[Fan.ONE_VOIDED_SUIT] = 1
+        if len(suits) == 3 and (  # noqa: PLR2004
+            any(used[tile] for tile in WINDS) and any(used[tile] for tile in DRAGONS)
+        ):
+            fans[Fan.ALL_TYPES] = 1
+        if all(tile in GREEN_TILES for tile in present):
+            fans[Fan.ALL_GREEN] = 1
+        if all(tile in REVERSIBLE_TILES for tile in present):
+            fans[Fan.REVERSIBLE_TILES] = 1
+
+        fans.update(_rank_fans(present, suits, has_honors=has_honors))
+        return fans
+
+    def _context_fans(self) -> Counter[Fan]:
+        context = self.context
+        fans: Counter[Fan] = Counter()
+        if context.self_drawn:
+            fans[Fan.SELF_DRAWN] = 1
+            if context.is_replacement:
+                fans[Fan.OUT_WITH_REPLACEMENT_TILE] = 1
+        if context.is_last_of_wall:
+            last = Fan.LAST_TILE_DRAW if context.self_drawn else Fan.LAST_TILE_CLAIM
+            fans[last] = 1
+        if context.is_robbing_kong:
+            fans[Fan.ROBBING_THE_KONG] = 1
+        if context.is_last_tile:
+            fans[Fan.LAST_TILE] = 1
+        if context.flowers:
+            fans[Fan.FLOWER_TILES] = context.flowers
+        return fans
+
+    def _kong_fans(self) -> Counter[Fan]:
+        kongs = [meld for meld in self.hand.melds if meld.kind is MeldKind.KONG]
+        concealed = sum(1 for kong in kongs if kong.concealed)
+        melded = len(kongs) - concealed
+        fans: Counter[Fan] = Counter()
+        if len(kongs) == SETS_PER_HAND:
+            fans[Fan.FOUR_KONGS] = 1
+        elif len(kongs) == 3:  # noqa: PLR2004
+            fans[Fan.THREE_KONGS] = 1
+        elif concealed == 2:  # noqa: PLR2004
+            fans[Fan.TWO_CONCEALED_KONGS] = 1
+        elif melded == 2:  # noqa: PLR2004
+            fans[Fan.TWO_MELDED_KONGS] = 1
+        else:
+            if concealed:
+                fans[Fan.CONCEALED_KONG] = 1
+            if melded:
+                fans[Fan.MELDED_KONG] = 1
+        return fans
+
+    def _is_nine_gates(self) -> bool:
+        suit = self.winning_tile // SUIT_SIZE
+        before = self.concealed[suit * SUIT_SIZE : (suit + 1) * SUIT_SIZE]
+        before[self.winning_tile % SUIT_SIZE] -= 1
+        return before == [3, 1, 1, 1, 1, 1, 1, 1, 3]
+
+    def candidates(self) -> list[dict[Fan, int]]:
+        results = []
+        for sets, pair in decompose(self.concealed):
+            results.extend(self._standard_candidates(sets, pair, None))
+
+        if len(self.hand.melds) <= 1:
+            for pattern, remainder in knitted_straight_remainders(self.concealed):
+                for sets, pair in decompose(remainder):
+                    results.extend(self._standard_candidates(sets, pair, pattern))
+
+        if not self.hand.melds:
+            results.extend(self._special_candidates())
+        return results
+
+    def _standard_candidates(
+        self,
+        sets: tuple[tuple[MeldKind, int], ...],
+        pair: int,
+        knitted: tuple[int, ...] | None,
+    ) -> list[dict[Fan, int]]:
+        winning_tile = self.winning_tile
+        attributions: list[int | None] = [
+            index
+            for index, (kind, tile) in enumerate(sets)
+            if tile == winning_tile
+            or (kind is MeldKind.CHOW and tile < winning_tile <= tile + 2)
+        ]
+        if pair == winning_tile:
+            attributions.append(PAIR)
+        if knitted is not None and winning_tile in knitted:
+            attributions.append(None)
+
+        results = []
+        seen: set[tuple[MeldKind, int] | int | None] = set()
+        for attribution in attributions:
+            # 같은 모양의 면자에 귀속시키는 경우는 한 번만 본다.
+            shape = attribution if attribution in (PAIR, None) else sets[attribution]
+            if shape in seen:
+                continue
+            seen.add(shape)
+            fans = self._standard_fans(sets, pair, attribution, knitted)
+            results.append(_apply_exclusions(fans))
+        return results
+
+    def _standard_fans(
+        self,
+        sets: tuple[tuple[MeldKind, int], ...],
+        pair: int,
+        attribution: int | None,
+        knitted: tuple[int, ...] | None,
+    ) -> Counter[Fan]:
+        # 론 화료패로 완성된 각자는 밍커로 본다.
+        all_sets: list[ScoredSet] = [
+            (kind, tile, self.context.self_drawn or index != attribution)
+            for index, (kind, tile) in enumerate(sets)
+        ]
+        all_sets += self.meld_sets
+        fans = Counter(self.hand_fans)
+
+        chows = [tile for kind, tile, _ in all_sets if kind is MeldKind.CHOW]
+        pungs = [tile for kind, tile, _ in all_sets if kind is not MeldKind.CHOW]
+        concealed_pungs = sum(
+            1
+            for kind, _, concealed in all_sets
+            if kind is not MeldKind.CHOW and concealed
+        )
+        fans.update(self._honor_pung_fans(pungs, pair))
+        fans.update(_pung_count_fans(pungs, pair, concealed_pungs))
+
+        if knitted is not None:
+            fans[Fan.KNITTED_STRAIGHT] = 1
+            if chows and not is_honor(pair):
+                fans[Fan.ALL_CHOWS] = 1
+        else:
+            fans.update(self._set_shape_fans(all_sets, chows, pungs, pair))
+
+        if attribution is not None and self.has_unique_wait():
+            wait = self._wait_fan(sets, attribution)
+            if wait is not None:
+                fans[wait] = 1
+        return fans
+
+    def _honor_pung_fans(self, pungs: list[int], pair: int) -> Counter[Fan]:
+        context = self.context
+        fans: Counter[Fan] = Counter()
+        wind_pungs = [tile for tile in pungs if tile in WINDS]
+        dragon_pungs = [tile for tile in pungs if tile in DRAGONS]
+        fans.update(_wind_dragon_fans(wind_pungs, dragon_pungs, pair))
+        if context.prevalent_wind in wind_pungs:
+            fans[Fan.PREVALENT_WIND] = 1
+        if context.seat_wind in wind_pungs:
+            fans[Fan.SEAT_WIND] = 1
+
+        # 삼원패 각자와 장풍/문풍 각자는 요구각(幺九刻)으로 다시 세지 않는다.
+        terminal_pungs = sum(1 for tile in pungs if is_terminal(tile))
+        if len(wind_pungs) < 3:  # noqa: PLR2004
+            terminal_pungs += sum(
+                1
+                for tile in wind_pungs
+                if tile not in (context.seat_wind, context.prevalent_wind)
+            )
+        if terminal_pungs:
+            fans[Fan.PUNG_OF_TERMINALS_OR_HONORS] = terminal_pungs
+        return fans
+
+    def _set_shape_fans(
+        self,
+        all_sets: list[ScoredSet],
+        chows: list[int],
+        pungs: list[int],
+        pair: int,
+    ) -> Counter[Fan]:
+        fans: Counter[Fan] = Counter()
+        whole_hand = self._whole_hand_chow_fan(chows, pair)
+        if whole_hand is not None:
+            fans[whole_hand] = 1
+        else:
+            fans.update(
+                _combination_fans(
+                    chows,
+                    _chow_pair_fan,
+                    _chow_triple_fan,
+                    _chow_quad_fan,
+                ),
+            )
+        suited_pungs = [tile for tile in pungs if tile < HONOR_START]
+        fans.update(
+            _combination_fans(
+                suited_pungs,
+                _pung_pair_fan,
+                _pung_triple_fan,
+                _pung_quad_fan,
+            ),
+        )
+        if len(chows) == SETS_PER_HAND and not is_honor(pair):
+            fans[Fan.ALL_CHOWS] = 1
+        shapes = [(kind, tile) for kind, tile, _ in all_sets]
+        shapes.append((MeldKind.PUNG, pair))
+        if all(_contains_terminal_or_honor(kind, tile) for kind, tile in shapes):
+            fans[Fan.OUTSIDE_HAND] = 1
+        if all(_contains_five(kind, tile) for kind, tile in shapes):
+            fans[Fan.ALL_FIVES] = 1
+        return fans
+
+    def _wait_fan(
+        self,
+        sets: tuple[tuple[MeldKind, int], ...],
+        attribution: int,
+    ) -> Fan | None:
+        if attribution == PAIR:
+            return Fan.SINGLE_WAIT
+        kind, tile = sets[attribution]
+        if kind is not MeldKind.CHOW:
+            return None
+        winning_tile = self.winning_tile
+        if winning_tile == tile + 1:
+            return Fan.CLOSED_WAIT
+        if (winning_tile == tile + 2 and tile % SUIT_SIZE == 0) or (
+            winning_tile == tile and tile % SUIT_SIZE == SUIT_SIZE - 3
+        ):
+            return Fan.EDGE_WAIT
+        return None
+
+    @staticmethod
+    def _whole_hand_chow_fan(chows: list[int], pair: int) -> Fan | None:
+        if len(chows) != SETS_PER_HAND or is_honor(pair):
+            return None
+        if pair % SUIT_SIZE != 4:  # noqa: PLR2004
+            return None
+        pair_suit = pair // SUIT_SIZE
+        by_suit: dict[int, list[int]] = {}
+        for chow in sorted(chows):
+            by_suit.setdefault(chow // SUIT_SIZE, []).append(chow % SUIT_SIZE)
+        if by_suit == {pair_suit: [0, 0, 6, 6]}:
+            return Fan.PURE_TERMINAL_CHOWS
+        if (
+            len(by_suit) == 2  # noqa: PLR2004
+            and pair_suit not in by_suit
+            and all(ranks == [0, 6] for ranks in by_suit.values())
+        ):
+            return Fan.THREE_SUITED_TERMINAL_CHOWS
+        return None
+
+    def _special_candidates(self) -> list[dict[Fan, int]]:
+        concealed = self.concealed
+        results = []
+        if is_seven_pairs(concealed):
+            fans = Counter(self.hand_fans)
+            fans[Fan.SEVEN_PAIRS] = 1
+            pairs = [tile for tile in range(TILE_KINDS) if concealed[tile]]
+            if (
+                len(pairs) == STANDARD_TILES // 2
+                and pairs[-1] - pairs[0] == len(pairs) - 1
+                and pairs[-1] < HONOR_START
+                and pairs[0] // SUIT_SIZE == pairs[-1] // SUIT_SIZE
+            ):
+                fans[Fan.SEVEN_SHIFTED_PAIRS] = 1
+            results.append(_apply_exclusions(fans))
+        if is_thirteen_orphans(concealed):
+            fans = Counter(self.hand_fans)
+            fans[Fan.THIRTEEN_ORPHANS] = 1
+            results.append(_apply_exclusions(fans))
+        pattern = honors_and_knitted_pattern(concealed)
+        if pattern is not None:
+            fans = Counter(self.hand_fans)
+            if all(concealed[tile] for tile in HONORS):
+                fans[Fan.GREATER_HONORS_AND_KNITTED_TILES] = 1
+            else:
+                fans[Fan.LESSER_HONORS_AND_KNITTED_TILES] = 1
+            if all(concealed[tile] for tile in pattern):
+                fans[Fan.KNITTED_STRAIGHT] = 1
+            results.append(_apply_exclusions(fans))
+        return results
+
+
+_RANK_FANS = (
+    (Fan.UPPER_TILES, frozenset(range(6, 9))),
+    (Fan.MIDDLE_TILES, frozenset(range(3, 6))),
+    (Fan.LOWER_TILES, frozenset(range(3))),
+    (Fan.UPPER_FOUR, frozenset(range(5, 9))),
+    (Fan.LOWER_FOUR, frozenset(range(4))),
+    (Fan.ALL_SIMPLES, frozenset(range(1, 8))),
+)
+
+
+def score_hand(hand: Hand, context: WinContext | None = None) -> ScoreResult | None:
+    # 화료형이 아니면 None. 8점 미만이어도 점수는 돌려주고 is_valid로 구분한다.
+    context = context or WinContext()
+    concealed = to_counts(hand.concealed)
+    concealed[hand.winning_tile] += 1
+    used = list(concealed)
+    for meld in hand.melds:
+        for tile in meld.tiles():
+            used[tile] += 1
+    if (
+        len(hand.melds) > SETS_PER_HAND
+        or sum(concealed) != STANDARD_TILES - 3 * len(hand.melds)
+        or max(used) > MAX_COPIES
+    ):
+        return None
+
+    candidates = _HandScorer(hand, context, concealed, used).candidates()
+    if not candidates:
+        return None
+    return ScoreResult(max(candidates, key=_points))
+
+
+def score_hands(
+    hands: Iterable[tuple[Hand, WinContext | None]],
+) -> list[ScoreResult | None]:
+    # 같은 손과 상황은 한 번만 계산한다 (로그 재계산, 봇 탐색 등에서 흔하다).
+    memo: dict[tuple, ScoreResult | None] = {}
+    results = []
+    for hand, given in hands:
+        context = given or WinContext()
+        key = (hand.key(), context.key())
+        if key not in memo:
+            memo[key] = score_hand(hand, context)
+        results.append(memo[key])
+    return results
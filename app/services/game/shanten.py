@@ -0,0 +1,399 @@
+import logging
+import struct
+import zlib
+from functools import cache, lru_cache
+from itertools import combinations_with_replacement, product
+from pathlib import Path
+
+from app.services.game.decomposition import (
+    KNITTED_PATTERNS,
+    MAX_COPIES,
+    SETS_PER_HAND,
+    STANDARD_TILES,
+    MeldKind,
+    is_complete,
+)
+from app.services.game.tile import (
+    HONOR_START,
+    HONORS,
+    SUIT_SIZE,
+    TERMINALS_AND_HONORS,
+    TILE_KINDS,
+    TileCounts,
+    is_honor,
+)
+
+logger = logging.getLogger(__name__)
+
+# 향청수(向听数): 화료까지 바꿔야 하는 장수 - 1. 텐파이는 0, 화료형은 -1.
+#
+# 한 그룹(만/통/삭 또는 자패)의 장수 벡터 h에 대해
+#   거리[k] = 면자 m개 + 머리 q개(k = m + 5q) 모양이 되려면 더 필요한 장수의 최소값
+# 를 미리 계산해 둔다. 필요한 장수는 그룹마다 독립이므로 손패 전체의 거리는 네
+# 그룹의 거리를 (면자 수, 머리 수)에 대해 min-plus로 합치면 된다.
+# 한 그룹은 최대 14장이므로 가능한 벡터는 수패 405,350개, 자패 43,130개다.
+# 표는 사전순 번호로 색인한 바이트열이며 shanten_tables.bin에 압축해 두고 읽는다.
+# 표를 다시 만들려면 python -m app.services.game.shanten
+
+TABLE_PATH = Path(__file__).with_name("shanten_tables.bin")
+TABLE_MAGIC = b"MCRS"
+TABLE_VERSION = 1
+_HEADER = struct.Struct("<4sHII")
+
+MAX_GROUP_TILES = STANDARD_TILES
+_SLOTS = SETS_PER_HAND + 1
+GOALS = 2 * _SLOTS
+_UNREACHABLE = 0xFF
+
+# 두 그룹의 거리를 합칠 때 가능한 (왼쪽 목표, 오른쪽 목표, 합친 목표) 조합
+_MERGES = tuple(
+    (left, right, melds + _SLOTS * pairs)
+    for left in range(GOALS)
+    for right in range(GOALS)
+    if (melds := left % _SLOTS + right % _SLOTS) < _SLOTS
+    and (pairs := left // _SLOTS + right // _SLOTS) <= 1
+)
+
+
+def _count_vectors(length: int, budget: int) -> int:
+    # 원소가 0-4이고 합이 budget 이하인 길이 length 벡터의 수
+    counts = [1] * (budget + 1)
+    for _ in range(length):
+        counts = [
+            sum(counts[total - value] for value in range(min(total, MAX_COPIES) + 1))
+            for total in range(budget + 1)
+        ]
+    return counts[budget]
+
+
+def _rank_offsets(length: int) -> list[int]:
+    # 자리마다 (앞자리까지의 장수, 이 자리의 장수)에 해당하는 값을 더하면 사전순 번호다.
+    offsets = []
+    for position in range(length):
+        for used in range(MAX_GROUP_TILES + 1):
+            for count in range(MAX_COPIES + 1):
+                offsets.append(
+                    sum(
+                        _count_vectors(length - position - 1, budget)
+                        for value in range(count)
+                        if (budget := MAX_GROUP_TILES - used - value) >= 0
+                    ),
+                )
+    return offsets
+
+
+def _vectors(length: int) -> list[tuple[int, ...]]:
+    return [
+        vector
+        for vector in product(range(MAX_COPIES + 1), repeat=length)
+        if sum(vector) <= MAX_GROUP_TILES
+    ]
+
+
+def _complete_shapes(length: int, *, chows: bool) -> dict[tuple[int, ...], int]:
+    # 면자 0-4개 + 머리 0-1개 완성형 -> 해당하는 목표 k의 비트마스크
+    melds = [(rank, rank, rank) for rank in range(length)]
+    if chows:
+        melds += [(rank, rank + 1, rank + 2) for rank in range(length - 2)]
+    shapes: dict[tuple[int, ...], int] = {}
+    for size in range(SETS_PER_HAND + 1):
+        for combo in combinations_with_replacement(melds, size):
+            counts = [0] * length
+            for meld in combo:
+                for rank in meld:
+                    counts[rank] += 1
+            if max(counts) > MAX_COPIES:
+                continue
+            key = tuple(counts)
+            shapes[key] = shapes.get(key, 0) | 1 << size
+            for pair in range(length):
+                if counts[pair] + 2 <= MAX_COPIES:
+                    counts[pair] += 2
+                    key = tuple(counts)
+                    shapes[key] = shapes.get(key, 0) | 1 << (size + _SLOTS)
+                    counts[pair] -= 2
+    return shapes
+
+
+def _target_goals(length: int, *, chows: bool) -> dict[tuple[int, ...], int]:
+    # 완성형의 부분집합도 같은 목표를 "만족하는 중"으로 표시한다.
+    goals = _complete_shapes(length, chows=chows)
+    by_size: list[list[tuple[int, ...]]] = [[] for _ in range(MAX_GROUP_TILES + 1)]
+    for key in goals:
+        by_size[sum(key)].append(key)
+    for size in range(MAX_GROUP_TILES, 0, -1):
+        for key in by_size[size]:
+            mask = goals[key]
+            for rank in range(length):
+                if not key[rank]:
+                    continue
+                smaller = (*key[:rank], key[rank] - 1, *key[rank + 1 :])
+                old = goals.get(smaller)
+                if old is None:
+                    goals[smaller] = mask
+                    by_size[size - 1].append(smaller)
+                else:
+                    goals[smaller] = old | mask
+    return goals
+
+
+def _build_group(length: int, *, chows: bool) -> bytes:
+    # 목표 k의 완성형과 겹칠 수 있는 최대 장수를 합이 작은 벡터부터 구한다.
+    # 부분집합이면 전부 겹치고, 아니면 한 장 뺀 벡터들 중 최대값과 같다.
+    goals = _target_goals(length, chows=chows)
+    vectors = _vectors(length)
+    overlap: dict[tuple[int, ...], tuple[int, ...]] = {}
+    for vector in sorted(vectors, key=sum):
+        size = sum(vector)
+        smaller = [
+            overlap[(*vector[:rank], vector[rank] - 1, *vector[rank + 1 :])]
+            for rank in range(length)
+            if vector[rank]
+        ]
+        if len(smaller) > 1:
+            best = list(map(max, *smaller))
+        else:
+            best = list(smaller[0]) if smaller else [0] * GOALS
+        mask = goals.get(vector, 0)
+        for goal in range(GOALS):
+            if mask >> goal & 1:
+                best[goal] = size
+        overlap[vector] = tuple(best)
+
+    needed = [3 * (goal % _SLOTS) + 2 * (goal // _SLOTS) for goal in range(GOALS)]
+    return bytes(
+        need - have
+        for vector in vectors
+        for need, have in zip(needed, overlap[vector], strict=True)
+    )
+
+
+class ShantenTables:
+    __slots__ = ("honor_offsets", "honors", "suit_offsets", "suits")
+
+    def __init__(self, suits: bytes, honors: bytes) -> None:
+        self.suits = suits
+        self.honors = honors
+        self.suit_offsets = _rank_offsets(SUIT_SIZE)
+        self.honor_offsets = _rank_offsets(len(HONORS))
+        suit_size = _count_vectors(SUIT_SIZE, MAX_GROUP_TILES) * GOALS
+        honor_size = _count_vectors(len(HONORS), MAX_GROUP_TILES) * GOALS
+        if len(suits) != suit_size or len(honors) != honor_size:
+            msg = "Shanten table size mismatch"
+            raise ValueError(msg)
+
+    @classmethod
+    def build(cls) -> "ShantenTables":
+        return cls(
+            _build_group(SUIT_SIZE, chows=True),
+            _build_group(len(HONORS), chows=False),
+        )
+
+    @classmethod
+    def load(cls, path: Path) -> "ShantenTables":
+        data = path.read_bytes()
+        magic, version, suit_size, honor_size = _HEADER.unpack_from(data)
+        if magic != TABLE_MAGIC or version != TABLE_VERSION:
+            msg = f"Unsupported shanten table {path}"
+            raise ValueError(msg)
+        payload = zlib.decompress(data[_HEADER.size :])
+        if len(payload) != suit_size + honor_size:
+            msg = f"Truncated shanten table {path}"
+            raise ValueError(msg)
+        return cls(payload[:suit_size], payload[suit_size:])
+
+    def dump(self, path: Path) -> None:
+        header = _HEADER.pack(
+            TABLE_MAGIC,
+            TABLE_VERSION,
+            len(self.suits),
+            len(self.honors),
+        )
+        path.write_bytes(header + zlib.compress(self.suits + self.honors, 9))
+
+    @staticmethod
+    def _rank(key: tuple[int, ...], offsets: list[int]) -> int:
+        rank = 0
+        used = 0
+        base = 0
+        for count in key:
+            rank += offsets[base + used * (MAX_COPIES + 1) + count]
+            used += count
+            base += (MAX_GROUP_TILES + 1) * (MAX_COPIES + 1)
+        return rank
+
+    def suit(self, key: tuple[int, ...]) -> bytes:
+        start = self._rank(key, self.suit_offsets) * GOALS
+        return self.suits[start : start + GOALS]
+
+    def honor(self, key: tuple[int, ...]) -> bytes:
+        start = self._rank(key, self.honor_offsets) * GOALS
+        return self.honors[start : start + GOALS]
+
+
+@cache
+def get_tables() -> ShantenTables:
+    try:
+        return ShantenTables.load(TABLE_PATH)
+    except (OSError, ValueError, struct.error, zlib.error):
+        logger.warning("Rebuilding shanten tables", exc_info=True)
+        return ShantenTables.build()
+
+
+@lru_cache(maxsize=65536)
+def _suit_distances(key: tuple[int, ...]) -> bytes:
+    return get_tables().suit(key)
+
+
+@lru_cache(maxsize=16384)
+def _honor_distances(key: tuple[int, ...]) -> bytes:
+    return get_tables().honor(key)
+
+
+def _merge(left: bytes | list[int], right: bytes) -> list[int]:
+    merged = [_UNREACHABLE] * GOALS
+    for i, j, goal in _MERGES:
+        distance = left[i] + right[j]
+        merged[goal] = min(merged[goal], distance)
+    return merged
+
+
+def _standard_distance(counts: TileCounts, sets: int) -> int:
+    # 면자 sets개 + 머리 하나가 되기까지 더 필요한 장수
+    suits = _merge(
+        _suit_distances(tuple(counts[0:SUIT_SIZE])),
+        _suit_distances(tuple(counts[SUIT_SIZE : 2 * SUIT_SIZE])),
+    )
+    suits = _merge(suits, _suit_distances(tuple(counts[2 * SUIT_SIZE : HONOR_START])))
+    honors = _honor_distances(tuple(counts[HONOR_START:TILE_KINDS]))
+    return min(
+        min(
+            suits[melds + _SLOTS] + honors[sets - melds],
+            suits[melds] + honors[sets - melds + _SLOTS],
+        )
+        for melds in range(sets + 1)
+    )
+
+
+def _check_hand_size(counts: TileCounts, meld_count: int) -> None:
+    size = sum(counts) + 3 * meld_count
+    if size not in (STANDARD_TILES - 1, STANDARD_TILES) or meld_count > SETS_PER_HAND:
+        msg = f"Expected 13 or 14 tiles including melds, got {size}"
+        raise ValueError(msg)
+
+
+def standard_shanten(counts: TileCounts, meld_count: int = 0) -> int:
+    _check_hand_size(counts, meld_count)
+    return _standard_distance(counts, SETS_PER_HAND - meld_count) - 1
+
+
+def seven_pairs_shanten(counts: TileCounts) -> int:
+    # 국표에서는 같은 패 네 장을 두 쌍으로 인정한다.
+    pairs = sum(count // 2 for count in counts)
+    return STANDARD_TILES // 2 - 1 - min(pairs, STANDARD_TILES // 2)
+
+
+def thirteen_orphans_shanten(counts: TileCounts) -> int:
+    kinds = sum(1 for tile in TERMINALS_AND_HONORS if counts[tile])
+    has_pair = any(counts[tile] >= 2 for tile in TERMINALS_AND_HONORS)  # noqa: PLR2004
+    return len(TERMINALS_AND_HONORS) - kinds - has_pair
+
+
+def honors_and_knitted_shanten(counts: TileCounts) -> int:
+    # 조합룡 배치 + 자패 16종 중 서로 다른 14장
+    honors = sum(1 for tile in HONORS if counts[tile])
+    knitted = max(
+        sum(1 for tile in pattern if counts[tile]) for pattern in KNITTED_PATTERNS
+    )
+    return STANDARD_TILES - 1 - min(honors + knitted, STANDARD_TILES)
+
+
+def knitted_straight_shanten(
+    counts: TileCounts,
+    meld_count: int = 0,
+    bound: int = STANDARD_TILES,
+) -> int:
+    # 조합룡(9장) + 면자 하나 + 머리. 조합룡 패는 한 장씩만 떼어 내면 된다.
+    # 빠진 조합룡 패 수만으로 bound를 넘으면 나머지 계산은 건너뛴다.
+    best = bound
+    for pattern in KNITTED_PATTERNS:
+        missing = sum(1 for tile in pattern if not counts[tile])
+        if missing - 1 >= best:
+            continue
+        remainder = list(counts)
+        for tile in pattern:
+            if remainder[tile]:
+                remainder[tile] -= 1
+        distance = missing + _standard_distance(remainder, 1 - meld_count)
+        best = min(best, distance - 1)
+    return best
+
+
+def shanten(counts: TileCounts, meld_count: int = 0) -> int:
+    _check_hand_size(counts, meld_count)
+    best = _standard_distance(counts, SETS_PER_HAND - meld_count) - 1
+    if meld_count <= 1 and best >= 0:
+        best = knitted_straight_shanten(counts, meld_count, best)
+    if meld_count == 0 and best >= 0:
+        best = min(
+            best,
+            seven_pairs_shanten(counts),
+            thirteen_orphans_shanten(counts),
+            honors_and_knitted_shanten(counts),
+        )
+    return best
+
+
+def effective_tiles(
+    counts: TileCounts,
+    meld_count: int = 0,
+    used: TileCounts | None = None,
+) -> list[int]:
+    # 13장 손패에서 향청수를 줄이는 타일 (유효패). 텐파이면 대기패와 같다.
+    used = used or counts
+    current = shanten(counts, meld_count)
+    tiles = []
+    for tile in range(TILE_KINDS):
+        if used[tile] >= MAX_COPIES:
+            continue
+        counts[tile] += 1
+        if shanten(counts, meld_count) < current:
+            tiles.append(tile)
+        counts[tile] -= 1
+    return tiles
+
+
+def can_win_on(counts: TileCounts, tile: int, meld_count: int = 0) -> bool:
+    # 버림패/쯔모패로 화료형이 되는지. 번수(8점) 조건은 scoring에서 따로 본다.
+    counts[tile] += 1
+    try:
+        return is_complete(counts, meld_count)
+    finally:
+        counts[tile] -= 1
+
+
+def call_options(
+    counts: TileCounts,
+    tile: int,
+    *,
+    can_chow: bool,
+) -> list[tuple[MeldKind, int]]:
+    # 버림패로 할 수 있는 치/퐁/깡. 치는 상가의 버림패에만 가능하다.
+    options: list[tuple[MeldKind, int]] = []
+    if can_chow and not is_honor(tile):
+        suit_start = tile - tile % SUIT_SIZE
+        for start in range(
+            max(tile - 2, suit_start),
+            min(tile, suit_start + SUIT_SIZE - 3) + 1,
+        ):
+            if all(counts[other] for other in range(start, start + 3) if other != tile):
+                options.append((MeldKind.CHOW, start))
+    if counts[tile] >= 2:  # noqa: PLR2004
+        options.append((MeldKind.PUNG, tile))
+    if counts[tile] >= 3:  # noqa: PLR2004
+        options.append((MeldKind.KONG, tile))
+    return options
+
+
+if __name__ == "__main__":
+    ShantenTables.build().dump(TABLE_PATH)
@@ -0,0 +1,350 @@
+import random
+import struct
+from enum import IntEnum
+
+from app.core.error import DomainErrorCode, MCRDomainError
+from app.services.game.decomposition import MAX_COPIES, MeldKind
+from app.services.game.tile import EAST, HONORS, SUIT_SIZE, TILE_KINDS, TileCounts
+
+# 게임 상태는 초당 수천 번 만들고 바꾸고 복사하므로 pydantic 모델 대신
+# __slots__ 클래스와 bytearray로 둔다.
+#   손패   bytearray(34)  타일 종류별 장수
+#   패산   bytearray      남은 패. 앞에서 쯔모, 뒤에서 영상개화용 보충
+#   부로   bytearray      (종류, 타일, 가져온 자리) 3바이트씩
+#   버림패 bytearray      버린 순서대로
+# 꽃패는 타일 번호 34 하나로 8장을 둔다.
+FLOWER = TILE_KINDS
+FLOWER_COUNT = 8
+WALL_SIZE = TILE_KINDS * MAX_COPIES + FLOWER_COUNT
+HAND_SIZE = 13
+NO_TILE = 0xFF
+CONCEALED = 0xFF
+
+
+class GamePhase(IntEnum):
+    DRAW = 0
+    DISCARD = 1
+    CLAIM = 2
+    FINISHED = 3
+
+
+def meld_tiles(kind: MeldKind, tile: int) -> list[int]:
+    if kind is MeldKind.CHOW:
+        return [tile, tile + 1, tile + 2]
+    return [tile] * (4 if kind is MeldKind.KONG else 3)
+
+
+class PlayerState:
+    __slots__ = ("discards", "flowers", "hand", "melds", "score", "user_id")
+
+    def __init__(self, user_id: int) -> None:
+        self.user_id = user_id
+        self.hand = bytearray(TILE_KINDS)
+        self.melds = bytearray()
+        self.discards = bytearray()
+        self.flowers = 0
+        self.score = 0
+
+    def copy(self) -> "PlayerState":
+        player = PlayerState.__new__(PlayerState)
+        player.user_id = self.user_id
+        player.hand = self.hand[:]
+        player.melds = self.melds[:]
+        player.discards = self.discards[:]
+        player.flowers = self.flowers
+        player.score = self.score
+        return player
+
+    @property
+    def meld_count(self) -> int:
+        return len(self.melds) // 3
+
+    def counts(self) -> TileCounts:
+        return list(self.hand)
+
+    def add_meld(self, kind: MeldKind, tile: int, from_seat: int = CONCEALED) -> None:
+        self.melds += bytes((kind, tile, from_seat))
+
+
+class GameState:
+    __slots__ = (
+        "dealer",
+        "game_id",
+        "last_discard",
+        "phase",
+        "players",
+        "prevalent_wind",
+        "seq",
+        "turn",
+        "wall",
+        "wall_head",
+        "wall_tail",
+    )
+
+    def __init__(
+        self,
+        game_id: int,
+        user_ids: list[int],
+        *,
+        dealer: int = 0,
+        prevalent_wind: int = EAST,
+    ) -> None:
+        self.game_id = game_id
+        self.players = [PlayerState(user_id) for user_id in user_ids]
+        self.dealer = dealer
+        self.prevalent_wind = prevalent_wind
+        self.turn = dealer
+        self.phase = GamePhase.DRAW
+        self.last_discard = NO_TILE
+        self.seq = 0
+        self.wall = bytearray()
+        self.wall_head = 0
+        self.wall_tail = 0
+
+    @classmethod
+    def new(
+        cls,
+        game_id: int,
+        user_ids: list[int],
+        *,
+        dealer: int = 0,
+        prevalent_wind: int = EAST,
+        rng: random.Random | None = None,
+    ) -> "GameState":
+        state = cls(game_id, user_ids, dealer=dealer, prevalent_wind=prevalent_wind)
+        wall = bytearray(tile for tile in range(TILE_KINDS) for _ in range(MAX_COPIES))
+        wall += bytes((FLOWER,)) * FLOWER_COUNT
+        (rng or random).shuffle(wall)
+        state.wall = wall
+        state.wall_tail = len(wall)
+        for offset in range(len(user_ids)):
+            seat = (dealer + offset) % len(user_ids)
+            for _ in range(HAND_SIZE):
+                state.draw(seat)
+        # 배패는 이벤트로 세지 않는다. 친의 첫 쯔모부터 시작한다.
+        state.turn = dealer
+        state.phase = GamePhase.DRAW
+        state.seq = 0
+        return state
+
+    def copy(self) -> "GameState":
+        state = GameState.__new__(GameState)
+        state.game_id = self.game_id
+        state.players = [player.copy() for player in self.players]
+        state.dealer = self.dealer
+        state.prevalent_wind = self.prevalent_wind
+        state.turn = self.turn
+        state.phase = self.phase
+        state.last_discard = self.last_discard
+        state.seq = self.seq
+        state.wall = self.wall[:]
+        state.wall_head = self.wall_head
+        state.wall_tail = self.wall_tail
+        return state
+
+    @property
+    def wall_remaining(self) -> int:
+        return self.wall_tail - self.wall_head
+
+    def seat_wind(self, seat: int) -> int:
+        return EAST + (seat - self.dealer) % len(self.players)
+
+    def draw(self, seat: int, *, replacement: bool = False) -> int:
+        # 꽃패는 바로 내려놓고 패산 끝에서 보충한다. 패산이 비면 NO_TILE.
+        player = self.players[seat]
+        while self.wall_head < self.wall_tail:
+            if replacement:
+                self.wall_tail -= 1
+                tile = self.wall[self.wall_tail]
+            else:
+                tile = self.wall[self.wall_head]
+                self.wall_head += 1
+            if tile != FLOWER:
+                player.hand[tile] += 1
+                self.turn = seat
+                self.phase = GamePhase.DISCARD
+                self.seq += 1
+                return tile
+            player.flowers += 1
+            replacement = True
+        return NO_TILE
+
+    def discard(self, seat: int, tile: int) -> None:
+        if seat != self.turn or self.phase is not GamePhase.DISCARD:
+            raise MCRDomainError(DomainErrorCode.NOT_YOUR_TURN)
+        player = self.players[seat]
+        if not player.hand[tile]:
+            raise MCRDomainError(DomainErrorCode.TILE_NOT_IN_HAND)
+        player.hand[tile] -= 1
+        player.discards.append(tile)
+        self.last_discard = tile
+        self.phase = GamePhase.CLAIM
+        self.seq += 1
+
+    def claim(self, seat: int, kind: MeldKind, tile: int) -> None:
+        # 마지막 버림패로 치/퐁/밍깡. tile은 면자의 첫 타일이다.
+        # 깡이면 보충패를 뽑아야 하므로 DRAW 단계로 넘긴다.
+        discarder = self.turn
+        discard = self.last_discard
+        if self.phase is not GamePhase.CLAIM or seat == discarder:
+            raise MCRDomainError(DomainErrorCode.NOT_YOUR_TURN)
+        if kind is MeldKind.CHOW and seat != (discarder + 1) % len(self.players):
+            raise MCRDomainError(DomainErrorCode.NOT_YOUR_TURN)
+        # 이벤트 로그에서 읽은 값도 여기로 오므로 틀린 면자는 도메인 에러로 막는다.
+        # 치는 같은 수패 안에서 1~7로 시작해야 한다.
+        if not 0 <= tile < TILE_KINDS or (
+            kind is MeldKind.CHOW
+            and (tile >= HONORS[0] or tile % SUIT_SIZE > SUIT_SIZE - 3)
+        ):
+            raise MCRDomainError(DomainErrorCode.INVALID_MELD)
+
+        tiles = meld_tiles(kind, tile)
+        if discard not in tiles:
+            raise MCRDomainError(DomainErrorCode.TILE_NOT_IN_HAND)
+        tiles.remove(discard)
+        player = self.players[seat]
+        needed = bytearray(TILE_KINDS)
+        for needed_tile in tiles:
+            needed[needed_tile] += 1
+        if any(player.hand[t] < count for t, count in enumerate(needed) if count):
+            raise MCRDomainError(DomainErrorCode.TILE_NOT_IN_HAND)
+
+        for needed_tile in tiles:
+            player.hand[needed_tile] -= 1
+        player.add_meld(kind, tile, discarder)
+        self.players[discarder].discards.pop()
+        self.turn = seat
+        self.last_discard = NO_TILE
+        self.phase = GamePhase.DRAW if kind is MeldKind.KONG else GamePhase.DISCARD
+        self.seq += 1
+
+    def finish(self) -> None:
+        self.phase = GamePhase.FINISHED
+        self.seq += 1
+
+    def pass_turn(self) -> None:
+        # 아무도 버림패를 가져가지 않으면 다음 자리가 쯔모한다.
+        self.turn = (self.turn + 1) % len(self.players)
+        self.last_discard = NO_TILE
+        self.phase = GamePhase.DRAW
+        self.seq += 1
+
+
+# 스냅샷 형식 (리틀 엔디언)
+#   헤더    magic "GS", 버전, game_id, seq, phase, 장풍, 친, 차례, 마지막 버림패,
+#           인원, 패산 head/tail, 패산 길이
+#   패산    패산 길이 바이트
+#   자리마다 user_id, 점수, 꽃패 수, 부로 수, 버림패 수, 손패 34바이트,
+#           부로 3바이트씩, 버림패
+# 형식을 바꾸면 SNAPSHOT_VERSION을 올리고 이전 버전 디코더는 남겨 둔다.
+SNAPSHOT_MAGIC = b"GS"
+SNAPSHOT_VERSION = 1
+_SNAPSHOT_HEADER = struct.Struct("<2sBQIBBBBBBHHH")
+_PLAYER_HEADER = struct.Struct("<QiBBB")
+
+
+def encode_snapshot(state: GameState) -> bytes:
+    parts: list[bytes | bytearray] = [
+        _SNAPSHOT_HEADER.pack(
+            SNAPSHOT_MAGIC,
+            SNAPSHOT_VERSION,
+            state.game_id,
+            state.seq,
+            state.phase,
+            state.prevalent_wind,
+            state.dealer,
+            state.turn,
+            state.last_discard,
+            len(state.players),
+            state.wall_head,
+            state.wall_tail,
+            len(state.wall),
+        ),
+        state.wall,
+    ]
+    for player in state.players:
+        parts.append(
+            _PLAYER_HEADER.pack(
+                player.user_id,
+                player.score,
+                player.flowers,
+                player.meld_count,
+                len(player.discards),
+            ),
+        )
+        parts += (player.hand, player.melds, player.discards)
+    return b"".join(parts)
+
+
+def _decode_v1(data: memoryview) -> GameState:
+    (
+        _,
+        _,
+        game_id,
+        seq,
+        phase,
+        prevalent_wind,
+        dealer,
+        turn,
+        last_discard,
+        player_count,
+        wall_head,
+        wall_tail,
+        wall_size,
+    ) = _SNAPSHOT_HEADER.unpack_from(data)
+    offset = _SNAPSHOT_HEADER.size
+
+    state = GameState.__new__(GameState)
+    state.game_id = game_id
+    state.seq = seq
+    state.phase = GamePhase(phase)
+    state.prevalent_wind = prevalent_wind
+    state.dealer = dealer
+    state.turn = turn
+    state.last_discard = last_discard
+    state.wall_head = wall_head
+    state.wall_tail = wall_tail
+    state.wall = bytearray(data[offset : offset + wall_size])
+    offset += wall_size
+
+    state.players = []
+    for _ in range(player_count):
+        user_id, score, flowers, meld_count, discard_count = _PLAYER_HEADER.unpack_from(
+            data, offset
+        )
+        offset += _PLAYER_HEADER.size
+        player = PlayerState.__new__(PlayerState)
+        player.user_id = user_id
+        player.score = score
+        player.flowers = flowers
+        player.hand = bytearray(data[offset : offset + TILE_KINDS])
+        offset += TILE_KINDS
+        player.melds = bytearray(data[offset : offset + 3 * meld_count])
+        offset += 3 * meld_count
+        player.discards = bytearray(data[offset : offset + discard_count])
+        offset += discard_count
+        state.players.append(player)
+
+    if offset != len(data) or len(state.wall) != wall_size:
+        msg = "Malformed game snapshot"
+        raise ValueError(msg)
+    return state
+
+
+_DECODERS = {1: _decode_v1}
+
+
+def decode_snapshot(data: bytes) -> GameState:
+    view = memoryview(data)
+    if len(view) < _SNAPSHOT_HEADER.size or bytes(view[:2]) != SNAPSHOT_MAGIC:
+        msg = "Not a game snapshot"
+        raise ValueError(msg)
+    decoder = _DECODERS.get(view[2])
+    if decoder is None:
+        msg = f"Unsupported snapshot version {view[2]}"
+        raise ValueError(msg)
+    try:
+        return decoder(view)
+    except struct.error as exc:
+        msg = "Malformed game snapshot"
+        raise ValueError(msg) from exc
@@ -0,0 +1,98 @@
+from collections.abc import Iterable
+
+# 타일 번호 (34종)
+#   0-8   만수(m) 1-9
+#   9-17  통수(p) 1-9
+#   18-26 삭수(s) 1-9
+#   27-30 풍패(z) 동 남 서 북
+#   31-33 삼원패(z) 백 발 중
+# 표기법은 "123m456p789s1234567z" 형식이다.
+TILE_KINDS = 34
+SUITS = "mps"
+HONOR_SUIT = "z"
+SUIT_SIZE = 9
+HONOR_START = 27
+
+EAST, SOUTH, WEST, NORTH = 27, 28, 29, 30
+WHITE_DRAGON, GREEN_DRAGON, RED_DRAGON = 31, 32, 33
+WINDS = (EAST, SOUTH, WEST, NORTH)
+DRAGONS = (WHITE_DRAGON, GREEN_DRAGON, RED_DRAGON)
+HONORS = WINDS + DRAGONS
+TERMINALS = (0, 8, 9, 17, 18, 26)
+TERMINALS_AND_HONORS = TERMINALS + HONORS
+GREEN_TILES = frozenset((19, 20, 21, 23, 25, GREEN_DRAGON))
+REVERSIBLE_TILES = frozenset(
+    (9, 10, 11, 12, 13, 16, 17, 19, 21, 22, 23, 25, 26, WHITE_DRAGON),
+)
+
+type TileCounts = list[int]
+
+
+def suit_of(tile: int) -> int:
+    return tile // SUIT_SIZE
+
+
+def rank_of(tile: int) -> int:
+    # 수패의 숫자(1-9). 자패는 의미 없음
+    return tile % SUIT_SIZE + 1
+
+
+def is_honor(tile: int) -> bool:
+    return tile >= HONOR_START
+
+
+def is_terminal(tile: int) -> bool:
+    return tile < HONOR_START and tile % SUIT_SIZE in (0, SUIT_SIZE - 1)
+
+
+def parse_tiles(notation: str) -> list[int]:
+    tiles: list[int] = []
+    digits: list[int] = []
+    for char in notation.replace(" ", ""):
+        if char.isdigit():
+            digits.append(int(char))
+            continue
+        if char == HONOR_SUIT:
+            if any(not 1 <= digit <= len(HONORS) for digit in digits):
+                msg = f"Invalid honor tile in {notation!r}"
+                raise ValueError(msg)
+            tiles.extend(HONOR_START + digit - 1 for digit in digits)
+        elif char in SUITS:
+            if 0 in digits:
+                msg = f"Invalid suited tile in {notation!r}"
+                raise ValueError(msg)
+            base = SUITS.index(char) * SUIT_SIZE
+            tiles.extend(base + digit - 1 for digit in digits)
+        else:
+            msg = f"Unknown suit {char!r} in {notation!r}"
+            raise ValueError(msg)
+        digits = []
+    if digits:
+        msg = f"Missing suit after {digits} in {notation!r}"
+        raise ValueError(msg)
+    return tiles
+
+
+def parse_tile(notation: str) -> int:
+    tiles = parse_tiles(notation)
+    if len(tiles) != 1:
+        msg = f"Expected a single tile, got {notation!r}"
+        raise ValueError(msg)
+    return tiles[0]
+
+
+def format_tiles(tiles: Iterable[int]) -> str:
+    groups: dict[int, list[int]] = {}
+    for tile in sorted(tiles):
+        groups.setdefault(tile // SUIT_SIZE, []).append(tile % SUIT_SIZE + 1)
+    return "".join(
+        "".join(map(str, ranks)) + (SUITS + HONOR_SUIT)[suit]
+        for suit, ranks in sorted(groups.items())
+    )
+
+
+def to_counts(tiles: Iterable[int]) -> TileCounts:
+    counts = [0] * TILE_KINDS
+    for tile in tiles:
+        counts[tile] += 1
+    return counts
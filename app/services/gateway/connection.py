@@ -0,0 +1,101 @@
+import asyncio
+import time
+from collections import deque
+from contextlib import suppress
+
+from fastapi import WebSocket, status
+from starlette.websockets import WebSocketState
+
+from app.core.config import SlowConsumerPolicy
+
+
+class Connection:
+    # 연결마다 제한된 송신 큐와 writer 태스크 하나를 둔다. 발행자는 큐에 넣기만 하고
+    # 느린 소켓을 기다리지 않으므로 메시지마다 태스크를 만들 필요가 없다.
+    __slots__ = (
+        "_queue",
+        "_wakeup",
+        "_writer",
+        "close_code",
+        "closed",
+        "dropped",
+        "last_seen",
+        "max_queue",
+        "policy",
+        "topics",
+        "user_id",
+        "websocket",
+    )
+
+    def __init__(
+        self,
+        websocket: WebSocket,
+        user_id: int,
+        max_queue: int,
+        policy: SlowConsumerPolicy,
+    ) -> None:
+        self.websocket = websocket
+        self.user_id = user_id
+        self.max_queue = max_queue
+        self.policy = policy
+        self.topics: set[str] = set()
+        self.last_seen = time.monotonic()
+        self.dropped = 0
+        self.closed = False
+        self.close_code = status.WS_1000_NORMAL_CLOSURE
+        self._queue: deque[str] = deque()
+        self._wakeup = asyncio.Event()
+        self._writer: asyncio.Task[None] | None = None
+
+    @property
+    def queued(self) -> int:
+        return len(self._queue)
+
+    def start(self) -> None:
+        self._writer = asyncio.create_task(self._write_loop())
+
+    def touch(self) -> None:
+        self.last_seen = time.monotonic()
+
+    def send(self, data: str) -> bool:
+        if self.closed:
+            return False
+
+        if len(self._queue) >= self.max_queue:
+            if self.policy is SlowConsumerPolicy.DISCONNECT:
+                self.close(status.WS_1013_TRY_AGAIN_LATER)
+                return False
+            self._queue.popleft()
+            self.dropped += 1
+
+        self._queue.append(data)
+        self._wakeup.set()
+        return True
+
+    def close(self, code: int = status.WS_1000_NORMAL_CLOSURE) -> None:
+        if self.closed:
+            return
+        self.closed = True
+        self.close_code = code
+        self._queue.clear()
+        self._wakeup.set()
+
+    async def wait_closed(self) -> None:
+        if self._writer is not None:
+            await asyncio.gather(self._writer, return_exceptions=True)
+
+    async def _write_loop(self) -> None:
+        websocket = self.websocket
+        try:
+            while not self.closed:
+                await self._wakeup.wait()
+                self._wakeup.clear()
+                while self._queue and not self.closed:
+                    await websocket.send_text(self._queue.popleft())
+        except (RuntimeError, OSError):
+            self.closed = True
+            return
+
+        if websocket.application_state is WebSocketState.CONNECTED:
+            with suppress(RuntimeError, OSError):
+                await websocket.close(code=self.close_code)
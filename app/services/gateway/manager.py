@@ -0,0 +1,223 @@
+import asyncio
+import logging
+import time
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from fastapi import WebSocket, status
+
+from app.core.config import SlowConsumerPolicy, settings
+from app.core.responses import dumps
+from app.models.user import UserStatus
+from app.services.eventbus.bus import EventBus, event_bus
+from app.services.gateway.connection import Connection
+from app.services.presence.registry import presence_registry
+
+logger = logging.getLogger(__name__)
+
+type MessageHandler = Callable[[Connection, dict], Awaitable[None]]
+
+TOPIC_EVENTS = "gateway.topic"
+USER_EVENTS = "gateway.user"
+SUBSCRIPTION_EVENTS = "gateway.subscription"
+
+
+def encode_message(message: dict) -> str:
+    return dumps(message).decode()
+
+
+class ConnectionManager:
+    # 연결과 토픽 구독을 워커 메모리에 들고 있는다. 발행은 한 번만 직렬화한 뒤
+    # 구독자 큐에 동기적으로 넣으므로 테이블 하나에 보내는 비용은 O(구독자 수)이다.
+    # 버스가 있으면 발행과 사용자 구독 변경을 다른 워커에도 알려서, 그 워커에 붙은
+    # 연결도 같은 메시지를 받게 한다.
+    def __init__(
+        self,
+        max_queue: int,
+        policy: SlowConsumerPolicy,
+        heartbeat_interval: float,
+        idle_timeout: float,
+        bus: EventBus | None = None,
+    ) -> None:
+        self.max_queue = max_queue
+        self.policy = policy
+        self.heartbeat_interval = heartbeat_interval
+        self.idle_timeout = idle_timeout
+        self._connections: set[Connection] = set()
+        self._by_user: dict[int, set[Connection]] = {}
+        self._topics: dict[str, set[Connection]] = {}
+        self._handlers: dict[str, MessageHandler] = {}
+        self.published = 0
+        self.delivered = 0
+        self.bus = bus
+        if bus is not None:
+            bus.subscribe(TOPIC_EVENTS, self._on_topic_event)
+            bus.subscribe(USER_EVENTS, self._on_user_event)
+            bus.subscribe(SUBSCRIPTION_EVENTS, self._on_subscription_event)
+
+    def __len__(self) -> int:
+        return len(self._connections)
+
+    def has_user(self, user_id: int) -> bool:
+        return bool(self._by_user.get(user_id))
+
+    async def connect(self, websocket: WebSocket, user_id: int) -> Connection:
+        await websocket.accept()
+        connection = Connection(websocket, user_id, self.max_queue, self.policy)
+        self._connections.add(connection)
+        user_connections = self._by_user.setdefault(user_id, set())
+        if not user_connections and not presence_registry.is_online(user_id):
+            presence_registry.set_status(user_id, UserStatus.ONLINE)
+        user_connections.add(connection)
+        connection.start()
+        return connection
+
+    async def disconnect(self, connection: Connection) -> None:
+        connection.close()
+        self._connections.discard(connection)
+        for topic in tuple(connection.topics):
+            self.unsubscribe(connection, topic)
+
+        user_connections = self._by_user.get(connection.user_id)
+        if user_connections is not None:
+            user_connections.discard(connection)
+            if not user_connections:
+                del self._by_user[connection.user_id]
+                presence_registry.set_status(connection.user_id, UserStatus.OFFLINE)
+        await connection.wait_closed()
+
+    def user_connections(self, user_id: int) -> set[Connection]:
+        return self._by_user.get(user_id, set())
+
+    def subscribe(self, connection: Connection, topic: str) -> None:
+        self._topics.setdefault(topic, set()).add(connection)
+        connection.topics.add(topic)
+
+    def unsubscribe(self, connection: Connection, topic: str) -> None:
+        subscribers = self._topics.get(topic)
+        if subscribers is not None:
+            subscribers.discard(connection)
+            if not subscribers:
+                del self._topics[topic]
+        connection.topics.discard(topic)
+
+    def subscribe_user(self, user_id: int, topic: str) -> None:
+        self._forward(
+            SUBSCRIPTION_EVENTS,
+            {"user_id": user_id, "topic": topic, "subscribed": True},
+        )
+        self._subscribe_local_user(user_id, topic)
+
+    def unsubscribe_user(self, user_id: int, topic: str) -> None:
+        self._forward(
+            SUBSCRIPTION_EVENTS,
+            {"user_id": user_id, "topic": topic, "subscribed": False},
+        )
+        self._unsubscribe_local_user(user_id, topic)
+
+    def _subscribe_local_user(self, user_id: int, topic: str) -> None:
+        for connection in self.user_connections(user_id):
+            self.subscribe(connection, topic)
+
+    def _unsubscribe_local_user(self, user_id: int, topic: str) -> None:
+        for connection in tuple(self.user_connections(user_id)):
+            self.unsubscribe(connection, topic)
+
+    def subscribers(self, topic: str) -> int:
+        return len(self._topics.get(topic, ()))
+
+    def _fan_out(self, connections: set[Connection] | None, message: dict) -> int:
+        if not connections:
+            return 0
+        data = encode_message(message)
+        sent = 0
+        for connection in tuple(connections):
+            sent += connection.send(data)
+        self.published += 1
+        self.delivered += sent
+        return sent
+
+    def publish(self, topic: str, message: dict) -> int:
+        self._forward(TOPIC_EVENTS, {"topic": topic, "message": message})
+        return self._fan_out(self._topics.get(topic), message)
+
+    def send_to_user(self, user_id: int, message: dict) -> int:
+        self._forward(USER_EVENTS, {"user_id": user_id, "message": message})
+        return self._fan_out(self._by_user.get(user_id), message)
+
+    def _forward(self, channel: str, payload: dict[str, Any]) -> None:
+        if self.bus is not None:
+            self.bus.publish(channel, payload)
+
+    def _on_topic_event(self, event: dict[str, Any]) -> None:
+        self._fan_out(self._topics.get(event["topic"]), event["message"])
+
+    def _on_user_event(self, event: dict[str, Any]) -> None:
+        self._fan_out(self._by_user.get(event["user_id"]), event["message"])
+
+    def _on_subscription_event(self, event: dict[str, Any]) -> None:
+        if event["subscribed"]:
+            self._subscribe_local_user(event["user_id"], event["topic"])
+        else:
+            self._unsubscribe_local_user(event["user_id"], event["topic"])
+
+    def register_handler(self, message_type: str, handler: MessageHandler) -> None:
+        self._handlers[message_type] = handler
+
+    async def dispatch(self, connection: Connection, message: dict) -> None:
+        message_type = message.get("type")
+        if message_type == "ping":
+            connection.send(encode_message({"type": "pong"}))
+            return
+        if message_type == "pong":
+            return
+
+        handler = self._handlers.get(message_type) if message_type else None
+        if handler is None:
+            connection.send(
+                encode_message({"type": "error", "detail": "Unknown message type"}),
+            )
+            return
+        await handler(connection, message)
+
+    def sweep(self, now: float | None = None) -> int:
+        # 하트비트는 워커당 태스크 하나가 모든 연결을 훑으며 처리한다.
+        now = time.monotonic() if now is None else now
+        ping = encode_message({"type": "ping"})
+        closed = 0
+        for connection in tuple(self._connections):
+            idle = now - connection.last_seen
+            if idle >= self.idle_timeout:
+                connection.close(status.WS_1001_GOING_AWAY)
+                closed += 1
+            elif idle >= self.heartbeat_interval:
+                connection.send(ping)
+        return closed
+
+    async def run_heartbeat_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.heartbeat_interval)
+            closed = self.sweep()
+            if closed:
+                logger.info("Closed %d idle websocket connections", closed)
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "connections": len(self._connections),
+            "users": len(self._by_user),
+            "topics": len(self._topics),
+            "queued": sum(connection.queued for connection in self._connections),
+            "dropped": sum(connection.dropped for connection in self._connections),
+            "published": self.published,
+            "delivered": self.delivered,
+        }
+
+
+connection_manager = ConnectionManager(
+    max_queue=settings.WS_SEND_QUEUE_SIZE,
+    policy=settings.WS_SLOW_CONSUMER_POLICY,
+    heartbeat_interval=settings.WS_HEARTBEAT_INTERVAL_SECONDS,
+    idle_timeout=settings.WS_IDLE_TIMEOUT_SECONDS,
+    bus=event_bus,
+)
+presence_registry.has_local_connections = connection_manager.has_user
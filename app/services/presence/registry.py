@@ -0,0 +1,153 @@
+import asyncio
+import logging
+from collections.abc import Callable, Set
+from typing import Any
+
+from sqlalchemy import update
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlmodel import col
+
+from app.db.session import async_session
+from app.models.user import User, UserStatus
+from app.services.eventbus.bus import EventBus, event_bus
+
+logger = logging.getLogger(__name__)
+
+FLUSH_CHUNK_SIZE = 10_000
+PRESENCE_EVENTS = "presence"
+
+
+class PresenceRegistry:
+    # 접속 상태의 기준은 메모리이고 user.status는 주기적으로 일괄 반영되는 사본이다.
+    # 플러시 사이의 여러 전이는 사용자별 마지막 상태 하나로 합쳐진다.
+    # 다른 워커의 전이는 이벤트 버스로 받아 메모리에만 반영하고, DB는 전이가
+    # 일어난 워커가 쓴다.
+    def __init__(self, bus: EventBus | None = None) -> None:
+        self._status: dict[int, UserStatus] = {}
+        self._by_status: dict[UserStatus, set[int]] = {
+            status: set() for status in UserStatus if status is not UserStatus.OFFLINE
+        }
+        self._dirty: dict[int, UserStatus] = {}
+        self.transitions = 0
+        self.flushed_rows = 0
+        self.flush_statements = 0
+        self.bus = bus
+        # 이 워커에 사용자의 연결이 남아 있는지 알려 주는 함수. 게이트웨이가 채운다.
+        self.has_local_connections: Callable[[int], bool] | None = None
+        if bus is not None:
+            bus.subscribe(PRESENCE_EVENTS, self._on_presence_event)
+
+    def get_status(self, user_id: int) -> UserStatus:
+        return self._status.get(user_id, UserStatus.OFFLINE)
+
+    def is_online(self, user_id: int) -> bool:
+        return user_id in self._status
+
+    def set_status(self, user_id: int, status: UserStatus) -> UserStatus:
+        previous = self._apply(user_id, status)
+        if previous is not status:
+            self._dirty[user_id] = status
+            self.transitions += 1
+            self._publish(user_id, status)
+        return previous
+
+    def _publish(self, user_id: int, status: UserStatus) -> None:
+        if self.bus is not None:
+            self.bus.publish(
+                PRESENCE_EVENTS, {"user_id": user_id, "status": status.value}
+            )
+
+    def _apply(self, user_id: int, status: UserStatus) -> UserStatus:
+        previous = self._status.get(user_id, UserStatus.OFFLINE)
+        if previous is status:
+            return previous
+
+        if previous is not UserStatus.OFFLINE:
+            self._by_status[previous].discard(user_id)
+        if status is UserStatus.OFFLINE:
+            del self._status[user_id]
+        else:
+            self._status[user_id] = status
+            self._by_status[status].add(user_id)
+        return previous
+
+    def _on_presence_event(self, event: dict[str, Any]) -> None:
+        user_id = event["user_id"]
+        status = UserStatus(event["status"])
+        # 같은 사용자가 여러 워커에 붙어 있을 수 있다. 다른 워커의 연결만 끊긴
+        # 것이면 여기 상태(IN_ROOM 등)를 그대로 두고 다른 워커와 DB에 다시 알린다.
+        if (
+            status is UserStatus.OFFLINE
+            and self.is_online(user_id)
+            and self.has_local_connections is not None
+            and self.has_local_connections(user_id)
+        ):
+            current = self.get_status(user_id)
+            self._dirty[user_id] = current
+            self._publish(user_id, current)
+            return
+        # 더 새로운 상태는 보낸 워커가 쓰므로 여기 남은 이전 변경은 버린다.
+        self._dirty.pop(user_id, None)
+        self._apply(user_id, status)
+
+    def users_with_status(self, status: UserStatus) -> Set[int]:
+        return self._by_status[status]
+
+    def online_count(self) -> int:
+        return len(self._status)
+
+    def counts(self) -> dict[UserStatus, int]:
+        return {status: len(users) for status, users in self._by_status.items()}
+
+    @property
+    def pending(self) -> int:
+        return len(self._dirty)
+
+    async def flush(self, session: AsyncSession) -> int:
+        if not self._dirty:
+            return 0
+
+        dirty, self._dirty = self._dirty, {}
+        by_status: dict[UserStatus, list[int]] = {}
+        for user_id, status in dirty.items():
+            by_status.setdefault(status, []).append(user_id)
+
+        statements = 0
+        try:
+            for status, user_ids in by_status.items():
+                for start in range(0, len(user_ids), FLUSH_CHUNK_SIZE):
+                    await session.execute(
+                        update(User)
+                        .where(
+                            col(User.id).in_(
+                                user_ids[start : start + FLUSH_CHUNK_SIZE]
+                            ),
+                        )
+                        .values(status=status.value),
+                    )
+                    statements += 1
+            await session.commit()
+        except BaseException:
+            # 실패한 변경은 그 사이에 들어온 더 새로운 상태를 덮지 않도록 되돌려 둔다.
+            self._dirty = dirty | self._dirty
+            raise
+
+        self.flush_statements += statements
+        self.flushed_rows += len(dirty)
+        return len(dirty)
+
+    async def run_flush_loop(self, interval: float) -> None:
+        while True:
+            await asyncio.sleep(interval)
+            await self.flush_safely()
+
+    async def flush_safely(self) -> None:
+        try:
+            async with async_session() as session:
+                await self.flush(session)
+        except (SQLAlchemyError, OSError):
+            logger.warning("Failed to flush presence changes", exc_info=True)
+
+
+presence_registry = PresenceRegistry(event_bus)
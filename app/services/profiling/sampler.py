@@ -0,0 +1,66 @@
+import sys
+import threading
+import time
+from collections import Counter
+from types import FrameType
+
+MAX_STACK_DEPTH = 128
+
+
+def format_stack(frame: FrameType | None) -> list[str]:
+    # 바깥 호출부터 안쪽 순서로 "모듈:함수:줄" 목록을 만든다.
+    names: list[str] = []
+    while frame is not None and len(names) < MAX_STACK_DEPTH:
+        code = frame.f_code
+        names.append(
+            f"{frame.f_globals.get('__name__', '?')}:{code.co_name}:{frame.f_lineno}"
+        )
+        frame = frame.f_back
+    names.reverse()
+    return names
+
+
+def thread_stack(thread_id: int) -> list[str]:
+    return format_stack(sys._current_frames().get(thread_id))
+
+
+class StackSampler:
+    # 별도 스레드가 interval마다 대상 스레드의 스택을 읽어 접힌(folded) 형식으로 센다.
+    # 대상 코드에는 훅을 걸지 않으므로 비용은 샘플 간격에만 비례한다.
+    # 비동기 요청은 이벤트 루프 스레드를 나눠 쓰므로 그동안 루프에서 돈 일이 모두
+    # 잡힌다.
+    def __init__(self, thread_id: int, interval: float) -> None:
+        self.thread_id = thread_id
+        self.interval = interval
+        self.samples: Counter[str] = Counter()
+        self.started = 0.0
+        self.duration = 0.0
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        self.started = time.perf_counter()
+        self._thread = threading.Thread(
+            target=self._run,
+            name="stack-sampler",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+        self.duration = time.perf_counter() - self.started
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            stack = thread_stack(self.thread_id)
+            if stack:
+                self.samples[";".join(stack)] += 1
+
+    def folded(self) -> str:
+        # flamegraph.pl, speedscope 등이 바로 읽는 "스택 개수" 줄 형식.
+        return "".join(
+            f"{stack} {count}\n" for stack, count in self.samples.most_common()
+        )
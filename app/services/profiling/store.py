@@ -0,0 +1,70 @@
+import os
+import re
+import time
+from pathlib import Path
+from typing import NamedTuple
+
+from app.core.config import settings
+from app.core.error import DomainErrorCode, MCRDomainError
+
+PROFILE_SUFFIX = ".folded"
+PROFILE_ID_PATTERN = re.compile(r"^\d{13}-[0-9a-f]{8}$")
+
+
+class ProfileInfo(NamedTuple):
+    profile_id: str
+    size: int
+    created_at: float
+
+
+class ProfileStore:
+    # 디렉터리 하나를 고정 크기 링 버퍼처럼 쓴다. 이름이 "밀리초-난수"라서 이름순이
+    # 곧 시간순이고, 저장할 때마다 max_files를 넘는 오래된 파일부터 지운다.
+    def __init__(self, directory: str, max_files: int) -> None:
+        self.directory = Path(directory)
+        self.max_files = max_files
+
+    @staticmethod
+    def new_id() -> str:
+        return f"{time.time_ns() // 1_000_000:013d}-{os.urandom(4).hex()}"
+
+    def save(self, profile_id: str, data: str) -> Path:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self._path(profile_id)
+        # 읽는 쪽이 쓰다 만 파일을 보지 않도록 임시 파일에 쓴 뒤 바꿔 넣는다.
+        temporary = path.with_suffix(".tmp")
+        temporary.write_text(data)
+        temporary.replace(path)
+        self._trim()
+        return path
+
+    def entries(self) -> list[ProfileInfo]:
+        profiles: list[ProfileInfo] = []
+        for path in self._files():
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            profiles.append(ProfileInfo(path.stem, stat.st_size, stat.st_mtime))
+        return profiles
+
+    def path(self, profile_id: str) -> Path:
+        path = self._path(profile_id)
+        if not PROFILE_ID_PATTERN.match(profile_id) or not path.is_file():
+            raise MCRDomainError(DomainErrorCode.PROFILE_NOT_FOUND)
+        return path
+
+    def _path(self, profile_id: str) -> Path:
+        return self.directory / f"{profile_id}{PROFILE_SUFFIX}"
+
+    def _files(self) -> list[Path]:
+        if not self.directory.is_dir():
+            return []
+        return sorted(self.directory.glob(f"*{PROFILE_SUFFIX}"), reverse=True)
+
+    def _trim(self) -> None:
+        for path in self._files()[self.max_files :]:
+            path.unlink(missing_ok=True)
+
+
+profile_store = ProfileStore(settings.PROFILING_DIR, settings.PROFILING_MAX_FILES)
@@ -0,0 +1,80 @@
+import asyncio
+import logging
+import threading
+import time
+from collections import deque
+from typing import NamedTuple
+
+from app.core.config import settings
+from app.core.metrics import event_loop_lag, event_loop_stalls
+from app.services.profiling.sampler import thread_stack
+
+logger = logging.getLogger(__name__)
+
+
+class LoopStall(NamedTuple):
+    started_at: float
+    duration: float
+    stack: list[str]
+
+
+class LoopLagMonitor:
+    # 루프 안의 작업이 interval마다 심장박동을 남기고, 감시 스레드는 박동이
+    # threshold보다 오래 끊기면 그 순간 루프 스레드의 스택을 찍어 둔다.
+    # 루프가 돌아오면 늦어진 시간과 찍어 둔 스택을 묶어 한 건의 정체로 남긴다.
+    def __init__(self, threshold: float, max_stalls: int) -> None:
+        self.threshold = threshold
+        self.stalls: deque[LoopStall] = deque(maxlen=max_stalls)
+        self._heartbeat = time.monotonic()
+        self._stack: list[str] | None = None
+        self._lock = threading.Lock()
+
+    def _watch(self, thread_id: int, interval: float, stop: threading.Event) -> None:
+        # 박동 간격 자체(interval)는 지연이 아니므로 빼고 본다.
+        while not stop.wait(interval / 2):
+            with self._lock:
+                lag = time.monotonic() - self._heartbeat - interval
+                if lag > self.threshold and self._stack is None:
+                    self._stack = thread_stack(thread_id)
+
+    def _beat(self, interval: float) -> None:
+        now = time.monotonic()
+        lag = max(now - self._heartbeat - interval, 0.0)
+        with self._lock:
+            stack, self._stack = self._stack, None
+            self._heartbeat = now
+        event_loop_lag.observe(lag)
+        if lag <= self.threshold:
+            return
+        stall = LoopStall(time.time() - lag, lag, stack or [])
+        self.stalls.append(stall)
+        event_loop_stalls.inc()
+        logger.warning(
+            "Event loop stalled for %.3fs\n%s",
+            lag,
+            "\n".join(stall.stack),
+        )
+
+    async def run(self, interval: float) -> None:
+        stop = threading.Event()
+        watcher = threading.Thread(
+            target=self._watch,
+            args=(threading.get_ident(), interval, stop),
+            name="loop-lag-watchdog",
+            daemon=True,
+        )
+        self._heartbeat = time.monotonic()
+        watcher.start()
+        try:
+            while True:
+                await asyncio.sleep(interval)
+                self._beat(interval)
+        finally:
+            stop.set()
+            watcher.join()
+
+
+loop_lag_monitor = LoopLagMonitor(
+    settings.LOOP_LAG_THRESHOLD_SECONDS,
+    settings.LOOP_LAG_MAX_STALLS,
+)
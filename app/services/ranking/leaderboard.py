@@ -0,0 +1,140 @@
+import logging
+import math
+from bisect import bisect_left, insort
+from typing import NamedTuple
+
+from sqlalchemy import select
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlmodel import col
+
+from app.core.config import settings
+from app.core.error import DomainErrorCode, MCRDomainError
+from app.db.session import async_read_session
+from app.models.user import User
+from app.util.fenwick import FenwickTree
+
+logger = logging.getLogger(__name__)
+
+REBUILD_CHUNK_SIZE = 10_000
+
+
+class LeaderboardEntry(NamedTuple):
+    rank: int
+    user_id: int
+    rating: float
+
+
+class Leaderboard:
+    # 레이팅을 resolution 단위 버킷으로 나누고 버킷별 인원을 펜윅 트리에 둔다.
+    # 높은 레이팅이 앞 인덱스에 오도록 뒤집어 두어 앞부분 합이 곧 "나보다 위"
+    # 인원이고, k번째 찾기로 순위 k의 버킷을 O(log n)에 찾는다.
+    # 같은 버킷 안에서는 user_id 오름차순으로 정렬한 목록을 둔다.
+    # 범위 밖 레이팅은 양 끝 버킷에 모인다.
+    def __init__(self, min_rating: float, max_rating: float, resolution: float) -> None:
+        self.min_rating = min_rating
+        self.resolution = resolution
+        self._bucket_count = math.floor((max_rating - min_rating) / resolution) + 1
+        self._counts = FenwickTree(self._bucket_count)
+        self._buckets: dict[int, list[int]] = {}
+        self._ratings: dict[int, float] = {}
+
+    def __len__(self) -> int:
+        return len(self._ratings)
+
+    def __contains__(self, user_id: int) -> bool:
+        return user_id in self._ratings
+
+    def _index_of(self, rating: float) -> int:
+        bucket = math.floor((rating - self.min_rating) / self.resolution)
+        return self._bucket_count - 1 - min(max(bucket, 0), self._bucket_count - 1)
+
+    def load(self, ratings: dict[int, float]) -> None:
+        # 기동 시 전체를 한 번에 채운다. 펜윅 트리는 O(n)으로 만든다.
+        buckets: dict[int, list[int]] = {}
+        for user_id, rating in ratings.items():
+            buckets.setdefault(self._index_of(rating), []).append(user_id)
+        counts = [0] * self._bucket_count
+        for index, user_ids in buckets.items():
+            user_ids.sort()
+            counts[index] = len(user_ids)
+        self._counts = FenwickTree.from_counts(counts)
+        self._buckets = buckets
+        self._ratings = dict(ratings)
+
+    def update(self, user_id: int, rating: float) -> None:
+        previous = self._ratings.get(user_id)
+        if previous is not None:
+            if self._index_of(previous) == self._index_of(rating):
+                self._ratings[user_id] = rating
+                return
+            self.remove(user_id)
+        index = self._index_of(rating)
+        insort(self._buckets.setdefault(index, []), user_id)
+        self._counts.add(index, 1)
+        self._ratings[user_id] = rating
+
+    def remove(self, user_id: int) -> None:
+        rating = self._ratings.pop(user_id, None)
+        if rating is None:
+            return
+        index = self._index_of(rating)
+        bucket = self._buckets[index]
+        del bucket[bisect_left(bucket, user_id)]
+        if not bucket:
+            del self._buckets[index]
+        self._counts.add(index, -1)
+
+    def rank(self, user_id: int) -> int:
+        rating = self._ratings.get(user_id)
+        if rating is None:
+            raise MCRDomainError(DomainErrorCode.NOT_RANKED)
+        index = self._index_of(rating)
+        position = bisect_left(self._buckets[index], user_id)
+        return self._counts.prefix_sum(index) + position + 1
+
+    def top(self, limit: int, offset: int = 0) -> list[LeaderboardEntry]:
+        return self._slice(offset + 1, limit)
+
+    def around(self, user_id: int, radius: int) -> list[LeaderboardEntry]:
+        rank = self.rank(user_id)
+        first = max(rank - radius, 1)
+        return self._slice(first, rank + radius - first + 1)
+
+    def _slice(self, first: int, limit: int) -> list[LeaderboardEntry]:
+        # first 순위부터 limit명. 버킷을 하나 건널 때마다 k번째 찾기 한 번이다.
+        entries: list[LeaderboardEntry] = []
+        rank = first
+        last = min(first + limit - 1, len(self))
+        while rank <= last:
+            index, start = self._counts.locate(rank)
+            bucket = self._buckets[index]
+            for user_id in bucket[start : start + last - rank + 1]:
+                entries.append(LeaderboardEntry(rank, user_id, self._ratings[user_id]))
+                rank += 1
+        return entries
+
+    async def rebuild(self, session: AsyncSession) -> None:
+        ratings: dict[int, float] = {}
+        result = await session.stream(
+            select(col(User.id), col(User.rating))
+            .where(col(User.is_active))
+            .execution_options(yield_per=REBUILD_CHUNK_SIZE),
+        )
+        async for rows in result.partitions():
+            ratings.update((user_id, rating) for user_id, rating in rows)
+        self.load(ratings)
+
+    async def rebuild_safely(self) -> None:
+        try:
+            async with async_read_session() as session:
+                await self.rebuild(session)
+        except (SQLAlchemyError, OSError):
+            logger.warning("Failed to rebuild leaderboard", exc_info=True)
+
+
+leaderboard = Leaderboard(
+    settings.LEADERBOARD_MIN_RATING,
+    settings.LEADERBOARD_MAX_RATING,
+    settings.LEADERBOARD_RESOLUTION,
+)
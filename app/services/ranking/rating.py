@@ -0,0 +1,206 @@
+from collections.abc import Sequence
+
+import numpy as np
+import numpy.typing as npt
+from sqlalchemy import select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlmodel import col
+
+from app.core.config import settings
+from app.models.game_event import GamePlayer
+from app.models.user import DEFAULT_RATING, User
+from app.services.game.room import MAX_PLAYERS
+from app.services.ranking.leaderboard import leaderboard
+
+# 4인 Elo. 한 판을 여섯 번의 1:1 대국으로 보고, 순위가 높으면 1, 같으면 0.5를 얻는다.
+#   E_ij = 1 / (1 + 10^((R_j - R_i) / scale))
+#   S_ij = [p_i < p_j] + 0.5 * [p_i == p_j]
+#   dR_i = K / (N - 1) * sum_j (S_ij - E_ij)
+# i == j 항은 S = E = 0.5라서 따로 빼지 않아도 0이 된다.
+# 시즌 재계산과 판마다의 갱신이 모두 rating_deltas 하나를 쓰므로 결과가 갈라지지 않는다.
+
+type FloatArray = npt.NDArray[np.float64]
+type IntArray = npt.NDArray[np.int64]
+
+RATING_UPDATE_SQL = text("""
+UPDATE "user" SET rating = v.rating
+FROM unnest(CAST(:ids AS integer[]), CAST(:ratings AS float8[])) AS v(id, rating)
+WHERE "user".id = v.id
+""")
+
+
+def placements_from_scores(scores: npt.ArrayLike) -> IntArray:
+    # 점수가 같으면 같은 (높은) 순위를 준다. 1위가 1.
+    values = np.asarray(scores)
+    higher = values[..., None, :] > values[..., :, None]
+    return np.asarray(higher.sum(axis=-1) + 1, dtype=np.int64)
+
+
+def rating_deltas(
+    ratings: FloatArray,
+    placements: IntArray,
+    k_factor: float,
+    scale: float,
+) -> FloatArray:
+    # ratings, placements: (판 수, 인원)
+    gap = ratings[:, None, :] - ratings[:, :, None]
+    expected = 1.0 / (1.0 + np.power(10.0, gap / scale))
+    actual = (placements[:, :, None] < placements[:, None, :]) + 0.5 * (
+        placements[:, :, None] == placements[:, None, :]
+    )
+    players = ratings.shape[1]
+    return np.asarray(k_factor / (players - 1) * (actual - expected).sum(axis=2))
+
+
+def assign_waves(players: IntArray, player_count: int) -> IntArray:
+    # 같은 사람이 두 번 나오지 않는 판끼리 한 묶음(wave)으로 모은다. 각 판은 참가자의
+    # 직전 판보다 뒤 wave에 들어가므로 wave 순서로 계산해도 시간순 계산과 같다.
+    last_wave = [-1] * player_count
+    waves = np.empty(len(players), dtype=np.int64)
+    for game, seats in enumerate(players.tolist()):
+        wave = max(last_wave[player] for player in seats) + 1
+        for player in seats:
+            last_wave[player] = wave
+        waves[game] = wave
+    return waves
+
+
+class RatingEngine:
+    # 시즌 전체를 시간순 청크로 받아 wave 단위로 한 번에 계산한다.
+    # 처음 보는 사용자는 initial_rating에서 시작한다.
+    def __init__(
+        self,
+        k_factor: float,
+        scale: float,
+        initial_rating: float = DEFAULT_RATING,
+    ) -> None:
+        self.k_factor = k_factor
+        self.scale = scale
+        self.initial_rating = initial_rating
+        self._index: dict[int, int] = {}
+        self._ratings = np.empty(0, dtype=np.float64)
+        self.games = 0
+
+    def ratings(self) -> dict[int, float]:
+        values = self._ratings.tolist()
+        return {user_id: values[index] for user_id, index in self._index.items()}
+
+    def _indices(self, user_ids: IntArray) -> IntArray:
+        unique, inverse = np.unique(user_ids, return_inverse=True)
+        for user_id in unique.tolist():
+            self._index.setdefault(user_id, len(self._index))
+        if len(self._index) > len(self._ratings):
+            grown = np.full(len(self._index), self.initial_rating)
+            grown[: len(self._ratings)] = self._ratings
+            self._ratings = grown
+        lookup = np.fromiter(
+            (self._index[user_id] for user_id in unique.tolist()),
+            dtype=np.int64,
+            count=len(unique),
+        )
+        return lookup[inverse].reshape(user_ids.shape)
+
+    def process(self, user_ids: npt.ArrayLike, placements: npt.ArrayLike) -> None:
+        # user_ids, placements: (판 수, 인원), 시간순
+        players = self._indices(np.asarray(user_ids, dtype=np.int64))
+        places = np.asarray(placements, dtype=np.int64)
+        waves = assign_waves(players, len(self._index))
+        order = np.argsort(waves, kind="stable")
+        bounds = np.flatnonzero(np.diff(waves[order])) + 1
+        for games in np.split(order, bounds):
+            seats = players[games]
+            self._ratings[seats] += rating_deltas(
+                self._ratings[seats],
+                places[games],
+                self.k_factor,
+                self.scale,
+            )
+        self.games += len(players)
+
+
+async def recompute_season(session: AsyncSession, chunk_games: int) -> RatingEngine:
+    # 끝난 판의 결과를 game_id 순으로 읽어 처음부터 다시 계산하고 한 번에 써 넣는다.
+    engine = RatingEngine(settings.RATING_K_FACTOR, settings.RATING_SCALE)
+    result = await session.stream(
+        select(
+            col(GamePlayer.game_id),
+            col(GamePlayer.user_id),
+            col(GamePlayer.placement),
+        )
+        .where(col(GamePlayer.placement).is_not(None))
+        .order_by(col(GamePlayer.game_id), col(GamePlayer.seat))
+        .execution_options(yield_per=chunk_games * MAX_PLAYERS),
+    )
+    pending: list[tuple[int, int, int]] = []
+    async for rows in result.partitions():
+        pending += ((game_id, user_id, place) for game_id, user_id, place in rows)
+        # 청크 경계에서 한 판이 잘리지 않도록 마지막 판은 다음 청크로 넘긴다.
+        cut = _last_game_start(pending)
+        _process_rows(engine, pending[:cut])
+        pending = pending[cut:]
+    _process_rows(engine, pending)
+
+    await save_ratings(session, engine.ratings())
+    return engine
+
+
+def _last_game_start(rows: list[tuple[int, int, int]]) -> int:
+    last = rows[-1][0]
+    cut = len(rows)
+    while cut and rows[cut - 1][0] == last:
+        cut -= 1
+    return cut
+
+
+def _process_rows(engine: RatingEngine, rows: list[tuple[int, int, int]]) -> None:
+    if not rows:
+        return
+    table = np.asarray(rows, dtype=np.int64)
+    _, sizes = np.unique(table[:, 0], return_counts=True)
+    if np.any(sizes != MAX_PLAYERS):
+        msg = f"Every finished game must have {MAX_PLAYERS} result rows"
+        raise ValueError(msg)
+    games = table.reshape(-1, MAX_PLAYERS, 3)
+    engine.process(games[:, :, 1], games[:, :, 2])
+
+
+async def save_ratings(session: AsyncSession, ratings: dict[int, float]) -> None:
+    # 사용자마다 UPDATE를 보내지 않고 배열 두 개를 unnest해 한 문장으로 쓴다.
+    chunk = settings.RATING_UPDATE_CHUNK_SIZE
+    items = list(ratings.items())
+    for start in range(0, len(items), chunk):
+        part = items[start : start + chunk]
+        await session.execute(
+            RATING_UPDATE_SQL,
+            {
+                "ids": [user_id for user_id, _ in part],
+                "ratings": [rating for _, rating in part],
+            },
+        )
+    await session.commit()
+    for user_id, rating in items:
+        leaderboard.update(user_id, rating)
+
+
+async def apply_game_result(
+    session: AsyncSession,
+    user_ids: Sequence[int],
+    scores: Sequence[int],
+) -> dict[int, float]:
+    # 판이 끝날 때 한 번 호출한다. 네 명의 행을 잠그고 같은 식으로 갱신한다.
+    rows = await session.execute(
+        select(col(User.id), col(User.rating))
+        .where(col(User.id).in_(user_ids))
+        .with_for_update(),
+    )
+    current = dict(rows.tuples().all())
+    ratings = np.array([[current[user_id] for user_id in user_ids]])
+    deltas = rating_deltas(
+        ratings,
+        placements_from_scores([scores]),
+        settings.RATING_K_FACTOR,
+        settings.RATING_SCALE,
+    )
+    updated = dict(zip(user_ids, (ratings + deltas)[0].tolist(), strict=True))
+    await save_ratings(session, updated)
+    return updated
@@ -0,0 +1,83 @@
+import asyncio
+from typing import NamedTuple
+
+PERIOD_SECONDS = {"second": 1.0, "minute": 60.0, "hour": 3600.0}
+
+
+class RateLimit(NamedTuple):
+    capacity: float
+    refill: float
+
+    @property
+    def full_after(self) -> float:
+        # 빈 버킷이 가득 차는 데 걸리는 시간. 이보다 오래 안 쓴 버킷은 새 버킷과 같다.
+        return self.capacity / self.refill
+
+
+def parse_rate(spec: str) -> RateLimit:
+    count, _, period = spec.partition("/")
+    if period not in PERIOD_SECONDS or not count.isdigit() or int(count) < 1:
+        msg = f"Invalid rate limit {spec!r}, expected '<count>/<second|minute|hour>'"
+        raise ValueError(msg)
+    return RateLimit(float(count), int(count) / PERIOD_SECONDS[period])
+
+
+class Bucket:
+    __slots__ = ("tokens", "updated_at")
+
+    def __init__(self, tokens: float, updated_at: float) -> None:
+        self.tokens = tokens
+        self.updated_at = updated_at
+
+
+class TokenBuckets:
+    # 키마다 남은 토큰과 마지막 갱신 시각만 두고, 채우기는 꺼낼 때 계산한다.
+    # 샤드로 나누는 것은 오래 안 쓴 키를 치울 때 샤드 하나씩 훑고 루프를 양보하기
+    # 위해서다. 키가 수십만 개여도 한 번에 루프를 붙잡는 시간은 샤드 하나 분량이다.
+    def __init__(self, shards: int) -> None:
+        self._shards: list[dict[str, Bucket]] = [{} for _ in range(shards)]
+
+    def __len__(self) -> int:
+        return sum(len(shard) for shard in self._shards)
+
+    def take(self, key: str, limit: RateLimit, now: float) -> float:
+        # 허용하면 0, 아니면 토큰 하나가 찰 때까지 남은 초를 돌려준다.
+        shard = self._shards[hash(key) % len(self._shards)]
+        bucket = shard.get(key)
+        if bucket is None:
+            shard[key] = Bucket(limit.capacity - 1, now)
+            return 0.0
+
+        tokens = min(
+            limit.capacity,
+            bucket.tokens + (now - bucket.updated_at) * limit.refill,
+        )
+        bucket.updated_at = now
+        if tokens >= 1:
+            bucket.tokens = tokens - 1
+            return 0.0
+        bucket.tokens = tokens
+        return (1 - tokens) / limit.refill
+
+    def refund(self, key: str, limit: RateLimit) -> None:
+        bucket = self._shards[hash(key) % len(self._shards)].get(key)
+        if bucket is not None:
+            bucket.tokens = min(limit.capacity, bucket.tokens + 1)
+
+    def evict_shard(self, index: int, before: float) -> int:
+        shard = self._shards[index]
+        idle = [key for key, bucket in shard.items() if bucket.updated_at < before]
+        for key in idle:
+            del shard[key]
+        return len(idle)
+
+    async def evict(self, before: float) -> int:
+        evicted = 0
+        for index in range(len(self._shards)):
+            evicted += self.evict_shard(index, before)
+            await asyncio.sleep(0)
+        return evicted
+
+    def clear(self) -> None:
+        for shard in self._shards:
+            shard.clear()
@@ -0,0 +1,193 @@
+import asyncio
+import logging
+import time
+from datetime import UTC, datetime, timedelta
+
+from sqlalchemy import case, delete, func, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlmodel import col
+
+from app.core.config import RateLimitBackend, settings
+from app.core.metrics import rate_limit_rejections
+from app.db.session import async_session
+from app.models.rate_limit import RateLimitBucket
+from app.services.ratelimit.buckets import RateLimit, TokenBuckets, parse_rate
+
+logger = logging.getLogger(__name__)
+
+IP_SCOPE = "ip"
+USER_SCOPE = "user"
+
+
+class PostgresBuckets:
+    # 워커끼리 같은 버킷을 쓰도록 upsert 한 번으로 채우기와 차감을 함께 한다.
+    # 행 잠금이 키마다 직렬화해 주므로 별도의 잠금은 필요 없다. SET 식은 모두
+    # 갱신 전 값을 보므로 allowed와 tokens가 같은 채우기 결과로 계산된다.
+    async def take(self, session: AsyncSession, key: str, limit: RateLimit) -> float:
+        elapsed = func.extract("epoch", func.now() - col(RateLimitBucket.updated_at))
+        refilled = func.least(
+            limit.capacity,
+            col(RateLimitBucket.tokens) + elapsed * limit.refill,
+        )
+        result = await session.execute(
+            insert(RateLimitBucket)
+            .values(
+                key=key,
+                tokens=limit.capacity - 1,
+                allowed=True,
+                updated_at=func.now(),
+            )
+            .on_conflict_do_update(
+                index_elements=["key"],
+                set_={
+                    "tokens": case((refilled >= 1, refilled - 1), else_=refilled),
+                    "allowed": refilled >= 1,
+                    "updated_at": func.now(),
+                },
+            )
+            .returning(col(RateLimitBucket.tokens), col(RateLimitBucket.allowed)),
+        )
+        tokens, allowed = result.one()
+        await session.commit()
+        return 0.0 if allowed else (1 - tokens) / limit.refill
+
+    async def refund(self, session: AsyncSession, key: str, limit: RateLimit) -> None:
+        await session.execute(
+            update(RateLimitBucket)
+            .where(col(RateLimitBucket.key) == key)
+            .values(tokens=func.least(limit.capacity, col(RateLimitBucket.tokens) + 1)),
+        )
+        await session.commit()
+
+    async def evict(self, session: AsyncSession, idle_seconds: float) -> int:
+        result = await session.execute(
+            delete(RateLimitBucket).where(
+                col(RateLimitBucket.updated_at)
+                < datetime.now(UTC) - timedelta(seconds=idle_seconds),
+            ),
+        )
+        await session.commit()
+        return int(getattr(result, "rowcount", 0) or 0)
+
+
+class RateLimiter:
+    # 라우트 이름마다 IP 버킷과 사용자 버킷을 따로 두고 둘 다 통과해야 허용한다.
+    # 공유 백엔드가 실패하면 그 요청은 워커 메모리 버킷으로 판정한다.
+    def __init__(
+        self,
+        per_ip: dict[str, RateLimit],
+        per_user: dict[str, RateLimit],
+        buckets: TokenBuckets,
+        shared: PostgresBuckets | None = None,
+    ) -> None:
+        self.per_ip = per_ip
+        self.per_user = per_user
+        self.buckets = buckets
+        self.shared = shared
+        self.shared_failures = 0
+
+    def limits(self, route: str) -> bool:
+        return route in self.per_ip or route in self.per_user
+
+    def limits_users(self, route: str) -> bool:
+        return route in self.per_user
+
+    @property
+    def idle_seconds(self) -> float:
+        limits = [*self.per_ip.values(), *self.per_user.values()]
+        return max((limit.full_after for limit in limits), default=0.0)
+
+    async def hit(self, route: str, ip: str | None, user: str | None) -> float:
+        # 허용하면 0, 아니면 Retry-After로 쓸 초를 돌려준다.
+        # 거절되면 앞에서 통과한 범위의 토큰을 되돌려 거절된 재시도가 다른 버킷을
+        # 깎지 않게 한다.
+        taken: list[tuple[str, RateLimit]] = []
+        for scope, subject, limits in (
+            (IP_SCOPE, ip, self.per_ip),
+            (USER_SCOPE, user, self.per_user),
+        ):
+            limit = limits.get(route)
+            if limit is None or subject is None:
+                continue
+            key = f"{route}:{scope}:{subject}"
+            if self.shared is None:
+                wait = self.buckets.take(key, limit, time.monotonic())
+            else:
+                wait = await self._take_shared(self.shared, key, limit)
+            if wait:
+                rate_limit_rejections.inc(route, scope)
+                for taken_key, taken_limit in taken:
+                    await self._refund(taken_key, taken_limit)
+                return wait
+            taken.append((key, limit))
+        return 0.0
+
+    async def _take_shared(
+        self,
+        shared: PostgresBuckets,
+        key: str,
+        limit: RateLimit,
+    ) -> float:
+        try:
+            async with async_session() as session:
+                return await shared.take(session, key, limit)
+        except (SQLAlchemyError, OSError):
+            self.shared_failures += 1
+            logger.warning("Shared rate limit backend failed", exc_info=True)
+        return self.buckets.take(key, limit, time.monotonic())
+
+    async def _refund(self, key: str, limit: RateLimit) -> None:
+        if self.shared is None:
+            self.buckets.refund(key, limit)
+            return
+        try:
+            async with async_session() as session:
+                await self.shared.refund(session, key, limit)
+        except (SQLAlchemyError, OSError):
+            logger.warning("Shared rate limit backend failed", exc_info=True)
+            self.buckets.refund(key, limit)
+
+    async def evict(self) -> int:
+        idle = self.idle_seconds
+        evicted = await self.buckets.evict(time.monotonic() - idle)
+        if self.shared is not None:
+            async with async_session() as session:
+                evicted += await self.shared.evict(session, idle)
+        return evicted
+
+    async def run_evict_loop(self, interval: float) -> None:
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await self.evict()
+            except (SQLAlchemyError, OSError):
+                logger.warning("Failed to evict rate limit buckets", exc_info=True)
+
+    def reset(self) -> None:
+        self.buckets.clear()
+
+
+def create_rate_limiter() -> RateLimiter:
+    if not settings.RATE_LIMIT_ENABLED:
+        return RateLimiter({}, {}, TokenBuckets(1))
+    return RateLimiter(
+        per_ip={
+            route: parse_rate(spec)
+            for route, spec in settings.RATE_LIMIT_PER_IP.items()
+        },
+        per_user={
+            route: parse_rate(spec)
+            for route, spec in settings.RATE_LIMIT_PER_USER.items()
+        },
+        buckets=TokenBuckets(settings.RATE_LIMIT_SHARDS),
+        shared=(
+            PostgresBuckets()
+            if settings.RATE_LIMIT_BACKEND is RateLimitBackend.POSTGRES
+            else None
+        ),
+    )
+
+
+rate_limiter = create_rate_limiter()
@@ -0,0 +1,47 @@
+import hashlib
+import math
+
+# 크기 산정 (n: 예상 원소 수, p: 목표 오탐률)
+#   비트 수   m = ceil(-n * ln(p) / ln(2)^2)
+#   해시 수   k = round(m / n * ln(2))
+#   실제 오탐률 ~= (1 - e^(-k * count / m))^k
+# 예) n=1,000,000, p=0.001 -> m=14,377,588 bits (약 1.71 MiB), k=10
+#     n=100,000,   p=0.001 -> m=1,437,759 bits  (약 176 KiB), k=10
+# 원소 수가 n을 넘으면 오탐률이 빠르게 올라가므로 재구성해야 한다.
+
+
+class BloomFilter:
+    def __init__(self, capacity: int, error_rate: float) -> None:
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.num_bits = math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2)
+        self.num_hashes = max(1, round(self.num_bits / capacity * math.log(2)))
+        self.count = 0
+        self._bits = bytearray((self.num_bits + 7) // 8)
+
+    @property
+    def memory_bytes(self) -> int:
+        return len(self._bits)
+
+    def expected_false_positive_rate(self) -> float:
+        fill = 1 - math.exp(-self.num_hashes * self.count / self.num_bits)
+        return float(fill**self.num_hashes)
+
+    def _positions(self, item: str) -> list[int]:
+        # Kirsch-Mitzenmacher double hashing: h_i = h1 + i * h2
+        digest = hashlib.blake2b(item.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return [(h1 + i * h2) % self.num_bits for i in range(self.num_hashes)]
+
+    def add(self, item: str) -> None:
+        for position in self._positions(item):
+            self._bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, item: str) -> bool:
+        bits = self._bits
+        return all(
+            bits[position >> 3] & (1 << (position & 7))
+            for position in self._positions(item)
+        )
@@ -0,0 +1,60 @@
+# 인덱스 0..size-1 의 정수 카운트를 두고 갱신, 앞부분 합, k번째 원소 찾기를
+# 모두 O(log n)에 한다. 내부 배열은 1부터 쓴다.
+
+
+class FenwickTree:
+    def __init__(self, size: int) -> None:
+        self.size = size
+        self.total = 0
+        self._tree = [0] * (size + 1)
+        self._top_bit = 1 << (size.bit_length() - 1) if size else 0
+
+    @classmethod
+    def from_counts(cls, counts: list[int]) -> "FenwickTree":
+        # 하나씩 add하는 O(n log n) 대신 부모에게 부분합을 올려 O(n)에 만든다.
+        fenwick = cls(len(counts))
+        tree = fenwick._tree
+        tree[1:] = counts
+        for index in range(1, len(tree)):
+            parent = index + (index & -index)
+            if parent < len(tree):
+                tree[parent] += tree[index]
+        fenwick.total = sum(counts)
+        return fenwick
+
+    def add(self, index: int, delta: int) -> None:
+        self.total += delta
+        index += 1
+        tree = self._tree
+        while index <= self.size:
+            tree[index] += delta
+            index += index & -index
+
+    def prefix_sum(self, end: int) -> int:
+        # [0, end) 구간의 합
+        total = 0
+        tree = self._tree
+        while end > 0:
+            total += tree[end]
+            end -= end & -end
+        return total
+
+    def find_kth(self, k: int) -> int:
+        # 앞에서부터 누적합이 처음으로 k(1부터)에 닿는 인덱스
+        return self.locate(k)[0]
+
+    def locate(self, k: int) -> tuple[int, int]:
+        # find_kth와 같고, 그 인덱스 안에서 k가 몇 번째(0부터)인지도 함께 준다.
+        if not 1 <= k <= self.total:
+            msg = f"k={k} is out of range for total {self.total}"
+            raise IndexError(msg)
+        position = 0
+        tree = self._tree
+        step = self._top_bit
+        while step:
+            following = position + step
+            if following <= self.size and tree[following] < k:
+                position = following
+                k -= tree[following]
+            step >>= 1
+        return position, k - 1
@@ -0,0 +1,291 @@
+"""API throughput and p50/p95/p99 latency, in-process and over a uvicorn socket.
+
+docker compose up -d test-db
+python -m benchmarks.api_load --requests 2000 --concurrency 16 \
+    --output results/api.json --baseline results/api-baseline.json
+
+Postgres defaults to the test-db compose service. Google is replaced by the
+local stub server. The run exits with status 1 when a scenario has failed
+requests, or when its --metric regressed more than --max-regression over the
+baseline.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+from collections.abc import Awaitable, Callable
+from contextlib import AsyncExitStack
+from datetime import UTC, datetime
+from pathlib import Path
+
+import httpx
+
+from benchmarks.stub_oauth import TOKEN_PATH, USER_INFO_PATH, StubOAuthServer
+
+API_PREFIX = "/api/v1"
+CALLBACK_PATH = f"{API_PREFIX}/auth/login/google/callback"
+VERIFY_PATH = f"{API_PREFIX}/presence"
+SCENARIOS = ("health", "google_callback", "token_verify")
+TRANSPORTS = ("asgi", "uvicorn")
+METRICS = ("p50_ms", "p95_ms", "p99_ms")
+SERVER_START_TIMEOUT = 30.0
+
+type Request = Callable[[httpx.AsyncClient], Awaitable[httpx.Response]]
+
+
+def percentile(ordered: list[float], fraction: float) -> float:
+    # 최근접 순위(nearest-rank) 백분위수. ordered는 정렬된 값이어야 한다.
+    if not ordered:
+        return 0.0
+    rank = max(int(fraction * len(ordered) + 0.999999) - 1, 0)
+    return ordered[min(rank, len(ordered) - 1)]
+
+
+def summarize(latencies: list[float], errors: int, elapsed: float) -> dict:
+    ordered = sorted(latencies)
+    return {
+        "requests": len(ordered),
+        "errors": errors,
+        "throughput_rps": round(len(ordered) / elapsed, 1) if elapsed else 0.0,
+        "p50_ms": round(percentile(ordered, 0.50) * 1e3, 3),
+        "p95_ms": round(percentile(ordered, 0.95) * 1e3, 3),
+        "p99_ms": round(percentile(ordered, 0.99) * 1e3, 3),
+    }
+
+
+def find_regressions(
+    current: dict[str, dict],
+    baseline: dict[str, dict],
+    metric: str,
+    max_regression: float,
+) -> list[str]:
+    # 기준선에 있는 시나리오만 비교한다. 새 시나리오는 다음 기준선부터 잡힌다.
+    problems: list[str] = []
+    for name, result in current.items():
+        if result["errors"]:
+            problems.append(f"{name}: {result['errors']} failed requests")
+        previous = baseline.get(name)
+        if previous is None or not previous[metric]:
+            continue
+        change = result[metric] / previous[metric] - 1
+        if change > max_regression:
+            problems.append(
+                f"{name}: {metric} {previous[metric]:.3f}ms -> "
+                f"{result[metric]:.3f}ms (+{change:.0%})",
+            )
+    return problems
+
+
+async def run_load(
+    client: httpx.AsyncClient,
+    request: Request,
+    total: int,
+    concurrency: int,
+    warmup: int,
+) -> dict:
+    for _ in range(warmup):
+        await request(client)
+
+    latencies: list[float] = []
+    errors = 0
+    remaining = total
+
+    async def worker() -> None:
+        nonlocal remaining, errors
+        while remaining > 0:
+            remaining -= 1
+            started = time.perf_counter()
+            try:
+                response = await request(client)
+            except httpx.HTTPError:
+                errors += 1
+                continue
+            latencies.append(time.perf_counter() - started)
+            if response.is_error:
+                errors += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return summarize(latencies, errors, time.perf_counter() - started)
+
+
+def configure_environment(args: argparse.Namespace, stub: StubOAuthServer) -> None:
+    # Settings는 app을 import할 때 만들어지므로 그 전에 환경 변수로 넘긴다.
+    # uvicorn 자식 프로세스도 같은 환경을 물려받는다.
+    os.environ.update(
+        {
+            "POSTGRES_SERVER": args.postgres_server,
+            "POSTGRES_PORT": str(args.postgres_port),
+            "POSTGRES_USER": args.postgres_user,
+            "POSTGRES_PASSWORD": args.postgres_password,
+            "POSTGRES_DB": args.postgres_db,
+            "DB_ECHO": "false",
+            "GOOGLE_TOKEN_URL": f"{stub.base_url}{TOKEN_PATH}",
+            "GOOGLE_USER_INFO_URL": f"{stub.base_url}{USER_INFO_PATH}",
+            "GOOGLE_VERIFY_ID_TOKEN": "false",
+            # 한 클라이언트가 같은 IP로 수천 번 로그인하므로 제한을 끈다.
+            "RATE_LIMIT_ENABLED": "false",
+        },
+    )
+
+
+def scenario_requests(access_token: str) -> dict[str, Request]:
+    headers = {"Authorization": f"Bearer {access_token}"}
+    return {
+        "health": lambda client: client.get("/health"),
+        "google_callback": lambda client: client.get(
+            CALLBACK_PATH,
+            params={"code": "bench"},
+        ),
+        "token_verify": lambda client: client.get(VERIFY_PATH, headers=headers),
+    }
+
+
+async def start_uvicorn(port: int) -> subprocess.Popen[bytes]:
+    process = subprocess.Popen(
+        [
+            sys.executable,
+            "-m",
+            "uvicorn",
+            "app.main:app",
+            "--host",
+            "127.0.0.1",
+            "--port",
+            str(port),
+            "--log-level",
+            "warning",
+            "--no-access-log",
+        ],
+    )
+    deadline = time.monotonic() + SERVER_START_TIMEOUT
+    async with httpx.AsyncClient(base_url=f"http://127.0.0.1:{port}") as client:
+        while time.monotonic() < deadline:
+            try:
+                await client.get("/health")
+            except httpx.TransportError:
+                await asyncio.sleep(0.1)
+            else:
+                return process
+    process.terminate()
+    msg = "uvicorn did not start in time"
+    raise RuntimeError(msg)
+
+
+async def run_transport(
+    transport: str,
+    args: argparse.Namespace,
+    scenarios: list[str],
+) -> dict[str, dict]:
+    # 앱 import는 환경 변수를 채운 뒤여야 해서 함수 안에서 한다.
+    from app.main import app
+
+    async with AsyncExitStack() as stack:
+        process = None
+        if transport == "asgi":
+            # ASGITransport는 lifespan을 돌리지 않는다. uvicorn 자식 프로세스처럼
+            # 엔진, 폐기 목록 동기화 등을 올려야 운영과 같은 경로를 잰다.
+            await stack.enter_async_context(app.router.lifespan_context(app))
+            client = httpx.AsyncClient(
+                transport=httpx.ASGITransport(app=app),
+                base_url="http://bench",
+            )
+        else:
+            process = await start_uvicorn(args.port)
+            client = httpx.AsyncClient(
+                base_url=f"http://127.0.0.1:{args.port}",
+                limits=httpx.Limits(max_connections=args.concurrency),
+            )
+
+        results: dict[str, dict] = {}
+        try:
+            login = await client.get(CALLBACK_PATH, params={"code": "bench"})
+            login.raise_for_status()
+            requests = scenario_requests(login.json()["access_token"])
+            for name in scenarios:
+                result = results[f"{transport}/{name}"] = await run_load(
+                    client,
+                    requests[name],
+                    args.requests,
+                    args.concurrency,
+                    args.warmup,
+                )
+                print(
+                    f"{transport}/{name}: {result['throughput_rps']} req/s, "
+                    f"p50 {result['p50_ms']}ms, p95 {result['p95_ms']}ms, "
+                    f"p99 {result['p99_ms']}ms, {result['errors']} errors",
+                )
+        finally:
+            await client.aclose()
+            if process is not None:
+                process.terminate()
+                process.wait()
+    return results
+
+
+async def main(args: argparse.Namespace) -> int:
+    async with StubOAuthServer() as stub:
+        configure_environment(args, stub)
+        # 스키마는 운영과 같게 마이그레이션으로 만든다. (uid 시퀀스 등)
+        if args.migrate:
+            subprocess.run(
+                [sys.executable, "-m", "alembic", "upgrade", "head"],
+                check=True,
+            )
+        results: dict[str, dict] = {}
+        for transport in args.transports.split(","):
+            results |= await run_transport(
+                transport,
+                args,
+                args.scenarios.split(","),
+            )
+
+    report = {
+        "created_at": datetime.now(UTC).isoformat(),
+        "python": platform.python_version(),
+        "requests": args.requests,
+        "concurrency": args.concurrency,
+        "results": results,
+    }
+    if args.output:
+        output = Path(args.output)
+        output.parent.mkdir(parents=True, exist_ok=True)
+        output.write_text(json.dumps(report, indent=2) + "\n")
+
+    problems: list[str] = []
+    if args.baseline:
+        baseline = json.loads(Path(args.baseline).read_text())["results"]
+        problems = find_regressions(
+            results,
+            baseline,
+            args.metric,
+            args.max_regression,
+        )
+    for problem in problems:
+        print(f"REGRESSION {problem}")
+    return 1 if problems else 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--warmup", type=int, default=50)
+    parser.add_argument("--scenarios", default=",".join(SCENARIOS))
+    parser.add_argument("--transports", default=",".join(TRANSPORTS))
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--postgres-server", default="localhost")
+    parser.add_argument("--postgres-port", type=int, default=5433)
+    parser.add_argument("--postgres-user", default="test")
+    parser.add_argument("--postgres-password", default="test")
+    parser.add_argument("--postgres-db", default="test_mcr_masters")
+    parser.add_argument("--no-migrate", dest="migrate", action="store_false")
+    parser.add_argument("--output")
+    parser.add_argument("--baseline")
+    parser.add_argument("--metric", choices=METRICS, default="p95_ms")
+    parser.add_argument("--max-regression", type=float, default=0.25)
+    sys.exit(asyncio.run(main(parser.parse_args())))
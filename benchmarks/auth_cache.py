@@ -0,0 +1,75 @@
+"""Cold vs warm get_current_user path.
+
+python -m benchmarks.auth_cache --iterations 20000 --db-latency-ms 0.5
+"""
+
+import argparse
+import asyncio
+import time
+from types import SimpleNamespace
+
+from fastapi.security import HTTPAuthorizationCredentials
+
+from app.api.deps import get_auth_cache_stats, get_current_user
+from app.core.security import create_access_token, token_cache
+from app.services.auth.user_service import identity_cache
+
+EMAIL = "bench@example.com"
+
+
+class FakeSession:
+    # SELECT 한 번의 왕복 지연을 흉내 내는 세션
+    def __init__(self, latency: float) -> None:
+        self.latency = latency
+        self.queries = 0
+
+    async def execute(self, _statement: object) -> SimpleNamespace:
+        self.queries += 1
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        row = SimpleNamespace(
+            _asdict=lambda: {
+                "id": 1,
+                "uid": "123456789",
+                "nickname": "bench",
+                "email": EMAIL,
+                "is_active": True,
+            },
+        )
+        return SimpleNamespace(one_or_none=lambda: row)
+
+
+async def _run(iterations: int, session: FakeSession, *, warm: bool) -> float:
+    credentials = HTTPAuthorizationCredentials(
+        scheme="Bearer",
+        credentials=create_access_token({"sub": EMAIL}),
+    )
+    await get_current_user(credentials, session)  # type: ignore[arg-type]
+
+    started = time.perf_counter()
+    for _ in range(iterations):
+        if not warm:
+            token_cache.clear()
+            identity_cache.clear()
+        await get_current_user(credentials, session)  # type: ignore[arg-type]
+    return time.perf_counter() - started
+
+
+async def main(iterations: int, db_latency: float) -> None:
+    for name, warm in (("cold", False), ("warm", True)):
+        token_cache.clear()
+        identity_cache.clear()
+        session = FakeSession(db_latency)
+        elapsed = await _run(iterations, session, warm=warm)
+        print(
+            f"{name}: {elapsed / iterations * 1e6:.1f} us/request, "
+            f"{session.queries} queries, caches={get_auth_cache_stats()}",
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--iterations", type=int, default=20000)
+    parser.add_argument("--db-latency-ms", type=float, default=0.0)
+    args = parser.parse_args()
+    asyncio.run(main(args.iterations, args.db_latency_ms / 1000))
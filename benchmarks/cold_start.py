@@ -0,0 +1,90 @@
+"""Cold import time of app.main from `python -X importtime`, with a budget check.
+
+python -m benchmarks.cold_start --runs 5 --top 15 --budget-ms 800
+"""
+
+import argparse
+import os
+import re
+import subprocess
+import sys
+import time
+
+from app.core.config import settings
+
+# 앱 import 경로에 올라오면 안 되는 무거운 모듈. 첫 사용 시점에 불러온다.
+DEFERRED_MODULES = ("httpx", "jose", "cryptography", "asyncpg", "numpy")
+
+_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)$")
+
+
+def import_times(module: str) -> list[tuple[int, int, str]]:
+    # (자체 us, 누적 us, 모듈 이름) 목록. 새 인터프리터에서 재야 캐시가 섞이지 않는다.
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+        env={**os.environ, "PYTHONPATH": os.getcwd()},
+    )
+    rows: list[tuple[int, int, str]] = []
+    for line in result.stderr.splitlines():
+        match = _LINE.match(line)
+        if match:
+            rows.append((int(match[1]), int(match[2]), match[4]))
+    return rows
+
+
+def cumulative_import_us(module: str) -> int:
+    return next(
+        cumulative for _, cumulative, name in import_times(module) if name == module
+    )
+
+
+def loaded_modules(module: str, candidates: tuple[str, ...]) -> list[str]:
+    script = (
+        f"import sys, {module}; "
+        f"print(' '.join(m for m in {candidates!r} if m in sys.modules))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", script],
+        capture_output=True,
+        text=True,
+        check=True,
+        env={**os.environ, "PYTHONPATH": os.getcwd()},
+    )
+    return result.stdout.split()
+
+
+def main(module: str, runs: int, top: int, budget_ms: float) -> int:
+    totals = sorted(cumulative_import_us(module) for _ in range(runs))
+    rows = import_times(module)
+    started = time.perf_counter()
+    subprocess.run([sys.executable, "-c", f"import {module}"], check=True)
+    process_ms = (time.perf_counter() - started) * 1e3
+
+    print(f"{module}: median {totals[len(totals) // 2] / 1e3:.1f}ms import")
+    print(f"  interpreter + import: {process_ms:.1f}ms")
+    print(f"  deferred modules loaded: {loaded_modules(module, DEFERRED_MODULES)}")
+    print(f"  top {top} by self time:")
+    for self_us, cumulative, name in sorted(rows, reverse=True)[:top]:
+        print(f"    {self_us / 1e3:7.1f}ms self {cumulative / 1e3:7.1f}ms cum  {name}")
+
+    if totals[0] / 1e3 > budget_ms:
+        print(f"over budget: {totals[0] / 1e3:.1f}ms > {budget_ms:.1f}ms")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--module", default="app.main")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=15)
+    parser.add_argument(
+        "--budget-ms",
+        type=float,
+        default=settings.IMPORT_TIME_BUDGET_MS,
+    )
+    args = parser.parse_args()
+    sys.exit(main(args.module, args.runs, args.top, args.budget_ms))
@@ -0,0 +1,166 @@
+"""Cross-process delivery latency of the Postgres LISTEN/NOTIFY event bus.
+
+python -m benchmarks.event_bus --subscribers 3 --messages 5000 --rate 2000
+
+Each subscriber is a separate process with its own bus connection, like a
+uvicorn worker. Latency is wall-clock time from publish() in the publisher to
+the handler in a subscriber. Payloads over the NOTIFY limit need the
+eventbusoverflow table (alembic upgrade head).
+"""
+
+import argparse
+import asyncio
+import multiprocessing
+import time
+from contextlib import suppress
+from multiprocessing.synchronize import Event as ProcessEvent
+from queue import Empty
+from typing import Any
+
+from app.core.config import settings
+from app.services.eventbus.bus import PostgresEventBus
+
+CHANNEL = "bench"
+DONE_TIMEOUT = 30.0
+CONNECT_TIMEOUT = 10.0
+
+
+def _make_bus(args: argparse.Namespace) -> PostgresEventBus:
+    return PostgresEventBus(
+        dsn=settings.database_uri.replace("+asyncpg", "", 1),
+        channel=args.channel,
+        batch_interval=args.batch_interval,
+        max_payload=settings.EVENT_BUS_MAX_PAYLOAD_BYTES,
+        compress_min=settings.EVENT_BUS_COMPRESS_MIN_BYTES,
+        max_pending=args.messages + 1,
+        keepalive=settings.EVENT_BUS_KEEPALIVE_SECONDS,
+        reconnect_max=settings.EVENT_BUS_RECONNECT_MAX_SECONDS,
+        overflow_retention=settings.EVENT_BUS_OVERFLOW_RETENTION_SECONDS,
+    )
+
+
+async def _wait_connected(bus: PostgresEventBus) -> None:
+    async with asyncio.timeout(CONNECT_TIMEOUT):
+        while not bus.connected:
+            await asyncio.sleep(0.01)
+
+
+async def _subscribe(
+    args: argparse.Namespace,
+    ready: ProcessEvent,
+    results: "multiprocessing.Queue[list[float]]",
+) -> None:
+    bus = _make_bus(args)
+    latencies: list[float] = []
+    done = asyncio.Event()
+
+    def on_event(event: dict[str, Any]) -> None:
+        if event.get("done"):
+            done.set()
+        else:
+            latencies.append(time.time() - event["sent_at"])
+
+    bus.subscribe(CHANNEL, on_event)
+    runner = asyncio.create_task(bus.run())
+    await _wait_connected(bus)
+    ready.set()
+    with suppress(TimeoutError):
+        await asyncio.wait_for(done.wait(), DONE_TIMEOUT)
+    runner.cancel()
+    with suppress(asyncio.CancelledError):
+        await runner
+    results.put(latencies)
+
+
+def _subscriber(
+    args: argparse.Namespace,
+    ready: ProcessEvent,
+    results: "multiprocessing.Queue[list[float]]",
+) -> None:
+    asyncio.run(_subscribe(args, ready, results))
+
+
+async def _publish(args: argparse.Namespace) -> PostgresEventBus:
+    bus = _make_bus(args)
+    runner = asyncio.create_task(bus.run())
+    await _wait_connected(bus)
+    padding = "x" * args.payload_bytes
+    interval = 1 / args.rate
+    started = time.perf_counter()
+    for index in range(args.messages):
+        # 목표 속도에 맞춰 보낸다. 밀리면 쉬지 않고 따라잡는다.
+        delay = started + index * interval - time.perf_counter()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        bus.publish(CHANNEL, {"seq": index, "sent_at": time.time(), "pad": padding})
+    bus.publish(CHANNEL, {"done": True})
+    while bus.stats()["pending"]:
+        await asyncio.sleep(0.01)
+    # 마지막 배치가 NOTIFY로 나갈 시간을 준다.
+    await asyncio.sleep(args.batch_interval + 0.1)
+    runner.cancel()
+    with suppress(asyncio.CancelledError):
+        await runner
+    return bus
+
+
+def _percentile(ordered: list[float], fraction: float) -> float:
+    return ordered[min(int(fraction * len(ordered)), len(ordered) - 1)]
+
+
+def main(args: argparse.Namespace) -> None:
+    context = multiprocessing.get_context("spawn")
+    results: multiprocessing.Queue[list[float]] = context.Queue()
+    readies = [context.Event() for _ in range(args.subscribers)]
+    processes = [
+        context.Process(target=_subscriber, args=(args, ready, results))
+        for ready in readies
+    ]
+    for process in processes:
+        process.start()
+    for ready in readies:
+        ready.wait(CONNECT_TIMEOUT * 2)
+
+    started = time.perf_counter()
+    bus = asyncio.run(_publish(args))
+    elapsed = time.perf_counter() - started
+
+    collected: list[list[float]] = []
+    for _ in processes:
+        with suppress(Empty):
+            collected.append(results.get(timeout=DONE_TIMEOUT))
+    for process in processes:
+        process.join()
+
+    stats = bus.stats()
+    print(
+        f"published {args.messages} x {args.payload_bytes}B in {elapsed:.2f}s: "
+        f"{stats['frames_sent']} NOTIFY frames, {stats['overflowed']} overflowed",
+    )
+    for index, latencies in enumerate(collected):
+        ordered = sorted(latencies)
+        if not ordered:
+            print(f"  subscriber {index}: nothing received")
+            continue
+        print(
+            f"  subscriber {index}: {len(ordered)}/{args.messages} received, "
+            f"p50 {_percentile(ordered, 0.50) * 1e3:.2f}ms "
+            f"p95 {_percentile(ordered, 0.95) * 1e3:.2f}ms "
+            f"p99 {_percentile(ordered, 0.99) * 1e3:.2f}ms "
+            f"max {ordered[-1] * 1e3:.2f}ms",
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--subscribers", type=int, default=3)
+    parser.add_argument("--messages", type=int, default=5000)
+    parser.add_argument("--rate", type=float, default=2000.0)
+    parser.add_argument("--payload-bytes", type=int, default=200)
+    parser.add_argument(
+        "--batch-interval",
+        type=float,
+        default=settings.EVENT_BUS_BATCH_INTERVAL_SECONDS,
+    )
+    parser.add_argument("--channel", default="mcr_events_bench")
+    main(parser.parse_args())
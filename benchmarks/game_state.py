@@ -0,0 +1,143 @@
+"""Game state memory and snapshot encode/decode against a pydantic JSON baseline.
+
+python -m benchmarks.game_state --tables 2000 --iterations 20000
+"""
+
+import argparse
+import random
+import time
+import tracemalloc
+from collections.abc import Callable
+
+from pydantic import BaseModel
+
+from app.services.game.state import (
+    NO_TILE,
+    GameState,
+    decode_snapshot,
+    encode_snapshot,
+)
+
+USER_IDS = [1, 2, 3, 4]
+
+
+class PlayerModel(BaseModel):
+    user_id: int
+    hand: list[int]
+    melds: list[tuple[int, int, int]]
+    discards: list[int]
+    flowers: int
+    score: int
+
+
+class GameModel(BaseModel):
+    # app/models 방식으로 같은 상태를 표현했을 때의 기준선
+    game_id: int
+    seq: int
+    phase: int
+    prevalent_wind: int
+    dealer: int
+    turn: int
+    last_discard: int
+    wall: list[int]
+    wall_head: int
+    wall_tail: int
+    players: list[PlayerModel]
+
+
+def to_model(state: GameState) -> GameModel:
+    return GameModel(
+        game_id=state.game_id,
+        seq=state.seq,
+        phase=state.phase,
+        prevalent_wind=state.prevalent_wind,
+        dealer=state.dealer,
+        turn=state.turn,
+        last_discard=state.last_discard,
+        wall=list(state.wall),
+        wall_head=state.wall_head,
+        wall_tail=state.wall_tail,
+        players=[
+            PlayerModel(
+                user_id=player.user_id,
+                hand=[
+                    tile for tile, count in enumerate(player.hand) for _ in range(count)
+                ],
+                melds=[
+                    (player.melds[i], player.melds[i + 1], player.melds[i + 2])
+                    for i in range(0, len(player.melds), 3)
+                ],
+                discards=list(player.discards),
+                flowers=player.flowers,
+                score=player.score,
+            )
+            for player in state.players
+        ],
+    )
+
+
+def mid_game(game_id: int, rng: random.Random) -> GameState:
+    state = GameState.new(game_id, USER_IDS, rng=rng)
+    for _ in range(rng.randrange(10, 60)):
+        seat = state.turn
+        if state.draw(seat) == NO_TILE:
+            break
+        hand = state.players[seat].hand
+        state.discard(seat, rng.choice([tile for tile, n in enumerate(hand) if n]))
+        state.pass_turn()
+    return state
+
+
+def _allocated[T](build: Callable[[], T]) -> tuple[T, int]:
+    tracemalloc.start()
+    result = build()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, size
+
+
+def _timed(name: str, iterations: int, operation: Callable[[], object]) -> None:
+    started = time.perf_counter()
+    for _ in range(iterations):
+        operation()
+    elapsed = time.perf_counter() - started
+    print(f"  {name}: {elapsed / iterations * 1e6:.2f}us")
+
+
+def main(tables: int, iterations: int) -> None:
+    rng = random.Random(0)
+    states = [mid_game(game_id, rng) for game_id in range(tables)]
+
+    copies, state_bytes = _allocated(lambda: [state.copy() for state in states])
+    models, model_bytes = _allocated(lambda: [to_model(state) for state in copies])
+    print(
+        f"memory per table: slots={state_bytes / tables:,.0f}B "
+        f"pydantic={model_bytes / tables:,.0f}B",
+    )
+
+    state = states[0]
+    model = models[0]
+    snapshot = encode_snapshot(state)
+    payload = model.model_dump_json()
+    print(f"size: snapshot={len(snapshot)}B json={len(payload)}B")
+
+    print("snapshot codec")
+    _timed("encode", iterations, lambda: encode_snapshot(state))
+    _timed("decode", iterations, lambda: decode_snapshot(snapshot))
+    _timed("copy", iterations, state.copy)
+    print("pydantic baseline")
+    _timed("model_dump_json", iterations, model.model_dump_json)
+    _timed(
+        "model_validate_json",
+        iterations,
+        lambda: GameModel.model_validate_json(payload),
+    )
+    _timed("model_copy(deep)", iterations, lambda: model.model_copy(deep=True))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--tables", type=int, default=2000)
+    parser.add_argument("--iterations", type=int, default=20000)
+    args = parser.parse_args()
+    main(args.tables, args.iterations)
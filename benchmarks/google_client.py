@@ -0,0 +1,57 @@
+"""Fresh-client vs shared-client login round trips against a local stub server.
+
+python -m benchmarks.google_client --logins 500
+"""
+
+import argparse
+import asyncio
+import time
+
+import httpx
+
+from app.core.http_client import create_http_client
+from benchmarks.stub_oauth import TOKEN_PATH, USER_INFO_PATH, StubOAuthServer
+
+
+async def _login(client: httpx.AsyncClient, base_url: str) -> None:
+    response = await client.post(f"{base_url}{TOKEN_PATH}", data={"code": "x"})
+    response.raise_for_status()
+    response = await client.get(f"{base_url}{USER_INFO_PATH}")
+    response.raise_for_status()
+
+
+async def _fresh_clients(server: StubOAuthServer, logins: int) -> None:
+    for _ in range(logins):
+        async with httpx.AsyncClient() as client:
+            await client.post(f"{server.base_url}{TOKEN_PATH}", data={"code": "x"})
+        async with httpx.AsyncClient() as client:
+            await client.get(f"{server.base_url}{USER_INFO_PATH}")
+
+
+async def _shared_client(server: StubOAuthServer, logins: int) -> None:
+    client = create_http_client()
+    try:
+        for _ in range(logins):
+            await _login(client, server.base_url)
+    finally:
+        await client.aclose()
+
+
+async def main(logins: int) -> None:
+    for name, scenario in (("fresh", _fresh_clients), ("shared", _shared_client)):
+        async with StubOAuthServer() as server:
+            started = time.perf_counter()
+            await scenario(server, logins)
+            elapsed = time.perf_counter() - started
+            print(
+                f"{name:>6}: {logins} logins in {elapsed:.3f}s "
+                f"({elapsed / logins * 1e3:.3f} ms/login), "
+                f"{server.connections} TCP connections for {server.requests} requests",
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--logins", type=int, default=500)
+    args = parser.parse_args()
+    asyncio.run(main(args.logins))
@@ -0,0 +1,76 @@
+"""Leaderboard rank/top/around/update latency with a million ranked users.
+
+python -m benchmarks.leaderboard --users 1000000 --queries 20000
+"""
+
+import argparse
+import random
+import time
+from bisect import bisect_left, insort
+from collections.abc import Callable
+
+from app.core.config import settings
+from app.services.ranking.leaderboard import Leaderboard
+
+
+def _timed(name: str, queries: int, operation: Callable[[], object]) -> None:
+    started = time.perf_counter()
+    for _ in range(queries):
+        operation()
+    elapsed = time.perf_counter() - started
+    print(f"  {name}: {elapsed / queries * 1e6:.2f}us")
+
+
+def main(users: int, queries: int) -> None:
+    rng = random.Random(0)
+    ratings = {user_id: rng.gauss(1500, 200) for user_id in range(users)}
+    user_ids = list(ratings)
+
+    board = Leaderboard(
+        settings.LEADERBOARD_MIN_RATING,
+        settings.LEADERBOARD_MAX_RATING,
+        settings.LEADERBOARD_RESOLUTION,
+    )
+    started = time.perf_counter()
+    board.load(ratings)
+    elapsed = time.perf_counter() - started
+    print(f"fenwick leaderboard ({users:,} users, load {elapsed:.2f}s)")
+    _timed("rank", queries, lambda: board.rank(rng.choice(user_ids)))
+    _timed("top 20", queries, lambda: board.top(20))
+    _timed("top 20 at offset n/2", queries, lambda: board.top(20, users // 2))
+    _timed("around radius 5", queries, lambda: board.around(rng.choice(user_ids), 5))
+
+    def update() -> None:
+        user_id = rng.choice(user_ids)
+        ratings[user_id] += rng.uniform(-20, 20)
+        board.update(user_id, ratings[user_id])
+
+    _timed("update", queries, update)
+
+    # 기준선: (-레이팅, user_id) 정렬 목록. 조회는 bisect지만 갱신이 O(n)이다.
+    started = time.perf_counter()
+    ordered = sorted((-rating, user_id) for user_id, rating in ratings.items())
+    print(f"sorted list baseline (build {time.perf_counter() - started:.2f}s)")
+    _timed(
+        "rank",
+        queries,
+        lambda: bisect_left(
+            ordered, (-ratings[user_id := rng.choice(user_ids)], user_id)
+        ),
+    )
+
+    def update_sorted() -> None:
+        user_id = rng.choice(user_ids)
+        ordered.pop(bisect_left(ordered, (-ratings[user_id], user_id)))
+        ratings[user_id] += rng.uniform(-20, 20)
+        insort(ordered, (-ratings[user_id], user_id))
+
+    _timed("update", max(queries // 10, 1), update_sorted)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--users", type=int, default=1_000_000)
+    parser.add_argument("--queries", type=int, default=20000)
+    args = parser.parse_args()
+    main(args.users, args.queries)
@@ -0,0 +1,105 @@
+"""Matchmaking simulation: match latency and rating spread.
+
+python -m benchmarks.matchmaking --players 100000 --arrival-rate 2000
+
+시계는 시뮬레이션 시간이다. 매 초 arrival-rate명이 들어오고 tick이 한 번 돈다.
+"""
+
+import argparse
+import random
+import statistics
+import time
+
+from app.core.config import SlowConsumerPolicy, settings
+from app.services.game.matchmaking import Matchmaker
+from app.services.game.room import Room, RoomRegistry
+from app.services.gateway.manager import ConnectionManager
+from app.services.presence.registry import PresenceRegistry
+
+
+class SimulatedClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _quantiles(samples: list[float]) -> str:
+    quantiles = statistics.quantiles(samples, n=100)
+    return (
+        f"p50={quantiles[49]:.1f} p95={quantiles[94]:.1f} "
+        f"p99={quantiles[98]:.1f} max={max(samples):.1f}"
+    )
+
+
+def main(players: int, arrival_rate: int, mean: float, stddev: float) -> None:
+    clock = SimulatedClock()
+    matchmaker = Matchmaker(
+        rooms=RoomRegistry(
+            presence=PresenceRegistry(),
+            gateway=ConnectionManager(
+                max_queue=16,
+                policy=SlowConsumerPolicy.DROP_OLDEST,
+                heartbeat_interval=20,
+                idle_timeout=60,
+            ),
+        ),
+        bucket_width=settings.MATCHMAKING_BUCKET_WIDTH,
+        base_window=settings.MATCHMAKING_BASE_WINDOW,
+        window_growth=settings.MATCHMAKING_WINDOW_GROWTH_PER_SECOND,
+        max_window=settings.MATCHMAKING_MAX_WINDOW,
+        clock=clock,
+    )
+    ratings = {user_id: random.gauss(mean, stddev) for user_id in range(players)}
+    enqueued_at: dict[int, float] = {}
+    waits: list[float] = []
+    spreads: list[float] = []
+    enqueue_times: list[float] = []
+    tick_times: list[float] = []
+
+    def record(room: Room) -> None:
+        group = [ratings[user_id] for user_id in room.player_ids]
+        spreads.append(max(group) - min(group))
+        waits.extend(clock.now - enqueued_at[user_id] for user_id in room.player_ids)
+
+    next_user = 0
+    while next_user < players or len(matchmaker):
+        for user_id in range(next_user, min(players, next_user + arrival_rate)):
+            enqueued_at[user_id] = clock.now
+            started = time.perf_counter()
+            room = matchmaker.enqueue(user_id, ratings[user_id])
+            enqueue_times.append(time.perf_counter() - started)
+            if room is not None:
+                record(room)
+        next_user += arrival_rate
+
+        clock.now += 1
+        started = time.perf_counter()
+        for room in matchmaker.tick():
+            record(room)
+        tick_times.append(time.perf_counter() - started)
+
+        if next_user >= players and clock.now > players / arrival_rate + 120:
+            break
+
+    print(
+        f"players={players} matched={len(waits)} unmatched={len(matchmaker)} "
+        f"simulated={clock.now:.0f}s",
+    )
+    print(f"match latency (s): {_quantiles(waits)}")
+    print(f"rating spread: {_quantiles(spreads)}")
+    enqueue_us = [sample * 1e6 for sample in enqueue_times]
+    print(f"enqueue cost (us): {_quantiles(enqueue_us)}")
+    tick_ms = [sample * 1e3 for sample in tick_times]
+    print(f"tick cost (ms): {_quantiles(tick_ms)}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--players", type=int, default=100_000)
+    parser.add_argument("--arrival-rate", type=int, default=2000)
+    parser.add_argument("--mean", type=float, default=1500.0)
+    parser.add_argument("--stddev", type=float, default=200.0)
+    args = parser.parse_args()
+    main(args.players, args.arrival_rate, args.mean, args.stddev)
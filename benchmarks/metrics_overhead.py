@@ -0,0 +1,86 @@
+"""Per-request cost of MetricsMiddleware, driving the ASGI app directly.
+
+python -m benchmarks.metrics_overhead --requests 20000 --rounds 5
+"""
+
+import argparse
+import asyncio
+import time
+
+from fastapi import FastAPI
+from starlette.types import ASGIApp, Message
+
+from app.core.metrics import Histogram, MetricsMiddleware
+from app.core.responses import FastJSONResponse
+
+
+def _build_app(instrumented: bool) -> ASGIApp:
+    app = FastAPI(default_response_class=FastJSONResponse)
+
+    @app.get("/rooms/{room_id}")
+    async def get_room(room_id: int) -> dict[str, int]:
+        return {"id": room_id}
+
+    if instrumented:
+        app.add_middleware(MetricsMiddleware)
+    return app
+
+
+async def _drive(app: ASGIApp, requests: int) -> float:
+    # httpx를 거치지 않고 scope/receive/send를 직접 넘겨 측정 잡음을 줄인다.
+    async def receive() -> Message:
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(_message: Message) -> None:
+        return None
+
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": "/rooms/7",
+        "raw_path": b"/rooms/7",
+        "root_path": "",
+        "query_string": b"",
+        "headers": [],
+        "client": ("127.0.0.1", 1),
+        "server": ("test", 80),
+    }
+    started = time.perf_counter()
+    for _ in range(requests):
+        await app(dict(scope), receive, send)
+    return time.perf_counter() - started
+
+
+async def main(requests: int, rounds: int) -> None:
+    plain = _build_app(instrumented=False)
+    instrumented = _build_app(instrumented=True)
+    # 미들웨어 스택을 만들고 캐시가 채워지도록 한 번씩 돌린다.
+    await _drive(plain, 100)
+    await _drive(instrumented, 100)
+
+    # 번갈아 여러 번 돌려 가장 빠른 회차끼리 비교한다.
+    baseline = measured = float("inf")
+    for _ in range(rounds):
+        baseline = min(baseline, await _drive(plain, requests))
+        measured = min(measured, await _drive(instrumented, requests))
+    print(f"without metrics: {baseline / requests * 1e6:.1f}us/request")
+    print(f"with metrics:    {measured / requests * 1e6:.1f}us/request")
+    print(f"overhead:        {(measured - baseline) / requests * 1e6:.2f}us/request")
+
+    histogram = Histogram("bench_seconds", "Benchmark", ("route",))
+    started = time.perf_counter()
+    for index in range(requests):
+        histogram.observe(index * 1e-6, "/rooms/{room_id}")
+    elapsed = time.perf_counter() - started
+    print(f"histogram observe: {elapsed / requests * 1e9:.0f}ns")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=20000)
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+    asyncio.run(main(args.requests, args.rounds))
@@ -0,0 +1,59 @@
+"""Write amplification of per-transition UPDATEs vs coalesced presence flushes.
+
+python -m benchmarks.presence_churn --users 20000 --seconds 60 --rate 5000
+"""
+
+import argparse
+import asyncio
+import random
+import time
+
+from app.models.user import UserStatus
+from app.services.presence.registry import PresenceRegistry
+
+STATUSES = list(UserStatus)
+
+
+class CountingSession:
+    def __init__(self) -> None:
+        self.statements = 0
+
+    async def execute(self, _statement: object) -> None:
+        self.statements += 1
+
+    async def commit(self) -> None:
+        pass
+
+
+async def main(users: int, seconds: int, rate: int, interval: float) -> None:
+    registry = PresenceRegistry()
+    session = CountingSession()
+    ticks_per_flush = max(1, round(interval * 10))
+
+    started = time.perf_counter()
+    for tick in range(seconds * 10):
+        for _ in range(rate // 10):
+            registry.set_status(random.randrange(users), random.choice(STATUSES))
+        if (tick + 1) % ticks_per_flush == 0:
+            await registry.flush(session)  # type: ignore[arg-type]
+    await registry.flush(session)  # type: ignore[arg-type]
+    elapsed = time.perf_counter() - started
+
+    transitions = registry.transitions
+    print(f"transitions:           {transitions:,}")
+    print(f"naive UPDATEs:         {transitions:,} (one per transition)")
+    print(f"coalesced statements:  {session.statements:,}")
+    print(f"coalesced rows:        {registry.flushed_rows:,}")
+    print(f"statement reduction:   {transitions / max(session.statements, 1):,.0f}x")
+    print(f"in-memory cost:        {elapsed / transitions * 1e6:.2f} us/transition")
+    print(f"final counts:          {registry.counts()}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--users", type=int, default=20000)
+    parser.add_argument("--seconds", type=int, default=60)
+    parser.add_argument("--rate", type=int, default=5000, help="transitions/s")
+    parser.add_argument("--interval", type=float, default=2.0, help="flush seconds")
+    args = parser.parse_args()
+    asyncio.run(main(args.users, args.seconds, args.rate, args.interval))
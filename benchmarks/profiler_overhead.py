@@ -0,0 +1,50 @@
+"""Slowdown of a CPU-bound workload while the stack sampler is running.
+
+python -m benchmarks.profiler_overhead --iterations 300 --interval 0.005
+"""
+
+import argparse
+import threading
+import time
+
+from app.services.game.shanten import get_tables, shanten
+from app.services.game.tile import TILE_KINDS
+from app.services.profiling.sampler import StackSampler
+
+HAND = [0] * TILE_KINDS
+for _tile in (0, 1, 2, 9, 10, 11, 18, 19, 20, 27, 27, 28, 29):
+    HAND[_tile] += 1
+
+
+def _workload(iterations: int) -> float:
+    started = time.perf_counter()
+    for _ in range(iterations):
+        for _ in range(100):
+            shanten(HAND)
+    return time.perf_counter() - started
+
+
+def main(iterations: int, interval: float, rounds: int) -> None:
+    get_tables()
+    _workload(iterations // 10 or 1)
+    baseline = profiled = float("inf")
+    samples = 0
+    for _ in range(rounds):
+        baseline = min(baseline, _workload(iterations))
+        sampler = StackSampler(threading.get_ident(), interval)
+        sampler.start()
+        profiled = min(profiled, _workload(iterations))
+        sampler.stop()
+        samples = sum(sampler.samples.values())
+    print(f"without sampler: {baseline * 1e3:.1f}ms")
+    print(f"with sampler:    {profiled * 1e3:.1f}ms ({samples} samples/round)")
+    print(f"overhead:        {(profiled / baseline - 1) * 100:.1f}%")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--iterations", type=int, default=300)
+    parser.add_argument("--interval", type=float, default=0.005)
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+    main(args.iterations, args.interval, args.rounds)
@@ -0,0 +1,132 @@
+"""Per-request cost of RateLimitedRoute and of the in-memory bucket store.
+
+python -m benchmarks.rate_limit --requests 20000 --rounds 5 --clients 10000
+
+Requests come from --clients distinct addresses, so most of them touch a
+different bucket. --shared also times the Postgres backend through the write
+pool. It needs the ratelimitbucket table (alembic upgrade head).
+"""
+
+import argparse
+import asyncio
+import time
+
+from fastapi import APIRouter, FastAPI
+from fastapi.routing import APIRoute
+from starlette.types import ASGIApp, Message
+
+from app.api.routing import RateLimitedRoute
+from app.core.responses import FastJSONResponse
+from app.db.session import async_session
+from app.services.ratelimit.buckets import RateLimit, TokenBuckets
+from app.services.ratelimit.limiter import PostgresBuckets, rate_limiter
+
+ROUTE = "bench"
+# 측정 중에는 거절되지 않을 만큼 넉넉한 한도
+GENEROUS = RateLimit(capacity=1e9, refill=1e9)
+
+
+def _build_app(limited: bool) -> ASGIApp:
+    app = FastAPI(default_response_class=FastJSONResponse)
+    router = APIRouter(route_class=RateLimitedRoute if limited else APIRoute)
+
+    @router.get("/rooms/{room_id}", name=ROUTE)
+    async def get_room(room_id: int) -> dict[str, int]:
+        return {"id": room_id}
+
+    app.include_router(router)
+    return app
+
+
+async def _drive(app: ASGIApp, requests: int, clients: int) -> float:
+    async def receive() -> Message:
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(_message: Message) -> None:
+        return None
+
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": "/rooms/7",
+        "raw_path": b"/rooms/7",
+        "root_path": "",
+        "query_string": b"",
+        "headers": [],
+        "server": ("test", 80),
+    }
+    addresses = [
+        (f"10.{i >> 16 & 255}.{i >> 8 & 255}.{i & 255}", 1) for i in range(clients)
+    ]
+    started = time.perf_counter()
+    for index in range(requests):
+        await app(
+            {**scope, "client": addresses[index % clients]},
+            receive,
+            send,
+        )
+    return time.perf_counter() - started
+
+
+def _bench_buckets(requests: int, clients: int) -> None:
+    buckets = TokenBuckets(64)
+    keys = [f"{ROUTE}:ip:{index}" for index in range(clients)]
+    started = time.perf_counter()
+    for index in range(requests):
+        buckets.take(keys[index % clients], GENEROUS, time.monotonic())
+    elapsed = time.perf_counter() - started
+    print(f"bucket take:        {elapsed / requests * 1e9:.0f}ns")
+
+    # 샤드 하나를 훑는 시간이 이벤트 루프를 한 번에 붙잡는 최대 시간이다.
+    for index in range(200_000):
+        buckets.take(f"idle:{index}", GENEROUS, 0.0)
+    started = time.perf_counter()
+    evicted = buckets.evict_shard(0, before=1.0)
+    elapsed = time.perf_counter() - started
+    print(f"evict one of 64 shards ({evicted} keys): {elapsed * 1e3:.2f}ms")
+
+
+async def _bench_shared(requests: int, clients: int) -> None:
+    buckets = PostgresBuckets()
+    started = time.perf_counter()
+    for index in range(requests):
+        async with async_session() as session:
+            await buckets.take(session, f"{ROUTE}:ip:{index % clients}", GENEROUS)
+    elapsed = time.perf_counter() - started
+    print(f"postgres take:      {elapsed / requests * 1e6:.0f}us")
+    async with async_session() as session:
+        await buckets.evict(session, idle_seconds=-1)
+
+
+async def main(args: argparse.Namespace) -> None:
+    rate_limiter.per_ip[ROUTE] = GENEROUS
+    plain = _build_app(limited=False)
+    limited = _build_app(limited=True)
+    await _drive(plain, 100, args.clients)
+    await _drive(limited, 100, args.clients)
+
+    # 번갈아 여러 번 돌려 가장 빠른 회차끼리 비교한다.
+    baseline = measured = float("inf")
+    for _ in range(args.rounds):
+        baseline = min(baseline, await _drive(plain, args.requests, args.clients))
+        measured = min(measured, await _drive(limited, args.requests, args.clients))
+    requests = args.requests
+    print(f"without limit: {baseline / requests * 1e6:.1f}us/request")
+    print(f"with limit:    {measured / requests * 1e6:.1f}us/request")
+    print(f"overhead:      {(measured - baseline) / requests * 1e6:.2f}us/request")
+
+    _bench_buckets(args.requests, args.clients)
+    if args.shared:
+        await _bench_shared(min(args.requests, 2000), args.clients)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=20000)
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--clients", type=int, default=10000)
+    parser.add_argument("--shared", action="store_true")
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,68 @@
+"""Season rating recompute: per-game Python loop vs wave-vectorised NumPy engine.
+
+python -m benchmarks.rating_recompute --players 100000 --games 1000000
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from app.core.config import settings
+from app.models.user import DEFAULT_RATING
+from app.services.ranking.rating import RatingEngine
+
+PLAYERS_PER_GAME = 4
+
+
+def scalar_season(user_ids: list[list[int]], placements: list[list[int]]) -> None:
+    # 기존 방식 기준선: 판마다 파이썬 루프
+    k_factor = settings.RATING_K_FACTOR / (PLAYERS_PER_GAME - 1)
+    scale = settings.RATING_SCALE
+    ratings: dict[int, float] = {}
+    for players, places in zip(user_ids, placements, strict=True):
+        before = [ratings.get(user_id, DEFAULT_RATING) for user_id in players]
+        for i, user_id in enumerate(players):
+            total = 0.0
+            for j, other in enumerate(before):
+                expected = 1 / (1 + 10 ** ((other - before[i]) / scale))
+                actual = (places[i] < places[j]) + 0.5 * (places[i] == places[j])
+                total += actual - expected
+            ratings[user_id] = before[i] + k_factor * total
+
+
+def main(players: int, games: int, chunk: int) -> None:
+    rng = np.random.default_rng(0)
+    user_ids = np.stack(
+        [rng.choice(players, PLAYERS_PER_GAME, replace=False) for _ in range(games)],
+    )
+    placements = np.argsort(rng.random((games, PLAYERS_PER_GAME)), axis=1) + 1
+
+    sample = min(games, 100_000)
+    started = time.perf_counter()
+    scalar_season(user_ids[:sample].tolist(), placements[:sample].tolist())
+    elapsed = time.perf_counter() - started
+    print(f"scalar loop:  {sample / elapsed:,.0f} games/s ({sample:,} games)")
+
+    engine = RatingEngine(settings.RATING_K_FACTOR, settings.RATING_SCALE)
+    started = time.perf_counter()
+    for start in range(0, games, chunk):
+        engine.process(
+            user_ids[start : start + chunk],
+            placements[start : start + chunk],
+        )
+    elapsed = time.perf_counter() - started
+    print(f"numpy engine: {games / elapsed:,.0f} games/s ({games:,} games)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--players", type=int, default=100_000)
+    parser.add_argument("--games", type=int, default=1_000_000)
+    parser.add_argument(
+        "--chunk",
+        type=int,
+        default=settings.RATING_RECOMPUTE_CHUNK_GAMES,
+    )
+    args = parser.parse_args()
+    main(args.players, args.games, args.chunk)
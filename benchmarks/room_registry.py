@@ -0,0 +1,88 @@
+"""Join and lobby-list latency with many concurrent rooms.
+
+python -m benchmarks.room_registry --rooms 50000 --operations 20000
+"""
+
+import argparse
+import random
+import statistics
+import time
+
+from app.core.config import SlowConsumerPolicy
+from app.services.game.room import MAX_PLAYERS, RoomRegistry, RoomState
+from app.services.gateway.manager import ConnectionManager
+from app.services.presence.registry import PresenceRegistry
+
+
+def _report(name: str, samples: list[float]) -> None:
+    quantiles = statistics.quantiles(samples, n=100)
+    print(
+        f"{name}: p50={quantiles[49] * 1e6:.1f}us p99={quantiles[98] * 1e6:.1f}us "
+        f"max={max(samples) * 1e6:.1f}us",
+    )
+
+
+def main(rooms: int, operations: int, page_size: int) -> None:
+    registry = RoomRegistry(
+        presence=PresenceRegistry(),
+        gateway=ConnectionManager(
+            max_queue=16,
+            policy=SlowConsumerPolicy.DROP_OLDEST,
+            heartbeat_interval=20,
+            idle_timeout=60,
+        ),
+    )
+    user_ids = iter(range(1, rooms * MAX_PLAYERS * 4))
+
+    started = time.perf_counter()
+    created = [registry.create(next(user_ids), "bench") for _ in range(rooms)]
+    for room in created:
+        for _ in range(random.randrange(MAX_PLAYERS)):
+            registry.join(next(user_ids), room.id)
+    print(f"setup {rooms} rooms in {time.perf_counter() - started:.2f}s")
+
+    quick_join: list[float] = []
+    for _ in range(operations):
+        if not registry.count(RoomState.WAITING):
+            registry.create(next(user_ids), "bench")
+        user_id = next(user_ids)
+        started = time.perf_counter()
+        room = registry.quick_join(user_id)
+        quick_join.append(time.perf_counter() - started)
+        if random.random() < 0.5:  # noqa: PLR2004
+            registry.leave(user_id, room.id)
+
+    join: list[float] = []
+    for _ in range(operations):
+        page, _ = registry.list_rooms(RoomState.WAITING, limit=1)
+        if not page:
+            registry.create(next(user_ids), "bench")
+            continue
+        user_id = next(user_ids)
+        started = time.perf_counter()
+        registry.join(user_id, page[0].id)
+        join.append(time.perf_counter() - started)
+
+    listing: list[float] = []
+    cursor = None
+    for _ in range(operations):
+        started = time.perf_counter()
+        _, cursor = registry.list_rooms(cursor=cursor, limit=page_size)
+        listing.append(time.perf_counter() - started)
+
+    print(
+        f"rooms={len(registry)} "
+        + " ".join(f"{state.value}={registry.count(state)}" for state in RoomState),
+    )
+    _report("quick_join", quick_join)
+    _report("join", join)
+    _report(f"list(limit={page_size})", listing)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rooms", type=int, default=50000)
+    parser.add_argument("--operations", type=int, default=20000)
+    parser.add_argument("--page-size", type=int, default=20)
+    args = parser.parse_args()
+    main(args.rooms, args.operations, args.page_size)
@@ -0,0 +1,98 @@
+"""Fan calculation throughput over random winning hands.
+
+python -m benchmarks.scoring --hands 20000 --duplicates 0.3
+"""
+
+import argparse
+import random
+import time
+
+from app.services.game.decomposition import MAX_COPIES, MeldKind, suit_table
+from app.services.game.scoring import Hand, Meld, WinContext, score_hand, score_hands
+from app.services.game.tile import SUIT_SIZE, TILE_KINDS, WINDS
+
+CHOW_STARTS = [
+    suit * SUIT_SIZE + rank for suit in range(3) for rank in range(SUIT_SIZE - 2)
+]
+
+
+def _random_set(used: list[int]) -> tuple[MeldKind, int]:
+    while True:
+        if random.random() < 0.6:  # noqa: PLR2004
+            tile = random.choice(CHOW_STARTS)
+            tiles = [tile, tile + 1, tile + 2]
+            kind = MeldKind.CHOW
+        else:
+            tile = random.randrange(TILE_KINDS)
+            tiles = [tile] * 3
+            kind = MeldKind.PUNG
+        if all(used[t] + tiles.count(t) <= MAX_COPIES for t in set(tiles)):
+            for t in tiles:
+                used[t] += 1
+            return kind, tile
+
+
+def random_hand() -> tuple[Hand, WinContext]:
+    used = [0] * TILE_KINDS
+    sets = [_random_set(used) for _ in range(4)]
+    pair = random.choice(
+        [tile for tile in range(TILE_KINDS) if used[tile] <= MAX_COPIES - 2],
+    )
+    used[pair] += 2
+
+    melds = [
+        Meld(kind, tile, concealed=False) for kind, tile in sets[: random.randrange(3)]
+    ]
+    concealed = [pair, pair]
+    for kind, tile in sets[len(melds) :]:
+        concealed += [tile, tile + 1, tile + 2] if kind is MeldKind.CHOW else [tile] * 3
+    winning_tile = concealed.pop(random.randrange(len(concealed)))
+    context = WinContext(
+        self_drawn=random.random() < 0.3,  # noqa: PLR2004
+        seat_wind=random.choice(WINDS),
+        prevalent_wind=random.choice(WINDS),
+    )
+    return Hand(concealed, winning_tile, melds), context
+
+
+def main(hands: int, duplicates: float) -> None:
+    started = time.perf_counter()
+    patterns = len(suit_table())
+    print(f"suit table: {patterns} patterns in {time.perf_counter() - started:.3f}s")
+
+    unique = [random_hand() for _ in range(hands)]
+    batch = [
+        random.choice(unique) if random.random() < duplicates else random_hand()
+        for _ in range(hands)
+    ]
+    print(f"{hands} hands, duplicates={duplicates:.0%}")
+
+    started = time.perf_counter()
+    valid = sum(
+        1
+        for hand, context in unique
+        if (result := score_hand(hand, context)) and result.is_valid
+    )
+    elapsed = time.perf_counter() - started
+    print(
+        f"score_hand: {hands / elapsed:,.0f} hands/s "
+        f"({elapsed / hands * 1e6:.1f}us/hand), {valid} reach 8 points",
+    )
+
+    started = time.perf_counter()
+    score_hands(batch)
+    elapsed = time.perf_counter() - started
+    print(
+        f"score_hands: {hands / elapsed:,.0f} hands/s "
+        f"({elapsed / hands * 1e6:.1f}us/hand)",
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--hands", type=int, default=20000)
+    parser.add_argument("--duplicates", type=float, default=0.3)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    random.seed(args.seed)
+    main(args.hands, args.duplicates)
@@ -0,0 +1,107 @@
+"""JSON response rendering and compression cost for representative payloads.
+
+python -m benchmarks.serialization --rounds 2000
+"""
+
+import argparse
+import time
+from collections.abc import Callable
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+from app.core.compression import BrotliCompressor, Compressor, GzipCompressor
+from app.core.config import settings
+from app.core.responses import FastJSONResponse
+from app.schemas.leaderboard import LeaderboardEntryResponse, LeaderboardResponse
+from app.schemas.room import RoomListResponse, RoomResponse
+from app.schemas.token_response import TokenResponse
+from app.services.game.room import RoomState
+
+
+def _payloads() -> dict[str, BaseModel]:
+    return {
+        "token": TokenResponse(
+            access_token="a" * 200,
+            refresh_token="r" * 200,
+            is_new_user=False,
+        ),
+        "room list (100)": RoomListResponse(
+            rooms=[
+                RoomResponse(
+                    id=room_id,
+                    name=f"방 {room_id}",
+                    host_id=room_id * 4,
+                    state=RoomState.WAITING,
+                    player_ids=[room_id * 4, room_id * 4 + 1],
+                    ready_ids=[room_id * 4 + 1],
+                    seats_free=2,
+                )
+                for room_id in range(100)
+            ],
+            next_cursor=100,
+        ),
+        "leaderboard (500)": LeaderboardResponse(
+            entries=[
+                LeaderboardEntryResponse(
+                    rank=rank,
+                    user_id=rank * 7,
+                    rating=2500 - rank * 1.37,
+                )
+                for rank in range(1, 501)
+            ],
+            total=1_000_000,
+        ),
+    }
+
+
+def _timed(name: str, rounds: int, operation: Callable[[], object]) -> None:
+    started = time.perf_counter()
+    for _ in range(rounds):
+        operation()
+    elapsed = time.perf_counter() - started
+    print(f"  {name}: {elapsed / rounds * 1e6:.1f}us")
+
+
+def _compress(compressor: Compressor, body: bytes) -> bytes:
+    return compressor.compress(body) + compressor.finish()
+
+
+def main(rounds: int) -> None:
+    for name, model in _payloads().items():
+        body = FastJSONResponse(model).body
+        print(f"{name} ({len(body):,} bytes)")
+        # 기준선: FastAPI 기본 경로(jsonable_encoder 후 json.dumps)
+        _timed(
+            "JSONResponse(jsonable_encoder)",
+            rounds,
+            lambda model=model: JSONResponse(jsonable_encoder(model)),
+        )
+        _timed(
+            "FastJSONResponse(dict)",
+            rounds,
+            lambda model=model: FastJSONResponse(model.model_dump(mode="json")),
+        )
+        _timed(
+            "FastJSONResponse(model)",
+            rounds,
+            lambda model=model: FastJSONResponse(model),
+        )
+        for label, factory in (
+            ("gzip", lambda: GzipCompressor(settings.RESPONSE_GZIP_LEVEL)),
+            ("br", lambda: BrotliCompressor(settings.RESPONSE_BROTLI_QUALITY)),
+        ):
+            size = len(_compress(factory(), body))
+            _timed(
+                f"{label} -> {size:,} bytes",
+                rounds,
+                lambda factory=factory, body=body: _compress(factory(), body),
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rounds", type=int, default=2000)
+    args = parser.parse_args()
+    main(args.rounds)
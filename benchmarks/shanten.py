@@ -0,0 +1,74 @@
+"""Win detection and shanten throughput on random hands.
+
+python -m benchmarks.shanten --hands 50000
+"""
+
+import argparse
+import random
+import time
+from collections.abc import Callable
+
+from app.services.game.decomposition import MAX_COPIES, waiting_tiles
+from app.services.game.shanten import (
+    ShantenTables,
+    can_win_on,
+    effective_tiles,
+    get_tables,
+    shanten,
+    standard_shanten,
+)
+from app.services.game.tile import TILE_KINDS, TileCounts
+
+WALL = [tile for tile in range(TILE_KINDS) for _ in range(MAX_COPIES)]
+
+
+def _random_hand() -> TileCounts:
+    counts = [0] * TILE_KINDS
+    for tile in random.sample(WALL, 13):
+        counts[tile] += 1
+    return counts
+
+
+def _measure[T](name: str, hands: list[T], evaluate: Callable[[T], object]) -> None:
+    started = time.perf_counter()
+    for hand in hands:
+        evaluate(hand)
+    elapsed = time.perf_counter() - started
+    print(
+        f"{name}: {len(hands) / elapsed:,.0f}/s "
+        f"({elapsed / len(hands) * 1e6:.2f}us/hand)",
+    )
+
+
+def main(hands: int, *, build: bool) -> None:
+    started = time.perf_counter()
+    get_tables()
+    print(f"load packed tables: {time.perf_counter() - started:.3f}s")
+    if build:
+        started = time.perf_counter()
+        ShantenTables.build()
+        print(f"build tables: {time.perf_counter() - started:.3f}s")
+
+    samples = [_random_hand() for _ in range(hands)]
+    claims = [(counts, random.randrange(TILE_KINDS)) for counts in samples]
+    histogram: dict[int, int] = {}
+    for counts in samples:
+        value = shanten(counts)
+        histogram[value] = histogram.get(value, 0) + 1
+    print(f"{hands} hands, shanten histogram {dict(sorted(histogram.items()))}")
+
+    _measure("can_win_on", claims, lambda claim: can_win_on(*claim))
+    _measure("standard_shanten", samples, standard_shanten)
+    _measure("shanten (with special shapes)", samples, shanten)
+    _measure("waiting_tiles", samples, waiting_tiles)
+    _measure("effective_tiles", samples[: hands // 10], effective_tiles)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--hands", type=int, default=50000)
+    parser.add_argument("--build", action="store_true")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    random.seed(args.seed)
+    main(args.hands, build=args.build)
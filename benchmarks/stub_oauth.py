@@ -0,0 +1,91 @@
+import asyncio
+import json
+from dataclasses import dataclass, field
+
+TOKEN_PATH = "/token"
+USER_INFO_PATH = "/userinfo"
+JWKS_PATH = "/certs"
+
+
+@dataclass
+class StubOAuthServer:
+    # Google token/userinfo 엔드포인트를 흉내 내는 HTTP/1.1 keep-alive 서버.
+    # 수락한 TCP 연결 수를 세어 커넥션 재사용 여부를 확인할 수 있다.
+    host: str = "127.0.0.1"
+    port: int = 0
+    latency: float = 0.0
+    email: str = "bench@example.com"
+    jwks: dict = field(default_factory=lambda: {"keys": []})
+    connections: int = 0
+    requests: int = 0
+    _server: asyncio.Server | None = None
+
+    @property
+    def base_url(self) -> str:
+        return f"http://{self.host}:{self.port}"
+
+    async def start(self) -> None:
+        self._server = await asyncio.start_server(self._handle, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    async def stop(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+
+    async def __aenter__(self) -> "StubOAuthServer":
+        await self.start()
+        return self
+
+    async def __aexit__(self, *_exc: object) -> None:
+        await self.stop()
+
+    def _body_for(self, path: str) -> dict:
+        if path.startswith(TOKEN_PATH):
+            return {
+                "access_token": "stub_access_token",
+                "expires_in": 3600,
+                "token_type": "Bearer",
+                "scope": "openid email profile",
+            }
+        if path.startswith(USER_INFO_PATH):
+            return {"email": self.email, "verified_email": True}
+        if path.startswith(JWKS_PATH):
+            return self.jwks
+        return {}
+
+    async def _handle(
+        self,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+    ) -> None:
+        self.connections += 1
+        try:
+            while True:
+                head = await reader.readuntil(b"\r\n\r\n")
+                lines = head.decode("latin-1").split("\r\n")
+                path = lines[0].split(" ")[1]
+                length = 0
+                for line in lines[1:]:
+                    name, _, value = line.partition(":")
+                    if name.lower() == "content-length":
+                        length = int(value)
+                if length:
+                    await reader.readexactly(length)
+
+                if self.latency:
+                    await asyncio.sleep(self.latency)
+                self.requests += 1
+                body = json.dumps(self._body_for(path)).encode()
+                writer.write(
+                    b"HTTP/1.1 200 OK\r\n"
+                    b"Content-Type: application/json\r\n"
+                    b"Cache-Control: public, max-age=3600\r\n"
+                    + f"Content-Length: {len(body)}\r\n\r\n".encode()
+                    + body,
+                )
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionResetError):
+            pass
+        finally:
+            writer.close()
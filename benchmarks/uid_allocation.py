@@ -0,0 +1,73 @@
+"""Signup uid allocation: legacy randint+SELECT loop vs prefetched Feistel allocator.
+
+python -m benchmarks.uid_allocation --signups 5000 --db-latency-ms 0.3 --fill 0.5
+"""
+
+import argparse
+import asyncio
+import random
+import time
+from types import SimpleNamespace
+
+from app.core.config import settings
+from app.services.auth.uid_allocator import FeistelPermutation, UidAllocator
+
+
+class FakeSession:
+    # 매 쿼리마다 왕복 지연을 흉내 내고, fill 비율만큼 기존 uid와 충돌시킨다.
+    def __init__(self, latency: float, fill: float) -> None:
+        self.latency = latency
+        self.fill = fill
+        self.queries = 0
+        self.sequence = 0
+
+    async def execute(self, _statement: object, params: dict | None = None) -> object:
+        self.queries += 1
+        await asyncio.sleep(self.latency)
+        if params is not None:
+            start = self.sequence
+            self.sequence += params["n"]
+            values = list(range(start, self.sequence))
+            return SimpleNamespace(scalars=lambda: SimpleNamespace(all=lambda: values))
+        existing = random.random() < self.fill
+        return SimpleNamespace(
+            scalar_one_or_none=lambda: object() if existing else None
+        )
+
+
+async def legacy_generate(db: FakeSession) -> str:
+    while True:
+        uid = str(random.randint(100000000, 999999999))
+        result = await db.execute(uid)
+        if not result.scalar_one_or_none():  # type: ignore[attr-defined]
+            return uid
+
+
+async def main(signups: int, latency: float, fill: float) -> None:
+    allocator = UidAllocator(
+        FeistelPermutation(settings.UID_PERMUTATION_KEY, 6),
+        prefetch_size=settings.UID_PREFETCH_SIZE,
+    )
+    scenarios = (
+        ("legacy", legacy_generate),
+        ("allocator", allocator.allocate),
+    )
+    for name, generate in scenarios:
+        session = FakeSession(latency, fill)
+        started = time.perf_counter()
+        for _ in range(signups):
+            await generate(session)  # type: ignore[operator]
+        elapsed = time.perf_counter() - started
+        print(
+            f"{name:>9}: {signups / elapsed:,.0f} signups/s, "
+            f"{session.queries / signups:.2f} queries/signup",
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--signups", type=int, default=5000)
+    parser.add_argument("--db-latency-ms", type=float, default=0.3)
+    parser.add_argument("--fill", type=float, default=0.5)
+    args = parser.parse_args()
+    asyncio.run(main(args.signups, args.db_latency_ms / 1000, args.fill))
@@ -0,0 +1,128 @@
+"""Fan-out latency of the WebSocket gateway for 4-player tables.
+
+python -m benchmarks.ws_fanout --tables 250 --rounds 50 --idle 5000
+
+서버(uvicorn)와 클라이언트가 같은 이벤트 루프에서 돌기 때문에 측정값에는
+클라이언트 수신 처리 시간도 포함된다. DB 없이 돌도록 identity 캐시를 미리 채운다.
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import time
+
+import uvicorn
+from websockets.asyncio.client import ClientConnection, connect
+
+from app.core.config import settings
+from app.core.security import create_access_token
+from app.main import app
+from app.schemas.user_identity import UserIdentity
+from app.services.auth.user_service import identity_cache
+from app.services.gateway.connection import Connection
+from app.services.gateway.manager import connection_manager
+
+PLAYERS_PER_TABLE = 4
+HOST = "127.0.0.1"
+
+
+def _token(user_id: int) -> str:
+    email = f"bench{user_id}@example.com"
+    identity_cache.set_with_ttl(
+        email,
+        UserIdentity(
+            id=user_id,
+            uid=str(100_000_000 + user_id),
+            nickname=f"bench{user_id}",
+            email=email,
+            is_active=True,
+        ),
+        3600,
+    )
+    return create_access_token({"sub": email})
+
+
+async def _join_table(connection: Connection, message: dict) -> None:
+    connection_manager.subscribe(connection, f"table:{message['table']}")
+    connection.send(json.dumps({"type": "joined"}))
+
+
+async def _open(url: str, user_id: int) -> ClientConnection:
+    return await connect(f"{url}?token={_token(user_id)}", max_queue=None)
+
+
+async def _receive(websocket: ClientConnection, latencies: list[float]) -> None:
+    async for raw in websocket:
+        message = json.loads(raw)
+        if message.get("type") == "discard":
+            latencies.append(time.perf_counter() - message["sent"])
+
+
+async def main(tables: int, rounds: int, idle: int, port: int) -> None:
+    connection_manager.register_handler("join", _join_table)
+    identity_cache.maxsize = max(identity_cache.maxsize, tables * 4 + idle)
+    server = uvicorn.Server(
+        uvicorn.Config(app, host=HOST, port=port, lifespan="off", log_level="warning"),
+    )
+    serving = asyncio.create_task(server.serve())
+    while not server.started:
+        await asyncio.sleep(0.01)
+
+    url = f"ws://{HOST}:{port}{settings.API_V1_STR}/ws"
+    idle_clients = [await _open(url, tables * 4 + i) for i in range(idle)]
+
+    players: list[ClientConnection] = []
+    for table in range(tables):
+        for seat in range(PLAYERS_PER_TABLE):
+            websocket = await _open(url, table * PLAYERS_PER_TABLE + seat)
+            await websocket.send(json.dumps({"type": "join", "table": table}))
+            await websocket.recv()
+            players.append(websocket)
+
+    latencies: list[float] = []
+    receivers = [
+        asyncio.create_task(_receive(websocket, latencies)) for websocket in players
+    ]
+
+    started = time.perf_counter()
+    for _ in range(rounds):
+        for table in range(tables):
+            connection_manager.publish(
+                f"table:{table}",
+                {"type": "discard", "tile": "1m", "sent": time.perf_counter()},
+            )
+        await asyncio.sleep(0.01)
+
+    expected = rounds * tables * PLAYERS_PER_TABLE
+    while len(latencies) < expected and time.perf_counter() - started < 60:  # noqa: PLR2004
+        await asyncio.sleep(0.01)
+    elapsed = time.perf_counter() - started
+
+    for task in receivers:
+        task.cancel()
+    for websocket in players + idle_clients:
+        await websocket.close()
+    server.should_exit = True
+    await serving
+
+    quantiles = statistics.quantiles(latencies, n=100)
+    print(
+        f"tables={tables} idle={idle} messages={len(latencies)}/{expected} "
+        f"in {elapsed:.2f}s",
+    )
+    print(
+        f"fan-out latency p50={quantiles[49] * 1e3:.2f}ms "
+        f"p95={quantiles[94] * 1e3:.2f}ms p99={quantiles[98] * 1e3:.2f}ms",
+    )
+    print(f"gateway={connection_manager.stats()}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--tables", type=int, default=250)
+    parser.add_argument("--rounds", type=int, default=50)
+    parser.add_argument("--idle", type=int, default=0)
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args()
+    asyncio.run(main(args.tables, args.rounds, args.idle, args.port))
@@ -6,6 +6,10 @@ from sqlalchemy import engine_from_config, pool
 from app.core.config import settings
 
 # Import your SQLModel models
+from app.models.event_bus import EventBusOverflow
+from app.models.game_event import GameEvent, GamePlayer, GameSnapshot
+from app.models.rate_limit import RateLimitBucket
+from app.models.revoked_token import RevokedToken
 from app.models.user import User
 
 # this is the Alembic Config object, which provides
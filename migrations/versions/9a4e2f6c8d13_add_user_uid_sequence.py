@@ -0,0 +1,31 @@
+"""add user uid sequence
+
+Revision ID: 9a4e2f6c8d13
+Revises: 3c1d9a7e5b21
+Create Date: 2026-10-17 11:03:27.118452
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "9a4e2f6c8d13"
+down_revision: Union[str, None] = "3c1d9a7e5b21"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute(
+        sa.schema.CreateSequence(
+            sa.Sequence("user_uid_seq", start=0, minvalue=0, maxvalue=899999999)
+        )
+    )
+
+
+def downgrade() -> None:
+    op.execute(sa.schema.DropSequence(sa.Sequence("user_uid_seq")))
@@ -0,0 +1,102 @@
+import pytest
+from fastapi import WebSocketDisconnect, status
+from fastapi.testclient import TestClient
+
+from app.core.config import settings
+from app.core.security import create_access_token, create_refresh_token
+from app.main import app
+from app.models.user import UserStatus
+from app.schemas.user_identity import UserIdentity
+from app.services.gateway.manager import connection_manager
+from app.services.presence.registry import presence_registry
+
+WS_URL = f"{settings.API_V1_STR}/ws"
+USER_ID = 1
+
+
+@pytest.fixture
+def identity(mocker):
+    identity = UserIdentity(
+        id=USER_ID,
+        uid="123456789",
+        nickname="tester",
+        email="test@example.com",
+        is_active=True,
+    )
+    mocker.patch(
+        "app.api.v1.endpoints.gateway.get_user_identity",
+        return_value=identity,
+    )
+    return identity
+
+
+@pytest.fixture
+def ws_client():
+    return TestClient(app)
+
+
+@pytest.fixture
+def isolated_handlers(monkeypatch):
+    # 테스트에서 등록한 핸들러가 전역 매니저에 남지 않도록 복사본을 쓴다.
+    monkeypatch.setattr(
+        connection_manager,
+        "_handlers",
+        dict(connection_manager._handlers),
+    )
+
+
+def test_rejects_missing_token(ws_client, identity):
+    with (
+        pytest.raises(WebSocketDisconnect) as exc_info,
+        ws_client.websocket_connect(
+            WS_URL,
+        ),
+    ):
+        pass
+    assert exc_info.value.code == status.WS_1008_POLICY_VIOLATION
+
+
+def test_rejects_refresh_token(ws_client, identity):
+    token = create_refresh_token({"sub": identity.email})
+    with (
+        pytest.raises(WebSocketDisconnect) as exc_info,
+        ws_client.websocket_connect(
+            f"{WS_URL}?token={token}",
+        ),
+    ):
+        pass
+    assert exc_info.value.code == status.WS_1008_POLICY_VIOLATION
+
+
+def test_ping_and_presence(ws_client, identity):
+    token = create_access_token({"sub": identity.email})
+    with ws_client.websocket_connect(
+        WS_URL,
+        headers={"Authorization": f"Bearer {token}"},
+    ) as websocket:
+        assert presence_registry.get_status(USER_ID) is UserStatus.ONLINE
+        websocket.send_json({"type": "ping"})
+        assert websocket.receive_json() == {"type": "pong"}
+
+    assert presence_registry.get_status(USER_ID) is UserStatus.OFFLINE
+    assert len(connection_manager) == 0
+
+
+def test_publish_reaches_topic_subscribers(ws_client, identity, isolated_handlers):
+    async def join_table(connection, message):
+        connection_manager.subscribe(connection, f"table:{message['table']}")
+        connection_manager.publish(
+            f"table:{message['table']}",
+            {"type": "joined", "user_id": connection.user_id},
+        )
+
+    connection_manager.register_handler("join", join_table)
+    token = create_access_token({"sub": identity.email})
+    with ws_client.websocket_connect(f"{WS_URL}?token={token}") as websocket:
+        websocket.send_json({"type": "join", "table": 7})
+        assert websocket.receive_json() == {"type": "joined", "user_id": USER_ID}
+
+        websocket.send_json({"type": "unknown"})
+        assert websocket.receive_json()["type"] == "error"
+
+    assert connection_manager.subscribers("table:7") == 0
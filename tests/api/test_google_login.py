@@ -2,6 +2,9 @@ import pytest
 from fastapi import status
 from httpx import HTTPStatusError
 
+from app.services.ratelimit.buckets import RateLimit
+from app.services.ratelimit.limiter import rate_limiter
+
 
 async def test_get_google_login_url(client):
     response = await client.get("/api/v1/auth/login/google")
@@ -39,3 +42,22 @@ async def test_google_callback_error(client, mocker):
     response = await client.get("/api/v1/auth/login/google/callback?code=invalid_code")
     assert response.status_code == status.HTTP_400_BAD_REQUEST
     assert response.json()["detail"] == "Failed to get token from Google"
+
+
+async def test_google_callback_is_rate_limited_per_ip(
+    client,
+    mock_google_client,
+    mocker,
+):
+    mocker.patch.dict(
+        rate_limiter.per_ip,
+        {"google_callback": RateLimit(capacity=2, refill=0.1)},
+    )
+    url = "/api/v1/auth/login/google/callback?code=test_code"
+    statuses = [(await client.get(url)).status_code for _ in range(2)]
+    response = await client.get(url)
+
+    assert statuses == [status.HTTP_200_OK] * 2
+    assert response.status_code == status.HTTP_429_TOO_MANY_REQUESTS
+    assert response.headers["Retry-After"] == "10"
+    assert mock_google_client.post.call_count == len(statuses)
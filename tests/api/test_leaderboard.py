@@ -0,0 +1,65 @@
+import pytest
+from fastapi import status
+
+from app.api.deps import get_current_user
+from app.core.config import settings
+from app.core.error import DomainErrorCode
+from app.main import app
+from app.schemas.user_identity import UserIdentity
+from app.services.ranking.leaderboard import Leaderboard
+
+LEADERBOARD_URL = f"{settings.API_V1_STR}/leaderboard"
+
+
+@pytest.fixture(autouse=True)
+def board(mocker):
+    board = Leaderboard(0.0, 4000.0, 0.01)
+    board.load({user_id: 1000.0 + 10 * user_id for user_id in range(1, 31)})
+    mocker.patch("app.api.v1.endpoints.leaderboard.leaderboard", board)
+    return board
+
+
+@pytest.fixture
+def as_user():
+    def _as_user(user_id):
+        app.dependency_overrides[get_current_user] = lambda: UserIdentity(
+            id=user_id,
+            uid=str(100_000_000 + user_id),
+            nickname=f"user{user_id}",
+        )
+
+    return _as_user
+
+
+async def test_top_players(client, as_user):
+    as_user(1)
+    response = await client.get(LEADERBOARD_URL, params={"limit": 3, "offset": 1})
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == {
+        "entries": [
+            {"rank": 2, "user_id": 29, "rating": 1290.0},
+            {"rank": 3, "user_id": 28, "rating": 1280.0},
+            {"rank": 4, "user_id": 27, "rating": 1270.0},
+        ],
+        "total": 30,
+    }
+
+
+async def test_around_me(client, as_user, board):
+    as_user(10)
+    response = await client.get(f"{LEADERBOARD_URL}/me", params={"radius": 1})
+
+    assert [entry["user_id"] for entry in response.json()["entries"]] == [11, 10, 9]
+
+    board.update(10, 2000.0)
+    response = await client.get(f"{LEADERBOARD_URL}/me", params={"radius": 1})
+    assert [entry["rank"] for entry in response.json()["entries"]] == [1, 2]
+
+
+async def test_unranked_user(client, as_user):
+    as_user(99)
+    response = await client.get(f"{LEADERBOARD_URL}/me")
+
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+    assert response.json()["code"] == DomainErrorCode.NOT_RANKED
@@ -5,3 +5,27 @@ async def test_health_check(client):
     response = await client.get("/health")
     assert response.status_code == status.HTTP_200_OK
     assert response.json()["message"] == "healthy"
+
+
+async def test_readiness_reports_database(client, mocker):
+    ping = mocker.patch("app.main.ping_database", return_value=True)
+    ready = await client.get("/health/ready")
+    ping.return_value = False
+    unavailable = await client.get("/health/ready")
+
+    assert ready.status_code == status.HTTP_200_OK
+    assert ready.json()["message"] == "ready"
+    assert unavailable.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
+
+
+async def test_metrics_exposition(client):
+    await client.get("/health")
+    response = await client.get("/metrics")
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    assert (
+        'http_request_duration_seconds_count{method="GET",route="/health",status="200"}'
+        in response.text
+    )
+    assert "# TYPE db_query_duration_seconds histogram" in response.text
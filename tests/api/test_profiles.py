@@ -0,0 +1,66 @@
+import pytest
+from fastapi import status
+
+from app.core.config import settings
+from app.core.error import DomainErrorCode
+from app.core.security import PROFILE_SIGNATURE_HEADER, sign_profile_request
+from app.services.profiling.store import ProfileStore
+from app.services.profiling.watchdog import LoopStall
+
+PROFILES_URL = f"{settings.API_V1_STR}/profiles"
+PROFILE_ID = "1700000000000-0a0b0c0d"
+
+
+@pytest.fixture
+def store(mocker, tmp_path):
+    mocker.patch.object(settings, "PROFILING_ENABLED", True)
+    store = ProfileStore(str(tmp_path), 10)
+    store.save(PROFILE_ID, "main;handler 3\n")
+    mocker.patch("app.api.v1.endpoints.profiles.profile_store", store)
+    return store
+
+
+def signed(path):
+    return {PROFILE_SIGNATURE_HEADER: sign_profile_request("GET", path)}
+
+
+async def test_profiles_are_hidden_when_disabled(client):
+    response = await client.get(PROFILES_URL, headers=signed(PROFILES_URL))
+
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+@pytest.mark.usefixtures("store")
+async def test_profiles_require_signature(client):
+    unsigned = await client.get(PROFILES_URL)
+    wrong_path = await client.get(PROFILES_URL, headers=signed("/health"))
+
+    assert unsigned.status_code == status.HTTP_403_FORBIDDEN
+    assert wrong_path.status_code == status.HTTP_403_FORBIDDEN
+
+
+@pytest.mark.usefixtures("store")
+async def test_list_and_download_profile(client):
+    listed = await client.get(PROFILES_URL, headers=signed(PROFILES_URL))
+    download_url = f"{PROFILES_URL}/{PROFILE_ID}"
+    downloaded = await client.get(download_url, headers=signed(download_url))
+    missing_url = f"{PROFILES_URL}/1700000000001-00000000"
+    missing = await client.get(missing_url, headers=signed(missing_url))
+
+    assert listed.status_code == status.HTTP_200_OK
+    assert [item["profile_id"] for item in listed.json()["profiles"]] == [PROFILE_ID]
+    assert downloaded.text == "main;handler 3\n"
+    assert missing.json()["code"] == DomainErrorCode.PROFILE_NOT_FOUND
+
+
+@pytest.mark.usefixtures("store")
+async def test_list_loop_stalls(client, mocker):
+    monitor = mocker.patch("app.api.v1.endpoints.profiles.loop_lag_monitor")
+    monitor.stalls = [LoopStall(1.0, 0.25, ["app.main:handler:10"])]
+    url = f"{PROFILES_URL}/stalls"
+
+    response = await client.get(url, headers=signed(url))
+
+    assert response.json()["stalls"] == [
+        {"started_at": 1.0, "duration": 0.25, "stack": ["app.main:handler:10"]},
+    ]
@@ -0,0 +1,84 @@
+import pytest
+from fastapi import status
+
+from app.api.deps import get_current_user
+from app.core.config import settings
+from app.core.error import DomainErrorCode
+from app.core.security import create_access_token
+from app.main import app
+from app.schemas.user_identity import UserIdentity
+from app.services.game.room import RoomRegistry, RoomState, room_registry
+from app.services.ratelimit.buckets import RateLimit
+from app.services.ratelimit.limiter import rate_limiter
+
+ROOMS_URL = f"{settings.API_V1_STR}/rooms"
+
+
+@pytest.fixture
+def as_user():
+    def _as_user(user_id):
+        app.dependency_overrides[get_current_user] = lambda: UserIdentity(
+            id=user_id,
+            uid=str(100_000_000 + user_id),
+            nickname=f"user{user_id}",
+            email=f"user{user_id}@example.com",
+            is_active=True,
+        )
+
+    return _as_user
+
+
+@pytest.fixture(autouse=True)
+def fresh_registry(mocker):
+    registry = RoomRegistry(room_registry.presence, room_registry.gateway)
+    mocker.patch("app.api.v1.endpoints.room.room_registry", registry)
+    return registry
+
+
+async def test_room_lifecycle(client, as_user):
+    as_user(1)
+    response = await client.post(ROOMS_URL, json={"name": "table"})
+    assert response.status_code == status.HTTP_200_OK
+    room_id = response.json()["id"]
+
+    as_user(2)
+    response = await client.post(f"{ROOMS_URL}/quick-join")
+    assert response.json()["id"] == room_id
+    assert response.json()["player_ids"] == [1, 2]
+
+    response = await client.get(ROOMS_URL, params={"state": RoomState.WAITING.value})
+    assert [room["id"] for room in response.json()["rooms"]] == [room_id]
+
+    response = await client.post(f"{ROOMS_URL}/{room_id}/start")
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+    assert response.json()["code"] == DomainErrorCode.NOT_ROOM_HOST
+
+    response = await client.post(f"{ROOMS_URL}/{room_id}/leave")
+    assert response.status_code == status.HTTP_200_OK
+
+
+async def test_get_missing_room(client, as_user):
+    as_user(1)
+    response = await client.get(f"{ROOMS_URL}/999")
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+    assert response.json()["code"] == DomainErrorCode.ROOM_NOT_FOUND
+
+
+async def test_create_room_is_rate_limited_per_user(client, as_user, mocker):
+    mocker.patch.dict(
+        rate_limiter.per_user,
+        {"create_room": RateLimit(capacity=1, refill=0.5)},
+    )
+    as_user(1)
+    first = {"Authorization": f"Bearer {create_access_token({'sub': 'a@x.com'})}"}
+    second = {"Authorization": f"Bearer {create_access_token({'sub': 'b@x.com'})}"}
+
+    response = await client.post(ROOMS_URL, json={"name": "a"}, headers=first)
+    assert response.status_code == status.HTTP_200_OK
+    response = await client.post(ROOMS_URL, json={"name": "b"}, headers=first)
+    assert response.status_code == status.HTTP_429_TOO_MANY_REQUESTS
+    assert response.headers["Retry-After"] == "2"
+
+    # 다른 사용자는 자기 버킷을 쓴다. 방 중복 입장은 한도와 별개로 422다.
+    response = await client.post(ROOMS_URL, json={"name": "b"}, headers=second)
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
@@ -4,12 +4,17 @@ import pytest
 import pytest_asyncio
 from dotenv import load_dotenv
 from httpx import ASGITransport, AsyncClient
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import NullPool
+from sqlmodel import SQLModel
 
-from app.db.session import get_session
+from app.core.config import get_test_settings
+from app.db.session import get_read_session, get_write_session
 from app.main import app
 from app.models.user import User
 from app.schemas.google_oauth import GoogleTokenResponse, GoogleUserInfo
+from app.services.auth.revocation import revocation_denylist
+from app.services.ratelimit.limiter import rate_limiter
 
 
 @pytest.fixture(scope="session", autouse=True)
@@ -19,6 +24,18 @@ def setup_test_environment():
     load_dotenv(".env", override=True)
 
 
+@pytest.fixture(autouse=True)
+def reset_rate_limits():
+    # 테스트 클라이언트는 모두 같은 주소라서 앞 테스트가 쓴 버킷을 비운다.
+    rate_limiter.reset()
+
+
+@pytest.fixture(autouse=True)
+def loaded_revocation_denylist(monkeypatch):
+    # lifespan의 동기화 루프가 돌지 않으므로 빈 filter를 불러온 상태로 둔다.
+    monkeypatch.setattr(revocation_denylist, "loaded", True)
+
+
 @pytest.fixture
 def mock_user():
     return User(
@@ -35,11 +52,28 @@ def mock_session(mocker, mock_user):
 
     mock_result = mocker.Mock()
     mock_result.scalar_one_or_none.return_value = mock_user
+    mock_result.scalar_one.return_value = mock_user
+    mock_result.scalars.return_value.all.return_value = [0]
     session.execute = AsyncMock(return_value=mock_result)
 
     return session
 
 
+@pytest.fixture
+def identity_session(mocker, mock_session, mock_user):
+    mock_user.id = 1
+    row = mocker.Mock()
+    row._asdict.return_value = {
+        "id": mock_user.id,
+        "uid": mock_user.uid,
+        "nickname": mock_user.nickname,
+        "email": mock_user.email,
+        "is_active": mock_user.is_active,
+    }
+    mock_session.execute.return_value.one_or_none.return_value = row
+    return mock_session
+
+
 @pytest.fixture
 def mock_google_client(mocker, mock_google_responses):
     def _create_mock_response(response_data):
@@ -49,7 +83,6 @@ def mock_google_client(mocker, mock_google_responses):
         return mock_response
 
     mock_client = mocker.AsyncMock()
-    mock_client.__aenter__.return_value = mock_client
 
     mock_client.post.return_value = _create_mock_response(
         mock_google_responses["token_response"],
@@ -58,7 +91,10 @@ def mock_google_client(mocker, mock_google_responses):
         mock_google_responses["userinfo_response"],
     )
 
-    mocker.patch("httpx.AsyncClient", return_value=mock_client)
+    mocker.patch(
+        "app.services.auth.google.get_http_client",
+        return_value=mock_client,
+    )
     yield mock_client
 
 
@@ -85,10 +121,47 @@ def mock_google_responses():
 
 @pytest_asyncio.fixture
 async def client(mock_session):
-    app.dependency_overrides[get_session] = lambda: mock_session
+    app.dependency_overrides[get_write_session] = lambda: mock_session
+    app.dependency_overrides[get_read_session] = lambda: mock_session
     async with AsyncClient(
         transport=ASGITransport(app=app),
         base_url="http://test",
     ) as client:
         yield client
     app.dependency_overrides.clear()
+
+
+@pytest_asyncio.fixture
+async def test_engine():
+    test_settings = get_test_settings()
+    engine = create_async_engine(
+        test_settings.database_uri,
+        echo=False,
+        future=True,
+        poolclass=NullPool,
+    )
+
+    async with engine.begin() as conn:
+        await conn.run_sync(SQLModel.metadata.create_all)
+    yield engine
+
+    async with engine.begin() as conn:
+        await conn.run_sync(SQLModel.metadata.drop_all)
+    await engine.dispose()
+
+
+@pytest_asyncio.fixture
+async def test_db_session(test_engine) -> AsyncSession:
+    async_session = async_sessionmaker(
+        bind=test_engine,
+        class_=AsyncSession,
+        expire_on_commit=False,
+        autoflush=False,
+    )
+
+    async with async_session() as session:
+        try:
+            yield session
+        finally:
+            await session.rollback()
+            await session.close()
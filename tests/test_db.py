@@ -1,46 +1,5 @@
-import pytest_asyncio
 from sqlalchemy import text
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
-from sqlalchemy.pool import NullPool
-from sqlmodel import SQLModel
-
-from app.core.config import get_test_settings
-
-
-@pytest_asyncio.fixture
-async def test_engine():
-    test_settings = get_test_settings()
-    engine = create_async_engine(
-        test_settings.database_uri,
-        echo=False,
-        future=True,
-        poolclass=NullPool,
-    )
-
-    async with engine.begin() as conn:
-        await conn.run_sync(SQLModel.metadata.create_all)
-    yield engine
-
-    async with engine.begin() as conn:
-        await conn.run_sync(SQLModel.metadata.drop_all)
-    await engine.dispose()
-
-
-@pytest_asyncio.fixture
-async def test_db_session(test_engine) -> AsyncSession:
-    async_session = async_sessionmaker(
-        bind=test_engine,
-        class_=AsyncSession,
-        expire_on_commit=False,
-        autoflush=False,
-    )
-
-    async with async_session() as session:
-        try:
-            yield session
-        finally:
-            await session.rollback()
-            await session.close()
+from sqlalchemy.ext.asyncio import AsyncSession
 
 
 async def test_db_connection(test_db_session: AsyncSession):
@@ -0,0 +1,24 @@
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import ProgrammingError
+
+from app.core.metrics import db_query_duration, db_query_errors
+from app.db.session import QUERY_STARTED_KEY, instrument_engine
+
+ENGINE_NAME = "test"
+
+
+async def test_engine_hooks_time_queries_and_errors(test_engine):
+    instrument_engine(test_engine, ENGINE_NAME)
+    selects = db_query_duration.count(ENGINE_NAME, "SELECT")
+    errors = db_query_errors.value(ENGINE_NAME, "SELECT")
+
+    async with test_engine.connect() as conn:
+        await conn.execute(text("SELECT 1"))
+        with pytest.raises(ProgrammingError):
+            await conn.execute(text("SELECT * FROM missing_table"))
+        info = (await conn.get_raw_connection()).info
+
+    assert db_query_duration.count(ENGINE_NAME, "SELECT") == selects + 1
+    assert db_query_errors.value(ENGINE_NAME, "SELECT") == errors + 1
+    assert not info.get(QUERY_STARTED_KEY)
@@ -0,0 +1,34 @@
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.core.config import get_test_settings
+from app.db.session import create_db_engine
+
+
+@pytest.fixture
+def replica_uri():
+    uri = get_test_settings().DATABASE_READ_REPLICA_URI
+    if not uri:
+        pytest.skip("DATABASE_READ_REPLICA_URI is not configured")
+    return uri
+
+
+async def _system_identifier(engine) -> int:
+    async with async_sessionmaker(engine, class_=AsyncSession)() as session:
+        result = await session.execute(
+            text("SELECT system_identifier FROM pg_control_system()"),
+        )
+        return result.scalar_one()
+
+
+async def test_read_and_write_engines_reach_different_servers(replica_uri):
+    primary = create_db_engine(get_test_settings().database_uri)
+    replica = create_db_engine(replica_uri)
+    try:
+        assert await _system_identifier(primary) != await _system_identifier(replica)
+        assert primary.pool.stats()["checkouts"] == 1
+        assert replica.pool.stats()["checkouts"] == 1
+    finally:
+        await primary.dispose()
+        await replica.dispose()
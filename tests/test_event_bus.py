@@ -0,0 +1,105 @@
+import asyncio
+import os
+from contextlib import asynccontextmanager, suppress
+
+import pytest
+from sqlalchemy import text
+
+from app.core.config import get_test_settings
+from app.services.eventbus.bus import PostgresEventBus
+
+CHANNEL = "test_mcr_events"
+MAX_PAYLOAD = 2000
+TIMEOUT = 5.0
+
+
+def make_bus() -> PostgresEventBus:
+    return PostgresEventBus(
+        dsn=get_test_settings().database_uri.replace("+asyncpg", "", 1),
+        channel=CHANNEL,
+        batch_interval=0.001,
+        max_payload=MAX_PAYLOAD,
+        compress_min=512,
+        max_pending=1000,
+        keepalive=0.2,
+        reconnect_max=0.2,
+        overflow_retention=60.0,
+    )
+
+
+@asynccontextmanager
+async def running(*buses: PostgresEventBus):
+    tasks = [asyncio.create_task(bus.run()) for bus in buses]
+    try:
+        async with asyncio.timeout(TIMEOUT):
+            while not all(bus.connected for bus in buses):
+                await asyncio.sleep(0.01)
+        yield
+    finally:
+        for task in tasks:
+            task.cancel()
+            with suppress(asyncio.CancelledError):
+                await task
+
+
+async def wait_for(received: list, count: int) -> None:
+    async with asyncio.timeout(TIMEOUT):
+        while len(received) < count:
+            await asyncio.sleep(0.01)
+
+
+@pytest.fixture
+def buses():
+    publisher, subscriber = make_bus(), make_bus()
+    received: list[dict] = []
+    publisher.subscribe("presence", received.append)
+    subscriber.subscribe("presence", received.append)
+    return publisher, subscriber, received
+
+
+async def test_batched_events_reach_other_workers_in_order(test_engine, buses):
+    publisher, subscriber, received = buses
+    async with running(publisher, subscriber):
+        for index in range(300):
+            publisher.publish("presence", {"user_id": index, "pad": "x" * 20})
+        await wait_for(received, 300)
+
+    assert [event["user_id"] for event in received] == list(range(300))
+    assert publisher.frames_sent < len(received)
+    assert publisher.received == 0
+
+
+async def test_oversized_event_goes_through_the_overflow_table(test_engine, buses):
+    publisher, subscriber, received = buses
+    noise = os.urandom(MAX_PAYLOAD).hex()
+    async with running(publisher, subscriber):
+        publisher.publish("presence", {"user_id": 1})
+        publisher.publish("presence", {"user_id": 2, "noise": noise})
+        publisher.publish("presence", {"user_id": 3})
+        await wait_for(received, 3)
+
+    assert [event["user_id"] for event in received] == [1, 2, 3]
+    assert received[1]["noise"] == noise
+    assert publisher.overflowed == 1
+
+
+async def test_reconnects_after_the_connection_is_killed(test_engine, buses):
+    publisher, subscriber, received = buses
+    async with running(publisher, subscriber):
+        async with test_engine.connect() as conn:
+            await conn.execute(
+                text(
+                    "SELECT pg_terminate_backend(pid) FROM pg_stat_activity "
+                    "WHERE datname = current_database() "
+                    "AND pid <> pg_backend_pid()",
+                ),
+            )
+        async with asyncio.timeout(TIMEOUT):
+            while not (subscriber.reconnects and subscriber.connected):
+                await asyncio.sleep(0.01)
+            while not publisher.connected:
+                await asyncio.sleep(0.01)
+        publisher.publish("presence", {"user_id": 9})
+        await wait_for(received, 1)
+
+    assert received == [{"user_id": 9}]
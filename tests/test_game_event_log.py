@@ -0,0 +1,188 @@
+import random
+
+import asyncpg
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.models.game_event import GameEvent, GameSnapshot
+from app.services.game.decomposition import MeldKind
+from app.services.game.event_log import (
+    GameEventKind,
+    GameEventWriter,
+    apply_event,
+    load_game,
+)
+from app.services.game.state import NO_TILE, GamePhase, GameState, encode_snapshot
+
+USER_IDS = [11, 12, 13, 14]
+SNAPSHOT_INTERVAL = 16
+PUNG_PAIR = 2
+CLAIM_RATE = 0.5
+
+
+@pytest.fixture
+def session_factory(test_engine):
+    return async_sessionmaker(test_engine, class_=AsyncSession, expire_on_commit=False)
+
+
+@pytest.fixture
+def writer(session_factory):
+    return GameEventWriter(
+        batch_size=10_000,
+        snapshot_interval=SNAPSHOT_INTERVAL,
+        session_factory=session_factory,
+    )
+
+
+def play(writer, state, rng, history=None):
+    # 무작위로 쯔모/타패하고 가끔 퐁을 하며 매 이벤트를 기록한다.
+    writer.begin_game(state)
+    while True:
+        seat = state.turn
+        if state.phase is GamePhase.DRAW:
+            tile = state.draw(seat)
+            if tile == NO_TILE:
+                break
+            writer.record(state, GameEventKind.DRAW, seat, tile)
+        hand = state.players[seat].hand
+        tile = rng.choice([tile for tile, count in enumerate(hand) if count])
+        state.discard(seat, tile)
+        writer.record(state, GameEventKind.DISCARD, seat, tile)
+        claimer = next(
+            (
+                other
+                for other, player in enumerate(state.players)
+                if other != seat and player.hand[tile] >= PUNG_PAIR
+            ),
+            None,
+        )
+        if claimer is not None and rng.random() < CLAIM_RATE:
+            state.claim(claimer, MeldKind.PUNG, tile)
+            writer.record(state, GameEventKind.CLAIM, claimer, tile, MeldKind.PUNG)
+        else:
+            state.pass_turn()
+            writer.record(state, GameEventKind.PASS, seat)
+        if history is not None:
+            history[state.seq] = encode_snapshot(state)
+    state.finish()
+    writer.record(state, GameEventKind.FINISH, state.turn)
+
+
+async def test_replay_matches_live_game(writer, session_factory):
+    state = GameState.new(1, USER_IDS, rng=random.Random(3))
+    history = {}
+    play(writer, state, random.Random(3), history)
+    await writer.end_game(state)
+
+    assert writer.pending == 0
+    async with session_factory() as session:
+        events = await session.scalar(select(func.count()).select_from(GameEvent))
+        snapshots = await session.scalar(
+            select(func.count()).select_from(GameSnapshot),
+        )
+        restored = await load_game(session, 1)
+        seq = next(seq for seq in history if seq % SNAPSHOT_INTERVAL)
+        midway = await load_game(session, 1, until_seq=seq)
+
+    assert events == state.seq
+    assert snapshots == 1 + state.seq // SNAPSHOT_INTERVAL + 1
+    assert encode_snapshot(restored) == encode_snapshot(state)
+    assert encode_snapshot(midway) == history[seq]
+
+
+async def test_batch_size_triggers_flush(session_factory):
+    writer = GameEventWriter(8, SNAPSHOT_INTERVAL, session_factory)
+    state = GameState.new(2, USER_IDS, rng=random.Random(0))
+    writer.begin_game(state)
+    for _ in range(8):
+        seat = state.turn
+        tile = state.draw(seat)
+        writer.record(state, GameEventKind.DRAW, seat, tile)
+        state.discard(seat, tile)
+        writer.record(state, GameEventKind.DISCARD, seat, tile)
+        state.pass_turn()
+        writer.record(state, GameEventKind.PASS, seat)
+
+    await writer._size_flush
+
+    assert writer.flushes >= 1
+    assert writer.flushed_events >= writer.batch_size
+
+
+async def test_failed_flush_keeps_batch(mock_session):
+    writer = GameEventWriter(10, SNAPSHOT_INTERVAL)
+    state = GameState.new(3, USER_IDS, rng=random.Random(0))
+    writer.begin_game(state)
+    tile = state.draw(0)
+    writer.record(state, GameEventKind.DRAW, 0, tile)
+    mock_session.connection.side_effect = OSError
+
+    with pytest.raises(OSError):
+        await writer.flush(mock_session)
+
+    # 스냅샷 1, 이벤트 1, 자리 4
+    assert writer.pending == 6
+
+
+async def test_flush_sets_aside_game_that_copy_rejects(writer, session_factory):
+    first = GameState.new(5, USER_IDS, rng=random.Random(0))
+    writer.begin_game(first)
+    await writer.flush_safely()
+    # 같은 게임의 seq 0 스냅샷과 자리 행을 다시 넣으면 COPY가 중복 키로 실패한다.
+    writer.begin_game(first)
+    second = GameState.new(6, USER_IDS, rng=random.Random(1))
+    writer.begin_game(second)
+    tile = second.draw(0)
+    writer.record(second, GameEventKind.DRAW, 0, tile)
+
+    await writer.flush_safely()
+
+    assert writer.pending == 0
+    assert writer.rejected_rows == 5
+    async with session_factory() as session:
+        restored = await load_game(session, 6)
+    assert encode_snapshot(restored) == encode_snapshot(second)
+
+
+async def test_flush_safely_survives_dropped_connection(writer, mocker):
+    mocker.patch(
+        "app.services.game.event_log._copy_rows",
+        side_effect=asyncpg.ConnectionDoesNotExistError("connection was closed"),
+    )
+    state = GameState.new(7, USER_IDS, rng=random.Random(0))
+    writer.begin_game(state)
+
+    await writer.flush_safely()
+
+    assert writer.pending == 5
+
+
+async def test_failed_flush_drops_batch_over_max_pending(mock_session):
+    writer = GameEventWriter(10, SNAPSHOT_INTERVAL, max_pending=4)
+    writer.begin_game(GameState.new(8, USER_IDS, rng=random.Random(0)))
+    mock_session.connection.side_effect = OSError
+
+    with pytest.raises(OSError):
+        await writer.flush(mock_session)
+
+    assert writer.pending == 0
+    assert writer.dropped_rows == 5
+
+
+def test_apply_event_rejects_gaps_and_bad_draws():
+    state = GameState.new(4, USER_IDS, rng=random.Random(0))
+    drawn = state.copy().draw(0)
+
+    with pytest.raises(ValueError):
+        apply_event(state, GameEvent(game_id=4, seq=2, kind=0, seat=0, tile=drawn))
+    with pytest.raises(ValueError):
+        apply_event(
+            state,
+            GameEvent(game_id=4, seq=1, kind=0, seat=0, tile=(drawn + 1) % 34),
+        )
+
+
+async def test_load_unknown_game(test_db_session):
+    with pytest.raises(LookupError):
+        await load_game(test_db_session, 999)
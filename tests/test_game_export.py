@@ -0,0 +1,198 @@
+import json
+import os
+from functools import partial
+
+import pytest
+from fastapi import status
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.api.deps import get_current_user
+from app.core.config import settings
+from app.main import app
+from app.schemas.user_identity import UserIdentity
+from app.services.game.event_log import GameEventKind
+from app.services.game.export import export_user_events
+from app.services.game.state import NO_TILE
+
+EXPORT_URL = f"{settings.API_V1_STR}/games/export"
+USER_ID = 7
+MILLION = 1_000_000
+EVENTS_PER_GAME = 500
+# 100만 행을 한 번에 들고 있으면 수백 MB가 늘어나므로 이보다 훨씬 작아야 한다.
+STREAM_GROWTH_BYTES = 32 * 1024 * 1024
+
+
+@pytest.fixture
+def session_factory(test_engine):
+    return async_sessionmaker(test_engine, class_=AsyncSession, expire_on_commit=False)
+
+
+async def seed(
+    session_factory,
+    games,
+    events_per_game,
+    user_ids=(USER_ID,),
+    placement=1,
+):
+    # games개의 판에 판마다 events_per_game개의 이벤트를 서버에서 바로 만든다.
+    # placement가 None이면 진행 중인 판이다.
+    async with session_factory() as session:
+        await session.execute(
+            text(
+                "INSERT INTO gameevent"
+                " (game_id, seq, kind, seat, tile, arg, created_at)"
+                " SELECT g, s, s % 3, s % 4, s % 34, 0, now()"
+                " FROM generate_series(1, :games) g,"
+                " generate_series(1, :events) s",
+            ),
+            {"games": games, "events": events_per_game},
+        )
+        for user_id in user_ids:
+            await session.execute(
+                text(
+                    "INSERT INTO gameplayer (game_id, seat, user_id, placement)"
+                    " SELECT g, CAST(:seat AS int), :user_id, :placement"
+                    " FROM generate_series(1, :games) g"
+                    " WHERE g % :players = CAST(:seat AS int)",
+                ),
+                {
+                    "games": games,
+                    "user_id": user_id,
+                    "seat": user_ids.index(user_id),
+                    "players": len(user_ids),
+                    "placement": placement,
+                },
+            )
+        await session.commit()
+
+
+async def collect(chunks):
+    return [json.loads(line) async for chunk in chunks for line in chunk.splitlines()]
+
+
+async def test_export_streams_only_own_games(session_factory):
+    await seed(session_factory, 4, 3, user_ids=(USER_ID, USER_ID + 1))
+
+    rows = await collect(
+        export_user_events(USER_ID, chunk_rows=2, session_factory=session_factory),
+    )
+
+    assert [(row["game_id"], row["seq"]) for row in rows] == [
+        (game_id, seq) for game_id in (2, 4) for seq in (1, 2, 3)
+    ]
+    assert set(rows[0]) == {
+        "game_id",
+        "seq",
+        "kind",
+        "seat",
+        "tile",
+        "arg",
+        "created_at",
+    }
+
+
+async def test_export_skips_live_games_and_hides_opponent_draws(session_factory):
+    # 1번 판은 끝났고 2번 판은 진행 중. 이벤트의 자리는 seq % 4.
+    await seed(session_factory, 1, 12)
+    async with session_factory() as session:
+        await session.execute(
+            text(
+                "INSERT INTO gameevent"
+                " (game_id, seq, kind, seat, tile, arg, created_at)"
+                " VALUES (2, 1, 0, 1, 5, 0, now())",
+            ),
+        )
+        await session.execute(
+            text(
+                "INSERT INTO gameplayer (game_id, seat, user_id)"
+                " VALUES (2, 0, :user_id)",
+            ),
+            {"user_id": USER_ID},
+        )
+        await session.commit()
+
+    rows = await collect(
+        export_user_events(USER_ID, chunk_rows=100, session_factory=session_factory),
+    )
+
+    assert {row["game_id"] for row in rows} == {1}
+    draws = [row for row in rows if row["kind"] == GameEventKind.DRAW]
+    assert {row["tile"] for row in draws if row["seat"] != 0} == {NO_TILE}
+    assert [row["tile"] for row in draws if row["seat"] == 0] == [12]
+
+
+async def test_export_resumes_after_cursor(session_factory):
+    await seed(session_factory, 3, 4)
+
+    rows = await collect(
+        export_user_events(
+            USER_ID,
+            (1, 2),
+            chunk_rows=100,
+            session_factory=session_factory,
+        ),
+    )
+
+    assert (rows[0]["game_id"], rows[0]["seq"]) == (1, 3)
+    assert len(rows) == 4 * 3 - 2
+
+
+async def test_export_endpoint_gzip(session_factory, mocker):
+    await seed(session_factory, 2, 5)
+    mocker.patch(
+        "app.api.v1.endpoints.games.export_user_events",
+        partial(export_user_events, session_factory=session_factory),
+    )
+    app.dependency_overrides[get_current_user] = lambda: UserIdentity(
+        id=USER_ID,
+        uid="100000007",
+        nickname="user7",
+        email="user7@example.com",
+        is_active=True,
+    )
+    try:
+        async with AsyncClient(
+            transport=ASGITransport(app=app),
+            base_url="http://test",
+        ) as client:
+            plain = await client.get(EXPORT_URL, params={"cursor": "1:1"})
+            packed = await client.get(
+                EXPORT_URL,
+                headers={"Accept-Encoding": "gzip"},
+            )
+            invalid = await client.get(EXPORT_URL, params={"cursor": "first"})
+    finally:
+        app.dependency_overrides.clear()
+
+    assert plain.status_code == status.HTTP_200_OK
+    assert plain.headers["content-type"] == "application/x-ndjson"
+    assert len(plain.text.splitlines()) == 2 * 5 - 1
+    assert packed.headers["content-encoding"] == "gzip"
+    assert len(packed.text.splitlines()) == 2 * 5
+    assert invalid.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+
+def rss_bytes():
+    with open("/proc/self/statm") as statm:
+        return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+
+
+@pytest.mark.skipif(not os.path.exists("/proc/self/statm"), reason="needs procfs")
+async def test_export_memory_is_constant_over_a_million_rows(session_factory):
+    # tracemalloc은 100만 행에서 수십 배 느려지므로 청크마다 RSS를 잰다.
+    await seed(session_factory, MILLION // EVENTS_PER_GAME, EVENTS_PER_GAME)
+
+    lines = 0
+    baseline = peak = rss_bytes()
+    async for chunk in export_user_events(
+        USER_ID,
+        chunk_rows=settings.GAME_EXPORT_CHUNK_ROWS,
+        session_factory=session_factory,
+    ):
+        lines += chunk.count(b"\n")
+        peak = max(peak, rss_bytes())
+
+    assert lines == MILLION
+    assert peak - baseline < STREAM_GROWTH_BYTES
@@ -0,0 +1,26 @@
+from sqlalchemy import insert
+
+from app.models.user import User
+from app.services.ranking.leaderboard import Leaderboard
+
+
+async def test_rebuild_from_active_users(test_db_session):
+    await test_db_session.execute(
+        insert(User),
+        [
+            {"id": 1, "uid": "100000001", "nickname": "a", "rating": 1700.0},
+            {"id": 2, "uid": "100000002", "nickname": "b", "rating": 1400.0},
+            {"id": 3, "uid": "100000003", "nickname": "c", "is_active": False},
+            {"id": 4, "uid": "100000004", "nickname": "d"},
+        ],
+    )
+    await test_db_session.commit()
+    board = Leaderboard(0.0, 4000.0, 0.01)
+
+    await board.rebuild(test_db_session)
+
+    assert [(entry.user_id, entry.rating) for entry in board.top(10)] == [
+        (1, 1700.0),
+        (4, 1500.0),
+        (2, 1400.0),
+    ]
@@ -0,0 +1,43 @@
+import pytest
+from sqlalchemy import select
+
+from app.models.rate_limit import RateLimitBucket
+from app.services.ratelimit.buckets import RateLimit
+from app.services.ratelimit.limiter import PostgresBuckets
+
+LIMIT = RateLimit(capacity=3, refill=0.01)
+
+
+async def test_shared_bucket_allows_burst_then_rejects(test_db_session):
+    buckets = PostgresBuckets()
+    waits = [await buckets.take(test_db_session, "login:ip:1", LIMIT) for _ in range(5)]
+
+    assert waits[:3] == [0.0] * 3
+    assert waits[3] == pytest.approx(1 / LIMIT.refill, rel=0.01)
+    assert waits[4] == pytest.approx(waits[3], rel=0.01)
+    assert await buckets.take(test_db_session, "login:ip:2", LIMIT) == 0.0
+
+    bucket = await test_db_session.get(RateLimitBucket, "login:ip:1")
+    assert bucket is not None
+    assert not bucket.allowed
+
+
+async def test_shared_evict_removes_idle_rows(test_db_session):
+    buckets = PostgresBuckets()
+    await buckets.take(test_db_session, "rooms:user:1", LIMIT)
+
+    assert await buckets.evict(test_db_session, idle_seconds=3600) == 0
+    assert await buckets.evict(test_db_session, idle_seconds=-1) == 1
+    rows = await test_db_session.execute(select(RateLimitBucket))
+    assert rows.all() == []
+
+
+async def test_shared_refund_returns_one_token(test_db_session):
+    buckets = PostgresBuckets()
+    for _ in range(3):
+        await buckets.take(test_db_session, "rooms:ip:1", LIMIT)
+
+    await buckets.refund(test_db_session, "rooms:ip:1", LIMIT)
+
+    assert await buckets.take(test_db_session, "rooms:ip:1", LIMIT) == 0.0
+    assert await buckets.take(test_db_session, "rooms:ip:1", LIMIT) > 0
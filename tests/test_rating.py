@@ -0,0 +1,111 @@
+import random
+
+import pytest
+from sqlalchemy import insert, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlmodel import col
+
+from app.core.config import settings
+from app.models.game_event import GamePlayer
+from app.models.user import User
+from app.services.game.event_log import GameEventWriter
+from app.services.game.state import GameState
+from app.services.ranking.leaderboard import Leaderboard
+from app.services.ranking.rating import (
+    RatingEngine,
+    apply_game_result,
+    recompute_season,
+)
+
+USERS = 8
+GAMES = 30
+
+
+@pytest.fixture(autouse=True)
+def board(mocker):
+    board = Leaderboard(0.0, 4000.0, 0.01)
+    mocker.patch("app.services.ranking.rating.leaderboard", board)
+    return board
+
+
+@pytest.fixture
+async def users(test_db_session):
+    await test_db_session.execute(
+        insert(User),
+        [
+            {"id": user_id, "uid": str(100_000_000 + user_id), "nickname": "p"}
+            for user_id in range(1, USERS + 1)
+        ],
+    )
+    await test_db_session.commit()
+    return list(range(1, USERS + 1))
+
+
+async def ratings_of(session):
+    rows = await session.execute(
+        select(col(User.id), col(User.rating)).order_by(col(User.id)),
+    )
+    return dict(rows.tuples().all())
+
+
+async def test_recompute_season_writes_back_in_bulk(test_db_session, users, board):
+    rng = random.Random(0)
+    season = []
+    rows = []
+    for game_id in range(1, GAMES + 1):
+        user_ids = rng.sample(users, 4)
+        placements = rng.sample([1, 2, 3, 4], 4)
+        season.append((user_ids, placements))
+        rows += [
+            {
+                "game_id": game_id,
+                "seat": seat,
+                "user_id": user_id,
+                "placement": placement,
+            }
+            for seat, (user_id, placement) in enumerate(
+                zip(user_ids, placements, strict=True),
+            )
+        ]
+    # 결과가 없는 (진행 중인) 판은 건너뛴다.
+    rows.append({"game_id": GAMES + 1, "seat": 0, "user_id": 1})
+    await test_db_session.execute(insert(GamePlayer), rows)
+    await test_db_session.commit()
+
+    engine = await recompute_season(test_db_session, chunk_games=7)
+
+    expected = RatingEngine(engine.k_factor, engine.scale)
+    expected.process(*zip(*season, strict=True))
+    assert engine.games == GAMES
+    assert await ratings_of(test_db_session) == pytest.approx(expected.ratings())
+    assert len(board) == USERS
+
+
+async def test_apply_game_result_matches_batch_engine(test_db_session, users):
+    updated = await apply_game_result(test_db_session, users[:4], [30, 10, 10, -50])
+
+    expected = RatingEngine(settings.RATING_K_FACTOR, settings.RATING_SCALE)
+    expected.process([users[:4]], [[1, 2, 2, 4]])
+    assert updated == pytest.approx(expected.ratings())
+    assert (await ratings_of(test_db_session))[users[0]] == updated[users[0]]
+
+
+async def test_end_game_records_results(test_engine, users):
+    factory = async_sessionmaker(test_engine, class_=AsyncSession)
+    writer = GameEventWriter(100, 64, factory)
+    state = GameState.new(1, users[:4], rng=random.Random(0))
+    writer.begin_game(state)
+    await writer.flush_safely()
+    for player, score in zip(state.players, [8, 24, -16, -16], strict=True):
+        player.score = score
+    state.finish()
+
+    await writer.end_game(state)
+
+    async with factory() as session:
+        rows = await session.execute(
+            select(col(GamePlayer.score), col(GamePlayer.placement)).order_by(
+                col(GamePlayer.seat),
+            ),
+        )
+        assert rows.tuples().all() == [(8, 2), (24, 1), (-16, 3), (-16, 3)]
@@ -0,0 +1,94 @@
+import asyncio
+
+import pytest
+from sqlalchemy import event, func, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.core.config import settings
+from app.models.user import User
+from app.services.auth.uid_allocator import FeistelPermutation, UidAllocator
+from app.services.auth.user_service import get_or_create_user
+
+CONCURRENT_LOGINS = 20
+
+
+@pytest.fixture(autouse=True)
+def uid_allocator(mocker):
+    allocator = UidAllocator(
+        FeistelPermutation(settings.UID_PERMUTATION_KEY, rounds=6),
+        prefetch_size=CONCURRENT_LOGINS,
+    )
+    mocker.patch("app.services.auth.user_service.uid_allocator", allocator)
+    return allocator
+
+
+@pytest.fixture
+def session_factory(test_engine):
+    return async_sessionmaker(test_engine, class_=AsyncSession, expire_on_commit=False)
+
+
+async def _login(session_factory, email):
+    async with session_factory() as session:
+        user, is_new_user = await get_or_create_user(session, {"email": email})
+        await session.commit()
+        return user, is_new_user
+
+
+async def test_first_login_creates_user(session_factory):
+    user, is_new_user = await _login(session_factory, "new@example.com")
+
+    assert is_new_user is True
+    assert user.id is not None
+    assert user.last_login is not None
+    assert len(user.uid) == len("123456789")
+
+
+async def test_returning_login_updates_last_login_in_one_statement(
+    session_factory,
+    test_engine,
+    uid_allocator,
+    mocker,
+):
+    first, _ = await _login(session_factory, "returning@example.com")
+    async with session_factory() as session:
+        user = await session.get(User, first.id)
+        user.nickname = "player"
+        await session.commit()
+
+    allocate = mocker.spy(uid_allocator, "allocate")
+    statements = []
+
+    def _record(_conn, _cursor, statement, *_args):
+        statements.append(statement)
+
+    event.listen(test_engine.sync_engine, "before_cursor_execute", _record)
+    try:
+        second, is_new_user = await _login(session_factory, "returning@example.com")
+    finally:
+        event.remove(test_engine.sync_engine, "before_cursor_execute", _record)
+
+    assert is_new_user is False
+    assert second.id == first.id
+    assert second.uid == first.uid
+    assert second.last_login > first.last_login
+    assert len(statements) == 1
+    assert statements[0].lstrip().upper().startswith("UPDATE")
+    allocate.assert_not_called()
+
+
+async def test_concurrent_first_logins_create_one_user(session_factory):
+    email = "race@example.com"
+
+    results = await asyncio.gather(
+        *(_login(session_factory, email) for _ in range(CONCURRENT_LOGINS)),
+    )
+
+    assert len({user.id for user, _ in results}) == 1
+    assert len({user.uid for user, _ in results}) == 1
+    assert all(is_new_user for _, is_new_user in results)
+
+    async with session_factory() as session:
+        count = await session.scalar(
+            select(func.count()).select_from(User).where(User.email == email),
+        )
+    assert count == 1
@@ -0,0 +1,41 @@
+from benchmarks.api_load import find_regressions, percentile, summarize
+
+METRIC = "p95_ms"
+LATENCIES = [0.001, 0.002, 0.003, 0.004]
+
+
+def result(p95_ms, errors=0):
+    return {"errors": errors, METRIC: p95_ms}
+
+
+def test_percentile_uses_nearest_rank():
+    ordered = [float(value) for value in range(1, 101)]
+
+    assert percentile(ordered, 0.50) == ordered[49]
+    assert percentile(ordered, 0.99) == ordered[98]
+    assert percentile(ordered[:1], 0.95) == ordered[0]
+    assert percentile([], 0.95) == 0.0
+
+
+def test_summarize_reports_milliseconds():
+    summary = summarize(LATENCIES, errors=1, elapsed=2.0)
+
+    assert summary["requests"] == len(LATENCIES)
+    assert summary["throughput_rps"] == len(LATENCIES) / 2
+    assert summary["p50_ms"] == LATENCIES[1] * 1000
+    assert summary[METRIC] == LATENCIES[-1] * 1000
+
+
+def test_find_regressions_against_baseline():
+    baseline = {"asgi/health": result(1.0), "asgi/google_callback": result(10.0)}
+    current = {
+        "asgi/health": result(1.2),
+        "asgi/google_callback": result(14.0),
+        "asgi/token_verify": result(5.0, errors=2),
+    }
+
+    problems = find_regressions(current, baseline, METRIC, 0.25)
+
+    assert len(problems) == 2
+    assert problems[0].startswith("asgi/google_callback: p95_ms")
+    assert problems[1] == "asgi/token_verify: 2 failed requests"
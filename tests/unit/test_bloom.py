@@ -0,0 +1,33 @@
+from app.util.bloom import BloomFilter
+
+CAPACITY = 10_000
+ERROR_RATE = 0.01
+
+
+def test_bloom_filter_has_no_false_negatives():
+    bloom = BloomFilter(CAPACITY, ERROR_RATE)
+    items = [f"jti-{i}" for i in range(CAPACITY)]
+    for item in items:
+        bloom.add(item)
+
+    assert all(item in bloom for item in items)
+    assert bloom.count == CAPACITY
+
+
+def test_bloom_filter_false_positive_rate_matches_sizing():
+    bloom = BloomFilter(CAPACITY, ERROR_RATE)
+    for i in range(CAPACITY):
+        bloom.add(f"jti-{i}")
+
+    probes = 20_000
+    false_positives = sum(f"other-{i}" in bloom for i in range(probes))
+
+    assert false_positives / probes < ERROR_RATE * 2
+    assert abs(bloom.expected_false_positive_rate() - ERROR_RATE) < ERROR_RATE / 2
+
+
+def test_bloom_filter_sizing():
+    bloom = BloomFilter(1_000_000, 0.001)
+
+    assert bloom.num_hashes == 10
+    assert bloom.memory_bytes < 2 * 1024 * 1024
@@ -0,0 +1,54 @@
+from app.util.cache import ExpiringLRUCache
+
+TTL = 10.0
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_get_counts_hits_and_misses():
+    cache = ExpiringLRUCache(maxsize=2)
+    cache.set_with_ttl("a", 1, TTL)
+
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    assert cache.stats() == {"size": 1, "hits": 1, "misses": 1}
+
+
+def test_entries_expire():
+    clock = FakeClock()
+    cache = ExpiringLRUCache(maxsize=2, clock=clock)
+    cache.set("a", 1, expires_at=TTL)
+
+    clock.now = TTL - 1
+    assert cache.get("a") == 1
+
+    clock.now = TTL
+    assert cache.get("a") is None
+    assert len(cache) == 0
+
+
+def test_already_expired_entries_are_not_stored():
+    clock = FakeClock()
+    clock.now = TTL
+    cache = ExpiringLRUCache(maxsize=2, clock=clock)
+    cache.set("a", 1, expires_at=TTL)
+
+    assert len(cache) == 0
+
+
+def test_least_recently_used_is_evicted():
+    cache = ExpiringLRUCache(maxsize=2)
+    cache.set_with_ttl("a", 1, TTL)
+    cache.set_with_ttl("b", 2, TTL)
+    cache.get("a")
+    cache.set_with_ttl("c", 3, TTL)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
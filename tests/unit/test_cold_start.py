@@ -0,0 +1,14 @@
+from app.core.config import settings
+from benchmarks.cold_start import (
+    DEFERRED_MODULES,
+    cumulative_import_us,
+    loaded_modules,
+)
+
+
+def test_app_import_stays_within_budget():
+    assert cumulative_import_us("app.main") / 1000 <= settings.IMPORT_TIME_BUDGET_MS
+
+
+def test_heavy_modules_are_not_imported_with_app():
+    assert loaded_modules("app.main", DEFERRED_MODULES) == []
@@ -0,0 +1,137 @@
+import gzip
+import json
+
+import brotli
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse, Response, StreamingResponse
+from httpx import ASGITransport, AsyncClient
+from pydantic import BaseModel
+
+from app.core.compression import CompressionMiddleware, negotiate_encoding
+from app.core.responses import FastJSONResponse
+
+MIN_SIZE = 100
+LARGE = "x" * (MIN_SIZE * 10)
+
+
+class Item(BaseModel):
+    id: int
+    name: str
+
+
+@pytest.fixture
+def compressed_app():
+    app = FastAPI(default_response_class=FastJSONResponse)
+    app.add_middleware(CompressionMiddleware, minimum_size=MIN_SIZE)
+
+    @app.get("/small")
+    async def small():
+        return {"ok": True}
+
+    @app.get("/large")
+    async def large():
+        return {"data": LARGE}
+
+    @app.get("/items")
+    async def items() -> list[Item]:
+        return [Item(id=index, name=f"item{index}") for index in range(50)]
+
+    @app.get("/stream")
+    async def stream():
+        async def chunks():
+            yield b"first\n"
+            yield b"second\n"
+
+        return StreamingResponse(chunks(), media_type="application/x-ndjson")
+
+    @app.get("/encoded")
+    async def encoded():
+        return Response(
+            gzip.compress(LARGE.encode()),
+            headers={"Content-Encoding": "gzip"},
+        )
+
+    @app.get("/events")
+    async def events():
+        return PlainTextResponse(LARGE, media_type="text/event-stream")
+
+    return app
+
+
+async def fetch(app, path, accept_encoding):
+    # httpx가 자동으로 풀지 않도록 원본 바이트를 읽는다.
+    client = AsyncClient(transport=ASGITransport(app=app), base_url="http://test")
+    async with (
+        client,
+        client.stream(
+            "GET",
+            path,
+            headers={"Accept-Encoding": accept_encoding},
+        ) as response,
+    ):
+        body = b"".join([chunk async for chunk in response.aiter_raw()])
+    return response, body
+
+
+@pytest.mark.parametrize(
+    ("header", "expected"),
+    [
+        ("gzip, deflate, br", "br"),
+        ("gzip", "gzip"),
+        ("br;q=0.5, gzip;q=0.8", "gzip"),
+        ("br;q=0, gzip;q=0", None),
+        ("*", "br"),
+        ("identity", None),
+        ("", None),
+    ],
+)
+def test_negotiate_encoding(header, expected):
+    assert negotiate_encoding(header) == expected
+
+
+async def test_large_response_is_compressed(compressed_app):
+    packed, packed_body = await fetch(compressed_app, "/large", "gzip")
+    brotli_packed, brotli_body = await fetch(compressed_app, "/large", "br, gzip")
+
+    assert packed.headers["content-encoding"] == "gzip"
+    assert packed.headers["vary"] == "Accept-Encoding"
+    assert int(packed.headers["content-length"]) == len(packed_body)
+    assert json.loads(gzip.decompress(packed_body)) == {"data": LARGE}
+    assert brotli_packed.headers["content-encoding"] == "br"
+    assert json.loads(brotli.decompress(brotli_body)) == {"data": LARGE}
+
+
+async def test_small_or_unaccepted_response_is_not_compressed(compressed_app):
+    small, small_body = await fetch(compressed_app, "/small", "gzip")
+    plain, plain_body = await fetch(compressed_app, "/large", "identity")
+
+    assert "content-encoding" not in small.headers
+    assert json.loads(small_body) == {"ok": True}
+    assert "content-encoding" not in plain.headers
+    assert len(plain_body) > len(LARGE)
+
+
+async def test_stream_is_flushed_per_chunk(compressed_app):
+    response, body = await fetch(compressed_app, "/stream", "gzip")
+
+    assert response.headers["content-encoding"] == "gzip"
+    assert "content-length" not in response.headers
+    assert gzip.decompress(body) == b"first\nsecond\n"
+
+
+async def test_encoded_and_event_stream_pass_through(compressed_app):
+    encoded, encoded_body = await fetch(compressed_app, "/encoded", "br")
+    events, events_body = await fetch(compressed_app, "/events", "gzip")
+
+    assert encoded.headers["content-encoding"] == "gzip"
+    assert gzip.decompress(encoded_body) == LARGE.encode()
+    assert "content-encoding" not in events.headers
+    assert events_body == LARGE.encode()
+
+
+async def test_response_model_is_serialized(compressed_app):
+    response, body = await fetch(compressed_app, "/items", "identity")
+
+    assert response.headers["content-type"] == "application/json"
+    assert json.loads(body)[1] == {"id": 1, "name": "item1"}
@@ -0,0 +1,106 @@
+from datetime import timedelta
+
+import pytest
+from fastapi import HTTPException, status
+from fastapi.security import HTTPAuthorizationCredentials
+
+from app.api.deps import get_auth_cache_stats, get_current_user, get_token_payload
+from app.core.security import (
+    create_access_token,
+    create_refresh_token,
+    decode_token,
+    token_cache,
+)
+from app.services.auth.user_service import identity_cache
+
+
+@pytest.fixture(autouse=True)
+def clear_auth_caches():
+    token_cache.clear()
+    identity_cache.clear()
+    yield
+    token_cache.clear()
+    identity_cache.clear()
+
+
+def _credentials(token: str) -> HTTPAuthorizationCredentials:
+    return HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+
+
+async def _authenticate(credentials, session):
+    payload = await get_token_payload(credentials, session)
+    return await get_current_user(payload, session, session)
+
+
+async def test_get_current_user_caches_token_and_identity(
+    mocker,
+    identity_session,
+    mock_user,
+):
+    decode = mocker.patch(
+        "app.core.security.decode_token",
+        wraps=decode_token,
+    )
+    credentials = _credentials(create_access_token({"sub": mock_user.email}))
+
+    first = await _authenticate(credentials, identity_session)
+    second = await _authenticate(credentials, identity_session)
+
+    assert first == second
+    assert first.uid == mock_user.uid
+    decode.assert_called_once()
+    identity_session.execute.assert_called_once()
+    assert get_auth_cache_stats() == {
+        "token": {"size": 1, "hits": 1, "misses": 1},
+        "identity": {"size": 1, "hits": 1, "misses": 1},
+    }
+
+
+async def test_get_current_user_rejects_missing_credentials(identity_session):
+    with pytest.raises(HTTPException) as exc_info:
+        await _authenticate(None, identity_session)
+
+    assert exc_info.value.status_code == status.HTTP_401_UNAUTHORIZED
+
+
+async def test_get_current_user_rejects_expired_token(identity_session, mock_user):
+    token = create_access_token(
+        {"sub": mock_user.email},
+        expires_delta=timedelta(seconds=-1),
+    )
+
+    with pytest.raises(HTTPException) as exc_info:
+        await _authenticate(_credentials(token), identity_session)
+
+    assert exc_info.value.status_code == status.HTTP_401_UNAUTHORIZED
+    assert len(token_cache) == 0
+
+
+async def test_get_current_user_rejects_unknown_user(identity_session, mock_user):
+    identity_session.execute.return_value.one_or_none.return_value = None
+    credentials = _credentials(create_access_token({"sub": mock_user.email}))
+
+    with pytest.raises(HTTPException) as exc_info:
+        await _authenticate(credentials, identity_session)
+
+    assert exc_info.value.status_code == status.HTTP_401_UNAUTHORIZED
+
+
+async def test_get_current_user_rejects_inactive_user(identity_session, mock_user):
+    row = identity_session.execute.return_value.one_or_none.return_value
+    row._asdict.return_value["is_active"] = False
+    credentials = _credentials(create_access_token({"sub": mock_user.email}))
+
+    with pytest.raises(HTTPException) as exc_info:
+        await _authenticate(credentials, identity_session)
+
+    assert exc_info.value.status_code == status.HTTP_403_FORBIDDEN
+
+
+async def test_get_current_user_rejects_refresh_token(identity_session, mock_user):
+    credentials = _credentials(create_refresh_token({"sub": mock_user.email}))
+
+    with pytest.raises(HTTPException) as exc_info:
+        await _authenticate(credentials, identity_session)
+
+    assert exc_info.value.status_code == status.HTTP_401_UNAUTHORIZED
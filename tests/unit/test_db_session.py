@@ -0,0 +1,45 @@
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from app.core.config import settings
+from app.db import session as db_session
+
+
+def test_read_engine_falls_back_to_primary(monkeypatch):
+    # 복제본이 설정된 환경에서도 돌도록 설정과 만들어 둔 엔진을 바꿔 둔다.
+    monkeypatch.setattr(settings, "DATABASE_READ_REPLICA_URI", None)
+    monkeypatch.setattr(db_session, "_engines", {})
+
+    assert db_session.get_read_engine() is db_session.get_engine()
+    assert set(db_session.get_pool_stats()) == {"primary"}
+
+
+def test_engine_uses_pool_settings():
+    engine = db_session.get_engine()
+    pool = engine.pool
+
+    assert isinstance(pool, db_session.InstrumentedQueuePool)
+    assert pool.size() == settings.DB_POOL_SIZE
+    assert engine.echo is settings.DB_ECHO
+
+
+def test_pool_stats_report_utilisation():
+    db_session.init_engines()
+    stats = db_session.get_pool_stats()["primary"]
+
+    assert stats["checked_out"] == 0
+    assert stats["utilisation"] == 0.0
+    assert stats["max_overflow"] == settings.DB_MAX_OVERFLOW
+
+
+def test_session_factory_creates_engine_on_first_session(mocker):
+    engine = create_async_engine(settings.database_uri)
+    get_bind = mocker.Mock(return_value=engine)
+    factory = db_session.LazyAsyncSessionMaker(get_bind, class_=AsyncSession)
+
+    get_bind.assert_not_called()
+    first = factory()
+    second = factory()
+
+    assert first.bind is engine
+    assert second.bind is engine
+    get_bind.assert_called_once()
@@ -0,0 +1,192 @@
+import asyncio
+import os
+
+import pytest
+
+from app.core.config import SlowConsumerPolicy
+from app.models.user import UserStatus
+from app.services.eventbus.bus import InProcessEventBus
+from app.services.eventbus.codec import (
+    COMPRESSED_FRAME,
+    JSON_FRAME,
+    encode_event,
+    pack,
+    parse_frame,
+    unpack,
+)
+from app.services.gateway.manager import ConnectionManager
+from app.services.presence.registry import PresenceRegistry
+from tests.unit.test_gateway_connection import FakeWebSocket
+
+ORIGIN = "worker1"
+MAX_PAYLOAD = 7900
+COMPRESS_MIN = 512
+
+
+def unpack_all(frames):
+    events = []
+    for frame in frames:
+        kind, origin, body = parse_frame(frame)
+        assert origin == ORIGIN
+        events += unpack(kind, body)
+    return events
+
+
+def test_small_batch_is_one_plain_frame():
+    events = [encode_event("presence", {"user_id": index}) for index in range(10)]
+    frames = pack(ORIGIN, events, MAX_PAYLOAD, COMPRESS_MIN)
+
+    assert len(frames) == 1
+    assert frames[0][0] == JSON_FRAME
+    assert unpack_all(frames) == [
+        ("presence", {"user_id": index}) for index in range(10)
+    ]
+
+
+def test_large_batch_is_compressed_and_split_in_order():
+    payloads = [{"index": index, "tiles": os.urandom(64).hex()} for index in range(400)]
+    frames = pack(
+        ORIGIN,
+        [encode_event("gateway.topic", payload) for payload in payloads],
+        MAX_PAYLOAD,
+        COMPRESS_MIN,
+    )
+
+    assert len(frames) > 1
+    assert all(len(frame.encode()) <= MAX_PAYLOAD for frame in frames)
+    assert {frame[0] for frame in frames} == {COMPRESSED_FRAME}
+    assert [payload for _, payload in unpack_all(frames)] == payloads
+
+
+def test_oversized_event_is_returned_for_the_overflow_table():
+    noise = os.urandom(MAX_PAYLOAD).hex()
+    events = [
+        encode_event("gateway.user", {"seq": 1}),
+        encode_event("gateway.user", {"seq": 2, "noise": noise}),
+        encode_event("gateway.user", {"seq": 3}),
+    ]
+    packed = pack(ORIGIN, events, MAX_PAYLOAD, COMPRESS_MIN)
+
+    oversized = [item for item in packed if isinstance(item, bytes)]
+    assert len(oversized) == 1
+    assert [type(item) for item in packed] == [str, bytes, str]
+    assert unpack(JSON_FRAME, oversized[0].decode()) == [
+        ("gateway.user", {"seq": 2, "noise": noise}),
+    ]
+
+
+def test_in_process_bus_skips_the_publisher():
+    peers: list[InProcessEventBus] = []
+    first = InProcessEventBus(peers)
+    second = InProcessEventBus(peers)
+    received = []
+    first.subscribe("presence", received.append)
+    second.subscribe("presence", received.append)
+
+    payload = {"user_id": 1, "ids": [1, 2]}
+    first.publish("presence", payload)
+    payload["ids"].append(3)
+
+    assert received == [{"user_id": 1, "ids": [1, 2]}]
+    assert second.received == 1
+
+
+def test_single_in_process_bus_publishes_nothing():
+    bus = InProcessEventBus()
+    bus.publish("presence", {"user_id": 1})
+    assert bus.published == 0
+
+
+def test_failing_handler_does_not_stop_others():
+    peers: list[InProcessEventBus] = []
+    first = InProcessEventBus(peers)
+    second = InProcessEventBus(peers)
+    received = []
+
+    def broken(_event):
+        raise RuntimeError
+
+    second.subscribe("presence", broken)
+    second.subscribe("presence", received.append)
+    first.publish("presence", {"user_id": 1})
+
+    assert received == [{"user_id": 1}]
+
+
+class Worker:
+    def __init__(self, peers):
+        self.bus = InProcessEventBus(peers)
+        self.presence = PresenceRegistry(self.bus)
+        self.manager = ConnectionManager(
+            max_queue=8,
+            policy=SlowConsumerPolicy.DROP_OLDEST,
+            heartbeat_interval=20.0,
+            idle_timeout=60.0,
+            bus=self.bus,
+        )
+        self.presence.has_local_connections = self.manager.has_user
+
+
+@pytest.fixture
+def workers(mocker):
+    peers: list[InProcessEventBus] = []
+    first, second = Worker(peers), Worker(peers)
+    # 연결은 두 번째 워커에만 붙는다. presence는 그 워커의 레지스트리를 쓴다.
+    mocker.patch(
+        "app.services.gateway.manager.presence_registry",
+        second.presence,
+    )
+    return first, second
+
+
+async def test_topic_and_user_messages_reach_other_workers(workers):
+    first, second = workers
+    websocket = FakeWebSocket()
+    connection = await second.manager.connect(websocket, 7)
+
+    first.manager.subscribe_user(7, "room:1")
+    assert first.manager.publish("room:1", {"type": "room"}) == 0
+    first.manager.send_to_user(7, {"type": "match"})
+    first.manager.unsubscribe_user(7, "room:1")
+    first.manager.publish("room:1", {"type": "stale"})
+
+    assert connection.topics == set()
+    while connection.queued:
+        await asyncio.sleep(0)
+    await second.manager.disconnect(connection)
+    assert websocket.sent == ['{"type":"room"}', '{"type":"match"}']
+
+
+async def test_presence_is_replicated_without_a_second_flush(workers):
+    first, second = workers
+    second.presence.set_status(3, UserStatus.IN_ROOM)
+
+    assert first.presence.get_status(3) is UserStatus.IN_ROOM
+    assert first.presence.pending == 0
+    assert second.presence.pending == 1
+
+
+async def test_remote_offline_keeps_local_connections_online(workers):
+    first, second = workers
+    connection = await second.manager.connect(FakeWebSocket(), 5)
+
+    first.presence.set_status(5, UserStatus.OFFLINE)
+
+    assert second.presence.get_status(5) is UserStatus.ONLINE
+    assert first.presence.get_status(5) is UserStatus.ONLINE
+    await second.manager.disconnect(connection)
+    assert first.presence.get_status(5) is UserStatus.OFFLINE
+
+
+async def test_remote_offline_keeps_local_status(workers):
+    # 두 워커에 모두 연결된 사용자가 첫 워커의 연결을 닫아도 게임 중 상태는 남는다.
+    first, second = workers
+    connection = await second.manager.connect(FakeWebSocket(), 6)
+    second.presence.set_status(6, UserStatus.PLAYING)
+
+    first.presence.set_status(6, UserStatus.OFFLINE)
+
+    assert second.presence.get_status(6) is UserStatus.PLAYING
+    assert first.presence.get_status(6) is UserStatus.PLAYING
+    assert second.presence.pending == 1
+    await second.manager.disconnect(connection)
@@ -0,0 +1,44 @@
+import random
+from itertools import accumulate
+
+import pytest
+
+from app.util.fenwick import FenwickTree
+
+SIZE = 1000
+
+
+@pytest.fixture
+def counts():
+    rng = random.Random(0)
+    return [rng.randrange(3) for _ in range(SIZE)]
+
+
+def test_bulk_build_matches_incremental_adds(counts):
+    built = FenwickTree.from_counts(counts)
+    added = FenwickTree(SIZE)
+    for index, count in enumerate(counts):
+        added.add(index, count)
+
+    assert built._tree == added._tree
+    assert built.total == added.total == sum(counts)
+
+
+def test_prefix_sum_and_find_kth(counts):
+    fenwick = FenwickTree.from_counts(counts)
+    sums = [0, *accumulate(counts)]
+
+    assert all(fenwick.prefix_sum(end) == sums[end] for end in range(SIZE + 1))
+    for k in range(1, fenwick.total + 1):
+        index = fenwick.find_kth(k)
+        assert sums[index] < k <= sums[index + 1]
+        assert fenwick.locate(k) == (index, k - sums[index] - 1)
+
+
+def test_find_kth_out_of_range(counts):
+    fenwick = FenwickTree.from_counts(counts)
+
+    with pytest.raises(IndexError):
+        fenwick.find_kth(0)
+    with pytest.raises(IndexError):
+        fenwick.find_kth(fenwick.total + 1)
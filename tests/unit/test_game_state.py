@@ -0,0 +1,200 @@
+import random
+
+import pytest
+
+from app.core.error import DomainErrorCode, MCRDomainError
+from app.services.game.decomposition import MeldKind
+from app.services.game.state import (
+    FLOWER_COUNT,
+    HAND_SIZE,
+    NO_TILE,
+    SNAPSHOT_VERSION,
+    WALL_SIZE,
+    GamePhase,
+    GameState,
+    decode_snapshot,
+    encode_snapshot,
+)
+from app.services.game.tile import EAST, SOUTH, parse_tile
+
+USER_IDS = [11, 12, 13, 14]
+
+
+def play(state, turns, rng):
+    for _ in range(turns):
+        seat = state.turn
+        if state.draw(seat) == NO_TILE:
+            break
+        tiles = [tile for tile, count in enumerate(state.players[seat].hand) if count]
+        state.discard(seat, rng.choice(tiles))
+        state.pass_turn()
+
+
+def tiles_in_play(state):
+    in_hands = sum(
+        sum(player.hand) + len(player.discards) + player.flowers
+        for player in state.players
+    )
+    return in_hands + state.wall_remaining
+
+
+@pytest.fixture
+def state():
+    return GameState.new(1, USER_IDS, dealer=1, rng=random.Random(7))
+
+
+def test_new_game_deals_hands(state):
+    assert all(sum(player.hand) == HAND_SIZE for player in state.players)
+    assert tiles_in_play(state) == WALL_SIZE
+    assert sum(player.flowers for player in state.players) <= FLOWER_COUNT
+    assert state.turn == 1
+    assert state.phase is GamePhase.DRAW
+    assert state.seq == 0
+    assert state.seat_wind(1) == EAST
+    assert state.seat_wind(2) == SOUTH
+
+
+def test_draw_and_discard(state):
+    tile = state.draw(1)
+
+    assert state.players[1].hand[tile] >= 1
+    assert state.phase is GamePhase.DISCARD
+
+    state.discard(1, tile)
+
+    assert state.last_discard == tile
+    assert state.players[1].discards == bytearray([tile])
+    assert state.phase is GamePhase.CLAIM
+    assert tiles_in_play(state) == WALL_SIZE
+
+
+def test_discard_validates_turn_and_tile(state):
+    tile = state.draw(1)
+
+    with pytest.raises(MCRDomainError) as exc_info:
+        state.discard(2, tile)
+    assert exc_info.value.code == DomainErrorCode.NOT_YOUR_TURN
+
+    missing = state.players[1].hand.index(0)
+    with pytest.raises(MCRDomainError) as exc_info:
+        state.discard(1, missing)
+    assert exc_info.value.code == DomainErrorCode.TILE_NOT_IN_HAND
+
+
+def discard_for_claim(state, tile):
+    # 친(1번 자리)이 tile을 버린 직후 상태를 만든다.
+    state.draw(1)
+    state.players[1].hand[tile] += 1
+    state.discard(1, tile)
+
+
+def test_claim_pung(state):
+    tile = parse_tile("5m")
+    discard_for_claim(state, tile)
+    claimer = state.players[3]
+    claimer.hand[tile] = 2
+
+    state.claim(3, MeldKind.PUNG, tile)
+
+    assert claimer.hand[tile] == 0
+    assert claimer.melds == bytearray([MeldKind.PUNG, tile, 1])
+    assert state.players[1].discards == bytearray()
+    assert state.turn == 3
+    assert state.phase is GamePhase.DISCARD
+    assert state.last_discard == NO_TILE
+
+
+def test_claim_chow_only_from_left(state):
+    tile = parse_tile("5m")
+    discard_for_claim(state, tile)
+    for seat in (2, 3):
+        state.players[seat].hand[tile - 2] += 1
+        state.players[seat].hand[tile - 1] += 1
+
+    with pytest.raises(MCRDomainError):
+        state.claim(3, MeldKind.CHOW, tile - 2)
+    with pytest.raises(MCRDomainError) as exc_info:
+        state.claim(2, MeldKind.CHOW, tile + 1)
+    assert exc_info.value.code == DomainErrorCode.TILE_NOT_IN_HAND
+
+    state.claim(2, MeldKind.CHOW, tile - 2)
+    assert state.players[2].meld_count == 1
+    assert state.turn == 2
+
+
+@pytest.mark.parametrize(
+    "first",
+    [parse_tile("8m"), parse_tile("1z"), parse_tile("3z"), -1, 32, 200],
+)
+def test_claim_rejects_malformed_chow(state, first):
+    # 8m-9m-1p처럼 수패를 넘거나 자패로 된 치, 범위를 벗어난 타일
+    discard_for_claim(state, parse_tile("8m"))
+
+    with pytest.raises(MCRDomainError) as exc_info:
+        state.claim(2, MeldKind.CHOW, first)
+    assert exc_info.value.code == DomainErrorCode.INVALID_MELD
+
+
+def test_claim_rejects_out_of_range_pung(state):
+    discard_for_claim(state, parse_tile("5m"))
+
+    with pytest.raises(MCRDomainError) as exc_info:
+        state.claim(3, MeldKind.PUNG, 200)
+    assert exc_info.value.code == DomainErrorCode.INVALID_MELD
+
+
+def test_wall_exhaustion(state):
+    play(state, 200, random.Random(0))
+
+    assert state.wall_remaining == 0
+    assert state.draw(state.turn) == NO_TILE
+    assert tiles_in_play(state) == WALL_SIZE
+
+
+def test_copy_is_independent(state):
+    copied = state.copy()
+    play(copied, 5, random.Random(0))
+
+    assert encode_snapshot(state) != encode_snapshot(copied)
+    assert tiles_in_play(state) == WALL_SIZE
+    assert state.seq == 0
+
+
+def test_snapshot_roundtrip(state):
+    rng = random.Random(1)
+    play(state, 30, rng)
+    state.players[2].add_meld(MeldKind.PUNG, 5, from_seat=1)
+    state.players[0].score = -24
+
+    data = encode_snapshot(state)
+    restored = decode_snapshot(data)
+
+    assert encode_snapshot(restored) == data
+    for name in GameState.__slots__:
+        if name != "players":
+            assert getattr(restored, name) == getattr(state, name)
+    for original, copy in zip(state.players, restored.players, strict=True):
+        for name in original.__slots__:
+            assert getattr(copy, name) == getattr(original, name)
+    assert restored.players[2].meld_count == 1
+    assert isinstance(restored.phase, GamePhase)
+
+
+def test_decode_rejects_foreign_data(state):
+    data = bytearray(encode_snapshot(state))
+
+    with pytest.raises(ValueError):
+        decode_snapshot(b"{}")
+
+    data[2] = SNAPSHOT_VERSION + 1
+    with pytest.raises(ValueError):
+        decode_snapshot(bytes(data))
+
+
+def test_decode_rejects_truncated_data(state):
+    data = encode_snapshot(state)
+
+    with pytest.raises(ValueError):
+        decode_snapshot(data[:-1])
+    with pytest.raises(ValueError):
+        decode_snapshot(data + b"\x00")
@@ -0,0 +1,119 @@
+import asyncio
+
+import pytest
+from fastapi import status
+from starlette.websockets import WebSocketState
+
+from app.core.config import SlowConsumerPolicy
+from app.services.gateway.connection import Connection
+from app.services.gateway.manager import ConnectionManager
+
+MAX_QUEUE = 3
+HEARTBEAT = 20.0
+IDLE_TIMEOUT = 60.0
+
+
+class FakeWebSocket:
+    def __init__(self):
+        self.application_state = WebSocketState.CONNECTED
+        self.sent: list[str] = []
+        self.close_code: int | None = None
+        self.blocked = asyncio.Event()
+        self.blocked.set()
+
+    async def accept(self):
+        pass
+
+    async def send_text(self, data):
+        await self.blocked.wait()
+        self.sent.append(data)
+
+    async def close(self, code):
+        self.close_code = code
+        self.application_state = WebSocketState.DISCONNECTED
+
+
+def test_drop_oldest_keeps_latest_messages():
+    connection = Connection(
+        FakeWebSocket(),
+        1,
+        MAX_QUEUE,
+        SlowConsumerPolicy.DROP_OLDEST,
+    )
+    for index in range(MAX_QUEUE + 2):
+        assert connection.send(str(index))
+
+    assert connection.queued == MAX_QUEUE
+    assert connection.dropped == 2
+    assert not connection.closed
+
+
+async def test_disconnect_policy_closes_slow_consumer():
+    websocket = FakeWebSocket()
+    websocket.blocked.clear()
+    connection = Connection(websocket, 1, MAX_QUEUE, SlowConsumerPolicy.DISCONNECT)
+    connection.start()
+
+    for index in range(MAX_QUEUE + 1):
+        connection.send(str(index))
+    assert connection.send("overflow") is False
+    assert connection.closed
+
+    websocket.blocked.set()
+    await connection.wait_closed()
+    assert websocket.close_code == status.WS_1013_TRY_AGAIN_LATER
+
+
+async def test_writer_drains_queue_in_order():
+    websocket = FakeWebSocket()
+    connection = Connection(websocket, 1, MAX_QUEUE, SlowConsumerPolicy.DROP_OLDEST)
+    connection.start()
+
+    for index in range(MAX_QUEUE):
+        connection.send(str(index))
+    await asyncio.sleep(0)
+    connection.close()
+    await connection.wait_closed()
+
+    assert websocket.sent == ["0", "1", "2"]
+    assert websocket.close_code == status.WS_1000_NORMAL_CLOSURE
+
+
+@pytest.fixture
+def manager():
+    return ConnectionManager(
+        max_queue=MAX_QUEUE,
+        policy=SlowConsumerPolicy.DROP_OLDEST,
+        heartbeat_interval=HEARTBEAT,
+        idle_timeout=IDLE_TIMEOUT,
+    )
+
+
+async def test_sweep_pings_then_closes_idle_connections(manager):
+    connection = await manager.connect(FakeWebSocket(), 1)
+    now = connection.last_seen
+
+    assert manager.sweep(now + HEARTBEAT) == 0
+    assert connection.queued == 1
+
+    assert manager.sweep(now + IDLE_TIMEOUT) == 1
+    assert connection.closed
+    await manager.disconnect(connection)
+    assert len(manager) == 0
+
+
+async def test_publish_serializes_once_per_topic(manager):
+    connections = [
+        await manager.connect(FakeWebSocket(), user_id) for user_id in range(4)
+    ]
+    for connection in connections:
+        manager.subscribe(connection, "table:1")
+
+    assert manager.publish("table:1", {"type": "discard", "tile": "1m"}) == len(
+        connections,
+    )
+    assert manager.publish("table:2", {"type": "discard"}) == 0
+
+    for connection in connections:
+        await manager.disconnect(connection)
+    assert manager.subscribers("table:1") == 0
@@ -0,0 +1,187 @@
+import asyncio
+import time
+
+import pytest
+import rsa
+from jose import jwt
+from jose.backends import RSAKey
+
+from app.core.config import settings
+from app.schemas.google_oauth import GoogleTokenResponse
+from app.services.auth.google import GoogleOAuthService
+from app.services.auth.jwks import JWKSCache, parse_max_age
+
+KID = "test-kid"
+MAX_AGE = 600.0
+
+
+class StubJWKS:
+    def __init__(self, keys, max_age=MAX_AGE):
+        self.keys = keys
+        self.max_age = max_age
+        self.calls = 0
+
+    async def __call__(self):
+        self.calls += 1
+        return self.keys, self.max_age
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture(scope="module")
+def signing_key():
+    _, private_key = rsa.newkeys(1024)
+    pem = private_key.save_pkcs1().decode()
+    public_jwk = RSAKey(pem, "RS256").public_key().to_dict()
+    public_jwk["kid"] = KID
+    return pem, public_jwk
+
+
+def _id_token(pem, kid=KID, **overrides):
+    claims = {
+        "iss": "https://accounts.google.com",
+        "aud": settings.GOOGLE_CLIENT_ID,
+        "sub": "1234567890",
+        "email": "test@example.com",
+        "email_verified": True,
+        "name": "Test User",
+        "exp": int(time.time()) + 3600,
+    }
+    claims.update(overrides)
+    return jwt.encode(claims, pem, algorithm="RS256", headers={"kid": kid})
+
+
+@pytest.fixture
+def stub_jwks(mocker, signing_key):
+    _, public_jwk = signing_key
+    fetcher = StubJWKS([public_jwk])
+    cache = JWKSCache(fetcher, default_max_age=MAX_AGE, min_refresh_interval=0)
+    mocker.patch("app.services.auth.google.google_jwks", cache)
+    return fetcher
+
+
+def test_parse_max_age():
+    header = f"public, max-age={int(MAX_AGE)}, must-revalidate"
+    assert parse_max_age(header) == MAX_AGE
+    assert parse_max_age("no-store") is None
+    assert parse_max_age(None) is None
+
+
+async def test_verify_id_token_success(signing_key, stub_jwks):
+    pem, _ = signing_key
+    token = GoogleTokenResponse(
+        access_token="mock_access_token",
+        expires_in=3600,
+        id_token=_id_token(pem),
+    )
+
+    user_info = await GoogleOAuthService.verify_id_token(token)
+
+    assert user_info is not None
+    assert user_info.email == "test@example.com"
+    assert user_info.verified_email is True
+
+    await GoogleOAuthService.verify_id_token(token)
+    assert stub_jwks.calls == 1
+
+
+@pytest.mark.parametrize(
+    "overrides",
+    [
+        {"aud": "another-client"},
+        {"iss": "https://evil.example.com"},
+        {"exp": 1},
+        {"email": None},
+    ],
+)
+async def test_verify_id_token_rejects_invalid_claims(
+    signing_key,
+    stub_jwks,
+    overrides,
+):
+    pem, _ = signing_key
+    token = GoogleTokenResponse(
+        access_token="mock_access_token",
+        expires_in=3600,
+        id_token=_id_token(pem, **overrides),
+    )
+
+    assert await GoogleOAuthService.verify_id_token(token) is None
+
+
+async def test_google_login_skips_userinfo_with_valid_id_token(
+    mock_google_client,
+    mock_google_responses,
+    mock_session,
+    signing_key,
+    stub_jwks,
+):
+    pem, _ = signing_key
+    mock_google_responses["token_response"]["id_token"] = _id_token(pem)
+
+    login_response = await GoogleOAuthService.process_google_login(
+        "test_code",
+        mock_session,
+    )
+
+    assert "access_token" in login_response.model_dump()
+    mock_google_client.post.assert_called_once()
+    mock_google_client.get.assert_not_called()
+
+
+async def test_unknown_kid_falls_back_and_refreshes_in_background(signing_key):
+    _, public_jwk = signing_key
+    fetcher = StubJWKS([public_jwk])
+    cache = JWKSCache(fetcher, default_max_age=MAX_AGE, min_refresh_interval=0)
+
+    assert await cache.get_key(KID) == public_jwk
+    assert fetcher.calls == 1
+
+    rotated = {**public_jwk, "kid": "rotated-kid"}
+    fetcher.keys = [public_jwk, rotated]
+
+    assert await cache.get_key("rotated-kid") is None
+    await asyncio.sleep(0)
+    assert await cache.get_key("rotated-kid") == rotated
+    assert fetcher.calls == 2
+
+
+async def test_expired_keys_are_served_while_refreshing(signing_key):
+    _, public_jwk = signing_key
+    clock = FakeClock()
+    fetcher = StubJWKS([public_jwk])
+    cache = JWKSCache(
+        fetcher,
+        default_max_age=MAX_AGE,
+        min_refresh_interval=0,
+        clock=clock,
+    )
+
+    await cache.get_key(KID)
+    clock.now += MAX_AGE - 1
+    await cache.get_key(KID)
+    assert fetcher.calls == 1
+
+    clock.now += 1
+    assert await cache.get_key(KID) == public_jwk
+    await asyncio.sleep(0)
+    assert fetcher.calls == 2
+
+
+async def test_refresh_is_rate_limited_for_unknown_kids(signing_key):
+    _, public_jwk = signing_key
+    fetcher = StubJWKS([public_jwk])
+    cache = JWKSCache(fetcher, default_max_age=MAX_AGE, min_refresh_interval=60)
+
+    await cache.get_key(KID)
+    for _ in range(5):
+        assert await cache.get_key("unknown") is None
+        await asyncio.sleep(0)
+
+    assert fetcher.calls == 1
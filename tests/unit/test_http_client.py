@@ -0,0 +1,87 @@
+import httpx
+import pytest
+from fastapi import status
+
+from app.core.http_client import RetryTransport, close_http_client, get_http_client
+from app.core.metrics import http_client_request_duration
+
+MAX_RETRIES = 2
+
+
+def _request(method: str) -> httpx.Request:
+    return httpx.Request(method, "https://oauth2.googleapis.com/token")
+
+
+@pytest.fixture
+def transport():
+    return RetryTransport(max_retries=MAX_RETRIES, backoff=0)
+
+
+async def test_retry_on_connect_error(mocker, transport):
+    responses = [
+        httpx.ConnectError("refused"),
+        httpx.Response(status.HTTP_200_OK, json={"ok": True}),
+    ]
+    handler = mocker.patch(
+        "httpx.AsyncHTTPTransport.handle_async_request",
+        side_effect=responses,
+    )
+
+    response = await transport.handle_async_request(_request("POST"))
+
+    assert response.status_code == status.HTTP_200_OK
+    assert handler.call_count == len(responses)
+
+
+async def test_retry_gives_up_after_max_retries(mocker, transport):
+    handler = mocker.patch(
+        "httpx.AsyncHTTPTransport.handle_async_request",
+        side_effect=httpx.ConnectTimeout("timeout"),
+    )
+
+    with pytest.raises(httpx.ConnectTimeout):
+        await transport.handle_async_request(_request("GET"))
+
+    assert handler.call_count == MAX_RETRIES + 1
+
+
+async def test_retry_on_server_error_only_for_idempotent(mocker, transport):
+    handler = mocker.patch(
+        "httpx.AsyncHTTPTransport.handle_async_request",
+        return_value=httpx.Response(status.HTTP_503_SERVICE_UNAVAILABLE),
+    )
+
+    get_response = await transport.handle_async_request(_request("GET"))
+    assert get_response.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
+    assert handler.call_count == MAX_RETRIES + 1
+
+    handler.reset_mock()
+    post_response = await transport.handle_async_request(_request("POST"))
+    assert post_response.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
+    assert handler.call_count == 1
+
+
+async def test_shared_client_is_reused():
+    client = get_http_client()
+    assert get_http_client() is client
+
+    await close_http_client()
+    assert client.is_closed
+    assert get_http_client() is not client
+    await close_http_client()
+
+
+async def test_client_hooks_time_outbound_requests(mocker):
+    mocker.patch.object(
+        RetryTransport,
+        "handle_async_request",
+        return_value=httpx.Response(status.HTTP_200_OK),
+    )
+    labels = ("POST", "oauth2.googleapis.com", "200")
+    before = http_client_request_duration.count(*labels)
+
+    client = get_http_client()
+    await client.send(_request("POST"))
+    await close_http_client()
+
+    assert http_client_request_duration.count(*labels) == before + 1
@@ -0,0 +1,91 @@
+import math
+import random
+
+import pytest
+
+from app.core.error import DomainErrorCode, MCRDomainError
+from app.services.ranking.leaderboard import Leaderboard, LeaderboardEntry
+
+USERS = 2000
+
+
+def expected_order(ratings, resolution):
+    # 버킷(레이팅 내림차순) 다음 user_id 오름차순
+    return sorted(
+        ratings,
+        key=lambda user_id: (-math.floor(ratings[user_id] / resolution), user_id),
+    )
+
+
+@pytest.fixture
+def ratings():
+    rng = random.Random(0)
+    return {user_id: rng.gauss(1500, 200) for user_id in range(1, USERS + 1)}
+
+
+@pytest.fixture
+def board(ratings):
+    board = Leaderboard(0.0, 4000.0, 0.01)
+    board.load(ratings)
+    return board
+
+
+def test_ranks_match_sorted_order(board, ratings):
+    order = expected_order(ratings, board.resolution)
+
+    assert [board.rank(user_id) for user_id in order] == list(range(1, USERS + 1))
+    assert [entry.user_id for entry in board.top(10)] == order[:10]
+    assert [entry.rank for entry in board.top(5, offset=100)] == [
+        101,
+        102,
+        103,
+        104,
+        105,
+    ]
+    assert board.top(10, offset=USERS - 3) == [
+        LeaderboardEntry(rank, user_id, ratings[user_id])
+        for rank, user_id in enumerate(order[-3:], start=USERS - 2)
+    ]
+
+
+def test_incremental_updates_match_rebuild(board, ratings):
+    rng = random.Random(1)
+    for _ in range(500):
+        user_id = rng.randrange(1, USERS + 100)
+        ratings[user_id] = ratings.get(user_id, 1500.0) + rng.uniform(-30, 30)
+        board.update(user_id, ratings[user_id])
+    for user_id in list(ratings)[:50]:
+        board.remove(user_id)
+        del ratings[user_id]
+
+    rebuilt = Leaderboard(0.0, 4000.0, 0.01)
+    rebuilt.load(ratings)
+
+    assert len(board) == len(ratings)
+    assert board.top(len(ratings)) == rebuilt.top(len(ratings))
+
+
+def test_around_clips_at_the_top(board, ratings):
+    order = expected_order(ratings, board.resolution)
+
+    around = board.around(order[1], radius=3)
+
+    assert [entry.user_id for entry in around] == order[:5]
+    assert [entry.user_id for entry in board.around(order[500], 2)] == order[498:503]
+
+
+def test_out_of_range_ratings_are_clamped():
+    board = Leaderboard(0.0, 100.0, 1.0)
+    board.update(1, 250.0)
+    board.update(2, 100.0)
+    board.update(3, -5.0)
+
+    assert [entry.user_id for entry in board.top(3)] == [1, 2, 3]
+    assert board.rank(3) == len(board)
+
+
+def test_unranked_user(board):
+    with pytest.raises(MCRDomainError) as exc_info:
+        board.rank(USERS + 1)
+    assert exc_info.value.code == DomainErrorCode.NOT_RANKED
+    board.remove(USERS + 1)
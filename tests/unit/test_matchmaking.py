@@ -0,0 +1,126 @@
+import pytest
+
+from app.core.config import SlowConsumerPolicy
+from app.core.error import DomainErrorCode, MCRDomainError
+from app.models.user import UserStatus
+from app.services.game.matchmaking import Matchmaker
+from app.services.game.room import MAX_PLAYERS, RoomRegistry, RoomState
+from app.services.gateway.manager import ConnectionManager
+from app.services.presence.registry import PresenceRegistry
+
+BASE_WINDOW = 50.0
+GROWTH = 10.0
+MAX_WINDOW = 200.0
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def presence():
+    return PresenceRegistry()
+
+
+@pytest.fixture
+def matchmaker(clock, presence):
+    gateway = ConnectionManager(
+        max_queue=16,
+        policy=SlowConsumerPolicy.DROP_OLDEST,
+        heartbeat_interval=20,
+        idle_timeout=60,
+    )
+    return Matchmaker(
+        rooms=RoomRegistry(presence=presence, gateway=gateway),
+        bucket_width=25.0,
+        base_window=BASE_WINDOW,
+        window_growth=GROWTH,
+        max_window=MAX_WINDOW,
+        clock=clock,
+    )
+
+
+def test_four_close_players_form_a_full_room(matchmaker, presence, clock):
+    rooms = []
+    for user_id, rating in enumerate([1500, 1510, 1490, 1520], start=1):
+        clock.now += 1
+        rooms.append(matchmaker.enqueue(user_id, rating))
+
+    assert rooms[:-1] == [None] * (MAX_PLAYERS - 1)
+    room = rooms[-1]
+    assert room is not None
+    assert room.state is RoomState.FULL
+    assert room.host_id == 1
+    assert len(matchmaker) == 0
+    assert presence.counts()[UserStatus.IN_ROOM] == MAX_PLAYERS
+
+
+def test_far_players_wait_until_windows_widen(matchmaker, clock):
+    for user_id, rating in enumerate([1500, 1600, 1700, 1800], start=1):
+        assert matchmaker.enqueue(user_id, rating) is None
+
+    clock.now = 10.0
+    assert matchmaker.tick() == []
+
+    clock.now = (MAX_WINDOW - BASE_WINDOW) / GROWTH
+    rooms = matchmaker.tick()
+    assert len(rooms) == 1
+    assert sorted(rooms[0].player_ids) == [1, 2, 3, 4]
+
+
+def test_new_player_needs_own_window(matchmaker, clock):
+    for user_id in range(1, MAX_PLAYERS):
+        matchmaker.enqueue(user_id, 1500)
+    clock.now = 60.0
+
+    # 오래 기다린 사람의 창은 넓지만 새로 온 사람의 창은 아직 좁다.
+    assert matchmaker.enqueue(10, 1650) is None
+    assert matchmaker.enqueue(11, 1540) is not None
+    assert matchmaker.is_queued(10)
+
+
+def test_queue_errors_and_dequeue(matchmaker):
+    matchmaker.enqueue(1, 1500)
+    with pytest.raises(MCRDomainError) as exc_info:
+        matchmaker.enqueue(1, 1500)
+    assert exc_info.value.code is DomainErrorCode.ALREADY_QUEUED
+
+    assert matchmaker.dequeue(1)
+    assert not matchmaker.dequeue(1)
+    with pytest.raises(MCRDomainError) as exc_info:
+        matchmaker.get_entry(1)
+    assert exc_info.value.code is DomainErrorCode.NOT_QUEUED
+
+    matchmaker.rooms.create(2, "table")
+    with pytest.raises(MCRDomainError) as exc_info:
+        matchmaker.enqueue(2, 1500)
+    assert exc_info.value.code is DomainErrorCode.ALREADY_IN_ROOM
+
+
+def test_failed_table_keeps_group_queued_and_tick_continues(matchmaker, clock):
+    for user_id, rating in enumerate([1000, 1060, 1120, 1180], start=1):
+        assert matchmaker.enqueue(user_id, rating) is None
+    for user_id, rating in enumerate([2000, 2060, 2120, 2180], start=5):
+        assert matchmaker.enqueue(user_id, rating) is None
+    # 큐에 있는 동안 다른 경로로 방에 들어갔다.
+    matchmaker.rooms.create(2, "table")
+
+    clock.now = 20
+    rooms = matchmaker.tick()
+
+    assert [room.player_ids for room in rooms] == [[5, 6, 7, 8]]
+    assert [matchmaker.is_queued(user_id) for user_id in (1, 2, 3, 4)] == [
+        True,
+        False,
+        True,
+        True,
+    ]
@@ -0,0 +1,104 @@
+import pytest
+from fastapi import FastAPI, HTTPException
+from httpx import ASGITransport, AsyncClient
+
+from app.core.metrics import (
+    OTHER_METHOD,
+    UNMATCHED_ROUTE,
+    Counter,
+    Gauge,
+    Histogram,
+    MetricsMiddleware,
+    MetricsRegistry,
+)
+from app.db.session import statement_kind
+
+BUCKETS = (0.1, 1.0)
+
+
+def test_histogram_renders_cumulative_buckets():
+    registry = MetricsRegistry()
+    histogram = registry.register(
+        Histogram("latency_seconds", "Latency", ("route",), BUCKETS),
+    )
+    for value in (0.05, 0.1, 0.5, 5.0):
+        histogram.observe(value, "/rooms/{room_id}")
+
+    lines = registry.render().splitlines()
+
+    assert lines[:2] == [
+        "# HELP latency_seconds Latency",
+        "# TYPE latency_seconds histogram",
+    ]
+    assert lines[2:] == [
+        'latency_seconds_bucket{route="/rooms/{room_id}",le="0.1"} 2',
+        'latency_seconds_bucket{route="/rooms/{room_id}",le="1.0"} 3',
+        'latency_seconds_bucket{route="/rooms/{room_id}",le="+Inf"} 4',
+        'latency_seconds_sum{route="/rooms/{room_id}"} 5.65',
+        'latency_seconds_count{route="/rooms/{room_id}"} 4',
+    ]
+    assert histogram.count("/rooms/{room_id}") == len((0.05, 0.1, 0.5, 5.0))
+
+
+def test_counter_gauge_and_collectors():
+    registry = MetricsRegistry()
+    counter = registry.register(Counter("errors_total", "Errors", ("kind",)))
+    gauge = registry.register(Gauge("connections", "Connections"))
+    registry.add_collector(lambda: gauge.set(value=3))
+    counter.inc('say "hi"')
+
+    text = registry.render()
+
+    assert 'errors_total{kind="say \\"hi\\""} 1.0' in text
+    assert "connections 3" in text
+
+
+def test_duplicate_metric_is_rejected():
+    registry = MetricsRegistry()
+    registry.register(Counter("requests_total", "Requests"))
+
+    with pytest.raises(ValueError, match="already registered"):
+        registry.register(Counter("requests_total", "Requests"))
+
+
+@pytest.mark.parametrize(
+    ("statement", "expected"),
+    [
+        ("SELECT 1", "SELECT"),
+        ("\n  insert into gameevent values (1)", "INSERT"),
+        ("", "UNKNOWN"),
+    ],
+)
+def test_statement_kind(statement, expected):
+    assert statement_kind(statement) == expected
+
+
+async def test_middleware_labels_by_route_template(mocker):
+    histogram = Histogram("request_seconds", "Requests", ("method", "route", "status"))
+    in_progress = Gauge("in_progress", "In progress", ("method",))
+    mocker.patch("app.core.metrics.http_request_duration", histogram)
+    mocker.patch("app.core.metrics.http_requests_in_progress", in_progress)
+    app = FastAPI()
+    app.add_middleware(MetricsMiddleware)
+
+    @app.get("/rooms/{room_id}")
+    async def get_room(room_id: int):
+        if room_id == 0:
+            raise HTTPException(status_code=404)
+        return {"id": room_id}
+
+    async with AsyncClient(
+        transport=ASGITransport(app=app),
+        base_url="http://test",
+    ) as client:
+        await client.get("/rooms/1")
+        await client.get("/rooms/2")
+        await client.get("/rooms/0")
+        await client.get("/missing")
+        await client.request("BREW", "/missing")
+
+    assert histogram.count("GET", "/rooms/{room_id}", "200") == 2
+    assert histogram.count("GET", "/rooms/{room_id}", "404") == 1
+    assert histogram.count("GET", UNMATCHED_ROUTE, "404") == 1
+    assert histogram.count(OTHER_METHOD, UNMATCHED_ROUTE, "404") == 1
+    assert in_progress.value("GET") == 0
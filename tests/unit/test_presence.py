@@ -0,0 +1,66 @@
+import pytest
+
+from app.models.user import UserStatus
+from app.services.presence.registry import PresenceRegistry
+
+
+@pytest.fixture
+def registry():
+    return PresenceRegistry()
+
+
+def test_status_transitions_update_indexes(registry):
+    registry.set_status(1, UserStatus.ONLINE)
+    registry.set_status(2, UserStatus.ONLINE)
+    registry.set_status(2, UserStatus.IN_ROOM)
+
+    assert registry.get_status(1) is UserStatus.ONLINE
+    assert registry.get_status(3) is UserStatus.OFFLINE
+    assert registry.is_online(2)
+    assert set(registry.users_with_status(UserStatus.IN_ROOM)) == {2}
+    assert registry.online_count() == 2
+    assert registry.counts() == {
+        UserStatus.ONLINE: 1,
+        UserStatus.IN_ROOM: 1,
+        UserStatus.PLAYING: 0,
+    }
+
+    registry.set_status(2, UserStatus.OFFLINE)
+    assert not registry.is_online(2)
+    assert registry.counts()[UserStatus.IN_ROOM] == 0
+
+
+async def test_flush_coalesces_transitions(registry, mock_session):
+    for status in (UserStatus.ONLINE, UserStatus.IN_ROOM, UserStatus.PLAYING):
+        registry.set_status(1, status)
+        registry.set_status(2, status)
+    registry.set_status(3, UserStatus.ONLINE)
+
+    flushed = await registry.flush(mock_session)
+
+    assert flushed == 3
+    # PLAYING과 ONLINE으로 나눠 UPDATE 두 번
+    assert mock_session.execute.await_count == 2
+    mock_session.commit.assert_awaited_once()
+    assert registry.pending == 0
+    assert await registry.flush(mock_session) == 0
+
+
+async def test_failed_flush_keeps_newer_changes(registry, mock_session):
+    registry.set_status(1, UserStatus.ONLINE)
+    registry.set_status(2, UserStatus.ONLINE)
+
+    async def _fail(*_args, **_kwargs):
+        registry.set_status(1, UserStatus.IN_ROOM)
+        raise OSError
+
+    mock_session.execute.side_effect = _fail
+    with pytest.raises(OSError):
+        await registry.flush(mock_session)
+
+    assert registry.pending == 2
+    mock_session.execute.side_effect = None
+    await registry.flush(mock_session)
+    statements = [call.args[0] for call in mock_session.execute.await_args_list[1:]]
+    values = {statement.compile().params["status"] for statement in statements}
+    assert values == {UserStatus.IN_ROOM.value, UserStatus.ONLINE.value}
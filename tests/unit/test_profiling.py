@@ -0,0 +1,130 @@
+import asyncio
+import threading
+import time
+
+import pytest
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+
+from app.core.config import settings
+from app.core.error import MCRDomainError
+from app.core.profiling import PROFILE_ID_HEADER, ProfilingMiddleware
+from app.core.security import (
+    PROFILE_SIGNATURE_HEADER,
+    sign_profile_request,
+    verify_profile_signature,
+)
+from app.services.profiling.sampler import StackSampler
+from app.services.profiling.store import ProfileStore
+from app.services.profiling.watchdog import LoopLagMonitor
+
+MAX_FILES = 3
+STALL_SECONDS = 0.3
+
+
+def busy_wait(seconds):
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        pass
+
+
+@pytest.fixture
+def store(tmp_path):
+    return ProfileStore(str(tmp_path), MAX_FILES)
+
+
+def test_signature_is_bound_to_method_path_and_time():
+    signature = sign_profile_request("GET", "/health")
+    stale = sign_profile_request(
+        "GET",
+        "/health",
+        int(time.time() - settings.PROFILING_SIGNATURE_TTL_SECONDS) - 1,
+    )
+
+    assert verify_profile_signature(signature, "get", "/health")
+    assert not verify_profile_signature(signature, "POST", "/health")
+    assert not verify_profile_signature(signature, "GET", "/metrics")
+    assert not verify_profile_signature(stale, "GET", "/health")
+    assert not verify_profile_signature("garbage", "GET", "/health")
+
+
+def test_store_keeps_only_newest_files(store):
+    ids = [f"{1_700_000_000_000 + index:013d}-0000000{index}" for index in range(5)]
+    for profile_id in ids:
+        store.save(profile_id, "main;work 1\n")
+
+    assert [info.profile_id for info in store.entries()] == ids[:1:-1]
+    assert store.path(ids[-1]).read_text() == "main;work 1\n"
+    with pytest.raises(MCRDomainError):
+        store.path(ids[0])
+    with pytest.raises(MCRDomainError):
+        store.path("../../etc/passwd")
+
+
+def test_sampler_collects_folded_stacks():
+    sampler = StackSampler(threading.get_ident(), 0.001)
+    sampler.start()
+    busy_wait(0.05)
+    sampler.stop()
+
+    assert sampler.samples
+    top_stack, _ = sampler.samples.most_common(1)[0]
+    assert "busy_wait" in top_stack
+    assert (
+        sampler.folded()
+        .splitlines()[0]
+        .endswith(
+            f" {sampler.samples[top_stack]}",
+        )
+    )
+
+
+async def test_loop_lag_monitor_records_stall_with_stack():
+    monitor = LoopLagMonitor(threshold=0.05, max_stalls=10)
+    task = asyncio.create_task(monitor.run(0.01))
+    await asyncio.sleep(0.05)
+    busy_wait(STALL_SECONDS)
+    await asyncio.sleep(0.05)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    assert len(monitor.stalls) == 1
+    stall = monitor.stalls[0]
+    assert stall.duration >= STALL_SECONDS - 0.05
+    assert any("busy_wait" in frame for frame in stall.stack)
+
+
+async def test_middleware_profiles_only_signed_requests(store):
+    app = FastAPI()
+    app.add_middleware(
+        ProfilingMiddleware,
+        store=store,
+        sample_rate=1.0,
+        interval=0.001,
+    )
+
+    @app.get("/work")
+    async def work():
+        busy_wait(0.02)
+        return {"ok": True}
+
+    async with AsyncClient(
+        transport=ASGITransport(app=app),
+        base_url="http://test",
+    ) as client:
+        plain = await client.get("/work")
+        forged = await client.get(
+            "/work",
+            headers={PROFILE_SIGNATURE_HEADER: sign_profile_request("GET", "/other")},
+        )
+        signed = await client.get(
+            "/work",
+            headers={PROFILE_SIGNATURE_HEADER: sign_profile_request("GET", "/work")},
+        )
+
+    assert PROFILE_ID_HEADER not in plain.headers
+    assert PROFILE_ID_HEADER not in forged.headers
+    profile_id = signed.headers[PROFILE_ID_HEADER]
+    assert [info.profile_id for info in store.entries()] == [profile_id]
+    assert "busy_wait" in store.path(profile_id).read_text()
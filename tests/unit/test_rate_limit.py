@@ -0,0 +1,97 @@
+import pytest
+from sqlalchemy.exc import OperationalError
+
+from app.services.ratelimit.buckets import RateLimit, TokenBuckets, parse_rate
+from app.services.ratelimit.limiter import RateLimiter
+
+PER_SECOND = RateLimit(capacity=3, refill=1.0)
+
+
+@pytest.fixture
+def buckets():
+    return TokenBuckets(shards=4)
+
+
+def test_parse_rate():
+    assert parse_rate("30/minute") == RateLimit(30, 0.5)
+    assert parse_rate("5/second").full_after == 1.0
+    for spec in ("30", "0/minute", "x/minute", "30/day"):
+        with pytest.raises(ValueError, match="Invalid rate limit"):
+            parse_rate(spec)
+
+
+def test_bucket_allows_burst_then_reports_retry_after(buckets):
+    assert [buckets.take("k", PER_SECOND, 100.0) for _ in range(3)] == [0.0] * 3
+    assert buckets.take("k", PER_SECOND, 100.0) == pytest.approx(1.0)
+    # 거절된 요청은 토큰을 쓰지 않는다.
+    assert buckets.take("k", PER_SECOND, 100.5) == pytest.approx(0.5)
+    assert buckets.take("k", PER_SECOND, 101.0) == 0.0
+    assert buckets.take("other", PER_SECOND, 101.0) == 0.0
+
+
+def test_refill_is_capped_at_capacity(buckets):
+    for _ in range(3):
+        buckets.take("k", PER_SECOND, 0.0)
+    allowed = [buckets.take("k", PER_SECOND, 1000.0) for _ in range(4)]
+    assert allowed.count(0.0) == PER_SECOND.capacity
+
+
+async def test_evict_drops_only_idle_keys(buckets):
+    for index in range(10):
+        buckets.take(f"old{index}", PER_SECOND, 0.0)
+    buckets.take("fresh", PER_SECOND, 5.0)
+
+    assert await buckets.evict(before=5.0 - PER_SECOND.full_after) == 10
+    assert len(buckets) == 1
+
+
+@pytest.fixture
+def limiter(buckets):
+    return RateLimiter(
+        per_ip={"login": PER_SECOND, "rooms": RateLimit(100, 100.0)},
+        per_user={"rooms": RateLimit(1, 0.5)},
+        buckets=buckets,
+    )
+
+
+async def test_limiter_checks_ip_and_user_buckets(limiter):
+    assert await limiter.hit("rooms", "10.0.0.1", "7") == 0.0
+    assert await limiter.hit("rooms", "10.0.0.2", "7") == pytest.approx(2.0, abs=0.1)
+    assert await limiter.hit("rooms", "10.0.0.2", "8") == 0.0
+    assert await limiter.hit("unlimited", "10.0.0.1", "7") == 0.0
+    assert limiter.limits_users("rooms")
+    assert not limiter.limits_users("login")
+    assert limiter.idle_seconds == PER_SECOND.full_after
+
+
+async def test_rejection_does_not_spend_the_other_scope(buckets):
+    single = RateLimit(1, 0.01)
+    limiter = RateLimiter({"rooms": single}, {"rooms": single}, buckets)
+
+    assert await limiter.hit("rooms", "10.0.0.1", "7") == 0.0
+    # 사용자 버킷이 거절하면 IP 토큰을 되돌린다.
+    assert await limiter.hit("rooms", "10.0.0.2", "7") > 0
+    assert await limiter.hit("rooms", "10.0.0.2", "8") == 0.0
+    # IP 버킷이 거절하면 사용자 버킷은 건드리지 않는다.
+    assert await limiter.hit("rooms", "10.0.0.1", "9") > 0
+    assert await limiter.hit("rooms", "10.0.0.3", "9") == 0.0
+
+
+async def test_limiter_falls_back_to_memory_when_shared_backend_fails(
+    limiter,
+    mocker,
+):
+    limiter.shared = mocker.Mock()
+    limiter.shared.take = mocker.AsyncMock(
+        side_effect=OperationalError("SELECT", {}, OSError()),
+    )
+    mocker.patch(
+        "app.services.ratelimit.limiter.async_session",
+        return_value=mocker.AsyncMock(),
+    )
+
+    results = [await limiter.hit("login", "10.0.0.1", None) for _ in range(4)]
+
+    assert results[:3] == [0.0] * 3
+    assert results[3] > 0
+    assert limiter.shared_failures == len(results)
@@ -0,0 +1,90 @@
+import random
+
+import numpy as np
+import pytest
+
+from app.services.ranking.rating import (
+    RatingEngine,
+    assign_waves,
+    placements_from_scores,
+    rating_deltas,
+)
+
+K_FACTOR = 32.0
+SCALE = 400.0
+INITIAL = 1500.0
+
+
+def reference_season(games):
+    # 판마다 순서대로 계산하는 스칼라 기준 구현
+    ratings = {}
+    for user_ids, placements in games:
+        before = [ratings.get(user_id, INITIAL) for user_id in user_ids]
+        for i, user_id in enumerate(user_ids):
+            total = 0.0
+            for j in range(len(user_ids)):
+                if i == j:
+                    continue
+                expected = 1 / (1 + 10 ** ((before[j] - before[i]) / SCALE))
+                if placements[i] < placements[j]:
+                    actual = 1.0
+                elif placements[i] == placements[j]:
+                    actual = 0.5
+                else:
+                    actual = 0.0
+                total += actual - expected
+            ratings[user_id] = before[i] + K_FACTOR / (len(user_ids) - 1) * total
+    return ratings
+
+
+def random_season(rng, players, games):
+    season = []
+    for _ in range(games):
+        user_ids = rng.sample(range(1, players + 1), 4)
+        scores = [rng.randrange(-3, 4) for _ in range(4)]
+        season.append((user_ids, placements_from_scores(scores).tolist()))
+    return season
+
+
+@pytest.mark.parametrize(("players", "chunk"), [(12, 7), (500, 1000)])
+def test_batch_matches_scalar_reference(players, chunk):
+    season = random_season(random.Random(players), players, 1000)
+    engine = RatingEngine(K_FACTOR, SCALE, INITIAL)
+
+    for start in range(0, len(season), chunk):
+        part = season[start : start + chunk]
+        engine.process(
+            [user_ids for user_ids, _ in part],
+            [placements for _, placements in part],
+        )
+
+    expected = reference_season(season)
+    actual = engine.ratings()
+    assert actual.keys() == expected.keys()
+    assert all(
+        actual[user_id] == pytest.approx(expected[user_id]) for user_id in actual
+    )
+    assert engine.games == len(season)
+
+
+def test_deltas_are_zero_sum_and_reward_placement():
+    deltas = rating_deltas(
+        np.array([[1500.0, 1500.0, 1500.0, 1500.0]]),
+        np.array([[1, 2, 3, 4]]),
+        K_FACTOR,
+        SCALE,
+    )[0]
+
+    assert deltas.sum() == pytest.approx(0.0)
+    assert list(deltas) == sorted(deltas, reverse=True)
+    assert deltas[0] == pytest.approx(K_FACTOR / 2)
+
+
+def test_placements_share_ties():
+    assert placements_from_scores([10, 30, 10, -5]).tolist() == [2, 1, 2, 4]
+
+
+def test_waves_never_repeat_a_player():
+    players = np.array([[0, 1, 2, 3], [4, 5, 6, 7], [0, 4, 8, 9], [1, 2, 3, 10]])
+
+    assert assign_waves(players, 11).tolist() == [0, 0, 1, 1]
@@ -0,0 +1,39 @@
+import json
+from datetime import UTC, datetime
+
+import pytest
+from pydantic import BaseModel
+
+from app.core.responses import FastJSONResponse, dumps
+
+
+class Player(BaseModel):
+    id: int
+    joined_at: datetime
+
+
+def test_dumps_model_matches_model_dump_json():
+    player = Player(id=1, joined_at=datetime(2025, 1, 1, tzinfo=UTC))
+
+    assert dumps(player) == player.model_dump_json().encode()
+
+
+def test_dumps_nested_models_and_int_keys():
+    player = Player(id=1, joined_at=datetime(2025, 1, 1, tzinfo=UTC))
+
+    assert json.loads(dumps({1: [player], "name": "방"})) == {
+        "1": [{"id": 1, "joined_at": "2025-01-01T00:00:00Z"}],
+        "name": "방",
+    }
+
+
+def test_dumps_rejects_unknown_types():
+    with pytest.raises(TypeError):
+        dumps({"value": object()})
+
+
+def test_response_renders_compact_utf8():
+    response = FastJSONResponse({"message": "안녕", "ok": True})
+
+    assert response.body == '{"message":"안녕","ok":true}'.encode()
+    assert response.headers["content-type"] == "application/json"
@@ -0,0 +1,136 @@
+import pytest
+
+from app.core.config import SlowConsumerPolicy
+from app.core.error import DomainErrorCode, MCRDomainError
+from app.models.user import UserStatus
+from app.services.game.room import MAX_PLAYERS, RoomRegistry, RoomState
+from app.services.gateway.manager import ConnectionManager
+from app.services.presence.registry import PresenceRegistry
+
+PAGE_SIZE = 2
+
+
+@pytest.fixture
+def presence():
+    return PresenceRegistry()
+
+
+@pytest.fixture
+def registry(presence):
+    gateway = ConnectionManager(
+        max_queue=16,
+        policy=SlowConsumerPolicy.DROP_OLDEST,
+        heartbeat_interval=20,
+        idle_timeout=60,
+    )
+    return RoomRegistry(presence=presence, gateway=gateway)
+
+
+def _fill(registry, room, first_user_id):
+    for offset in range(room.seats_free):
+        registry.join(first_user_id + offset, room.id)
+
+
+def _error_code(call, *args, **kwargs):
+    with pytest.raises(MCRDomainError) as exc_info:
+        call(*args, **kwargs)
+    return exc_info.value.code
+
+
+def test_create_and_join_update_state_and_presence(registry, presence):
+    room = registry.create(1, "table")
+    assert presence.get_status(1) is UserStatus.IN_ROOM
+    assert registry.room_of(1) is room
+
+    _fill(registry, room, 2)
+    assert room.state is RoomState.FULL
+    assert registry.count(RoomState.WAITING) == 0
+    assert registry.count(RoomState.FULL) == 1
+    assert _error_code(registry.join, 10, room.id) is DomainErrorCode.ROOM_FULL
+    assert _error_code(registry.create, 2, "again") is DomainErrorCode.ALREADY_IN_ROOM
+
+
+def test_quick_join_prefers_fullest_room(registry):
+    assert _error_code(registry.quick_join, 1) is DomainErrorCode.NO_AVAILABLE_ROOM
+
+    registry.create(1, "one player")
+    crowded = registry.create(2, "two players")
+    registry.join(3, crowded.id)
+
+    assert registry.quick_join(4) is crowded
+    assert crowded.seats_free == 1
+
+
+def test_leave_transfers_host_and_deletes_empty_room(registry, presence):
+    room = registry.create(1, "table")
+    registry.join(2, room.id)
+    registry.set_ready(2, room.id, ready=True)
+
+    registry.leave(1, room.id)
+    assert room.host_id == room.player_ids[0]
+    assert room.ready_ids == set()
+    assert presence.get_status(1) is UserStatus.ONLINE
+
+    registry.leave(2, room.id)
+    assert len(registry) == 0
+    assert _error_code(registry.get, room.id) is DomainErrorCode.ROOM_NOT_FOUND
+
+
+def test_start_requires_host_full_room_and_ready_players(registry, presence):
+    room = registry.create(1, "table")
+    _fill(registry, room, 2)
+
+    assert _error_code(registry.start, 2, room.id) is DomainErrorCode.NOT_ROOM_HOST
+    assert _error_code(registry.start, 1, room.id) is DomainErrorCode.ROOM_NOT_READY
+
+    for user_id in range(2, MAX_PLAYERS + 1):
+        registry.set_ready(user_id, room.id, ready=True)
+    registry.start(1, room.id)
+
+    assert room.state is RoomState.PLAYING
+    assert presence.counts()[UserStatus.PLAYING] == MAX_PLAYERS
+    assert _error_code(registry.leave, 2, room.id) is (
+        DomainErrorCode.ROOM_ALREADY_STARTED
+    )
+
+    registry.finish(room.id)
+    assert room.state is RoomState.FULL
+    assert presence.get_status(2) is UserStatus.IN_ROOM
+
+
+def test_detach_keeps_seat_only_while_playing(registry, presence):
+    waiting = registry.create(1, "waiting")
+    presence.set_status(1, UserStatus.OFFLINE)
+    registry.detach(1)
+    assert registry.room_of(1) is None
+    assert len(registry) == 0
+
+    playing = registry.create(2, "playing")
+    _fill(registry, playing, 3)
+    for user_id in range(3, MAX_PLAYERS + 2):
+        registry.set_ready(user_id, playing.id, ready=True)
+    registry.start(2, playing.id)
+
+    presence.set_status(3, UserStatus.OFFLINE)
+    registry.detach(3)
+    assert registry.room_of(3) is playing
+
+    registry.attach(3)
+    assert presence.get_status(3) is UserStatus.PLAYING
+    assert waiting.id != playing.id
+
+
+def test_lobby_list_is_cursor_paginated(registry):
+    rooms = [registry.create(user_id, f"room {user_id}") for user_id in range(1, 6)]
+    registry.leave(2, rooms[1].id)
+
+    page, cursor = registry.list_rooms(RoomState.WAITING, limit=PAGE_SIZE)
+    assert [room.id for room in page] == [rooms[0].id, rooms[2].id]
+
+    page, cursor = registry.list_rooms(RoomState.WAITING, cursor, PAGE_SIZE)
+    assert [room.id for room in page] == [rooms[3].id, rooms[4].id]
+    assert cursor is None
+
+    _fill(registry, rooms[0], 10)
+    page, _ = registry.list_rooms(RoomState.FULL)
+    assert page == [rooms[0]]
@@ -0,0 +1,265 @@
+import pytest
+
+from app.services.game.decomposition import MeldKind, waiting_tiles
+from app.services.game.scoring import (
+    MIN_POINTS,
+    Fan,
+    Hand,
+    Meld,
+    WinContext,
+    score_hand,
+    score_hands,
+)
+from app.services.game.tile import (
+    EAST,
+    format_tiles,
+    parse_tile,
+    parse_tiles,
+    to_counts,
+)
+
+
+def meld(kind, tile, *, concealed=False):
+    return Meld(kind, parse_tile(tile), concealed=concealed)
+
+
+def hand(concealed, winning_tile, melds=()):
+    return Hand(parse_tiles(concealed), parse_tile(winning_tile), melds)
+
+
+def score(concealed, winning_tile, melds=(), **context):
+    return score_hand(hand(concealed, winning_tile, melds), WinContext(**context))
+
+
+@pytest.mark.parametrize(
+    ("concealed", "winning_tile", "melds", "context", "total", "expected"),
+    [
+        (
+            "111222333z44z55p",
+            "4z",
+            (),
+            {},
+            112,
+            {Fan.BIG_FOUR_WINDS, Fan.THREE_CONCEALED_PUNGS, Fan.HALF_FLUSH},
+        ),
+        (
+            "19m19p19s1234567z",
+            "1m",
+            (),
+            {"self_drawn": True},
+            89,
+            {Fan.THIRTEEN_ORPHANS, Fan.SELF_DRAWN},
+        ),
+        ("1133m5577p99s11z2z", "2z", (), {}, 24, {Fan.SEVEN_PAIRS}),
+        (
+            "234m567m234p56p88s",
+            "7p",
+            (),
+            {},
+            9,
+            {Fan.ALL_CHOWS, Fan.MIXED_DOUBLE_CHOW, Fan.SHORT_STRAIGHT},
+        ),
+        ("123123123m789p5s", "5s", (), {}, 45, {Fan.PURE_SHIFTED_PUNGS}),
+        ("111999m111p999s1s", "1s", (), {}, 133, {Fan.ALL_TERMINALS}),
+        (
+            "777z234m9p",
+            "9p",
+            (meld(MeldKind.PUNG, "5z"), meld(MeldKind.PUNG, "6z")),
+            {},
+            90,
+            {Fan.BIG_THREE_DRAGONS},
+        ),
+        (
+            "666z123p456p7z",
+            "7z",
+            (meld(MeldKind.PUNG, "5z"),),
+            {},
+            72,
+            {Fan.LITTLE_THREE_DRAGONS, Fan.HALF_FLUSH},
+        ),
+        (
+            "123m123p123s78m55p",
+            "9m",
+            (),
+            {"self_drawn": True},
+            15,
+            {Fan.MIXED_TRIPLE_CHOW, Fan.TWO_TERMINAL_CHOWS},
+        ),
+        (
+            "1z",
+            "1z",
+            (
+                meld(MeldKind.CHOW, "1m"),
+                meld(MeldKind.CHOW, "4p"),
+                meld(MeldKind.PUNG, "9s"),
+                meld(MeldKind.CHOW, "7p"),
+            ),
+            {},
+            8,
+            {Fan.MELDED_HAND, Fan.SHORT_STRAIGHT},
+        ),
+        (
+            "9p",
+            "9p",
+            (
+                meld(MeldKind.KONG, "1m"),
+                meld(MeldKind.KONG, "2p", concealed=True),
+                meld(MeldKind.KONG, "3s"),
+                meld(MeldKind.KONG, "5z"),
+            ),
+            {},
+            99,
+            {Fan.FOUR_KONGS, Fan.MIXED_SHIFTED_PUNGS},
+        ),
+        ("2233445566778m", "8m", (), {}, 90, {Fan.SEVEN_SHIFTED_PAIRS}),
+        (
+            "14m58p36s1234567z",
+            "9s",
+            (),
+            {},
+            24,
+            {Fan.GREATER_HONORS_AND_KNITTED_TILES},
+        ),
+        (
+            "444p666s888m2s",
+            "2s",
+            (meld(MeldKind.PUNG, "2m"),),
+            {},
+            41,
+            {Fan.ALL_EVEN_PUNGS, Fan.THREE_CONCEALED_PUNGS},
+        ),
+        ("123m789m789p111s9s", "9s", (), {}, 11, {Fan.OUTSIDE_HAND}),
+        ("222m222p222s45m99s", "3m", (), {}, 35, {Fan.TRIPLE_PUNG}),
+        (
+            "567p78s666s5z5z",
+            "9s",
+            (meld(MeldKind.CHOW, "2m"),),
+            {},
+            8,
+            {Fan.CHICKEN_HAND},
+        ),
+        (
+            "123m456p789s11z23m",
+            "4m",
+            (),
+            {"is_robbing_kong": True, "is_last_tile": True},
+            18,
+            {Fan.MIXED_STRAIGHT, Fan.ROBBING_THE_KONG},
+        ),
+        ("147m258p369s11z23p", "4p", (), {}, 14, {Fan.KNITTED_STRAIGHT}),
+        (
+            "123789m123789p5s",
+            "5s",
+            (),
+            {},
+            19,
+            {Fan.THREE_SUITED_TERMINAL_CHOWS, Fan.SINGLE_WAIT},
+        ),
+        ("111122223333m4p", "4p", (), {}, 66, {Fan.QUADRUPLE_CHOW}),
+    ],
+)
+def test_score_hand(concealed, winning_tile, melds, context, total, expected):  # noqa: PLR0913
+    result = score(concealed, winning_tile, melds, **context)
+
+    assert result is not None
+    assert result.total == total
+    assert expected <= set(result.fans)
+    assert result.is_valid
+
+
+def test_excluded_fans_are_not_counted():
+    # 사암각은 문전청과 대대화를 포함한다.
+    result = score("111m222p333s444m5z", "5z")
+
+    assert Fan.FOUR_CONCEALED_PUNGS in result.fans
+    assert Fan.ALL_PUNGS not in result.fans
+    assert Fan.CONCEALED_HAND not in result.fans
+
+
+def test_nine_gates():
+    result = score("1112345678999m", "5m")
+
+    assert Fan.NINE_GATES in result.fans
+    assert Fan.FULL_FLUSH not in result.fans
+
+
+def test_flowers_do_not_reach_minimum():
+    result = score("12m456p678s999s55z", "3m", flowers=4)
+
+    assert result.total == MIN_POINTS
+    assert result.points_without_flowers < MIN_POINTS
+    assert not result.is_valid
+
+
+def test_wait_fan_requires_unique_wait():
+    # 23m은 1m/4m 양면 대기라 화료패가 4m이어도 변장이 아니다.
+    result = score("123m456p789s11z23m", "4m")
+
+    assert Fan.EDGE_WAIT not in result.fans
+    assert Fan.CLOSED_WAIT not in result.fans
+
+
+def test_seat_and_prevalent_wind():
+    result = score(
+        "111z234m567p78s55p",
+        "9s",
+        seat_wind=EAST,
+        prevalent_wind=EAST,
+    )
+
+    assert {Fan.SEAT_WIND, Fan.PREVALENT_WIND} <= set(result.fans)
+    assert Fan.PUNG_OF_TERMINALS_OR_HONORS not in result.fans
+
+
+@pytest.mark.parametrize(
+    ("concealed", "winning_tile", "melds"),
+    [
+        ("123m456p789s11z2m", "5m", ()),
+        ("1111m", "1m", (meld(MeldKind.CHOW, "2p"),)),
+        ("11m", "1m", ()),
+    ],
+)
+def test_invalid_hand_returns_none(concealed, winning_tile, melds):
+    assert score(concealed, winning_tile, melds) is None
+
+
+def test_score_hands_matches_single_scoring():
+    pairs = [
+        (hand("123m456p789s11z23m", "4m"), None),
+        (hand("111999m111p999s1s", "1s"), WinContext(self_drawn=True)),
+        (hand("123m456p789s11z23m", "4m"), None),
+        (hand("11m", "1m"), None),
+    ]
+
+    results = score_hands(pairs)
+
+    expected = [score_hand(hand_, context) for hand_, context in pairs]
+    assert [result and result.fans for result in results] == [
+        result and result.fans for result in expected
+    ]
+    assert results[0] is results[2]
+
+
+@pytest.mark.parametrize(
+    ("concealed", "melds", "waits"),
+    [
+        ("1112345678999m", 0, "123456789m"),
+        ("19m19p19s1234567z", 0, "19m19p19s1234567z"),
+        ("1133m5577p99s11z2z", 0, "2z"),
+        ("23m11p", 3, "14m"),
+        ("1z", 4, "1z"),
+        ("123m456p789s11z25m", 0, ""),
+    ],
+)
+def test_waiting_tiles(concealed, melds, waits):
+    counts = to_counts(parse_tiles(concealed))
+
+    assert waiting_tiles(counts, melds, counts) == parse_tiles(waits)
+
+
+def test_parse_and_format_roundtrip():
+    tiles = parse_tiles("19m5p78s1234567z")
+
+    assert format_tiles(tiles) == "19m5p78s1234567z"
+    with pytest.raises(ValueError):
+        parse_tiles("12x")
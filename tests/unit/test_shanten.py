@@ -0,0 +1,136 @@
+import random
+
+import pytest
+
+from app.services.game.decomposition import MeldKind, waiting_tiles
+from app.services.game.shanten import (
+    GOALS,
+    ShantenTables,
+    _build_group,
+    _complete_shapes,
+    _vectors,
+    call_options,
+    can_win_on,
+    effective_tiles,
+    get_tables,
+    shanten,
+    standard_shanten,
+)
+from app.services.game.tile import SUIT_SIZE, parse_tile, parse_tiles, to_counts
+
+
+def counts_of(notation):
+    return to_counts(parse_tiles(notation))
+
+
+@pytest.mark.parametrize(
+    ("notation", "meld_count", "expected"),
+    [
+        ("123m456p789s11z23m4m", 0, -1),
+        ("123m456p789s11z23m", 0, 0),
+        ("123m456p789s1z2z23m", 0, 1),
+        ("19m19p19s1234567z", 0, 0),
+        ("19m19p19s123456z5p", 0, 1),
+        ("1133m5577p99s11z2z", 0, 0),
+        ("113355m99s11z2z3p7m", 0, 1),
+        ("147m258p36s12345z", 0, 0),
+        ("147m258p369s11z23p", 0, 0),
+        ("147m258p369s1z", 1, 0),
+        ("23m11p", 3, 0),
+        ("1m", 4, 0),
+        ("11m", 4, -1),
+    ],
+)
+def test_shanten(notation, meld_count, expected):
+    assert shanten(counts_of(notation), meld_count) == expected
+
+
+def test_special_shapes_are_ignored_with_melds():
+    # 부로가 있으면 칠대자를 보지 않는다.
+    counts = counts_of("1133m5577p99s")
+
+    assert shanten(counts, 1) == standard_shanten(counts, 1)
+    assert shanten(counts, 1) > 0
+
+
+def test_rejects_wrong_hand_size():
+    with pytest.raises(ValueError):
+        shanten(counts_of("123m"))
+
+
+def test_packed_honor_table_matches_build():
+    assert get_tables().honors == _build_group(7, chows=False)
+
+
+def test_packed_suit_table_matches_brute_force():
+    shapes = _complete_shapes(SUIT_SIZE, chows=True)
+    needed = [3 * (goal % 5) + 2 * (goal // 5) for goal in range(GOALS)]
+    tables = get_tables()
+    rng = random.Random(0)
+    for vector in rng.sample(_vectors(SUIT_SIZE), 10):
+        expected = [
+            min(
+                sum(max(t - h, 0) for t, h in zip(shape, vector, strict=True))
+                for shape, mask in shapes.items()
+                if mask >> goal & 1
+            )
+            for goal in range(GOALS)
+        ]
+        assert list(tables.suit(vector)) == expected
+        assert all(value <= need for value, need in zip(expected, needed, strict=True))
+
+
+def test_rank_follows_lexicographic_order():
+    tables = get_tables()
+    for index, vector in enumerate(_vectors(7)):
+        assert tables._rank(vector, tables.honor_offsets) == index
+
+
+def test_dump_and_load_roundtrip(tmp_path):
+    tables = get_tables()
+    path = tmp_path / "tables.bin"
+    tables.dump(path)
+
+    loaded = ShantenTables.load(path)
+
+    assert loaded.suits == tables.suits
+    assert loaded.honors == tables.honors
+
+
+def test_load_rejects_unknown_file(tmp_path):
+    path = tmp_path / "tables.bin"
+    path.write_bytes(b"XXXX" + bytes(16))
+
+    with pytest.raises(ValueError):
+        ShantenTables.load(path)
+
+
+@pytest.mark.parametrize(
+    "notation",
+    ["123m456p789s11z23m", "1112345678999m", "1133m5577p99s11z2z", "147m258p36s12345z"],
+)
+def test_effective_tiles_at_tenpai_are_waits(notation):
+    counts = counts_of(notation)
+
+    assert effective_tiles(counts) == waiting_tiles(counts)
+
+
+def test_can_win_on():
+    counts = counts_of("123m456p789s11z23m")
+
+    assert can_win_on(counts, parse_tile("1m"))
+    assert not can_win_on(counts, parse_tile("5m"))
+    assert counts == counts_of("123m456p789s11z23m")
+
+
+def test_call_options():
+    counts = counts_of("2344m55p")
+
+    assert call_options(counts, parse_tile("4m"), can_chow=True) == [
+        (MeldKind.CHOW, parse_tile("2m")),
+        (MeldKind.PUNG, parse_tile("4m")),
+    ]
+    assert call_options(counts, parse_tile("5m"), can_chow=False) == []
+    assert call_options(counts, parse_tile("5p"), can_chow=True) == [
+        (MeldKind.PUNG, parse_tile("5p")),
+    ]
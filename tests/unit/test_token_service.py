@@ -0,0 +1,103 @@
+import pytest
+from fastapi import HTTPException, status
+from fastapi.security import HTTPAuthorizationCredentials
+
+from app.api.deps import get_token_payload
+from app.core.security import (
+    create_access_token,
+    create_refresh_token,
+    decode_token,
+    token_cache,
+)
+from app.services.auth.revocation import RevocationDenylist
+from app.services.auth.token_service import rotate_refresh_token
+from app.services.auth.user_service import identity_cache
+
+
+@pytest.fixture(autouse=True)
+def denylist(mocker):
+    denylist = RevocationDenylist(capacity=1000, error_rate=0.001)
+    denylist.loaded = True
+    mocker.patch("app.services.auth.token_service.revocation_denylist", denylist)
+    mocker.patch("app.api.deps.revocation_denylist", denylist)
+    token_cache.clear()
+    identity_cache.clear()
+    return denylist
+
+
+async def test_rotate_refresh_token_issues_new_pair(
+    identity_session,
+    mock_user,
+    denylist,
+):
+    old_token = create_refresh_token({"sub": mock_user.email})
+
+    response = await rotate_refresh_token(identity_session, old_token)
+
+    new_payload = decode_token(response.refresh_token)
+    assert new_payload["sub"] == mock_user.email
+    assert new_payload["jti"] != decode_token(old_token)["jti"]
+    assert denylist.might_be_revoked(decode_token(old_token)["jti"])
+    identity_session.commit.assert_awaited_once()
+
+
+async def test_rotate_refresh_token_rejects_reuse(identity_session, mock_user):
+    identity_session.execute.return_value.scalar_one_or_none.return_value = None
+
+    with pytest.raises(HTTPException) as exc_info:
+        await rotate_refresh_token(
+            identity_session,
+            create_refresh_token({"sub": mock_user.email}),
+        )
+
+    assert exc_info.value.status_code == status.HTTP_401_UNAUTHORIZED
+    identity_session.rollback.assert_awaited_once()
+    identity_session.commit.assert_not_awaited()
+
+
+async def test_rotate_refresh_token_rejects_access_token(identity_session, mock_user):
+    with pytest.raises(HTTPException) as exc_info:
+        await rotate_refresh_token(
+            identity_session,
+            create_access_token({"sub": mock_user.email}),
+        )
+
+    assert exc_info.value.status_code == status.HTTP_401_UNAUTHORIZED
+    identity_session.execute.assert_not_called()
+
+
+async def test_unrevoked_token_skips_exact_check(identity_session, mock_user, denylist):
+    token = create_access_token({"sub": mock_user.email})
+    credentials = HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+
+    payload = await get_token_payload(credentials, identity_session)
+
+    assert payload["sub"] == mock_user.email
+    assert denylist.exact_checks == 0
+    identity_session.execute.assert_not_called()
+
+
+async def test_revoked_access_token_is_rejected(identity_session, mock_user, denylist):
+    token = create_access_token({"sub": mock_user.email})
+    denylist.add(decode_token(token)["jti"])
+    credentials = HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+
+    with pytest.raises(HTTPException) as exc_info:
+        await get_token_payload(credentials, identity_session)
+
+    assert exc_info.value.status_code == status.HTTP_401_UNAUTHORIZED
+    assert denylist.exact_checks == 1
+
+
+async def test_denylist_checks_db_until_first_rebuild(mock_session, mocker):
+    denylist = RevocationDenylist(capacity=2, error_rate=0.001)
+    assert denylist.might_be_revoked("any")
+
+    rows = [(token_id, f"jti-{token_id}") for token_id in range(1, 6)]
+    mocker.patch.object(denylist, "_load", mocker.AsyncMock(return_value=rows))
+    await denylist.rebuild(mock_session)
+
+    assert not denylist.might_be_revoked("any")
+    assert denylist.might_be_revoked("jti-3")
+    assert denylist.capacity >= len(rows)
+    assert denylist.filter.count <= denylist.capacity
@@ -0,0 +1,60 @@
+import pytest
+
+from app.services.auth.uid_allocator import (
+    UID_SPACE,
+    FeistelPermutation,
+    UidAllocator,
+)
+from app.util.validators import validate_uid
+
+PREFETCH_SIZE = 3
+
+
+@pytest.fixture(scope="module")
+def permutation():
+    return FeistelPermutation("test-key", rounds=6)
+
+
+def test_million_allocations_are_unique_and_valid(permutation):
+    allocator = UidAllocator(permutation, prefetch_size=PREFETCH_SIZE)
+    allocations = 1_000_000
+
+    uids = {allocator.to_uid(value) for value in range(allocations)}
+
+    assert len(uids) == allocations
+    assert all(validate_uid(uid) for uid in uids)
+
+
+def test_permutation_is_invertible_over_the_whole_space(permutation):
+    for value in (0, 1, UID_SPACE // 2, UID_SPACE - 1, *range(12345, UID_SPACE, 7919)):
+        permuted = permutation.permute(value)
+        assert 0 <= permuted < UID_SPACE
+        assert permutation.invert(permuted) == value
+
+
+def test_sequential_values_do_not_look_sequential(permutation):
+    permuted = [permutation.permute(value) for value in range(100)]
+
+    assert permuted != sorted(permuted)
+    assert max(permuted) - min(permuted) > UID_SPACE // 2
+
+
+def test_different_keys_give_different_uids(permutation):
+    other = FeistelPermutation("other-key", rounds=6)
+
+    assert [permutation.permute(v) for v in range(10)] != [
+        other.permute(v) for v in range(10)
+    ]
+
+
+async def test_allocator_prefetches_sequence_blocks(mock_session, permutation):
+    mock_session.execute.return_value.scalars.return_value.all.side_effect = [
+        [0, 1, 2],
+        [3, 4, 5],
+    ]
+    allocator = UidAllocator(permutation, prefetch_size=PREFETCH_SIZE)
+
+    uids = [await allocator.allocate(mock_session) for _ in range(PREFETCH_SIZE + 1)]
+
+    assert uids == [allocator.to_uid(value) for value in range(PREFETCH_SIZE + 1)]
+    assert mock_session.execute.await_count == 2